@@ -0,0 +1,340 @@
+"""Time nasem() and its most expensive steps, and compare against a baseline.
+
+Usage:
+    python dev/scripts/benchmark.py run [--output results.json] [--repeat 5]
+                                        [--filter REGEX]
+    python dev/scripts/benchmark.py compare baseline.json [results.json]
+                                            [--threshold 0.1]
+
+`run` times nasem() end to end for every scenario in nasem_dairy/data/demo
+and tests/integration, plus micro-benchmarks of get_feed_data,
+calculate_feed_data, calculate_diet_data, ModelOutput construction,
+export_to_JSON, get_report and the cost of one SensitivityAnalyzer sample.
+Results are written as JSON, e.g. to save a baseline before a change.
+
+`compare` prints the change in median time of every benchmark between two
+result files, running the benchmarks first if only the baseline is given.
+It exits with status 1 if any benchmark got slower by more than --threshold
+(a fraction, 0.1 = 10%).
+"""
+import argparse
+import contextlib
+import datetime
+import glob
+import importlib.metadata
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+import warnings
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import nasem_dairy as nd
+import nasem_dairy.model.nasem as nasem_module
+import nasem_dairy.model.utility as utility
+import nasem_dairy.nasem_equations.amino_acid as aa
+import nasem_dairy.nasem_equations.nutrient_intakes as diet
+from nasem_dairy.model_output.ModelOutput import ModelOutput
+from nasem_dairy.sensitivity.SensitivityAnalyzer import SensitivityAnalyzer
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+    )))
+DEMO_DIRECTORY = os.path.join(REPOSITORY, "src", "nasem_dairy", "data", "demo")
+INTEGRATION_DIRECTORY = os.path.join(REPOSITORY, "tests", "integration")
+# Scenario used for the micro-benchmarks
+MICRO_SCENARIO = "lactating_cow_test"
+
+
+def demo_scenarios() -> Dict[str, Dict[str, Any]]:
+    """nasem() keyword arguments for each demo scenario."""
+    scenarios = {}
+    for path in sorted(glob.glob(os.path.join(DEMO_DIRECTORY, "*.json"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        user_diet, animal_input, equation_selection, infusion_input = nd.demo(
+            name
+            )
+        scenarios[f"demo/{name}"] = {
+            "user_diet": user_diet, "animal_input": animal_input,
+            "equation_selection": equation_selection,
+            "infusion_input": infusion_input
+        }
+    return scenarios
+
+
+def integration_scenarios() -> Dict[str, Dict[str, Any]]:
+    """nasem() keyword arguments for each integration test scenario."""
+    scenarios = {}
+    for path in sorted(glob.glob(os.path.join(INTEGRATION_DIRECTORY, "*.json"))):
+        with open(path) as file:
+            input_data = json.load(file)["input"]
+        name = os.path.splitext(os.path.basename(path))[0]
+        scenarios[f"integration/{name}"] = {
+            "user_diet": pd.DataFrame(
+                input_data["user_diet_in"].items(),
+                columns=["Feedstuff", "kg_user"]
+                ),
+            "animal_input": input_data["animal_input_in"],
+            "equation_selection": input_data["equation_selection_in"],
+            "coeff_dict": input_data["coeff_dict"],
+            "infusion_input": input_data["infusion_input"],
+            "MP_NP_efficiency": input_data["MP_NP_efficiency"],
+            "mPrt_coeff_list": input_data["mPrt_coeff_list"],
+            "f_Imb": pd.Series(input_data["f_Imb"], index=aa.AA_LIST)
+        }
+    return scenarios
+
+
+def capture_call(
+    module: Any,
+    function_name: str,
+    run: Callable[[], Any]
+) -> Tuple[tuple, Any]:
+    """Arguments and result of the first call to module.function_name."""
+    function = getattr(module, function_name)
+    calls = []
+
+    # nasem() calls these functions with positional arguments only
+    def spy(*args):
+        result = function(*args)
+        if not calls:
+            calls.append((args, result))
+        return result
+
+    setattr(module, function_name, spy)
+    try:
+        run()
+    finally:
+        setattr(module, function_name, function)
+    return calls[0]
+
+
+def _fresh(args: tuple) -> tuple:
+    # Functions that fill in a dict argument get a new copy on every call
+    return tuple(dict(arg) if isinstance(arg, dict) else arg for arg in args)
+
+
+def micro_benchmarks() -> Dict[str, Callable[[], Any]]:
+    """Callables for the steps of one nasem() run, by benchmark name."""
+    user_diet, animal_input, equation_selection, infusion_input = nd.demo(
+        MICRO_SCENARIO
+        )
+    inputs = nd.prepare(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input, verbose=False
+        )
+    run = lambda: nasem_module.nasem(inputs)
+
+    feed_args, feed_data = capture_call(utility, "get_feed_data", run)
+    feed_array_args, _ = capture_call(diet, "calculate_feed_arrays", run)
+    Dt_DMIn, An_StatePhys, Use_DNDF_IV, _, coeff_dict = feed_array_args
+    diet_args, _ = capture_call(diet, "calculate_diet_data", run)
+    # ModelOutput pops values from the dict it is given, keep a copy
+    captured_locals = {}
+    original_model_output = nasem_module.ModelOutput
+
+    def capture_locals(locals_input, **kwargs):
+        captured_locals.update(locals_input)
+        return original_model_output(locals_input=locals_input, **kwargs)
+
+    nasem_module.ModelOutput = capture_locals
+    try:
+        model_output = run()
+    finally:
+        nasem_module.ModelOutput = original_model_output
+    report_names = list(model_output.report_structure)
+    json_path = os.path.join(tempfile.mkdtemp(), "output.json")
+
+    def get_reports():
+        for report_name in report_names:
+            model_output.get_report(report_name)
+
+    return {
+        "micro/get_feed_data": lambda: utility.get_feed_data(*feed_args),
+        "micro/calculate_feed_data": lambda: diet.calculate_feed_data(
+            Dt_DMIn, An_StatePhys, Use_DNDF_IV, feed_data, coeff_dict
+            ),
+        "micro/calculate_diet_data": lambda: diet.calculate_diet_data(
+            *_fresh(diet_args)
+            ),
+        "micro/ModelOutput": lambda: ModelOutput(
+            locals_input=dict(captured_locals)
+            ),
+        "micro/export_to_JSON": lambda: model_output.export_to_JSON(json_path),
+        f"micro/get_report ({len(report_names)} reports)": get_reports,
+        "micro/nasem (prepared inputs)": run,
+    }
+
+
+def time_sensitivity_sample(repeat: int) -> Dict[str, Any]:
+    """Wall time per sample of SensitivityAnalyzer.run_sensitivity()."""
+    value_ranges = {"VmMiNInt": (90.0, 110.0), "KpConc": (4.5, 6.0)}
+    num_samples = 4
+    # Saltelli sampling evaluates N * (2D + 2) samples
+    sample_count = num_samples * (2 * len(value_ranges) + 2)
+    input_path = os.path.join(DEMO_DIRECTORY, f"{MICRO_SCENARIO}.json")
+    times = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as directory:
+            analyzer = SensitivityAnalyzer(os.path.join(directory, "bench.db"))
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = timeit.default_timer()
+                analyzer.run_sensitivity(
+                    value_ranges, num_samples, input_path,
+                    calc_second_order=True
+                    )
+                times.append((timeit.default_timer() - start) / sample_count)
+    return _summarize(times, sample_count)
+
+
+def _summarize(times: List[float], number: int) -> Dict[str, Any]:
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "mean": statistics.mean(times),
+        "repeat": len(times),
+        "number": number
+    }
+
+
+def time_function(function: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Seconds per call, from `repeat` runs of about 0.2 s each."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat, number)]
+    return _summarize(times, number)
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPOSITORY,
+            capture_output=True, text=True, check=True
+            ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_benchmarks(repeat: int = 5, pattern: str = "") -> Dict[str, Any]:
+    """Run every benchmark whose name matches pattern."""
+    benchmarks = {}
+    for name, kwargs in {**demo_scenarios(), **integration_scenarios()}.items():
+        benchmarks[f"nasem/{name}"] = (
+            lambda kwargs=kwargs: nd.nasem(**kwargs)
+            )
+    benchmarks.update(micro_benchmarks())
+
+    results = {}
+    for name, function in benchmarks.items():
+        if re.search(pattern, name):
+            # Scenarios with non-default coefficients print them on every run
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                results[name] = time_function(function, repeat)
+            print(f"{name}: {results[name]['median'] * 1000:.3f} ms",
+                  file=sys.stderr)
+    if re.search(pattern, "micro/SensitivityAnalyzer sample"):
+        name = "micro/SensitivityAnalyzer sample"
+        results[name] = time_sensitivity_sample(repeat)
+        print(f"{name}: {results[name]['median'] * 1000:.3f} ms",
+              file=sys.stderr)
+    return {
+        "metadata": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "nasem_dairy": importlib.metadata.version("nasem_dairy"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "unit": "seconds per call"
+        },
+        "results": results
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.1
+) -> List[str]:
+    """Print a comparison table and return the benchmarks that got slower."""
+    baseline_results = baseline["results"]
+    current_results = current["results"]
+    width = max(len(name) for name in current_results)
+    print(f"{'benchmark':<{width}}  {'baseline ms':>12}  {'current ms':>12}  "
+          f"{'change':>8}")
+    regressions = []
+    for name in sorted(current_results):
+        if name not in baseline_results:
+            print(f"{name:<{width}}  (not in baseline)")
+            continue
+        before = baseline_results[name]["median"]
+        after = current_results[name]["median"]
+        change = after / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  slower"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"{name:<{width}}  {before * 1000:>12.3f}  {after * 1000:>12.3f}  "
+              f"{change:>+8.1%}{flag}")
+    not_run = set(baseline_results) - set(current_results)
+    if not_run:
+        print(f"{len(not_run)} baseline benchmarks were not run")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "-o", "--output", help="Results file (default: stdout)"
+        )
+    compare_parser = commands.add_parser(
+        "compare", help="Compare results against a baseline"
+        )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument(
+        "current", nargs="?",
+        help="Results to compare (default: run the benchmarks now)"
+        )
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    for subparser in (run_parser, compare_parser):
+        subparser.add_argument("--repeat", type=int, default=5)
+        subparser.add_argument(
+            "--filter", default="", help="Only run benchmarks matching REGEX"
+            )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_benchmarks(args.repeat, args.filter)
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(results, file, indent=2)
+        else:
+            print(json.dumps(results, indent=2))
+    else:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if args.current:
+            with open(args.current) as file:
+                current = json.load(file)
+        else:
+            pattern = args.filter or "|".join(
+                re.escape(name) for name in baseline["results"]
+                )
+            current = run_benchmarks(args.repeat, pattern)
+        sys.exit(1 if compare_results(baseline, current, args.threshold) else 0)
@@ -0,0 +1,48 @@
+"""Measure how long `import nasem_dairy` takes in a fresh interpreter.
+
+Usage:
+    python dev/scripts/benchmark_import.py [--runs 10] [--attribute nasem]
+
+Each run starts a new Python process so nothing is cached in sys.modules. 
+With --attribute the time to first access nd.<attribute> is reported too, 
+e.g. --attribute nasem for the cost of loading the model itself.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+TIMING_CODE = """
+import time
+start = time.perf_counter()
+import nasem_dairy as nd
+imported = time.perf_counter()
+if {attribute!r}:
+    getattr(nd, {attribute!r})
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def time_import(attribute: str = ""):
+    result = subprocess.run(
+        [sys.executable, "-c", TIMING_CODE.format(attribute=attribute)],
+        capture_output=True, text=True, check=True
+    )
+    import_time, attribute_time = result.stdout.split()
+    return float(import_time), float(attribute_time)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--attribute", default="")
+    args = parser.parse_args()
+
+    timings = [time_import(args.attribute) for _ in range(args.runs)]
+    import_times = [import_time for import_time, _ in timings]
+    print(f"import nasem_dairy: median {statistics.median(import_times) * 1000:.1f} ms, "
+          f"min {min(import_times) * 1000:.1f} ms over {args.runs} runs")
+    if args.attribute:
+        attribute_times = [attribute_time for _, attribute_time in timings]
+        print(f"nd.{args.attribute} first access: median "
+              f"{statistics.median(attribute_times) * 1000:.1f} ms")
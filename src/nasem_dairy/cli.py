@@ -0,0 +1,361 @@
+"""Command line interface for the NASEM model.
+
+Commands:
+    nasem-dairy run: Evaluates a batch of scenarios across worker processes
+                     and streams the selected outputs to CSV, JSON lines or
+                     Parquet as each scenario completes.
+    nasem-dairy serve: Starts the warm model server, see
+                       nasem_dairy.service.server.
+
+Scenarios use the `read_json_input` format. They are read from a directory of
+.json files (the file name is the scenario id) or a .jsonl file with one
+scenario per line (the "id" key, or the line number, is the scenario id).
+
+Example:
+    nasem-dairy run herd/ --workers 8 --outputs Mlk_Prod An_MPBal_g_Trg \\
+        --output results.csv
+"""
+import argparse
+import concurrent.futures
+import csv
+import json
+import os
+import sys
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from nasem_dairy.model_output.ModelOutput import CustomJSONEncoder
+from nasem_dairy.sensitivity.response_variables_config import RESPONSE_VARIABLE_NAMES
+from nasem_dairy.service import server as model_server
+
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+
+
+def read_scenarios(path: str) -> Tuple[Iterator[Dict[str, Any]], int]:
+    """
+    Reads scenarios from a directory of .json files or a .jsonl file.
+
+    Scenarios are read lazily, one at a time, as they are needed.
+
+    Args:
+        path: A directory of .json files or a .jsonl file.
+
+    Returns:
+        An iterator of scenario dictionaries, each with an "id", and the
+        number of scenarios. A scenario that cannot be parsed is returned as
+        {"id": ..., "error": ...}.
+
+    Raises:
+        FileNotFoundError: If path does not exist.
+    """
+    if os.path.isdir(path):
+        file_names = sorted(
+            name for name in os.listdir(path) if name.endswith(".json")
+            )
+
+        def read_directory() -> Iterator[Dict[str, Any]]:
+            for file_name in file_names:
+                scenario_id = os.path.splitext(file_name)[0]
+                try:
+                    with open(os.path.join(path, file_name)) as file:
+                        scenario = json.load(file)
+                except (OSError, json.JSONDecodeError) as error:
+                    yield {"id": scenario_id, "error": _format_error(error)}
+                    continue
+                yield {**scenario, "id": scenario_id}
+
+        return read_directory(), len(file_names)
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No scenarios found at {path}")
+    with open(path) as file:
+        total = sum(1 for line in file if line.strip())
+
+    def read_lines() -> Iterator[Dict[str, Any]]:
+        with open(path) as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                yield model_server._parse_request_line(line, line_number)
+
+    return read_lines(), total
+
+
+def _format_error(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+class ResultWriter:
+    """
+    Writes one row per scenario as results arrive.
+
+    Rows have an id column, an error column (empty on success) and one column
+    per output. Outputs that are not scalars (e.g. amino acid tables) are
+    written as JSON strings. Parquet files have a fixed schema, with string
+    id and error columns and float64 outputs, so they only take numeric 
+    outputs.
+    """
+    def __init__(
+        self,
+        stream: IO,
+        output_format: str,
+        outputs: List[str],
+        batch_size: int = 500
+    ):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {OUTPUT_FORMATS}, "
+                f"{output_format} was given"
+                )
+        if output_format == "parquet" and pyarrow is None:
+            raise ImportError("Parquet output requires the pyarrow package")
+        self.stream = stream
+        self.output_format = output_format
+        self.columns = ["id", "error"] + list(outputs)
+        self.batch_size = batch_size
+        self._batch = []
+        self._parquet_writer = None
+        if output_format == "parquet":
+            # The schema is fixed, so it does not depend on the first rows
+            self._parquet_schema = pyarrow.schema(
+                [("id", pyarrow.string()), ("error", pyarrow.string())]
+                + [(name, pyarrow.float64()) for name in outputs]
+                )
+        if output_format == "csv":
+            self._csv_writer = csv.DictWriter(stream, self.columns)
+            self._csv_writer.writeheader()
+
+    def _row(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        row = {"id": response["id"], "error": response.get("error")}
+        for name, value in response.get("outputs", {}).items():
+            if not isinstance(value, (str, int, float, bool, type(None))):
+                try:
+                    value = value.item()  # numpy scalars
+                except (AttributeError, ValueError):
+                    value = json.dumps(value, cls=CustomJSONEncoder)
+            row[name] = value
+        return row
+
+    def write(self, response: Dict[str, Any]) -> None:
+        row = self._row(response)
+        if self.output_format == "csv":
+            self._csv_writer.writerow(row)
+            self.stream.flush()
+        elif self.output_format == "jsonl":
+            self.stream.write(json.dumps(row, cls=CustomJSONEncoder) + "\n")
+            self.stream.flush()
+        else:
+            self._batch.append(row)
+            if len(self._batch) >= self.batch_size:
+                self._write_parquet_batch()
+
+    def _write_parquet_batch(self) -> None:
+        if not self._batch:
+            return
+        try:
+            table = pyarrow.Table.from_pylist(
+                [{**row, "id": str(row["id"])} for row in self._batch],
+                schema=self._parquet_schema
+                )
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as error:
+            raise ValueError(
+                "Parquet output requires numeric outputs, use CSV or JSON "
+                f"lines for other outputs: {error}"
+                ) from error
+        self._open_parquet_writer()
+        self._parquet_writer.write_table(table)
+        self._batch = []
+
+    def _open_parquet_writer(self) -> None:
+        if self._parquet_writer is None:
+            self._parquet_writer = pyarrow.parquet.ParquetWriter(
+                self.stream, self._parquet_schema
+                )
+
+    def close(self) -> None:
+        if self.output_format == "parquet":
+            self._write_parquet_batch()
+            # A file without results still has the columns
+            self._open_parquet_writer()
+            self._parquet_writer.close()
+
+
+def _evaluate_in_worker(request: Dict[str, Any]) -> Dict[str, Any]:
+    return model_server._worker_server.handle(request)
+
+
+def run_scenarios(
+    scenarios: Iterator[Dict[str, Any]],
+    writer: ResultWriter,
+    outputs: List[str],
+    workers: int = 1,
+    feed_library_path: Optional[str] = None,
+    progress: Optional[IO[str]] = None,
+    total: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Evaluates scenarios and writes each result as soon as it is ready.
+
+    With more than one worker, results are written in the order they
+    complete. At most a few scenarios per worker are read ahead, so large
+    batches are never held in memory.
+
+    Args:
+        scenarios: Scenario dictionaries from read_scenarios().
+        writer: Where results are written.
+        outputs: Output names to return for every scenario.
+        workers: Number of worker processes. 1 runs in this process.
+        feed_library_path: Path to a feed library CSV file. Defaults to the
+            NASEM feed library.
+        progress: Stream for progress messages, e.g. sys.stderr.
+        total: Number of scenarios, for progress messages.
+
+    Returns:
+        The number of scenarios evaluated and the number that failed.
+    """
+    feed_library = None
+    if feed_library_path:
+        feed_library = pd.read_csv(feed_library_path)
+    completed = 0
+    failed = 0
+
+    def record(response: Dict[str, Any]) -> None:
+        nonlocal completed, failed
+        writer.write(response)
+        completed += 1
+        failed += "error" in response
+        if progress is not None:
+            of_total = f"/{total}" if total is not None else ""
+            progress.write(
+                f"\rEvaluated {completed}{of_total} scenarios "
+                f"({failed} failed)"
+                )
+            progress.flush()
+
+    scenarios = (
+        scenario if "error" in scenario else {**scenario, "outputs": outputs}
+        for scenario in scenarios
+        )
+    if workers <= 1:
+        server = model_server.ModelServer(feed_library, outputs)
+        for scenario in scenarios:
+            record(scenario if "error" in scenario else server.handle(scenario))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=model_server._initialize_worker,
+            initargs=(feed_library, outputs)
+        ) as pool:
+            pending = set()
+            for scenario in scenarios:
+                if "error" in scenario:
+                    record(scenario)
+                    continue
+                pending.add(pool.submit(_evaluate_in_worker, scenario))
+                if len(pending) >= workers * 4:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                    for future in done:
+                        record(future.result())
+            for future in concurrent.futures.as_completed(pending):
+                record(future.result())
+    writer.close()
+    if progress is not None:
+        progress.write("\n")
+    return completed, failed
+
+
+def _output_format(args: argparse.Namespace) -> str:
+    if args.format:
+        return args.format
+    if args.output:
+        extension = os.path.splitext(args.output)[1].lstrip(".").lower()
+        if extension in OUTPUT_FORMATS:
+            return extension
+    return "csv"
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Runs `nasem-dairy run`, returning 1 if any scenario failed."""
+    scenarios, total = read_scenarios(args.scenarios)
+    outputs = args.outputs or list(RESPONSE_VARIABLE_NAMES)
+    output_format = _output_format(args)
+    if args.output:
+        mode = "wb" if output_format == "parquet" else "w"
+        newline = None if mode == "wb" else ""
+        stream = open(args.output, mode, newline=newline)
+    elif output_format == "parquet":
+        stream = sys.stdout.buffer
+    else:
+        stream = sys.stdout
+    try:
+        writer = ResultWriter(stream, output_format, outputs)
+        _, failed = run_scenarios(
+            scenarios, writer, outputs, args.workers, args.feed_library,
+            progress=None if args.quiet else sys.stderr, total=total
+            )
+    finally:
+        if args.output:
+            stream.close()
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="nasem-dairy",
+        description="Run the NASEM Nutrient Requirements of Dairy Cattle model."
+        )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser(
+        "run", help="Evaluate a batch of scenarios"
+        )
+    run_parser.add_argument(
+        "scenarios", help="Directory of .json scenarios or a .jsonl file"
+        )
+    run_parser.add_argument(
+        "-o", "--output",
+        help="Output file, the format is taken from the extension "
+             "(default: CSV to stdout)"
+        )
+    run_parser.add_argument("--format", choices=OUTPUT_FORMATS)
+    run_parser.add_argument(
+        "--outputs", nargs="+",
+        help="Output variables to write (default: the response variables)"
+        )
+    run_parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)"
+        )
+    run_parser.add_argument(
+        "--feed-library", help="Path to a feed library CSV file"
+        )
+    run_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not report progress"
+        )
+    run_parser.set_defaults(handler=run_command)
+
+    serve_parser = commands.add_parser(
+        "serve", help="Serve model requests from a warm process"
+        )
+    model_server.add_server_arguments(serve_parser)
+    serve_parser.set_defaults(
+        handler=lambda args: model_server.run_server(args) or 0
+        )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
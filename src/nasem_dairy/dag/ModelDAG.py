@@ -92,8 +92,10 @@ class ModelDAG:
         dag (graph_tool.Graph): The Directed Acyclic Graph representing the dependencies of variables.
 
     Methods:
-        __init__(self, path: str = "./src/nasem_dairy/nasem_equations", colour_map: dict = module_colour_map):
+        __init__(self, path: str = "./src/nasem_dairy/nasem_equations", colour_map: dict = module_colour_map, dag_data: Optional[pd.DataFrame] = None):
             Initializes the `ModelDAG` instance by collecting data and creating the DAG.
+            When dag_data is given, e.g. from DependencyTrace.to_dag_data(), it is used
+            instead of parsing the equations.
         
         _get_variable_names(self) -> List[str]:
             Retrieves the variable names needed to build the DAG.
@@ -132,10 +134,15 @@ class ModelDAG:
     def __init__(
         self, 
         path:str = "./src/nasem_dairy/nasem_equations", 
-        colour_map: dict = module_colour_map
+        colour_map: dict = module_colour_map,
+        dag_data: Optional[pd.DataFrame] = None
     ):
         """
         Collect data for DAG and create graph.
+
+        dag_data from nasem_dairy.dag.tracing.DependencyTrace.to_dag_data() 
+        includes the dependencies passed through dictionaries and is used 
+        without running the model or parsing the equations.
         """
         self.aa_list = [
             "Arg", "His", "Ile", "Leu", "Lys", "Met", "Phe", "Thr", "Trp", "Val"
@@ -163,6 +170,12 @@ class ModelDAG:
             self.possible_user_inputs
             )
 
+        if dag_data is not None:
+            self.modules = []
+            self.dag_data = dag_data.copy()
+            self.dag = self._create_dag(self.dag_data)
+            return
+
         variable_names = self._get_variable_names()
         variables = pd.DataFrame(variable_names, columns=["Name"])
 
@@ -0,0 +1,550 @@
+"""Dependency tracing of model runs.
+
+ModelDAG builds its graph by parsing the equation sources, which cannot see
+values that flow through dictionaries such as diet_data, an_data and
+infusion_data. This module records the dependencies while nasem() actually
+runs instead. Inside trace_dependencies(), every `calculate_*` and `get_*`
+function in nasem_equations is wrapped to record which named values each
+call reads, including the keys it reads from dictionary arguments, and which
+values it produces. Values are matched to the names they are stored under in
+nasem() by object identity, so the graph follows the values actually passed
+rather than argument names. Graph-tool is not required.
+
+The mineral requirements are calculated for all minerals at once by
+micronutrient_requirement.calculate_mineral_requirements(). Its outputs are
+recorded as if calculated by their reference functions (e.g. An_Ca_req by
+calculate_An_Ca_req), with the parameters of those functions as 
+dependencies, so the graph has the same nodes as for per-mineral equations.
+
+Only the branches executed by the traced runs are recorded. Tracing several
+scenarios (e.g. a lactating cow, a heifer and a calf) in one block merges
+their graphs.
+
+Classes:
+    DependencyTrace: Traced dependencies of each model variable, in the
+                     format used by ModelDAG.
+
+Functions:
+    trace_dependencies: Context manager that records a DependencyTrace.
+
+Example:
+    with nd.trace_dependencies() as trace:
+        nd.nasem(user_diet, animal_input, equation_selection)
+    trace.save("nasem_dependencies.json")
+
+    trace = nd.DependencyTrace.load("nasem_dependencies.json")
+    dag = nd.ModelDAG(dag_data=trace.to_dag_data())
+"""
+import collections
+import contextlib
+import inspect
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+import nasem_dairy.model.input_definitions as expected
+import nasem_dairy.model.nasem as nasem_module
+import nasem_dairy.nasem_equations.micronutrient_requirement as micro_req
+from nasem_dairy.model.profiling import _equation_functions
+
+# Arguments whose keys are recorded as constants
+CONSTANT_DICTS = ("coeff_dict", "mPrt_coeff", "MP_NP_efficiency_dict")
+# Arguments recorded as a constant by name
+CONSTANT_VALUES = ("f_Imb", "SIDig_values")
+IGNORED_ARGUMENTS = ("aa_list",)
+DAG_DATA_COLUMNS = [
+    "Name", "Module", "Function", "Arguments", "Constants", "Inputs"
+]
+# Functions of the mineral engine, not traced as equations
+MINERAL_ENGINE_FUNCTIONS = (
+    "get_mineral_intakes", "calculate_mineral_requirements"
+)
+
+_tracing_active = False
+
+
+def _user_input_names() -> Set[str]:
+    """Names of all user inputs, as in ModelDAG."""
+    return (
+        set(expected.AnimalInput.__annotations__)
+        | set(expected.EquationSelection.__annotations__)
+        | set(expected.InfusionInput.__annotations__)
+        | set(expected.UserDietSchema)
+        | set(expected.FeedLibrarySchema)
+    )
+
+
+def _trackable(value: Any) -> bool:
+    """
+    Whether a value can be identified by object identity.
+
+    Small integers, strings, booleans and None are shared objects in Python,
+    so the same object can hold unrelated values.
+    """
+    if isinstance(value, np.bool_):
+        return False
+    return isinstance(
+        value, (float, np.generic, np.ndarray, pd.Series, pd.DataFrame)
+        )
+
+
+class _RecordingDict(dict):
+    """Copy of a dictionary argument that records reads and writes."""
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self.reads: List[Tuple[str, Any]] = []
+        self.written: List[str] = []
+
+    def _record(self, key: Any, value: Any) -> None:
+        # Reading back a value written in the same call is not a dependency
+        if isinstance(key, str) and key not in self.written:
+            self.reads.append((key, value))
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        self._record(key, value)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key not in self.written:
+            self.written.append(key)
+        super().__setitem__(key, value)
+
+    def _record_all(self) -> None:
+        for key, value in super().items():
+            self._record(key, value)
+
+    def items(self):
+        self._record_all()
+        return super().items()
+
+    def values(self):
+        self._record_all()
+        return super().values()
+
+    def copy(self) -> dict:
+        self._record_all()
+        return dict(self)
+
+
+class _Call:
+    """A traced function call and the values it read."""
+    def __init__(self, module: str, function: str):
+        self.module = module
+        self.function = function
+        self.reads: List[Tuple[str, Any]] = []
+        self.constants: List[str] = []
+
+
+class _Node:
+    """A value produced by a traced call."""
+    def __init__(self, call: _Call, index: int, name: str, value: Any):
+        self.call = call
+        self.index = index
+        self.name = name
+        self.value = value
+        self.hints: List[str] = []
+
+
+class _TraceState:
+    """Calls and values of the run being traced."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls: List[_Call] = []
+        self.nodes: List[_Node] = []
+        self.node_by_id: Dict[int, _Node] = {}
+
+    def add_node(
+        self,
+        call: _Call,
+        name: str,
+        value: Any,
+        hint: Optional[str] = None
+    ) -> None:
+        node = _Node(call, len(self.nodes), name, value)
+        if hint is not None:
+            node.hints.append(hint)
+        self.nodes.append(node)
+        # The first producer of an object keeps it, e.g. when a function
+        # returns one of its arguments unchanged
+        if _trackable(value):
+            self.node_by_id.setdefault(id(value), node)
+
+
+class DependencyTrace:
+    """
+    Traced dependencies of each model variable.
+
+    Parameters
+    ----------
+    variables : Dict[str, Dict[str, Any]], optional
+        Entries by variable name, each with the Module and Function that
+        calculate the variable and the Arguments (other variables),
+        Constants and Inputs it depends on.
+
+    Attributes
+    ----------
+    variables : Dict[str, Dict[str, Any]]
+        Entries by variable name.
+    user_inputs : Set[str]
+        Names classified as user inputs rather than calculated variables.
+
+    Examples
+    --------
+    >>> with trace_dependencies() as trace:
+    ...     output = nasem(user_diet, animal_input, equation_selection)
+    >>> trace.dependencies("An_CPIn")
+    ['Dt_CPIn', 'Inf_CPIn']
+    >>> dag = ModelDAG(dag_data=trace.to_dag_data())
+    """
+    def __init__(self, variables: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.variables = variables if variables is not None else {}
+        self.user_inputs = _user_input_names()
+
+    def __len__(self) -> int:
+        return len(self.variables)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.variables
+
+    def __repr__(self) -> str:
+        return f"DependencyTrace({len(self)} variables)"
+
+    def dependencies(self, name: str) -> List[str]:
+        """
+        Direct dependencies of a variable.
+
+        Parameters
+        ----------
+        name : str
+            Variable name.
+
+        Returns
+        -------
+        List[str]
+            Arguments, Constants and Inputs of the variable.
+
+        Raises
+        ------
+        KeyError
+            If name was not produced in the traced runs.
+        """
+        entry = self.variables[name]
+        return entry["Arguments"] + entry["Constants"] + entry["Inputs"]
+
+    def to_dag_data(self) -> pd.DataFrame:
+        """
+        Dependencies in the format of ModelDAG.dag_data.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per variable with the columns Name, Module, Function,
+            Arguments, Constants and Inputs.
+        """
+        return pd.DataFrame(
+            [
+                {"Name": name, **{
+                    column: (list(entry[column])
+                             if isinstance(entry[column], list)
+                             else entry[column])
+                    for column in DAG_DATA_COLUMNS[1:]
+                }}
+                for name, entry in self.variables.items()
+            ],
+            columns=DAG_DATA_COLUMNS
+            )
+
+    def save(self, path: str) -> None:
+        """
+        Save the trace as JSON.
+
+        Parameters
+        ----------
+        path : str
+            Output file path.
+        """
+        with open(path, "w") as file:
+            json.dump(self.variables, file, indent=1)
+
+    @classmethod
+    def load(cls, path: str) -> "DependencyTrace":
+        """
+        Load a trace saved with save().
+
+        Parameters
+        ----------
+        path : str
+            Path to the JSON file.
+
+        Returns
+        -------
+        DependencyTrace
+            The loaded trace.
+        """
+        with open(path) as file:
+            return cls(json.load(file))
+
+    def _add(self, name: str, call: _Call) -> Dict[str, Any]:
+        return self.variables.setdefault(name, {
+            "Module": call.module,
+            "Function": call.function,
+            "Arguments": [],
+            "Constants": [],
+            "Inputs": []
+        })
+
+    def _add_run(self, state: _TraceState, locals_input: Dict[str, Any]) -> None:
+        """Name the values produced in a run and record their dependencies."""
+        # Names that nasem() stores values under, including dictionary keys
+        local_names = collections.defaultdict(list)
+        for mapping in (
+            [value for value in locals_input.values() if isinstance(value, dict)]
+            + [locals_input]
+        ):
+            for name, value in mapping.items():
+                if isinstance(name, str) and _trackable(value):
+                    local_names[id(value)].append(name)
+
+        for node in state.nodes:
+            candidates = node.hints + local_names.get(id(node.value), [])
+            if candidates and node.name not in candidates:
+                node.name = candidates[0]
+
+        def resolve(name: str, value: Any) -> Tuple[str, bool]:
+            """Name of a value that was read and if it was calculated."""
+            if _trackable(value):
+                node = state.node_by_id.get(id(value))
+                if node is not None:
+                    return node.name, True
+                names = local_names.get(id(value), [])
+                if names and name not in names:
+                    return names[0], False
+            return name, False
+
+        for node in state.nodes:
+            entry = self._add(node.name, node.call)
+            for read_name, value in node.call.reads:
+                name, calculated = resolve(read_name, value)
+                if name == node.name:
+                    continue
+                if not calculated and name in self.user_inputs:
+                    column = "Inputs"
+                else:
+                    column = "Arguments"
+                    if name in entry["Inputs"]:
+                        entry["Inputs"].remove(name)
+                if name not in entry["Arguments"] + entry[column]:
+                    entry[column].append(name)
+            for constant in node.call.constants:
+                if constant not in entry["Constants"]:
+                    entry["Constants"].append(constant)
+
+
+def _traced(
+    function: Callable,
+    module: str,
+    name: str,
+    state: _TraceState
+) -> Callable:
+    """Wrap function so its reads and results are recorded in state."""
+    signature = inspect.signature(function)
+    # calculate_X returns X, and calculate_X_array the array of X by amino acid
+    tentative_name = name.split("_", 1)[1]
+    if tentative_name.endswith("_array"):
+        tentative_name = tentative_name[:-len("_array")]
+
+    def wrapper(*args, **kwargs) -> Any:
+        bound = signature.bind(*args, **kwargs)
+        call = _Call(module, name)
+        recorders = []
+        for argument, value in bound.arguments.items():
+            if argument in IGNORED_ARGUMENTS:
+                continue
+            if argument in CONSTANT_VALUES:
+                call.constants.append(argument)
+            elif isinstance(value, dict):
+                recorder = _RecordingDict(value)
+                bound.arguments[argument] = recorder
+                recorders.append((argument in CONSTANT_DICTS, value, recorder))
+            else:
+                call.reads.append((argument, value))
+        state.calls.append(call)
+        first_node = len(state.nodes)
+
+        result = function(*bound.args, **bound.kwargs)
+
+        produced = []
+        for is_constant, original, recorder in recorders:
+            if is_constant:
+                call.constants.extend(
+                    key for key, _ in recorder.reads
+                    if key not in call.constants
+                    )
+            else:
+                call.reads.extend(recorder.reads)
+            # Changes to a dictionary argument are made to the original
+            for key in recorder.written:
+                value = dict.__getitem__(recorder, key)
+                original[key] = value
+                produced.append((key, value))
+            if result is recorder:
+                result = original
+
+        if isinstance(result, dict):
+            if not any(result is original for _, original, _ in recorders):
+                produced.extend(result.items())
+        elif result is not None:
+            state.add_node(call, tentative_name, result)
+
+        read_values = dict(call.reads)
+        for key, value in produced:
+            if not isinstance(key, str):
+                continue
+            # Values copied from a dictionary argument are not new values
+            if key in read_values and (
+                read_values[key] is value or not _trackable(value)
+            ):
+                continue
+            node = state.node_by_id.get(id(value)) if _trackable(value) else None
+            if node is not None and node.index >= first_node:
+                node.hints.append(key)  # Calculated by a nested call
+            else:
+                state.add_node(call, key, value, hint=key)
+        return result
+
+    return wrapper
+
+
+def _traced_mineral_outputs(
+    function: Callable,
+    references: Dict[str, Tuple[str, str, List[str]]],
+    state: _TraceState
+) -> Callable:
+    """
+    Wrap get_mineral_outputs() so each output is recorded as calculated by
+    its reference function.
+
+    Args:
+        function: get_mineral_outputs().
+        references: Module, function and parameter names of the reference
+            function of each output.
+        state: Where calls and values are recorded.
+    """
+    def wrapper(*args, **kwargs) -> Any:
+        outputs = function(*args, **kwargs)
+        for name, value in outputs.items():
+            module, function_name, parameters = references.get(
+                name, ("micronutrient_requirement", "get_mineral_outputs", [])
+                )
+            call = _Call(module, function_name)
+            # Parameters of the reference functions are variable names
+            call.reads.extend((parameter, None) for parameter in parameters)
+            state.calls.append(call)
+            state.add_node(call, name, value, hint=name)
+        return outputs
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def trace_dependencies(
+    trace: Optional[DependencyTrace] = None
+) -> Iterator[DependencyTrace]:
+    """
+    Record the dependencies between model variables during nasem() runs.
+
+    All `calculate_*` and `get_*` functions in nasem_equations are wrapped
+    for the duration of the block. The values produced in each run are named
+    when nasem() creates its ModelOutput. Values of the coefficient-only
+    equations are not reused from earlier runs while tracing, so their
+    equations are recorded as well. Tracing is not thread-safe and cannot be
+    nested.
+
+    Parameters
+    ----------
+    trace : DependencyTrace, optional
+        Existing trace to add to, by default a new trace.
+
+    Yields
+    ------
+    DependencyTrace
+        The trace, complete when the block exits.
+
+    Raises
+    ------
+    RuntimeError
+        If tracing is already active.
+    """
+    global _tracing_active
+    if _tracing_active:
+        raise RuntimeError("trace_dependencies() is already active")
+
+    trace = trace if trace is not None else DependencyTrace()
+    state = _TraceState()
+    originals = []
+    _tracing_active = True
+
+    def finish_run(locals_input: Dict[str, Any]) -> None:
+        trace._add_run(state, locals_input)
+        state.reset()
+
+    try:
+        references = {}
+        for module, name, function in _equation_functions(
+            ("calculate_", "get_")
+        ):
+            module_name = module.__name__.rsplit(".", 1)[-1]
+            if module is micro_req and name in MINERAL_ENGINE_FUNCTIONS:
+                continue
+            if module is micro_req and name == "get_mineral_outputs":
+                mineral_outputs = function
+                continue
+            if name.startswith("calculate_"):
+                references[name[len("calculate_"):]] = (
+                    module_name, name, 
+                    list(inspect.signature(function).parameters)
+                    )
+            originals.append((module, name, function))
+            setattr(module, name, _traced(function, module_name, name, state))
+
+        originals.append((micro_req, "get_mineral_outputs", mineral_outputs))
+        micro_req.get_mineral_outputs = _traced_mineral_outputs(
+            mineral_outputs, references, state
+            )
+
+        model_output = nasem_module.ModelOutput
+
+        def create_output(*args, **kwargs):
+            locals_input = kwargs.get("locals_input", args[0] if args else {})
+            finish_run(locals_input)
+            return model_output(*args, **kwargs)
+
+        originals.append((nasem_module, "ModelOutput", model_output))
+        nasem_module.ModelOutput = create_output
+        # Run the coefficient-only equations every time
+        originals.append((
+            nasem_module, "_INPUT_VALUES_CACHE",
+            nasem_module._INPUT_VALUES_CACHE
+            ))
+        originals.append((
+            nasem_module, "_INPUT_VALUES_CACHE_SIZE",
+            nasem_module._INPUT_VALUES_CACHE_SIZE
+            ))
+        nasem_module._INPUT_VALUES_CACHE = collections.OrderedDict()
+        nasem_module._INPUT_VALUES_CACHE_SIZE = 0
+        yield trace
+        finish_run({})
+    finally:
+        for module, name, function in originals:
+            setattr(module, name, function)
+        _tracing_active = False
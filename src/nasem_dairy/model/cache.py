@@ -0,0 +1,273 @@
+"""On-disk cache of model results.
+
+Results are stored under a hash of everything that determines the output of
+nasem(): the validated inputs, the feed library rows used by the diet, all
+coefficients and the package version. Repeated scenarios are then loaded from
+disk instead of running the model again. The least recently used entries are
+removed when the cache grows beyond its size limit.
+
+Classes:
+    ResultCache: Content-addressed store of ModelOutput objects or selected
+                 output values.
+"""
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from importlib.metadata import version
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+import nasem_dairy.model.input_validation as validate
+from nasem_dairy.model.nasem import nasem
+from nasem_dairy.model_output.ModelOutput import CustomJSONEncoder, ModelOutput
+
+
+@functools.lru_cache(maxsize=None)
+def _package_version() -> str:
+    return version("nasem_dairy")
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache for nasem() results.
+
+    Parameters
+    ----------
+    directory : str
+        Directory for cache files. Created if it does not exist.
+    max_size : int, optional
+        Maximum total size of the cache files in bytes, by default 1 GB.
+        Least recently used entries are removed when it is exceeded.
+
+    Attributes
+    ----------
+    hits : int
+        Number of results loaded from the cache.
+    misses : int
+        Number of results that had to be calculated.
+
+    Examples
+    --------
+    >>> cache = ResultCache("~/.cache/nasem_dairy")
+    >>> output = cache.run(user_diet, animal_input, equation_selection)
+    >>> # The same inputs are now loaded from disk
+    >>> output = cache.run(user_diet, animal_input, equation_selection)
+    >>> values = cache.run(inputs, outputs=["Mlk_Prod", "An_MPBal_g_Trg"])
+    """
+    def __init__(self, directory: str, max_size: int = 1024**3):
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Running total of the cache size, read from disk on the first put()
+        self._size: Optional[int] = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        inputs: validate.ValidatedInputs,
+        outputs: Optional[List[str]] = None
+    ) -> str:
+        """
+        Hash of the canonicalized inputs.
+
+        Parameters
+        ----------
+        inputs : ValidatedInputs
+            Inputs returned by prepare().
+        outputs : List[str], optional
+            Names of selected outputs, for entries that store only those.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-256 digest.
+        """
+        digest = hashlib.sha256()
+
+        def add_json(value: Any) -> None:
+            digest.update(json.dumps(
+                value, sort_keys=True, cls=CustomJSONEncoder
+                ).encode())
+
+        def add_pandas(value: Union[pd.DataFrame, pd.Series]) -> None:
+            if isinstance(value, pd.DataFrame):
+                add_json(list(value.columns))
+            else:
+                add_json([value.name])
+            digest.update(
+                pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes()
+                )
+
+        add_json(_package_version())
+        add_pandas(inputs.user_diet.reset_index(drop=True))
+        # Only the rows of the feed library used by the diet affect the result
+        feed_names = inputs.feed_library["Fd_Name"].str.strip()
+        used_feeds = inputs.feed_library.loc[
+            feed_names.isin(inputs.user_diet["Feedstuff"])
+            ]
+        add_pandas(used_feeds.sort_values("Fd_Name").reset_index(drop=True))
+        for value in (
+            inputs.animal_input, inputs.equation_selection, inputs.coeff_dict,
+            inputs.infusion_input, inputs.MP_NP_efficiency,
+            inputs.mPrt_coeff_list, outputs
+        ):
+            add_json(value)
+        add_pandas(inputs.f_Imb)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pkl")
+
+    def get(self, key: str) -> Any:
+        """
+        Load a cached result.
+
+        Parameters
+        ----------
+        key : str
+            Key from ResultCache.key().
+
+        Returns
+        -------
+        Any
+            The cached result, or None if there is no entry for key or it 
+            cannot be loaded.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                result = pickle.load(file)
+        except Exception:
+            # Besides missing or partial files, unpickling raises e.g. 
+            # AttributeError or ImportError for entries written by other code
+            return None
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            pass  # Evicted by another process
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a result and remove least recently used entries if needed.
+
+        The file is written to a temporary name first, so readers in other
+        processes never see a partial entry. The size of the cache is kept 
+        as a running total, so the directory is only scanned when entries 
+        have to be removed.
+
+        Parameters
+        ----------
+        key : str
+            Key from ResultCache.key().
+        result : Any
+            A picklable result, e.g. a ModelOutput.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            replaced_size = os.stat(path).st_size
+        except FileNotFoundError:
+            replaced_size = 0
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=".tmp"
+            )
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            entry_size = file.tell()
+        os.replace(temporary_path, path)
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += entry_size - replaced_size
+        if self._size > self.max_size:
+            self.evict()
+
+    def _entries(self) -> List[os.DirEntry]:
+        entries = []
+        for subdirectory in os.scandir(self.directory):
+            if subdirectory.is_dir():
+                entries.extend(
+                    entry for entry in os.scandir(subdirectory.path)
+                    if entry.name.endswith(".pkl")
+                    )
+        return entries
+
+    def size(self) -> int:
+        """Total size of the cache files in bytes."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_size."""
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry, entry.stat()))
+            except FileNotFoundError:
+                pass  # Removed by another process
+        # Also picks up entries written by other processes
+        total_size = sum(stat.st_size for _, stat in entries)
+        if total_size > self.max_size:
+            for entry, stat in sorted(
+                entries, key=lambda item: item[1].st_mtime
+            ):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+                total_size -= stat.st_size
+                if total_size <= self.max_size:
+                    break
+        self._size = total_size
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for entry in self._entries():
+            os.remove(entry.path)
+        self._size = 0
+
+    def run(
+        self,
+        user_diet: Union[pd.DataFrame, validate.ValidatedInputs],
+        *args,
+        outputs: Optional[List[str]] = None,
+        **kwargs
+    ) -> Union[ModelOutput, Dict[str, Any]]:
+        """
+        Run nasem(), or load the result if these inputs were run before.
+
+        Parameters
+        ----------
+        user_diet : pd.DataFrame or ValidatedInputs
+            The first argument of nasem().
+        *args, **kwargs
+            The remaining arguments of nasem(), ignored for ValidatedInputs.
+        outputs : List[str], optional
+            Store and return only these output values as a dictionary, which
+            is much smaller and faster to load than a full ModelOutput.
+
+        Returns
+        -------
+        ModelOutput or Dict[str, Any]
+            The model output, or the selected output values.
+        """
+        if isinstance(user_diet, validate.ValidatedInputs):
+            inputs = user_diet
+        else:
+            inputs = validate.prepare(user_diet, *args, **kwargs)
+        key = self.key(inputs, outputs)
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = nasem(inputs)
+        if outputs is not None:
+            result = result.get_values(outputs)
+        self.put(key, result)
+        return result
@@ -0,0 +1,280 @@
+"""Least-cost ration formulation with the NASEM model.
+
+This module finds the cheapest combination of feeds that meets constraints
+on model outputs. Diet intakes from nutrient_intakes.DIET_MATRIX_COLUMNS are
+linear in the feed amounts and are used directly as linear programming rows.
+All other outputs (e.g. An_MPBal_g_Trg, An_NEbal) are nonlinear, so they are
+linearized around the current diet with finite differences from nasem()
+runs and the linear program is solved repeatedly inside a trust region
+(successive linear programming).
+
+Functions:
+    formulate_diet: Finds the least-cost kg_user for a set of feeds, feed
+                    prices, inclusion limits and output constraints.
+"""
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import linprog
+
+import nasem_dairy.data.constants as constants
+import nasem_dairy.nasem_equations.nutrient_intakes as diet
+from nasem_dairy.model.nasem import nasem
+from nasem_dairy.model.utility import evaluate_diets, select_feeds
+from nasem_dairy.model_output.ModelOutput import ModelOutput
+
+
+def _evaluate_outputs(
+    kg_user: np.ndarray,
+    feeds: List[str],
+    output_names: List[str],
+    animal_input: dict,
+    equation_selection: dict,
+    feed_library: pd.DataFrame,
+    coeff_dict: dict,
+    infusion_input: dict
+) -> Tuple[np.ndarray, ModelOutput]:
+    user_diet = pd.DataFrame({"Feedstuff": feeds, "kg_user": kg_user})
+    model_output = nasem(
+        user_diet, animal_input, equation_selection, feed_library,
+        coeff_dict=coeff_dict, infusion_input=infusion_input
+        )
+    values = []
+    for name in output_names:
+        value = model_output.get_value(name)
+        if value is None:
+            raise KeyError(f"{name} is not a model output")
+        values.append(value)
+    return np.array(values, dtype=float), model_output
+
+
+def _constraint_violation(
+    values: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray
+) -> float:
+    if values.size == 0:
+        return 0.0
+    return float(np.maximum(np.maximum(lower - values, values - upper), 0).sum())
+
+
+def formulate_diet(
+    feed_prices: Dict[str, float],
+    constraints: Dict[str, Tuple[Optional[float], Optional[float]]],
+    animal_input: dict,
+    equation_selection: dict,
+    inclusion_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+    feed_library: Optional[pd.DataFrame] = None,
+    coeff_dict: dict = constants.coeff_dict,
+    infusion_input: dict = constants.infusion_dict,
+    max_iterations: int = 30,
+    tolerance: float = 1e-3
+) -> Tuple[pd.DataFrame, ModelOutput]:
+    """
+    Finds the least-cost diet that meets constraints on model outputs.
+
+    The total amount of feed is fixed at animal_input["Trg_Dt_DMIn"] kg DM.
+    Constraints on diet intakes in nutrient_intakes.DIET_MATRIX_COLUMNS are
+    exact linear constraints when DMIn_eqn is 0. Constraints on any other
+    model output are linearized from nasem() runs around the current diet,
+    and the linear program is re-solved within a shrinking trust region until
+    the diet stops changing.
+
+    Args:
+        feed_prices (Dict[str, float]): Price per kg DM for each feed that may
+            be used. The keys define the feeds in the ration.
+        constraints (Dict[str, Tuple[Optional[float], Optional[float]]]):
+            Lower and upper bound for model outputs, by name. Use None for an
+            open bound, e.g. {"An_MPBal_g_Trg": (0, None),
+            "Dt_NDF": (28, 35), "Dt_St": (None, 28)}.
+        animal_input (dict): The animal input data.
+        equation_selection (dict): The equation selection data.
+        inclusion_limits (Dict[str, Tuple[float, float]], optional): Minimum
+            and maximum kg DM of each feed. Feeds that are not listed can be
+            used from 0 up to the total DMI.
+        feed_library (pd.DataFrame, optional): Feed library to use. Defaults
+            to the NASEM feed library.
+        coeff_dict (dict, optional): Model coefficients.
+        infusion_input (dict, optional): Infusion inputs.
+        max_iterations (int, optional): Maximum number of linear programs to
+            solve. Defaults to 30.
+        tolerance (float, optional): Largest change in kg DM of any feed
+            between iterations at which the search stops. Defaults to 1e-3.
+
+    Returns:
+        Tuple[pd.DataFrame, ModelOutput]: The least-cost diet as a user_diet
+        DataFrame (Feedstuff, kg_user) and the model output for that diet.
+
+    Raises:
+        ValueError: If the feed amounts or linear constraints cannot be met.
+        KeyError: If a constraint is not a model output.
+
+    Example:
+        ```python
+        user_diet, animal_input, equation_selection, _ = nd.demo(
+            "lactating_cow_test"
+            )
+        prices = dict.fromkeys(user_diet["Feedstuff"], 0.3)
+        diet, output = formulate_diet(
+            prices, {"An_MPBal_g_Trg": (0, None), "Dt_NDF": (28, 40)},
+            animal_input, equation_selection
+            )
+        ```
+    """
+    feeds = list(feed_prices)
+    feed_count = len(feeds)
+    cost = np.array([feed_prices[feed] for feed in feeds], dtype=float)
+    Dt_DMIn = float(animal_input["Trg_Dt_DMIn"])
+    if feed_library is None:
+        feed_library = select_feeds(feeds)
+
+    inclusion_limits = inclusion_limits or {}
+    kg_lower = np.array(
+        [inclusion_limits.get(feed, (0, Dt_DMIn))[0] for feed in feeds],
+        dtype=float
+        )
+    kg_upper = np.array(
+        [inclusion_limits.get(feed, (0, Dt_DMIn))[1] for feed in feeds],
+        dtype=float
+        )
+    if kg_lower.sum() > Dt_DMIn or kg_upper.sum() < Dt_DMIn:
+        raise ValueError(
+            f"Inclusion limits cannot add up to Trg_Dt_DMIn of {Dt_DMIn} kg"
+            )
+
+    # Diet intakes are linear in kg_user for a fixed Dt_DMIn
+    if equation_selection["DMIn_eqn"] == 0:
+        linear_names = [
+            name for name in constraints if name in diet.DIET_MATRIX_COLUMNS
+            ]
+    else:
+        linear_names = []
+    model_names = [name for name in constraints if name not in linear_names]
+    model_lower = np.array(
+        [-np.inf if constraints[name][0] is None else constraints[name][0]
+         for name in model_names], dtype=float
+        )
+    model_upper = np.array(
+        [np.inf if constraints[name][1] is None else constraints[name][1]
+         for name in model_names], dtype=float
+        )
+
+    A_ub = [np.zeros((0, feed_count))]
+    b_ub = [np.zeros(0)]
+    if linear_names:
+        # Value of each intake for a diet of only one feed, per kg DM
+        single_feed_diets = evaluate_diets(
+            pd.DataFrame(np.eye(feed_count) * Dt_DMIn, columns=feeds),
+            animal_input["An_StatePhys"], feed_library, Dt_DMIn,
+            equation_selection["Use_DNDF_IV"], coeff_dict
+            )
+        linear_matrix = single_feed_diets[linear_names].to_numpy().T / Dt_DMIn
+        for row, name in zip(linear_matrix, linear_names):
+            lower, upper = constraints[name]
+            if lower is not None:
+                A_ub.append(-row[np.newaxis, :])
+                b_ub.append(np.array([-lower]))
+            if upper is not None:
+                A_ub.append(row[np.newaxis, :])
+                b_ub.append(np.array([upper]))
+    A_ub = np.vstack(A_ub)
+    b_ub = np.concatenate(b_ub)
+    A_eq = np.ones((1, feed_count))
+    b_eq = np.array([Dt_DMIn])
+
+    # Start from the least-cost diet that meets the linear constraints
+    result = linprog(
+        cost, A_ub=A_ub if len(b_ub) else None, b_ub=b_ub if len(b_ub) else None,
+        A_eq=A_eq, b_eq=b_eq, bounds=list(zip(kg_lower, kg_upper)),
+        method="highs"
+        )
+    if not result.success:
+        raise ValueError(
+            f"No diet meets the inclusion limits and diet constraints: "
+            f"{result.message}"
+            )
+    kg_user = result.x
+    model_args = (
+        feeds, model_names, animal_input, equation_selection, feed_library,
+        coeff_dict, infusion_input
+        )
+    values, model_output = _evaluate_outputs(kg_user, *model_args)
+    if not model_names:
+        return pd.DataFrame({"Feedstuff": feeds, "kg_user": kg_user}), model_output
+
+    # Violations of the nonlinear constraints are penalized well above the
+    # cost of any feed so the linear program always has a solution
+    penalty = 1e3 * max(np.abs(cost).max(), 1.0)
+    step = 1e-3 * Dt_DMIn
+    trust_radius = 0.25 * Dt_DMIn
+    merit = cost @ kg_user + penalty * _constraint_violation(
+        values, model_lower, model_upper
+        )
+    finite_lower = np.isfinite(model_lower)
+    finite_upper = np.isfinite(model_upper)
+    slack_count = finite_lower.sum() + finite_upper.sum()
+
+    for _ in range(max_iterations):
+        # Forward difference Jacobian of the nonlinear outputs
+        jacobian = np.empty((len(model_names), feed_count))
+        for feed_index in range(feed_count):
+            perturbed = kg_user.copy()
+            perturbed[feed_index] += step
+            perturbed_values, _ = _evaluate_outputs(perturbed, *model_args)
+            jacobian[:, feed_index] = (perturbed_values - values) / step
+
+        # lower <= values + J (x - kg_user) <= upper, with slack variables
+        offset = values - jacobian @ kg_user
+        rows = np.vstack([-jacobian[finite_lower], jacobian[finite_upper]])
+        bounds_rhs = np.concatenate([
+            offset[finite_lower] - model_lower[finite_lower],
+            model_upper[finite_upper] - offset[finite_upper]
+            ])
+        A_ub_step = np.vstack([
+            np.hstack([A_ub, np.zeros((A_ub.shape[0], slack_count))]),
+            np.hstack([rows, -np.eye(slack_count)])
+            ])
+        b_ub_step = np.concatenate([b_ub, bounds_rhs])
+        A_eq_step = np.hstack([A_eq, np.zeros((1, slack_count))])
+        c_step = np.concatenate([cost, np.full(slack_count, penalty)])
+
+        while True:
+            bounds = list(zip(
+                np.maximum(kg_lower, kg_user - trust_radius),
+                np.minimum(kg_upper, kg_user + trust_radius)
+                )) + [(0, None)] * slack_count
+            result = linprog(
+                c_step, A_ub=A_ub_step, b_ub=b_ub_step, A_eq=A_eq_step,
+                b_eq=b_eq, bounds=bounds, method="highs"
+                )
+            if not result.success:
+                raise ValueError(
+                    f"Linear program failed during formulation: {result.message}"
+                    )
+            candidate = result.x[:feed_count]
+            candidate_values, candidate_output = _evaluate_outputs(
+                candidate, *model_args
+                )
+            candidate_merit = cost @ candidate + penalty * _constraint_violation(
+                candidate_values, model_lower, model_upper
+                )
+            change = np.abs(candidate - kg_user).max()
+            if candidate_merit <= merit + 1e-9 or change <= tolerance:
+                break
+            trust_radius /= 2
+
+        kg_user, values, model_output = candidate, candidate_values, candidate_output
+        merit = candidate_merit
+        if change <= tolerance:
+            break
+
+    violation = _constraint_violation(values, model_lower, model_upper)
+    if violation > tolerance:
+        warnings.warn(
+            f"Least-cost diet does not meet all constraints (total violation "
+            f"{violation:.4g})"
+            )
+    user_diet = pd.DataFrame({"Feedstuff": feeds, "kg_user": kg_user})
+    return user_diet, model_output
@@ -16,13 +16,29 @@ Functions:
     validate_MP_NP_efficiency_input: Validates the MP/NP efficiency input dictionary.
     validate_mPrt_coeff_list: Validates a list of mPrt coefficient dictionaries.
     validate_f_Imb: Validates the structure and content of the f_Imb pandas Series.
+    prepare: Validates all inputs to nasem() once and returns ValidatedInputs.
+    compile_schema: Builds per-field converters from a schema in 
+                    `input_definitions.py`.
+    validate_table: Validates a DataFrame column-wise against a compiled schema.
+    validate_herd_table: Validates a table of animal inputs, one row per animal.
+
+Classes:
+    ValidatedInputs: Inputs that nasem() accepts without validating again.
+    CompiledSchema: Per-field converters for one schema.
+    InputTableError: Lists every invalid row of an input table.
 """
 
-from typing import Any, Type, Union, List, Dict, Literal, get_args
+import importlib.resources
+from typing import (
+    Any, Callable, Type, Union, List, Dict, Literal, Mapping, NamedTuple, 
+    Optional, Tuple, get_args
+    )
 
+import numpy as np
 import pandas as pd
 
 import nasem_dairy as nd
+import nasem_dairy.data.constants as constants
 import nasem_dairy.model.input_definitions as expected
 
 
@@ -143,6 +159,327 @@ def check_value_is_valid(
         raise ValueError(f"{value_name} must be one of {valid_values}, "
                          f"{input_value} was given")
 
+# Compiled Schemas
+class CompiledSchema(NamedTuple):
+    """
+    Converters built once from a schema by compile_schema().
+
+    converters convert and check a single value, column_converters do the 
+    same for a pd.Series and return the converted column with a mask of the 
+    rows that failed. required is the set of keys that must be present and 
+    descriptions say what each key must contain, for error messages.
+    """
+    converters: Dict[str, Callable[[Any], Any]]
+    column_converters: Dict[
+        str, Callable[[pd.Series], Tuple[pd.Series, np.ndarray]]
+        ]
+    required: frozenset
+    descriptions: Dict[str, str]
+
+    def convert(self, input_dict: dict) -> dict:
+        """Checks and converts the schema keys in input_dict, see 
+        check_and_convert_type().
+        """
+        return {
+            key: convert(input_dict[key]) 
+            for key, convert in self.converters.items() if key in input_dict
+            }
+
+    def check_keys(self, input_keys) -> None:
+        """Raises KeyError if any required keys are missing."""
+        missing_keys = set(self.required.difference(input_keys))
+        if missing_keys:
+            raise KeyError(f"The following keys are missing: {missing_keys}")
+
+
+def _type_error(key: str, type_name: str, value: Any) -> TypeError:
+    return TypeError(
+        f"Value for {key} must be of type {type_name}. Got "
+        f"{type(value).__name__} instead and failed to convert."
+        )
+
+
+def _convert_value(value: Any, valid_type: Type) -> Any:
+    """Converts one value, with the same rules for inputs and table columns.
+
+    Raises ValueError, TypeError or OverflowError if value cannot be 
+    converted. Missing values are not converted to str, so NaN never becomes 
+    "nan".
+    """
+    if isinstance(value, valid_type):
+        return value
+    if valid_type is str and pd.api.types.is_scalar(value) and pd.isna(value):
+        raise TypeError("Missing values cannot be converted to str")
+    return valid_type(value)
+
+
+def _compile_converter(key: str, expected_type: Type) -> Callable[[Any], Any]:
+    if getattr(expected_type, "__origin__", None) is Literal:
+        valid_values = get_args(expected_type)
+        valid_set = frozenset(valid_values)
+        valid_type = type(valid_values[0])
+    else:
+        valid_values = None
+        valid_type = expected_type
+    type_name = valid_type.__name__
+
+    def convert(value: Any) -> Any:
+        try:
+            converted = _convert_value(value, valid_type)
+        except (ValueError, TypeError, OverflowError) as e:
+            raise _type_error(key, type_name, value) from e
+        if valid_values is not None and converted not in valid_set:
+            raise ValueError(
+                f"{key} must be one of {valid_values}, {converted} was given"
+                )
+        return converted
+
+    return convert
+
+
+def _compile_column_converter(
+    expected_type: Type
+) -> Callable[[pd.Series], Tuple[pd.Series, np.ndarray]]:
+    if getattr(expected_type, "__origin__", None) is Literal:
+        valid_values = list(get_args(expected_type))
+        valid_type = type(valid_values[0])
+    else:
+        valid_values = None
+        valid_type = expected_type
+
+    def convert_values(column: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+        values = column.tolist()
+        invalid = np.zeros(len(values), dtype=bool)
+        for position, value in enumerate(values):
+            try:
+                values[position] = _convert_value(value, valid_type)
+            except (ValueError, TypeError, OverflowError):
+                invalid[position] = True
+        return pd.Series(values, index=column.index, name=column.name), invalid
+
+    def convert_column(column: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+        # Bool, integer and float columns are converted at once, with the 
+        # same results as converting each value. Others go value by value.
+        kind = column.dtype.kind if isinstance(column.dtype, np.dtype) else ""
+        if valid_type in (int, float) and kind in ("b", "i", "u"):
+            converted = column.astype(valid_type)
+            invalid = np.zeros(len(column), dtype=bool)
+        elif valid_type is float and kind == "f":
+            converted = column.astype(float)
+            invalid = np.zeros(len(column), dtype=bool)
+        elif valid_type is int and kind == "f":
+            # int() truncates and cannot convert NaN or inf
+            invalid = ~np.isfinite(column.to_numpy())
+            converted = column
+            if not invalid.any():
+                converted = np.trunc(column).astype(int)
+        else:
+            converted, invalid = convert_values(column)
+        if valid_values is not None:
+            invalid = invalid | ~converted.isin(valid_values).to_numpy()
+        return converted, invalid
+
+    return convert_column
+
+
+def _describe_type(expected_type: Type) -> str:
+    if getattr(expected_type, "__origin__", None) is Literal:
+        return f"must be one of {get_args(expected_type)}"
+    return f"must be of type {expected_type.__name__}"
+
+
+def compile_schema(
+    schema: Union[Type, Mapping[str, Type]],
+    optional: frozenset = frozenset()
+) -> CompiledSchema:
+    """
+    Builds converters for every field of a schema.
+
+    The TypedDict annotations are read once and each field gets a converter 
+    that holds its expected type and, for Literal fields, a frozenset of the 
+    valid values. Validating an input is then a loop over these converters.
+
+    Args:
+        schema: A TypedDict class or a dictionary mapping keys to types, as 
+                defined in `input_definitions.py`.
+        optional: Keys that are not always required.
+
+    Returns:
+        The compiled schema.
+
+    Example:
+        ```python
+        compiled = compile_schema(expected.EquationSelection)
+        compiled.check_keys(equation_selection)
+        equation_selection = compiled.convert(equation_selection)
+        ```
+    """
+    type_mapping = getattr(schema, "__annotations__", schema)
+    return CompiledSchema(
+        converters={
+            key: _compile_converter(key, expected_type) 
+            for key, expected_type in type_mapping.items()
+            },
+        column_converters={
+            key: _compile_column_converter(expected_type) 
+            for key, expected_type in type_mapping.items()
+            },
+        required=frozenset(type_mapping) - optional,
+        descriptions={
+            key: _describe_type(expected_type) 
+            for key, expected_type in type_mapping.items()
+            }
+    )
+
+
+class InputTableError(ValueError):
+    """
+    Raised when rows of an input table fail validation.
+
+    All problems are collected before raising. errors is a list of 
+    dictionaries with the column, the problem and the index labels of 
+    every offending row.
+    """
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        lines = []
+        for error in errors:
+            rows = error["rows"]
+            shown = ", ".join(str(row) for row in rows[:10])
+            if len(rows) > 10:
+                shown += f", ... ({len(rows)} rows)"
+            lines.append(f"{error['column']} in rows [{shown}]: {error['problem']}")
+        super().__init__(
+            "Input table has invalid values:\n" + "\n".join(lines)
+            )
+
+
+def _convert_columns(
+    table: pd.DataFrame,
+    compiled_schema: CompiledSchema,
+    errors: List[Dict[str, Any]]
+) -> Dict[str, pd.Series]:
+    """Converts the schema columns in table and adds any failures to errors."""
+    converted_columns = {}
+    for key, convert_column in compiled_schema.column_converters.items():
+        if key not in table.columns:
+            continue
+        converted, invalid = convert_column(table[key])
+        if invalid.any():
+            errors.append({
+                "column": key,
+                "problem": compiled_schema.descriptions[key],
+                "rows": table.index[invalid].tolist()
+            })
+        converted_columns[key] = converted
+    return converted_columns
+
+
+def validate_table(
+    table: pd.DataFrame, 
+    compiled_schema: CompiledSchema
+) -> pd.DataFrame:
+    """
+    Validates a DataFrame column-wise against a compiled schema.
+
+    Each row is one input (e.g. one animal), each column one schema key. 
+    Columns are converted with the same rules as single inputs. Columns that 
+    are not in the schema are dropped.
+
+    Args:
+        table: DataFrame with one column per schema key.
+        compiled_schema: A schema from compile_schema().
+
+    Returns:
+        A DataFrame with converted columns.
+
+    Raises:
+        TypeError: If table is not a DataFrame.
+        KeyError: If required columns are missing.
+        InputTableError: If any values cannot be converted or are not allowed, 
+                         listing every offending row.
+    """
+    check_input_type(table, pd.DataFrame, "table")
+    compiled_schema.check_keys(table.columns)
+    errors = []
+    converted_columns = _convert_columns(table, compiled_schema, errors)
+    if errors:
+        raise InputTableError(errors)
+    return pd.DataFrame(converted_columns, index=table.index)
+
+
+def validate_herd_table(herd: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validates a table of animal inputs, one animal per row.
+
+    All AnimalInput columns are required, An_AgeConcept1st only for rows 
+    where An_StatePhys is "Heifer". EquationSelection columns are validated 
+    when present so each animal can use its own equations. Every column is 
+    checked at once and all problems are reported together.
+
+    Args:
+        herd: DataFrame with one row per animal.
+
+    Returns:
+        A DataFrame with the converted AnimalInput and EquationSelection 
+        columns. An_AgeConcept1st is NaN for animals that are not heifers.
+
+    Raises:
+        TypeError: If herd is not a DataFrame.
+        KeyError: If required columns are missing.
+        InputTableError: If any rows have invalid values, listing the index 
+                         of every offending row for each column.
+
+    Example:
+        ```python
+        herd = pd.read_csv("herd.csv")
+        try:
+            herd = validate_herd_table(herd)
+        except InputTableError as error:
+            print(error.errors)
+        ```
+    """
+    check_input_type(herd, pd.DataFrame, "herd")
+    _ANIMAL_INPUT_SCHEMA.check_keys(herd.columns)
+    errors = []
+    converted_columns = _convert_columns(
+        herd.drop(columns="An_AgeConcept1st", errors="ignore"), 
+        _ANIMAL_INPUT_SCHEMA, errors
+        )
+    converted_columns.update(
+        _convert_columns(herd, _EQUATION_SELECTION_SCHEMA, errors)
+        )
+
+    # Heifers have an extra input
+    is_heifer = (herd["An_StatePhys"] == "Heifer").to_numpy()
+    if "An_AgeConcept1st" in herd.columns:
+        heifers = herd.loc[is_heifer, ["An_AgeConcept1st"]]
+        converted_columns.update(
+            _convert_columns(heifers, _ANIMAL_INPUT_SCHEMA, errors)
+            )
+        converted_columns["An_AgeConcept1st"] = (
+            converted_columns["An_AgeConcept1st"].reindex(herd.index)
+            )
+    elif is_heifer.any():
+        errors.append({
+            "column": "An_AgeConcept1st",
+            "problem": "is required for heifers",
+            "rows": herd.index[is_heifer].tolist()
+        })
+    if errors:
+        raise InputTableError(errors)
+    return pd.DataFrame(converted_columns, index=herd.index)
+
+
+_ANIMAL_INPUT_SCHEMA = compile_schema(
+    expected.AnimalInput, optional=frozenset({"An_AgeConcept1st"})
+    )
+_EQUATION_SELECTION_SCHEMA = compile_schema(expected.EquationSelection)
+_COEFF_DICT_SCHEMA = compile_schema(expected.CoeffDict)
+_INFUSION_DICT_SCHEMA = compile_schema(expected.InfusionDict)
+_MP_NP_EFFICIENCY_SCHEMA = compile_schema(expected.MPNPEfficiencyDict)
+
+
 # Validation Functions 
 def validate_user_diet(user_diet: pd.DataFrame) -> pd.DataFrame:
     """
@@ -208,13 +545,16 @@ def validate_animal_input(animal_input: dict) -> dict:
     """
     check_input_type(animal_input, dict, "animal_input")
 
-    type_mapping = expected.AnimalInput.__annotations__.copy()
-
-    if animal_input["An_StatePhys"] != "Heifer":
-        type_mapping.pop("An_AgeConcept1st") # Heifers have an extra input
-
-    check_keys_presence(animal_input, type_mapping.keys())
-    corrected_input = check_and_convert_type(animal_input, type_mapping)
+    _ANIMAL_INPUT_SCHEMA.check_keys(animal_input)
+    corrected_input = _ANIMAL_INPUT_SCHEMA.convert(animal_input)
+    if corrected_input["An_StatePhys"] == "Heifer":
+        # Heifers have an extra input
+        if "An_AgeConcept1st" not in corrected_input:
+            raise KeyError(
+                "The following keys are missing: {'An_AgeConcept1st'}"
+                )
+    else:
+        corrected_input.pop("An_AgeConcept1st", None)
     
     return corrected_input
 
@@ -241,12 +581,8 @@ def validate_equation_selection(equation_selection: dict) -> dict:
     """
     check_input_type(equation_selection, dict, "equation_selection")
     
-    input_mapping = expected.EquationSelection.__annotations__.copy()
-    
-    check_keys_presence(equation_selection, input_mapping.keys())
-    corrected_input = check_and_convert_type(
-        equation_selection, input_mapping
-        )       
+    _EQUATION_SELECTION_SCHEMA.check_keys(equation_selection)
+    corrected_input = _EQUATION_SELECTION_SCHEMA.convert(equation_selection)
     return corrected_input
 
 
@@ -288,7 +624,7 @@ def validate_feed_library_df(
     return feed_library
 
 
-def validate_coeff_dict(coeff_dict: dict) -> dict:
+def validate_coeff_dict(coeff_dict: dict, verbose: bool = True) -> dict:
     """
     Validates and corrects the coefficient dictionary.
 
@@ -298,6 +634,7 @@ def validate_coeff_dict(coeff_dict: dict) -> dict:
 
     Args:
         coeff_dict: A dictionary containing coefficient data.
+        verbose: Print the keys that differ from the default coefficients.
 
     Returns:
         A corrected dictionary with validated and possibly converted values.
@@ -307,15 +644,12 @@ def validate_coeff_dict(coeff_dict: dict) -> dict:
                    converted to the expected type.
         KeyError: If required keys are missing from the coeff_dict.
     """
-    expected_coeff_dict = expected.CoeffDict.__annotations__.copy()
-
     check_input_type(coeff_dict, dict, "coeff_dict")
-    check_keys_presence(coeff_dict, expected_coeff_dict.keys())
-    corrected_dict = check_and_convert_type(
-        coeff_dict, 
-        expected_coeff_dict
-        )
+    _COEFF_DICT_SCHEMA.check_keys(coeff_dict)
+    corrected_dict = _COEFF_DICT_SCHEMA.convert(coeff_dict)
     
+    if not verbose:
+        return corrected_dict
     # Use the default coeff_dict to check for differing values
     default_coeff_dict = nd.coeff_dict
     differing_keys = [
@@ -350,14 +684,9 @@ def validate_infusion_input(infusion_input: dict) -> dict:
                    converted to the expected type.
         KeyError: If required keys are missing from the infusion_input.
     """
-    expected_infusion_dict = expected.InfusionDict.__annotations__.copy()
-
     check_input_type(infusion_input, dict, "infusion_input")
-    check_keys_presence(infusion_input, expected_infusion_dict.keys())
-    corrected_input = check_and_convert_type(
-        infusion_input,
-        expected_infusion_dict
-    )    
+    _INFUSION_DICT_SCHEMA.check_keys(infusion_input)
+    corrected_input = _INFUSION_DICT_SCHEMA.convert(infusion_input)
     return corrected_input
 
 
@@ -381,14 +710,9 @@ def validate_MP_NP_efficiency_input(MP_NP_efficiency_input: dict) -> dict:
                    cannot be converted to the expected type.
         KeyError: If required keys are missing from the MP_NP_efficiency_input.
     """
-    expected_MP_NP_efficiency = expected.MPNPEfficiencyDict.__annotations__.copy()
     check_input_type(MP_NP_efficiency_input, dict, "MP_NP_efficiency_input")
-    check_keys_presence(
-        MP_NP_efficiency_input.keys(), expected_MP_NP_efficiency.keys()
-        )
-    corrected_values = check_and_convert_type(
-        MP_NP_efficiency_input, expected_MP_NP_efficiency
-        )
+    _MP_NP_EFFICIENCY_SCHEMA.check_keys(MP_NP_efficiency_input)
+    corrected_values = _MP_NP_EFFICIENCY_SCHEMA.convert(MP_NP_efficiency_input)
     return corrected_values
 
 
@@ -454,4 +778,149 @@ def validate_f_Imb(f_Imb: pd.Series) -> pd.Series:
     if not f_Imb.apply(lambda x: isinstance(x, (int, float))).all():
         raise TypeError("All values in f_Imb must be int or float")
     return f_Imb
-    
\ No newline at end of file
+    
+
+
+class ValidatedInputs(NamedTuple):
+    """
+    Inputs to nasem() that have already been validated.
+
+    Create with prepare(). nasem() trusts these values and does not validate 
+    or copy them again, so repeated runs only pay for validation once. Use 
+    with_changes() to validate and replace individual inputs.
+    """
+    user_diet: pd.DataFrame
+    animal_input: dict
+    equation_selection: dict
+    feed_library: pd.DataFrame
+    coeff_dict: dict
+    infusion_input: dict
+    MP_NP_efficiency: dict
+    mPrt_coeff_list: List[Dict[str, Any]]
+    f_Imb: pd.Series
+
+    def with_changes(self, verbose: bool = True, **changes) -> "ValidatedInputs":
+        """
+        Validates only the changed inputs and returns new ValidatedInputs.
+
+        Args:
+            verbose: Print coefficients that differ from the defaults when 
+                     coeff_dict is changed.
+            **changes: New values for any of the fields, e.g. coeff_dict.
+
+        Returns:
+            ValidatedInputs with the changed fields replaced.
+
+        Raises:
+            KeyError: If a change is not a field of ValidatedInputs.
+
+        Example:
+            ```python
+            inputs = prepare(user_diet, animal_input, equation_selection)
+            for value in [95.0, 100.8, 105.0]:
+                coeffs = {**inputs.coeff_dict, "VmMiNInt": value}
+                output = nasem(inputs.with_changes(coeff_dict=coeffs))
+            ```
+        """
+        unknown_fields = set(changes) - set(self._fields)
+        if unknown_fields:
+            raise KeyError(f"Not fields of ValidatedInputs: {unknown_fields}")
+        validated = {}
+        for field, value in changes.items():
+            if field == "user_diet":
+                validated[field] = validate_user_diet(value.copy())
+            elif field == "feed_library":
+                validated[field] = value
+            elif field == "coeff_dict":
+                validated[field] = validate_coeff_dict(value.copy(), verbose)
+            else:
+                validated[field] = _FIELD_VALIDATORS[field](value.copy())
+        if "user_diet" in changes or "feed_library" in changes:
+            validate_feed_library_df(
+                validated.get("feed_library", self.feed_library),
+                validated.get("user_diet", self.user_diet)
+                )
+        return self._replace(**validated)
+
+
+_FIELD_VALIDATORS = {
+    "animal_input": validate_animal_input,
+    "equation_selection": validate_equation_selection,
+    "infusion_input": validate_infusion_input,
+    "MP_NP_efficiency": validate_MP_NP_efficiency_input,
+    "mPrt_coeff_list": validate_mPrt_coeff_list,
+    "f_Imb": validate_f_Imb,
+}
+
+
+def prepare(
+    user_diet: pd.DataFrame,
+    animal_input: dict,
+    equation_selection: dict,
+    feed_library: Optional[pd.DataFrame] = None,
+    coeff_dict: dict = constants.coeff_dict,
+    infusion_input: dict = constants.infusion_dict,
+    MP_NP_efficiency: dict = constants.MP_NP_efficiency_dict,
+    mPrt_coeff_list: List[Dict[str, Any]] = constants.mPrt_coeff_list,
+    f_Imb: pd.Series = constants.f_Imb,
+    verbose: bool = True
+) -> ValidatedInputs:
+    """
+    Validates all inputs to nasem() once.
+
+    The inputs are copied before validation so the originals are not 
+    modified. The result can be passed to nasem() in place of user_diet and 
+    the other inputs.
+
+    Args:
+        user_diet: The diet with columns Feedstuff and kg_user.
+        animal_input: A dictionary containing animal input data.
+        equation_selection: A dictionary containing equation selection data.
+        feed_library: The feed library. Defaults to the NASEM feed library.
+        coeff_dict: A dictionary containing coefficient data.
+        infusion_input: A dictionary containing infusion input data.
+        MP_NP_efficiency: A dictionary containing MP/NP efficiency data.
+        mPrt_coeff_list: A list of mPrt coefficient dictionaries.
+        f_Imb: Imbalance factors for amino acids.
+        verbose: Print coefficients that differ from the defaults.
+
+    Returns:
+        The validated inputs.
+
+    Raises:
+        TypeError: If any input is not of the expected type.
+        KeyError: If required keys or columns are missing.
+        ValueError: If any input value is invalid.
+
+    Example:
+        ```python
+        user_diet, animal_input, equation_selection, _ = nd.demo(
+            "lactating_cow_test"
+            )
+        inputs = prepare(user_diet, animal_input, equation_selection)
+        output = nd.nasem(inputs)
+        ```
+    """
+    if feed_library is None:
+        path_to_package_data = importlib.resources.files(
+            "nasem_dairy.data.feed_library"
+            )
+        feed_library = pd.read_csv(
+            path_to_package_data.joinpath("NASEM_feed_library.csv")
+        )
+    user_diet = validate_user_diet(user_diet.copy())
+    return ValidatedInputs(
+        user_diet=user_diet,
+        animal_input=validate_animal_input(animal_input.copy()),
+        equation_selection=validate_equation_selection(
+            equation_selection.copy()
+            ),
+        feed_library=validate_feed_library_df(feed_library.copy(), user_diet),
+        coeff_dict=validate_coeff_dict(coeff_dict.copy(), verbose),
+        infusion_input=validate_infusion_input(infusion_input.copy()),
+        MP_NP_efficiency=validate_MP_NP_efficiency_input(
+            MP_NP_efficiency.copy()
+            ),
+        mPrt_coeff_list=validate_mPrt_coeff_list(mPrt_coeff_list.copy()),
+        f_Imb=validate_f_Imb(f_Imb.copy())
+    )
@@ -20,8 +20,9 @@ Example:
     )
 """
 
-import importlib.resources
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -52,17 +53,75 @@ import nasem_dairy.model.input_validation as validate
 import nasem_dairy.model.utility as utility
 from nasem_dairy.model_output.ModelOutput import ModelOutput
 
+# Values that depend only on the coefficients, by coefficient contents
+_INPUT_VALUES_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_INPUT_VALUES_CACHE_SIZE = 32
+# nasem() may run in several threads, e.g. under the HTTP server
+_INPUT_VALUES_LOCK = threading.Lock()
+
+
+def _calculate_input_values(
+    aa_list: List[str],
+    coeff_dict: Dict[str, float],
+    MP_NP_efficiency: Dict[str, float],
+    mPrt_coeff: Dict[str, float]
+) -> Tuple:
+    """
+    Calculate the amino acid profiles and scalars that use only coefficients.
+
+    Results are kept for the most recently used coefficient sets. The arrays
+    are shared between runs, so they are returned read-only.
+    """
+    key = (
+        tuple(aa_list), tuple(coeff_dict.items()), 
+        tuple(MP_NP_efficiency.items()), tuple(mPrt_coeff.items())
+        )
+    with _INPUT_VALUES_LOCK:
+        try:
+            values = _INPUT_VALUES_CACHE[key]
+        except (KeyError, TypeError):  # TypeError for unhashable coefficients
+            pass
+        else:
+            _INPUT_VALUES_CACHE.move_to_end(key)
+            return values
+
+    values = (
+        aa.calculate_Trg_AbsAA_NPxprtAA_array(MP_NP_efficiency, aa_list),
+        aa.calculate_mPrt_k_AA_array(mPrt_coeff, aa_list),
+        aa.calculate_MWAA(aa_list, coeff_dict),
+        aa.calculate_Body_AA_TP(aa_list, coeff_dict),
+        aa.calculate_MiTPAAProf(aa_list, coeff_dict),
+        aa.calculate_EndAAProf(aa_list, coeff_dict),
+        aa.calculate_RecAA(aa_list, coeff_dict),
+        milk.calculate_Mlk_AA_TP(aa_list, coeff_dict),
+        fecal.calculate_Fe_AAMetab_TP(aa_list, coeff_dict),
+        urine.calculate_Ur_AAEnd_TP(aa_list, coeff_dict),
+        body_comp.calculate_NPGain_RsrvGain(coeff_dict)
+        )
+    for value in values:
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    with _INPUT_VALUES_LOCK:
+        try:
+            _INPUT_VALUES_CACHE[key] = values
+        except TypeError:
+            return values
+        if len(_INPUT_VALUES_CACHE) > _INPUT_VALUES_CACHE_SIZE:
+            _INPUT_VALUES_CACHE.popitem(last=False)
+    return values
+
 
 def nasem(
-    user_diet: pd.DataFrame,
-    animal_input: Dict[str, Any],
-    equation_selection: Dict[str, Any],
+    user_diet: Union[pd.DataFrame, validate.ValidatedInputs],
+    animal_input: Optional[Dict[str, Any]] = None,
+    equation_selection: Optional[Dict[str, Any]] = None,
     feed_library: Optional[pd.DataFrame] = None,
     coeff_dict: Optional[Dict[str, float]] = constants.coeff_dict,
     infusion_input: Optional[Dict[str, float]] = constants.infusion_dict,
     MP_NP_efficiency: Optional[Dict[str, float]] = constants.MP_NP_efficiency_dict,
     mPrt_coeff_list: Optional[List[Dict[str, float]]] = constants.mPrt_coeff_list,
     f_Imb: Optional[pd.Series] = constants.f_Imb,
+    retain: Optional[Union[str, List[str]]] = None
 ) -> ModelOutput:
     """
     Run the NASEM (National Academies of Sciences, Engineering, and Medicine) Nutrient Requirements of Dairy Cattle model.
@@ -74,8 +133,10 @@ def nasem(
 
     Parameters
     ----------
-    user_diet : pd.DataFrame
-        The diet with 2 columns: Fd_Name and kg_user
+    user_diet : pd.DataFrame or ValidatedInputs
+        The diet with 2 columns: Fd_Name and kg_user. Inputs returned by 
+        prepare() can be passed instead, in which case all other arguments 
+        are ignored and the inputs are not validated again
     animal_input : Dict[str, Any]
         Dictionary containing the animal input data
     equation_selection : Dict[str, Any]
@@ -97,6 +158,11 @@ def nasem(
     f_Imb : pd.Series, optional
         Series representing imbalance factors for amino acids. If not provided,
         default values are used
+    retain : str or List[str], optional
+        Names of the outputs to keep in the ModelOutput, or "response_variables".
+        Everything else is dropped, which greatly reduces the memory used by
+        each output. Names in a list that are not outputs are reported with a
+        warning. By default all outputs are kept
 
     Returns
     -------
@@ -118,38 +184,39 @@ def nasem(
     ...     animal_input=animal_input_in,
     ...     equation_selection=equation_selection_in,
     ... )
+
+    Validate once and reuse the inputs for repeated runs:
+
+    >>> inputs = nd.prepare(user_diet_in, animal_input_in, equation_selection_in)
+    >>> output = nd.nasem(inputs)
     """
     ####################
     # Validate Inputs  
     ####################
-    if feed_library is None:
-        path_to_package_data = importlib.resources.files(
-            "nasem_dairy.data.feed_library"
+    if isinstance(user_diet, validate.ValidatedInputs):
+        inputs = user_diet
+    else:
+        inputs = validate.prepare(
+            user_diet, animal_input, equation_selection, feed_library, 
+            coeff_dict, infusion_input, MP_NP_efficiency, mPrt_coeff_list, 
+            f_Imb
             )
-        feed_library = pd.read_csv(
-            path_to_package_data.joinpath("NASEM_feed_library.csv")
-        )
-    user_diet = validate.validate_user_diet(user_diet.copy())
-    animal_input = validate.validate_animal_input(animal_input.copy())
-    equation_selection = validate.validate_equation_selection(
-        equation_selection.copy()
-        )
-    feed_library = validate.validate_feed_library_df(feed_library.copy(),
-                                                        user_diet.copy())
-    coeff_dict = validate.validate_coeff_dict(coeff_dict.copy())
-    infusion_input = validate.validate_infusion_input(infusion_input.copy())
-    MP_NP_efficiency = validate.validate_MP_NP_efficiency_input(
-        MP_NP_efficiency.copy()
-        )
-    mPrt_coeff_list = validate.validate_mPrt_coeff_list(mPrt_coeff_list.copy())
-    f_Imb = validate.validate_f_Imb(f_Imb.copy())
+    # Shallow copies of the inputs that are modified below
+    user_diet = inputs.user_diet.copy(deep=False)
+    animal_input = dict(inputs.animal_input)
+    equation_selection = inputs.equation_selection
+    feed_library = inputs.feed_library
+    coeff_dict = dict(inputs.coeff_dict)
+    infusion_input = inputs.infusion_input
+    MP_NP_efficiency = inputs.MP_NP_efficiency
+    mPrt_coeff_list = inputs.mPrt_coeff_list
+    f_Imb = inputs.f_Imb
     # Adjust value of mPrt_eqn when used to index mPrt_coeff_list as the indexing 
     # in R and Python use different starting values. Use max to prevent negatives
     mPrt_coeff = mPrt_coeff_list[max(0, equation_selection["mPrt_eqn"] - 1)]  
-    aa_list = [
-        "Arg", "His", "Ile", "Leu", "Lys", "Met", "Phe", "Thr", "Trp", "Val"
-    ]
-    aa_values = pd.DataFrame(index=aa_list)
+    aa_list = aa.AA_LIST
+    # Per amino acid arrays in aa_list order, returned as a DataFrame
+    aa_values = {}
     diet_data = {}
     an_data = {}
 
@@ -197,22 +264,14 @@ def nasem(
     # NOTE This section has all the calculations that use ONLY user input values
     # This was done to help with reorganizing the function. It may be possible 
     # to move some of these further down in the function to better group them 
-    ### ARRAYS ###
-    Trg_AbsAA_NPxprtAA = aa.calculate_Trg_AbsAA_NPxprtAA_array(
-        MP_NP_efficiency, aa_list
-        )
-    mPrt_k_AA_array = aa.calculate_mPrt_k_AA_array(mPrt_coeff, aa_list)
-    MWAA = aa.calculate_MWAA(aa_list, coeff_dict)
-    Body_AA_TP = aa.calculate_Body_AA_TP(aa_list, coeff_dict)
-    MiTPAAProf = aa.calculate_MiTPAAProf(aa_list, coeff_dict)
-    EndAAProf = aa.calculate_EndAAProf(aa_list, coeff_dict)
-    RecAA = aa.calculate_RecAA(aa_list, coeff_dict)
-    Mlk_AA_TP = milk.calculate_Mlk_AA_TP(aa_list, coeff_dict)
-    Fe_AAMetab_TP = fecal.calculate_Fe_AAMetab_TP(aa_list, coeff_dict)   
-    Ur_AAEnd_TP = urine.calculate_Ur_AAEnd_TP(aa_list, coeff_dict)
-
-    ### COEFFS ONLY ###
-    NPGain_RsrvGain = body_comp.calculate_NPGain_RsrvGain(coeff_dict)
+    ### ARRAYS AND COEFFS ONLY ###
+    (
+        Trg_AbsAA_NPxprtAA, mPrt_k_AA_array, MWAA, Body_AA_TP, MiTPAAProf,
+        EndAAProf, RecAA, Mlk_AA_TP, Fe_AAMetab_TP, Ur_AAEnd_TP, 
+        NPGain_RsrvGain
+    ) = _calculate_input_values(
+        aa_list, coeff_dict, MP_NP_efficiency, mPrt_coeff
+        )
 
     ### OTHER ###
     An_DMIn_BW = animal.calculate_An_DMIn_BW(animal_input["An_BW"], Dt_DMIn)
@@ -317,43 +376,16 @@ def nasem(
     infusion_data = infusion.calculate_infusion_data(
         infusion_input, Dt_DMIn, coeff_dict
         )   
-    feed_data = diet.calculate_feed_data(
+    # Feed level data is held as a dict of arrays until the outputs are captured
+    feed_data = diet.calculate_feed_arrays(
         Dt_DMIn, animal_input["An_StatePhys"], 
-        equation_selection["Use_DNDF_IV"], feed_data, coeff_dict
-        )
-    diet_data["Dt_CPIn_ClfLiq"] = diet.calculate_Dt_CPIn_ClfLiq(
-        feed_data["Fd_CPIn_ClfLiq"]
-        )
-    diet_data["Dt_DMIn_ClfLiq"] = diet.calculate_Dt_DMIn_ClfLiq(
-        feed_data["Fd_DMIn_ClfLiq"]
-        )
-    diet_data["Dt_NDFIn"] = diet.calculate_Dt_NDFIn(feed_data["Fd_NDFIn"])
-    diet_data["Dt_StIn"] = diet.calculate_Dt_StIn(feed_data["Fd_StIn"])
-    diet_data["Dt_CPIn"] = diet.calculate_Dt_CPIn(feed_data["Fd_CPIn"])
-    diet_data["Dt_ADFIn"] = diet.calculate_Dt_ADFIn(feed_data["Fd_ADFIn"])
-    diet_data["Dt_ForNDF"] = diet.calculate_Dt_ForNDF(
-        feed_data["Fd_DMInp"], feed_data["Fd_ForNDF"]
-        )
-    diet_data["Dt_AshIn"] = diet.calculate_Dt_AshIn(feed_data["Fd_AshIn"])
-    diet_data["Dt_FAhydrIn"] = diet.calculate_Dt_FAhydrIn(
-        feed_data["Fd_FAhydrIn"]
-        )
-    diet_data["Dt_TPIn"] = diet.calculate_Dt_TPIn(feed_data["Fd_TPIn"])
-    diet_data["Dt_NPNDMIn"] = diet.calculate_Dt_NPNDMIn(
-        feed_data["Fd_NPNDMIn"]
-        )
-    diet_data["Dt_idRUPIn"] = diet.calculate_Dt_idRUPIn(
-        feed_data["Fd_idRUPIn"]
-        )
-    diet_data["Dt_ForWetIn"] = diet.calculate_Dt_ForWetIn(
-        feed_data["Fd_ForWetIn"]
+        equation_selection["Use_DNDF_IV"], diet.get_feed_arrays(feed_data), 
+        coeff_dict
         )
+    diet_data.update(diet.calculate_diet_aggregates(feed_data))
     diet_data["Dt_dcCP_ClfDry"] = diet.calculate_Dt_dcCP_ClfDry(
         animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"]
         )
-    diet_data["Dt_ForNDFIn"] = diet.calculate_Dt_ForNDFIn(
-        feed_data["Fd_DMIn"], feed_data["Fd_ForNDF"]
-        )
     diet_data["Dt_ForWet"] = diet.calculate_Dt_ForWet(
         diet_data["Dt_ForWetIn"], Dt_DMIn
         )
@@ -1323,210 +1355,22 @@ def nasem(
     ####################
     # Mineral Requirements
     ####################
-    ### Calcium ###
     Ca_Mlk = micro_req.calculate_Ca_Mlk(animal_input["An_Breed"])
-    Fe_Ca_m = micro_req.calculate_Fe_Ca_m(an_data["An_DMIn"])
-    An_Ca_g = micro_req.calculate_An_Ca_g(
-        animal_input["An_BW_mature"], animal_input["An_BW"], Body_Gain
-        )
-    An_Ca_y = micro_req.calculate_An_Ca_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Ca_l = micro_req.calculate_An_Ca_l(
-        Mlk_NP_g, Ca_Mlk, animal_input["Trg_MilkProd"], 
-        animal_input["Trg_MilkTPp"]
-        )
-    An_Ca_Clf = micro_req.calculate_An_Ca_Clf(
-        an_data["An_BW_empty"], Body_Gain_empty
-        )
-    An_Ca_req = micro_req.calculate_An_Ca_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Ca_Clf, 
-        Fe_Ca_m, An_Ca_g, An_Ca_y, An_Ca_l
-        )
-    An_Ca_bal = micro_req.calculate_An_Ca_bal(diet_data["Abs_CaIn"], An_Ca_req)
-    An_Ca_prod = micro_req.calculate_An_Ca_prod(An_Ca_y, An_Ca_l, An_Ca_g)
-
-    ### Phosphorus ###
-    Ur_P_m = micro_req.calculate_Ur_P_m(animal_input["An_BW"])
-    Fe_P_m = micro_req.calculate_Fe_P_m(
-        animal_input["An_Parity_rl"], an_data["An_DMIn"]
-        )
-    An_P_m = micro_req.calculate_An_P_m(Ur_P_m, Fe_P_m)
-    An_P_g = micro_req.calculate_An_P_g(
-        animal_input["An_BW_mature"], animal_input["An_BW"], Body_Gain
-        )
-    An_P_y = micro_req.calculate_An_P_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_P_l = micro_req.calculate_An_P_l(
-        animal_input["Trg_MilkProd"], MlkNP_Milk
-        )
-    An_P_Clf = micro_req.calculate_An_P_Clf(
-        an_data["An_BW_empty"], Body_Gain_empty
-        )
-    An_P_req = micro_req.calculate_An_P_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_P_Clf, 
-        An_P_m, An_P_g, An_P_y, An_P_l
-        )
-    An_P_bal = micro_req.calculate_An_P_bal(diet_data["Abs_PIn"], An_P_req)
+    # All minerals at once, named values are in mineral_values
+    mineral_requirements = micro_req.calculate_mineral_requirements(
+        animal_input["An_StatePhys"], animal_input["An_BW"], 
+        animal_input["An_BW_mature"], an_data["An_BW_empty"], 
+        animal_input["An_Parity_rl"], animal_input["An_GestDay"], 
+        an_data["An_DMIn"], animal_input["Trg_MilkProd"], 
+        animal_input["Trg_MilkTPp"], Ca_Mlk, Mlk_NP_g, MlkNP_Milk, Body_Gain, 
+        Body_Gain_empty, diet_data["Dt_DMIn_ClfLiq"], 
+        **micro_req.get_mineral_intakes(diet_data)
+        )
+    mineral_values = micro_req.get_mineral_outputs(mineral_requirements)
     Fe_P_g = micro_req.calculate_Fe_P_g(
-        diet_data["Dt_PIn"], An_P_l, An_P_y, An_P_g, Ur_P_m
+        diet_data["Dt_PIn"], mineral_values["An_P_l"], mineral_values["An_P_y"],
+        mineral_values["An_P_g"], mineral_values["Ur_P_m"]
         )
-    An_P_prod = micro_req.calculate_An_P_prod(An_P_y, An_P_l, An_P_g)
-
-    ### Magnesium ###
-    An_Mg_Clf = micro_req.calculate_An_Mg_Clf(
-        an_data["An_BW_empty"], Body_Gain_empty
-        )
-    Ur_Mg_m = micro_req.calculate_Ur_Mg_m(animal_input["An_BW"])
-    Fe_Mg_m = micro_req.calculate_Fe_Mg_m(an_data["An_DMIn"])
-    An_Mg_m = micro_req.calculate_An_Mg_m(Ur_Mg_m, Fe_Mg_m)
-    An_Mg_g = micro_req.calculate_An_Mg_g(Body_Gain)
-    An_Mg_y = micro_req.calculate_An_Mg_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Mg_l = micro_req.calculate_An_Mg_l(animal_input["Trg_MilkProd"])
-    An_Mg_req = micro_req.calculate_An_Mg_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Mg_Clf, 
-        An_Mg_m, An_Mg_g, An_Mg_y, An_Mg_l
-        )
-    An_Mg_bal = micro_req.calculate_An_Mg_bal(diet_data["Abs_MgIn"], An_Mg_req)
-    An_Mg_prod = micro_req.calculate_An_Mg_prod(An_Mg_y, An_Mg_l, An_Mg_g)
-
-    ### Sodium ###
-    An_Na_Clf = micro_req.calculate_An_Na_Clf(
-        an_data["An_BW_empty"], Body_Gain_empty
-        )
-    Fe_Na_m = micro_req.calculate_Fe_Na_m(an_data["An_DMIn"])
-    An_Na_g = micro_req.calculate_An_Na_g(Body_Gain)
-    An_Na_y = micro_req.calculate_An_Na_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Na_l = micro_req.calculate_An_Na_l(animal_input["Trg_MilkProd"])
-    An_Na_req = micro_req.calculate_An_Na_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Na_Clf, 
-        Fe_Na_m, An_Na_g, An_Na_y, An_Na_l
-        )
-    An_Na_bal = micro_req.calculate_An_Na_bal(diet_data["Abs_NaIn"], An_Na_req)
-    An_Na_prod = micro_req.calculate_An_Na_prod(An_Na_y, An_Na_l, An_Na_g)
-
-    ### Chlorine ###
-    An_Cl_Clf = micro_req.calculate_An_Cl_Clf(
-        an_data["An_BW_empty"], Body_Gain_empty
-        )
-    Fe_Cl_m = micro_req.calculate_Fe_Cl_m(an_data["An_DMIn"])
-    An_Cl_g = micro_req.calculate_An_Cl_g(Body_Gain)
-    An_Cl_y = micro_req.calculate_An_Cl_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Cl_l = micro_req.calculate_An_Cl_l(animal_input["Trg_MilkProd"])
-    An_Cl_req = micro_req.calculate_An_Cl_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Cl_Clf, 
-        Fe_Cl_m, An_Cl_g, An_Cl_y, An_Cl_l
-        )
-    An_Cl_bal = micro_req.calculate_An_Cl_bal(diet_data["Abs_ClIn"], An_Cl_req)
-    An_Cl_prod = micro_req.calculate_An_Cl_prod(An_Cl_y, An_Cl_l, An_Cl_g)
-
-    ### Potassium ###
-    An_K_Clf = micro_req.calculate_An_K_Clf(
-        an_data["An_BW_empty"], Body_Gain_empty
-        )
-    Ur_K_m = micro_req.calculate_Ur_K_m(
-        animal_input["Trg_MilkProd"], animal_input["An_BW"]
-        )
-    Fe_K_m = micro_req.calculate_Fe_K_m(an_data["An_DMIn"])
-    An_K_m = micro_req.calculate_An_K_m(Ur_K_m, Fe_K_m)
-    An_K_g = micro_req.calculate_An_K_g(Body_Gain)
-    An_K_y = micro_req.calculate_An_K_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_K_l = micro_req.calculate_An_K_l(animal_input["Trg_MilkProd"])
-    An_K_req = micro_req.calculate_An_K_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_K_Clf, 
-        An_K_m, An_K_g, An_K_y, An_K_l
-        )
-    An_K_bal = micro_req.calculate_An_K_bal(diet_data["Abs_KIn"], An_K_req)
-    An_K_prod = micro_req.calculate_An_K_prod(An_K_y, An_K_l, An_K_g)
-
-    ### Sulphur ###
-    An_S_req = micro_req.calculate_An_S_req(an_data["An_DMIn"])
-    An_S_bal = micro_req.calculate_An_S_bal(diet_data["Dt_SIn"], An_S_req)
-
-    ### Cobalt ###
-    An_Co_req = micro_req.calculate_An_Co_req(an_data["An_DMIn"])
-    An_Co_bal = micro_req.calculate_An_Co_bal(diet_data["Abs_CoIn"], An_Co_req)
-
-    ### Copper ###
-    An_Cu_Clf = micro_req.calculate_An_Cu_Clf(
-        animal_input["An_BW"], Body_Gain_empty
-        )
-    An_Cu_m = micro_req.calculate_An_Cu_m(animal_input["An_BW"])
-    An_Cu_g = micro_req.calculate_An_Cu_g(Body_Gain)
-    An_Cu_y = micro_req.calculate_An_Cu_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Cu_l = micro_req.calculate_An_Cu_l(animal_input["Trg_MilkProd"])
-    An_Cu_req = micro_req.calculate_An_Cu_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Cu_Clf, 
-        An_Cu_m, An_Cu_g, An_Cu_y, An_Cu_l
-        )
-    An_Cu_bal = micro_req.calculate_An_Cu_bal(diet_data["Abs_CuIn"], An_Cu_req)
-    An_Cu_prod = micro_req.calculate_An_Cu_prod(An_Cu_y, An_Cu_l, An_Cu_g)
-
-    ### Iodine ###
-    An_I_req = micro_req.calculate_An_I_req(
-        animal_input["An_StatePhys"], an_data["An_DMIn"], animal_input["An_BW"],
-        animal_input["Trg_MilkProd"]
-        )
-    An_I_bal = micro_req.calculate_An_I_bal(diet_data["Dt_IIn"], An_I_req)
-
-    ### Iron ###
-    An_Fe_Clf = micro_req.calculate_An_Fe_Clf(Body_Gain)
-    An_Fe_g = micro_req.calculate_An_Fe_g(Body_Gain)
-    An_Fe_y = micro_req.calculate_An_Fe_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Fe_l = micro_req.calculate_An_Fe_l(animal_input["Trg_MilkProd"])
-    An_Fe_req = micro_req.calculate_An_Fe_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Fe_Clf, 
-        An_Fe_g, An_Fe_y, An_Fe_l
-        )
-    An_Fe_bal = micro_req.calculate_An_Fe_bal(diet_data["Abs_FeIn"], An_Fe_req)
-    An_Fe_prod = micro_req.calculate_An_Fe_prod(An_Fe_y, An_Fe_l, An_Fe_g)
-
-    ### Maganese ###
-    An_Mn_Clf = micro_req.calculate_An_Mn_Clf(animal_input["An_BW"], Body_Gain)
-    An_Mn_m = micro_req.calculate_An_Mn_m(animal_input["An_BW"])
-    An_Mn_g = micro_req.calculate_An_Mn_g(Body_Gain)
-    An_Mn_y = micro_req.calculate_An_Mn_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Mn_l = micro_req.calculate_An_Mn_l(animal_input["Trg_MilkProd"])
-    An_Mn_req = micro_req.calculate_An_Mn_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Mn_Clf, 
-        An_Mn_m, An_Mn_g, An_Mn_y, An_Mn_l
-        )
-    An_Mn_bal = micro_req.calculate_An_Mn_bal(diet_data["Abs_MnIn"], An_Mn_req)
-    An_Mn_prod = micro_req.calculate_An_Mn_prod(An_Mn_y, An_Mn_l, An_Mn_g)
-
-    ### Selenium ###
-    An_Se_req = micro_req.calculate_An_Se_req(an_data["An_DMIn"])
-    An_Se_bal = micro_req.calculate_An_Se_bal(diet_data["Dt_SeIn"], An_Se_req)
-
-    ### Zinc ###
-    An_Zn_Clf = micro_req.calculate_An_Zn_Clf(an_data["An_DMIn"], Body_Gain)
-    An_Zn_m = micro_req.calculate_An_Zn_m(an_data["An_DMIn"])
-    An_Zn_g = micro_req.calculate_An_Zn_g(Body_Gain)
-    An_Zn_y = micro_req.calculate_An_Zn_y(
-        animal_input["An_GestDay"], animal_input["An_BW"]
-        )
-    An_Zn_l = micro_req.calculate_An_Zn_l(animal_input["Trg_MilkProd"])
-    An_Zn_req = micro_req.calculate_An_Zn_req(
-        animal_input["An_StatePhys"], diet_data["Dt_DMIn_ClfLiq"], An_Zn_Clf, 
-        An_Zn_m, An_Zn_g, An_Zn_y, An_Zn_l
-        )
-    An_Zn_bal = micro_req.calculate_An_Zn_bal(diet_data["Abs_ZnIn"], An_Zn_req)
-    An_Zn_prod = micro_req.calculate_An_Zn_prod(An_Zn_y, An_Zn_l, An_Zn_g)
 
     ### DCAD ###
     An_DCADmeq = micro_req.calculate_An_DCADmeq(
@@ -1534,99 +1378,6 @@ def nasem(
         diet_data["Dt_S"]
         )
     
-    ####################
-    # Mineral Use Efficiency
-    ####################
-    Dt_acCa = micro_req.calculate_Dt_acCa(
-        diet_data["Abs_CaIn"], diet_data["Dt_CaIn"]
-        )
-    Dt_acP = micro_req.calculate_Dt_acP(
-        diet_data["Abs_PIn"], diet_data["Dt_PIn"]
-        )
-    Dt_acNa = micro_req.calculate_Dt_acNa(
-        diet_data["Abs_NaIn"], diet_data["Dt_NaIn"]
-        )
-    Dt_acMg = micro_req.calculate_Dt_acMg_final(
-        diet_data["Abs_MgIn"], diet_data["Dt_MgIn"]
-        )
-    Dt_acK = micro_req.calculate_Dt_acK(
-        diet_data["Abs_KIn"], diet_data["Dt_KIn"]
-        )
-    Dt_acCl = micro_req.calculate_Dt_acCl(
-        diet_data["Abs_ClIn"], diet_data["Dt_ClIn"]
-        )
-    Dt_acCo = micro_req.calculate_Dt_acCo(
-        diet_data["Abs_CoIn"], diet_data["Dt_CoIn"]
-        )
-    Dt_acCu = micro_req.calculate_Dt_acCu(
-        diet_data["Abs_CuIn"], diet_data["Dt_CuIn"]
-        )
-    Dt_acFe = micro_req.calculate_Dt_acFe(
-        diet_data["Abs_FeIn"], diet_data["Dt_FeIn"]
-        )
-    Dt_acMn = micro_req.calculate_Dt_acMn(
-        diet_data["Abs_MnIn"], diet_data["Dt_MnIn"]
-        )
-    Dt_acZn = micro_req.calculate_Dt_acZn(
-        diet_data["Abs_ZnIn"], diet_data["Dt_ZnIn"]
-        )
-    CaProd_CaIn = micro_req.calculate_CaProd_CaIn(
-        An_Ca_prod, diet_data["Dt_CaIn"]
-        )
-    PProd_PIn = micro_req.calculate_PProd_PIn(
-        An_P_prod, diet_data["Dt_PIn"]
-        )
-    MgProd_MgIn = micro_req.calculate_MgProd_MgIn(
-        An_Mg_prod, diet_data["Dt_MgIn"]
-        )
-    KProd_KIn = micro_req.calculate_KProd_KIn(
-        An_K_prod, diet_data["Dt_KIn"]
-        )
-    NaProd_NaIn = micro_req.calculate_NaProd_NaIn(
-        An_Na_prod, diet_data["Dt_NaIn"]
-        )
-    ClProd_ClIn = micro_req.calculate_ClProd_ClIn(
-        An_Cl_prod, diet_data["Dt_ClIn"]
-        )
-    CuProd_CuIn = micro_req.calculate_CuProd_CuIn(
-        An_Cu_prod, diet_data["Dt_CuIn"]
-        )
-    FeProd_FeIn = micro_req.calculate_FeProd_FeIn(
-        An_Fe_prod, diet_data["Dt_FeIn"]
-        )
-    MnProd_MnIn = micro_req.calculate_MnProd_MnIn(
-        An_Mn_prod, diet_data["Dt_MnIn"]
-        )
-    ZnProd_ZnIn = micro_req.calculate_ZnProd_ZnIn(
-        An_Zn_prod, diet_data["Dt_ZnIn"]
-        )
-    CaProd_CaAbs = micro_req.calculate_CaProd_CaAbs(
-        An_Ca_prod, diet_data["Abs_CaIn"]
-        )
-    PProd_PAbs = micro_req.calculate_PProd_PAbs(An_P_prod, diet_data["Abs_PIn"])
-    MgProd_MgAbs = micro_req.calculate_MgProd_MgAbs(
-        An_Mg_prod, diet_data["Abs_MgIn"]
-        )
-    KProd_KAbs = micro_req.calculate_KProd_KAbs(An_K_prod, diet_data["Abs_KIn"])
-    NaProd_NaAbs = micro_req.calculate_NaProd_NaAbs(
-        An_Na_prod, diet_data["Abs_NaIn"]
-        )
-    ClProd_ClAbs = micro_req.calculate_ClProd_ClAbs(
-        An_Cl_prod, diet_data["Abs_ClIn"]
-        )
-    CuProd_CuAbs = micro_req.calculate_CuProd_CuAbs(
-        An_Cu_prod, diet_data["Abs_CuIn"]
-        )
-    FeProd_FeAbs = micro_req.calculate_FeProd_FeAbs(
-        An_Fe_prod, diet_data["Abs_FeIn"]
-        )
-    MnProd_MnAbs = micro_req.calculate_MnProd_MnAbs(
-        An_Mn_prod, diet_data["Abs_MnIn"]
-        )
-    ZnProd_ZnAbs = micro_req.calculate_ZnProd_ZnAbs(
-        An_Zn_prod, diet_data["Abs_ZnIn"]
-        )
-    
     ####################
     # Vitamin Requirements
     ####################
@@ -1652,48 +1403,8 @@ def nasem(
         )
 
     ####################
-    # Required Mineral Density
+    # Required Vitamin Density
     ####################
-    Dt_CaReq_DMI = micro_req.calculate_Dt_CaReq_DMI(
-        An_Ca_req, Dt_acCa, an_data['An_DMIn']
-        )
-    Dt_PReq_DMI = micro_req.calculate_Dt_PReq_DMI(
-        An_P_req, Dt_acP, an_data['An_DMIn']
-        )
-    Dt_MgReq_DMI = micro_req.calculate_Dt_MgReq_DMI(
-        An_Mg_req, Dt_acMg, an_data['An_DMIn']
-        )
-    Dt_KReq_DMI = micro_req.calculate_Dt_KReq_DMI(
-        An_K_req, Dt_acK, an_data['An_DMIn']
-        )
-    Dt_NaReq_DMI = micro_req.calculate_Dt_NaReq_DMI(
-        An_Na_req, Dt_acNa, an_data['An_DMIn']
-        )
-    Dt_ClReq_DMI = micro_req.calculate_Dt_ClReq_DMI(
-        An_Cl_req, Dt_acCl, an_data['An_DMIn']
-        )
-    Dt_SReq_DMI = micro_req.calculate_Dt_SReq_DMI(
-        An_S_req, an_data["An_DMIn"]
-        )
-    Dt_CoReq_DMI = micro_req.calculate_Dt_CoReq_DMI(
-        An_Co_req, an_data['An_DMIn']
-        )
-    Dt_CuReq_DMI = micro_req.calculate_Dt_CuReq_DMI(
-        An_Cu_req, Dt_acCu, an_data['An_DMIn']
-        )
-    Dt_FeReq_DMI = micro_req.calculate_Dt_FeReq_DMI(
-        An_Fe_req, Dt_acFe, an_data['An_DMIn']
-        )
-    Dt_IReq_DMI = micro_req.calculate_Dt_IReq_DMI(An_I_req, an_data['An_DMIn'])
-    Dt_MnReq_DMI = micro_req.calculate_Dt_MnReq_DMI(
-        An_Mn_req, Dt_acMn, an_data['An_DMIn']
-        )
-    Dt_SeReq_DMI = micro_req.calculate_Dt_SeReq_DMI(
-        An_Se_req, an_data['An_DMIn']
-        )
-    Dt_ZnReq_DMI = micro_req.calculate_Dt_ZnReq_DMI(
-        An_Zn_req, Dt_acZn, an_data['An_DMIn']
-        )
     Dt_VitAReq_DMI = micro_req.calculate_Dt_VitAReq_DMI(
         An_VitA_req, an_data["An_DMIn"]
         )
@@ -1752,21 +1463,13 @@ def nasem(
     Man_Nout_g = manure.calculate_Man_Nout_g(Ur_Nout_g, Fe_N_g, Scrf_N_g)
     Man_Nout2_g = manure.calculate_Man_Nout2_g(an_data["An_NIn_g"], An_Nprod_g)
     ManN_Milk = manure.calculate_ManN_Milk(Man_Nout_g, Mlk_Prod)
-    Man_Ca_out = manure.calculate_Man_Ca_out(diet_data["Dt_CaIn"], An_Ca_prod)
-    Man_P_out = manure.calculate_Man_P_out(diet_data["Dt_PIn"], An_P_prod)
-    Man_Mg_out = manure.calculate_Man_Mg_out(diet_data["Dt_MgIn"], An_Mg_prod)
-    Man_K_out = manure.calculate_Man_K_out(diet_data["Dt_KIn"], An_K_prod)
-    Man_Na_out = manure.calculate_Man_Na_out(diet_data["Dt_NaIn"], An_Na_prod)
-    Man_Cl_out = manure.calculate_Man_Cl_out(diet_data["Dt_ClIn"], An_Cl_prod)
     Man_MacMin_out = manure.calculate_Man_MacMin_out(
-        Man_Ca_out, Man_P_out, Man_Mg_out, Man_K_out, Man_Na_out, Man_Cl_out
+        *(mineral_values[f"Man_{mineral}_out"] 
+          for mineral in ["Ca", "P", "Mg", "K", "Na", "Cl"])
         )
-    Man_Cu_out = manure.calculate_Man_Cu_out(diet_data["Dt_CuIn"], An_Cu_prod)
-    Man_Fe_out = manure.calculate_Man_Fe_out(diet_data["Dt_FeIn"], An_Fe_prod)
-    Man_Mn_out = manure.calculate_Man_Mn_out(diet_data["Dt_MnIn"], An_Mn_prod)
-    Man_Zn_out = manure.calculate_Man_Zn_out(diet_data["Dt_ZnIn"], An_Zn_prod)
     Man_MicMin_out = manure.calculate_Man_MicMin_out(
-        Man_Cu_out, Man_Fe_out, Man_Mn_out, Man_Zn_out
+        *(mineral_values[f"Man_{mineral}_out"] 
+          for mineral in ["Cu", "Fe", "Mn", "Zn"])
         )
     Man_Min_out_g = manure.calculate_Man_Min_out_g(
         Man_MacMin_out, Man_MicMin_out
@@ -1846,17 +1549,39 @@ def nasem(
     An_BW_protein = report.calculate_An_BW_protein(
         animal_input["An_BW"], mPrt_coeff
         )
-    Dt_acCa_per_100g = report.calculate_Dt_acCa_per_100g(Dt_acCa)
-    Dt_acP_per_100g = report.calculate_Dt_acP_per_100g(Dt_acP)
-    Dt_acMg_per_100g = report.calculate_Dt_acMg_per_100g(Dt_acMg)
-    Dt_acCl_per_100g = report.calculate_Dt_acCl_per_100g(Dt_acCl)
-    Dt_acK_per_100g = report.calculate_Dt_acK_per_100g(Dt_acK)
-    Dt_acNa_per_100g = report.calculate_Dt_acNa_per_100g(Dt_acNa)
-    Dt_acCo_per_100g = report.calculate_Dt_acCo_per_100g(Dt_acCo)
-    Dt_acCu_per_100g = report.calculate_Dt_acCu_per_100g(Dt_acCu)
-    Dt_acFe_per_100g = report.calculate_Dt_acFe_per_100g(Dt_acFe)
-    Dt_acMn_per_100g = report.calculate_Dt_acMn_per_100g(Dt_acMn)
-    Dt_acZn_per_100g = report.calculate_Dt_acZn_per_100g(Dt_acZn)
+    Dt_acCa_per_100g = report.calculate_Dt_acCa_per_100g(
+        mineral_values["Dt_acCa"]
+        )
+    Dt_acP_per_100g = report.calculate_Dt_acP_per_100g(
+        mineral_values["Dt_acP"]
+        )
+    Dt_acMg_per_100g = report.calculate_Dt_acMg_per_100g(
+        mineral_values["Dt_acMg"]
+        )
+    Dt_acCl_per_100g = report.calculate_Dt_acCl_per_100g(
+        mineral_values["Dt_acCl"]
+        )
+    Dt_acK_per_100g = report.calculate_Dt_acK_per_100g(
+        mineral_values["Dt_acK"]
+        )
+    Dt_acNa_per_100g = report.calculate_Dt_acNa_per_100g(
+        mineral_values["Dt_acNa"]
+        )
+    Dt_acCo_per_100g = report.calculate_Dt_acCo_per_100g(
+        mineral_values["Dt_acCo"]
+        )
+    Dt_acCu_per_100g = report.calculate_Dt_acCu_per_100g(
+        mineral_values["Dt_acCu"]
+        )
+    Dt_acFe_per_100g = report.calculate_Dt_acFe_per_100g(
+        mineral_values["Dt_acFe"]
+        )
+    Dt_acMn_per_100g = report.calculate_Dt_acMn_per_100g(
+        mineral_values["Dt_acMn"]
+        )
+    Dt_acZn_per_100g = report.calculate_Dt_acZn_per_100g(
+        mineral_values["Dt_acZn"]
+        )
     An_MPuse_kg_Trg = report.calculate_An_MPuse_kg_Trg(An_MPuse_g_Trg)
     Dt_ForNDFIn_percNDF = report.calculate_Dt_ForNDFIn_percNDF(
         diet_data["Dt_ForNDFIn"], diet_data["Dt_NDFIn"]
@@ -1866,6 +1591,18 @@ def nasem(
     ####################
     # Capture Outputs
     ####################
+    feed_data = pd.DataFrame(feed_data)
+    aa_values = pd.DataFrame(aa_values, index=aa_list)
+    # Per amino acid outputs are Series indexed by amino acid, as before they
+    # were calculated on arrays. The names are those of the Series they were
+    # calculated from.
+    An_IdAAIn = pd.Series(An_IdAAIn, index=aa_list)
+    Dt_IdAARUPIn = pd.Series(Dt_IdAARUPIn, index=aa_list)
+    Inf_AA_g = pd.Series(Inf_AA_g, index=aa_list)
+    Fe_AAMet_AbsAA = pd.Series(Fe_AAMet_AbsAA, index=aa_list, name="Abs_AA_g")
+    Ur_AAEnd_AbsAA = pd.Series(Ur_AAEnd_AbsAA, index=aa_list, name="Abs_AA_g")
+    ScrfAA_AbsAA = pd.Series(ScrfAA_AbsAA, index=aa_list, name="Abs_AA_g")
     locals_dict = locals()
-    model_output = ModelOutput(locals_input=locals_dict)
+    locals_dict.update(locals_dict.pop("mineral_values"))
+    model_output = ModelOutput(locals_input=locals_dict, retain=retain)
     return model_output
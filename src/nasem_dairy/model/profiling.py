@@ -0,0 +1,231 @@
+"""Per-equation timing of model runs.
+
+Inside profile_equations(), every `calculate_*` function in the
+nasem_equations modules is replaced by a wrapper that counts calls and
+measures wall time. Each ModelOutput created by nasem() in the block gets a
+`timings` attribute with the timings of that run. The original functions are
+restored when the block exits, so there is no overhead when profiling is not
+active.
+
+Classes:
+    EquationTimings: Call counts and wall time per equation.
+
+Functions:
+    profile_equations: Context manager that records EquationTimings.
+
+Example:
+    with nd.profile_equations() as timings:
+        output = nd.nasem(user_diet, animal_input, equation_selection)
+
+    timings.by_module()
+    output.timings.by_function().head(10)
+"""
+import contextlib
+import functools
+import importlib
+import pkgutil
+import time
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+import nasem_dairy.model.nasem as nasem_module
+import nasem_dairy.nasem_equations as nasem_equations
+
+_profiling_active = False
+
+
+class EquationTimings:
+    """
+    Call counts and cumulative wall time per equation.
+
+    Total time includes the time spent in other profiled functions called by
+    an equation (e.g. calculate_diet_data calls many diet equations). Self
+    time excludes it, so self times add up to the time spent in profiled
+    code and can be summed per module without counting anything twice.
+
+    Attributes
+    ----------
+    records : Dict[Tuple[str, str], List[float]]
+        [calls, total time, self time] by (module, function), times in
+        seconds.
+    """
+    def __init__(self):
+        self.records: Dict[Tuple[str, str], List[float]] = {}
+
+    def record(
+        self,
+        module: str,
+        function: str,
+        total_time: float,
+        self_time: float
+    ) -> None:
+        entry = self.records.get((module, function))
+        if entry is None:
+            self.records[(module, function)] = [1, total_time, self_time]
+        else:
+            entry[0] += 1
+            entry[1] += total_time
+            entry[2] += self_time
+
+    @property
+    def total_time(self) -> float:
+        """Time spent in profiled functions, in seconds."""
+        return sum(entry[2] for entry in self.records.values())
+
+    def by_function(self) -> pd.DataFrame:
+        """
+        Timings of each function, slowest first.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns Module, Function, Calls, Total Time (s) and
+            Self Time (s), sorted by self time.
+        """
+        table = pd.DataFrame(
+            [
+                (module, function, int(calls), total_time, self_time)
+                for (module, function), (calls, total_time, self_time)
+                in self.records.items()
+            ],
+            columns=[
+                "Module", "Function", "Calls", "Total Time (s)", "Self Time (s)"
+            ]
+            )
+        return table.sort_values(
+            "Self Time (s)", ascending=False, ignore_index=True
+            )
+
+    def by_module(self) -> pd.DataFrame:
+        """
+        Timings summed over the functions of each module, slowest first.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns Module, Functions, Calls, Time (s) and Share (%). Time is
+            the sum of the self times of the module's functions.
+        """
+        table = self.by_function().groupby("Module", as_index=False).agg(
+            Functions=("Function", "size"),
+            Calls=("Calls", "sum"),
+            **{"Time (s)": ("Self Time (s)", "sum")}
+            )
+        total_time = table["Time (s)"].sum()
+        table["Share (%)"] = (
+            table["Time (s)"] / total_time * 100 if total_time else 0.0
+            )
+        return table.sort_values("Time (s)", ascending=False, ignore_index=True)
+
+    def __repr__(self) -> str:
+        calls = sum(int(entry[0]) for entry in self.records.values())
+        return (
+            f"EquationTimings({calls} calls, {self.total_time:.4f} s)\n"
+            f"{self.by_module().to_string()}"
+            )
+
+
+def _timed(
+    function: Callable,
+    module: str,
+    name: str,
+    sinks: List[EquationTimings],
+    stack: List[float]
+) -> Callable:
+    """Wrap function so every call is recorded in each of sinks."""
+    def wrapper(*args, **kwargs) -> Any:
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            total_time = time.perf_counter() - start
+            self_time = total_time - stack.pop()
+            stack[-1] += total_time
+            for timings in sinks:
+                timings.record(module, name, total_time, self_time)
+
+    return functools.update_wrapper(wrapper, function, updated=())
+
+
+def _equation_functions(
+    prefixes: Tuple[str, ...] = ("calculate_",)
+) -> Iterator[Tuple[Any, str, Callable]]:
+    """Yield (module, name, function) for nasem_equations functions."""
+    for module_info in pkgutil.iter_modules(nasem_equations.__path__):
+        module = importlib.import_module(
+            f"{nasem_equations.__name__}.{module_info.name}"
+            )
+        for name, function in list(vars(module).items()):
+            # Functions imported from another module are wrapped there
+            if (name.startswith(prefixes) and callable(function)
+                    and getattr(function, "__module__", None) == module.__name__):
+                yield module, name, function
+
+
+@contextlib.contextmanager
+def profile_equations() -> Iterator[EquationTimings]:
+    """
+    Record call counts and wall time of the model equations.
+
+    All `calculate_*` functions in nasem_equations are wrapped for the
+    duration of the block, without changes to the code that calls them.
+    Construction of ModelOutput is recorded as well, under the module
+    "model_output". Each ModelOutput created by nasem() gets a `timings`
+    attribute with the EquationTimings of its own run.
+
+    Profiling is not thread-safe and cannot be nested.
+
+    Yields
+    ------
+    EquationTimings
+        Timings of everything called in the block.
+
+    Raises
+    ------
+    RuntimeError
+        If profiling is already active.
+
+    Examples
+    --------
+    >>> with profile_equations() as timings:
+    ...     output = nasem(user_diet, animal_input, equation_selection)
+    >>> timings.by_module()
+    >>> output.timings.by_function()
+    """
+    global _profiling_active
+    if _profiling_active:
+        raise RuntimeError("profile_equations() is already active")
+
+    timings = EquationTimings()
+    # The second sink collects the current run and is replaced after each
+    # ModelOutput is created
+    sinks = [timings, EquationTimings()]
+    stack = [0.0]
+    originals = []
+    _profiling_active = True
+    try:
+        for module, name, function in _equation_functions():
+            originals.append((module, name, function))
+            setattr(module, name, _timed(
+                function, module.__name__.rsplit(".", 1)[-1], name, sinks, stack
+                ))
+
+        timed_output = _timed(
+            nasem_module.ModelOutput, "model_output", "ModelOutput", sinks, stack
+            )
+
+        def create_output(*args, **kwargs):
+            output = timed_output(*args, **kwargs)
+            output.timings = sinks[1]
+            sinks[1] = EquationTimings()
+            return output
+
+        originals.append((nasem_module, "ModelOutput", nasem_module.ModelOutput))
+        nasem_module.ModelOutput = create_output
+        yield timings
+    finally:
+        for module, name, function in originals:
+            setattr(module, name, function)
+        _profiling_active = False
@@ -12,18 +12,27 @@ Functions:
                     DataFrame and dictionaries.
     read_json_input: Reads input data from a JSON file and returns it as a 
                      DataFrame and dictionaries.
+    parse_json_input: Organizes input data loaded from JSON into a DataFrame 
+                      and dictionaries.
     demo: Provides input data for a given scenario from the demo directory.
     select_feeds: Selects specific feeds from the NASEM feed library based on 
                   a list of feed names.
+    adjust_diet: Adjusts feed library nutrients so the diet matches expected 
+                 nutrient values, one nutrient at a time or simultaneously.
+    evaluate_diets: Calculates diet intakes for many rations built from the 
+                    same feeds in one pass.
 """
 import importlib
 import json
 from typing import Dict, Tuple, Union, Optional, List
 
+import numpy as np
 import pandas as pd
 
+import nasem_dairy.data.constants as constants
 import nasem_dairy.nasem_equations.nutrient_intakes as diet
-from nasem_dairy.model.nasem import nasem
+# Module import as nasem.py also imports this module
+import nasem_dairy.model.nasem as model
 
 def get_feed_data(
     Trg_Dt_DMIn: float,
@@ -67,9 +76,11 @@ def get_feed_data(
         ```
     """
     feeds = user_diet["Feedstuff"].tolist()
+    # Select the diet's feeds before copying any columns of the library
+    is_selected = feed_library["Fd_Name"].str.strip().isin(feeds)
     selected_feeds = (
-        feed_library.assign(Fd_Name=lambda df: df["Fd_Name"].str.strip())
-        .loc[lambda df: df["Fd_Name"].isin(feeds)]
+        feed_library.loc[is_selected]
+        .assign(Fd_Name=lambda df: df["Fd_Name"].str.strip())
         .rename(columns={"Fd_Name": "Feedstuff"})
         .pipe(lambda df: df[
             ["Feedstuff"] + [col for col in df.columns if col != "Feedstuff"]
@@ -192,7 +203,26 @@ def read_json_input(file_path: str) -> Tuple[pd.DataFrame, Dict, Dict, Dict]:
     """
     with open(file_path, "r") as f:
         data = json.load(f)
-    
+    return parse_json_input(data)
+
+
+def parse_json_input(data: dict) -> Tuple[pd.DataFrame, Dict, Dict, Dict]:
+    """
+    Organizes input data already loaded from JSON into a DataFrame and dictionaries.
+
+    Accepts the same structure as read_json_input, for inputs that do not come 
+    from a file (e.g. requests to a model server).
+
+    Args:
+        data: A dictionary with user_diet, animal_input, equation_selection 
+              and infusion_input keys.
+
+    Returns:
+        tuple: The same tuple as read_json_input.
+
+    Raises:
+        KeyError: If any of the required keys are missing.
+    """
     user_diet = data["user_diet"]
     user_diet_df = pd.DataFrame({
         "Feedstuff": user_diet["Feedstuff"],
@@ -319,17 +349,64 @@ def adjust_nutrient(
     return (adjusted_nutrient, adjustment)
 
 
+def _calculate_diet_stage_values(
+    feed_data: pd.DataFrame,
+    factors: Dict[str, float],
+    output_names: List[str],
+    Dt_DMIn: float,
+    An_StatePhys: str,
+    Use_DNDF_IV: int,
+    coeff_dict: dict
+) -> np.ndarray:
+    feed_data = feed_data.copy()
+    for feed_column, factor in factors.items():
+        feed_data[feed_column] = feed_data[feed_column] * factor
+    feed_data["Fd_ForNDF"] = diet.calculate_Fd_ForNDF(
+        feed_data["Fd_NDF"], feed_data["Fd_Conc"]
+        )
+    feed_arrays = diet.calculate_feed_arrays(
+        Dt_DMIn, An_StatePhys, Use_DNDF_IV, diet.get_feed_arrays(feed_data), 
+        coeff_dict
+        )
+    diet_aggregates = diet.calculate_diet_aggregates(feed_arrays)
+    values = []
+    for name in output_names:
+        if name in diet_aggregates:
+            values.append(diet_aggregates[name])
+        # Concentrations such as Dt_CP are Dt_CPIn / Dt_DMIn * 100
+        elif f"{name}In" in diet_aggregates:
+            values.append(diet_aggregates[f"{name}In"] / Dt_DMIn * 100)
+        else:
+            raise ValueError(
+                f"{name} is not calculated from diet intakes, use "
+                f"method='sequential' to adjust it"
+                )
+    return np.array(values, dtype=float)
+
+
 def adjust_diet(
         animal_input: dict,
         equation_selection: dict,
         diet: pd.DataFrame,
         expected_nutrients: dict,
         nutrients_to_adjust: List[Tuple[str, str]],
-        feed_library: Optional[pd.DataFrame] = None
+        feed_library: Optional[pd.DataFrame] = None,
+        method: str = "sequential",
+        tolerance: Optional[float] = None,
+        max_iterations: int = 20,
+        coeff_dict: dict = constants.coeff_dict
     ) -> pd.DataFrame:
     """
     Adjust the diet to match the expected nutrient values.
 
+    The "sequential" method runs nasem() once for each nutrient and adjusts 
+    each feed column independently. The "simultaneous" method evaluates all 
+    observed Dt_ values from the diet intake stage only and solves the 
+    adjustment factors together, so adjustments that affect each other (e.g. 
+    Fd_NDF and Fd_NFC) are accounted for. With a tolerance, the simultaneous 
+    method repeats the diet intake stage until every observed value is 
+    within that relative tolerance of the expected value.
+
     Args:
     ----
     animal_input: dict
@@ -344,11 +421,27 @@ def adjust_diet(
         The nutrients to adjust.
     feed_library: Optional[pd.DataFrame]
         The feed library to use.
+    method: str
+        "sequential" (default) or "simultaneous".
+    tolerance: Optional[float]
+        Relative tolerance for the simultaneous method. If None a single 
+        joint adjustment is made.
+    max_iterations: int
+        Maximum number of joint adjustments for the simultaneous method.
+    coeff_dict: dict
+        Model coefficients, used by the simultaneous method.
 
     Returns:
     -------
     Tuple[pd.DataFrame, dict]
         The adjusted feed library and the adjustment factors.
+
+    Raises:
+    ------
+    ValueError
+        If method is not recognised, or for the simultaneous method, if an 
+        output is not calculated from diet intakes or the adjustments cannot 
+        be solved.
     """
     if feed_library is None:
         feed_library = select_feeds(list(diet["Feedstuff"]))
@@ -356,13 +449,148 @@ def adjust_diet(
     adjusted_feed_library = feed_library.copy(deep=True)
     adjustment_dict = {}
 
-    for feed_column, output_name in nutrients_to_adjust:
-        output = nasem(diet, animal_input, equation_selection, feed_library)
-        adjusted_nutrient, adjustment = adjust_nutrient(
-            feed_column, feed_library, expected_nutrients[output_name], 
-            output.get_value(output_name)
+    if method == "sequential":
+        for feed_column, output_name in nutrients_to_adjust:
+            output = model.nasem(
+                diet, animal_input, equation_selection, feed_library
+                )
+            adjusted_nutrient, adjustment = adjust_nutrient(
+                feed_column, feed_library, expected_nutrients[output_name], 
+                output.get_value(output_name)
+            )
+            adjusted_feed_library[feed_column] = adjusted_nutrient
+            adjustment_dict[feed_column] = adjustment
+        return adjusted_feed_library, adjustment_dict
+
+    if method != "simultaneous":
+        raise ValueError(
+            f"method must be 'sequential' or 'simultaneous', got {method}"
+            )
+
+    # Dt_DMIn only depends on the diet when a DMI prediction is selected
+    if equation_selection["DMIn_eqn"] == 0:
+        Dt_DMIn = animal_input["Trg_Dt_DMIn"]
+    else:
+        Dt_DMIn = model.nasem(
+            diet, animal_input, equation_selection, feed_library
+            ).get_value("Dt_DMIn")
+
+    feed_columns = [feed_column for feed_column, _ in nutrients_to_adjust]
+    output_names = [output_name for _, output_name in nutrients_to_adjust]
+    expected = np.array(
+        [expected_nutrients[name] for name in output_names], dtype=float
+        )
+    feed_data = get_feed_data(animal_input["Trg_Dt_DMIn"], diet, feed_library)
+    stage_args = (
+        output_names, Dt_DMIn, animal_input["An_StatePhys"], 
+        equation_selection["Use_DNDF_IV"], coeff_dict
+        )
+    factors = np.ones(len(feed_columns))
+    observed = _calculate_diet_stage_values(
+        feed_data, dict(zip(feed_columns, factors)), *stage_args
         )
-        adjusted_feed_library[feed_column] = adjusted_nutrient
-        adjustment_dict[feed_column] = adjustment
 
+    # Jacobian of the observed values with respect to the factors, the 
+    # outputs are close to linear in the factors so it is calculated once
+    step = 1e-4
+    jacobian = np.empty((len(output_names), len(feed_columns)))
+    for index in range(len(feed_columns)):
+        perturbed = factors.copy()
+        perturbed[index] += step
+        jacobian[:, index] = (_calculate_diet_stage_values(
+            feed_data, dict(zip(feed_columns, perturbed)), *stage_args
+            ) - observed) / step
+
+    iterations = 1 if tolerance is None else max_iterations
+    for _ in range(iterations):
+        try:
+            factors = factors + np.linalg.solve(jacobian, expected - observed)
+        except np.linalg.LinAlgError as error:
+            raise ValueError(
+                f"Adjustment factors cannot be solved for {output_names}: "
+                f"{error}"
+                ) from error
+        observed = _calculate_diet_stage_values(
+            feed_data, dict(zip(feed_columns, factors)), *stage_args
+            )
+        if (tolerance is not None and 
+            np.all(np.abs(observed - expected) <= tolerance * np.abs(expected))
+            ):
+            break
+
+    for feed_column, factor in zip(feed_columns, factors):
+        adjusted_feed_library[feed_column] = feed_library[feed_column] * factor
+        adjustment_dict[feed_column] = 1 - factor
     return adjusted_feed_library, adjustment_dict
+
+
+def evaluate_diets(
+    kg_user: pd.DataFrame,
+    An_StatePhys: str,
+    feed_library: Optional[pd.DataFrame] = None,
+    Dt_DMIn: Optional[Union[float, pd.Series]] = None,
+    Use_DNDF_IV: int = 0,
+    coeff_dict: Dict[str, float] = constants.coeff_dict
+) -> pd.DataFrame:
+    """
+    Calculate diet intakes for many rations built from the same feeds.
+
+    Feed level values are calculated once per feed and every ration is 
+    evaluated with a single matrix product, so large numbers of candidate 
+    diets can be screened without running nasem() for each one.
+
+    Args:
+        kg_user (pd.DataFrame): One row per diet and one column per feed name, 
+            with the kg DM of each feed in the diet.
+        An_StatePhys (str): Physiological state of the animal.
+        feed_library (pd.DataFrame, optional): Feed library to use. Defaults 
+            to the NASEM feed library.
+        Dt_DMIn (float or pd.Series, optional): Dry matter intake for every 
+            diet, or one value per diet. Defaults to the row sums of kg_user.
+        Use_DNDF_IV (int, optional): Equation selection for NDF digestibility. 
+            Defaults to 0.
+        coeff_dict (Dict[str, float], optional): Model coefficients.
+
+    Returns:
+        pd.DataFrame: One row per diet (same index as kg_user) and one column 
+        per diet intake in nutrient_intakes.DIET_MATRIX_COLUMNS.
+
+    Raises:
+        ValueError: If a feed in kg_user is not in the feed library.
+
+    Example:
+        ```python
+        kg_user = pd.DataFrame(
+            [[10, 5], [8, 7]], 
+            columns=["Corn silage, typical", "Canola meal"]
+        )
+        diets = evaluate_diets(kg_user, "Lactating Cow")
+        diets[["Dt_CPIn", "Dt_NDF"]]
+        ```
+    """
+    feeds = list(kg_user.columns)
+    if feed_library is None:
+        feed_library = select_feeds(feeds)
+    feed_library = feed_library.assign(
+        Fd_Name=feed_library["Fd_Name"].str.strip()
+        ).drop_duplicates("Fd_Name").set_index("Fd_Name")
+    missing_feeds = [feed for feed in feeds if feed not in feed_library.index]
+    if missing_feeds:
+        raise ValueError(
+            f"The following feeds are not in the feed library: {missing_feeds}"
+            )
+    feed_data = feed_library.loc[feeds].reset_index(drop=True)
+    feed_data["Fd_ForNDF"] = diet.calculate_Fd_ForNDF(
+        feed_data["Fd_NDF"], feed_data["Fd_Conc"]
+        )
+    if Dt_DMIn is None:
+        Dt_DMIn = kg_user.sum(axis=1)
+
+    diet_matrix = diet.calculate_diet_matrix(
+        np.asarray(Dt_DMIn, dtype=float), An_StatePhys, Use_DNDF_IV, 
+        kg_user.to_numpy(dtype=float), diet.get_feed_arrays(feed_data), 
+        coeff_dict
+        )
+    return pd.DataFrame(
+        diet_matrix, index=kg_user.index, columns=diet.DIET_MATRIX_COLUMNS
+        )
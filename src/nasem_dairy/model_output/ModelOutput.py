@@ -6,21 +6,78 @@ class loads output structures from JSON configuration files, categorizes the
 model outputs, and provides various methods for retrieving, displaying, and
 exporting the model data.
 
-Class:
+Classes:
     ModelOutput: Handles the organization and retrieval of model outputs.
+    OutputExtractor: Reads the same outputs from many ModelOutput objects.
 """
 
+import bisect
 import json
 import logging
 import os
+import pickle
 import re
-from typing import Any, Dict, List, Union
+import sys
+import warnings
+import zlib
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from nasem_dairy.sensitivity.response_variables_config import RESPONSE_VARIABLE_NAMES
 
+_STRUCTURE_CACHE: Dict[str, dict] = {}
+# Encoded layouts of pickled outputs. Outputs with the same variables share
+# a layout, so it is only encoded and decoded once per process.
+_ENCODED_LAYOUTS: Dict[tuple, bytes] = {}
+_DECODED_LAYOUTS: Dict[bytes, tuple] = {}
+_LAYOUT_CACHE_SIZE = 64
+# Kinds of values in a pickled output
+_FLOAT, _FLOAT64, _GROUP, _SERIES, _OTHER = range(5)
+# Version of the packed state. Packed states of other versions are rejected.
+_PICKLE_FORMAT = 2
+# Inputs in dev_out that are not pickled with an output
+_UNPICKLED_DEV_OUT = ("feed_library", "inputs")
+# Value of `retain` that keeps only RESPONSE_VARIABLE_NAMES
+RETAIN_RESPONSE_VARIABLES = "response_variables"
+
+
+def _read_only_error(*args, **kwargs):
+    raise TypeError(
+        "Output structures are shared by all outputs and cannot be changed"
+        )
+
+
+class _ReadOnlyDict(dict):
+    """A dict that cannot be changed, for structures shared between outputs."""
+    __setitem__ = __delitem__ = __ior__ = _read_only_error
+    clear = pop = popitem = setdefault = update = _read_only_error
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class _ReadOnlyList(list):
+    """A list that cannot be changed, for structures shared between outputs."""
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only_error
+    append = extend = insert = pop = remove = _read_only_error
+    clear = sort = reverse = _read_only_error
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+def _read_only(value: Any) -> Any:
+    """Make parsed JSON read-only all the way down."""
+    if isinstance(value, dict):
+        return _ReadOnlyDict(
+            (key, _read_only(item)) for key, item in value.items()
+            )
+    if isinstance(value, list):
+        return _ReadOnlyList(_read_only(item) for item in value)
+    return value
+
 
 class ModelOutput:
     """
@@ -40,6 +97,11 @@ class ModelOutput:
     report_config_path : str, optional
         Path to the JSON file containing the report structure, by default
         "./report_structure.json"
+    retain : str or List[str], optional
+        Keep only these outputs and drop everything else, including dev_out.
+        Names can be variables, DataFrame columns, groups or categories, at
+        any level of the structure. "response_variables" keeps only the
+        response variables. By default all outputs are kept.
 
     Attributes
     ----------
@@ -55,6 +117,18 @@ class ModelOutput:
         Structure loaded from the model output configuration file.
     report_structure : dict
         Structure loaded from the report configuration file.
+    timings : EquationTimings or None
+        Equation timings of the run when created inside profile_equations(),
+        otherwise None.
+
+    Notes
+    -----
+    Pickled outputs, e.g. results returned from worker processes, are packed
+    into a compact form. The structures are reloaded from their files instead
+    of being pickled. Variable names are stored in a compressed layout that is
+    shared by outputs with the same variables, floats in a single array and
+    DataFrames as arrays. The feed library and validated inputs in dev_out are
+    not pickled.
 
     Examples
     --------
@@ -74,12 +148,17 @@ class ModelOutput:
     >>> 
     >>> # Generate a report
     >>> summary_report = output.get_report("summary")
+    >>>
+    >>> # Keep only a few outputs when holding many results in memory
+    >>> output = ModelOutput(locals_dict, retain=["Mlk_Prod", "Requirements"])
+    >>> output.memory_usage()
     """
     def __init__(
         self, 
         locals_input: dict, 
         config_path: str = "./model_output_structure.json",
-        report_config_path: str = "./report_structure.json"
+        report_config_path: str = "./report_structure.json",
+        retain: Optional[Union[str, List[str]]] = None
     ):
         """
         Initialize ModelOutput with input data and configuration paths.
@@ -88,17 +167,22 @@ class ModelOutput:
             locals_input (dict): Dictionary of local input data.
             config_path (str): Path to the JSON file containing the model output structure.
             report_config_path (str): Path to the JSON file containing the report structure.
+            retain (str or List[str], optional): Names of the outputs to keep.
         """
         self.skip_attrs = ["categories_structure", "report_structure", 
                            "locals_input", "dev_out"]
         self.locals_input = locals_input
         self.dev_out = {}
+        self.timings = None
+        self._config_paths = (config_path, report_config_path)
         self.categories_structure = self.__load_structure(config_path)
         self.report_structure = self.__load_structure(report_config_path)
         self.__filter_locals_input()
         for name, structure in self.categories_structure.items():
             self.__populate_category(name, structure)
         self.__populate_uncategorized()
+        if retain is not None:
+            self.__retain(retain)
         self.categories = self.__get_category_list()
 
     ### Initalization ###
@@ -111,24 +195,8 @@ class ModelOutput:
 
         Returns:
             dict: The structure loaded from the JSON file.
-
-        Raises:
-            FileNotFoundError: If the JSON file does not exist.
-            ValueError: If there is an error decoding the JSON file.
         """
-        base_path = os.path.dirname(__file__)
-        full_path = os.path.join(base_path, config_path)
-
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(
-                f"The configuration file {full_path} does not exist."
-                )
-        
-        with open(full_path, 'r') as file:
-            try:
-                return json.load(file)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Error decoding JSON file {full_path}: {e}")
+        return _load_structure(config_path)
 
     def __filter_locals_input(self) -> None:
         """
@@ -146,11 +214,15 @@ class ModelOutput:
             - aa_list
             - mPrt_coeff_list
             - mPrt_k_AA
+            - mineral_requirements
             - path_to_package_data
+            - inputs
+            - retain
         """
         variables_to_remove = [
             "key", "value", "num_value", "feed_library", "aa_list",
-            "mPrt_coeff_list", "mPrt_k_AA", "path_to_package_data"
+            "mPrt_coeff_list", "mPrt_k_AA", "mineral_requirements",
+            "path_to_package_data", "inputs", "retain"
         ]
         for key in variables_to_remove:
             if key in self.locals_input:
@@ -211,6 +283,88 @@ class ModelOutput:
         self.Uncategorized.update(self.locals_input)
         self.locals_input.clear()
 
+    def __retain(self, retain: Union[str, List[str]]) -> None:
+        """
+        Drop all outputs except the retained names.
+
+        Groups that contain a retained name are kept with only the retained 
+        values, DataFrames with only the retained columns. Categories left 
+        empty and dev_out are removed. A warning lists the names in a list
+        that are not in the output, e.g. because of a typo. Names are not 
+        checked for "response_variables", as some of them are only 
+        calculated for lactating cows.
+
+        Args:
+            retain (str or List[str]): Names to keep, or "response_variables".
+
+        Raises:
+            ValueError: If retain is a string other than "response_variables".
+        """
+        if isinstance(retain, str):
+            if retain != RETAIN_RESPONSE_VARIABLES:
+                raise ValueError(
+                    f"retain must be a list of names or "
+                    f"'{RETAIN_RESPONSE_VARIABLES}', not '{retain}'"
+                    )
+            names = set(RESPONSE_VARIABLE_NAMES)
+        else:
+            names = set(retain)
+            self.__warn_unknown_names(names)
+
+        def _prune(group: dict) -> dict:
+            kept = {}
+            for key, value in group.items():
+                if key in names:
+                    kept[key] = value
+                elif isinstance(value, dict):
+                    value = _prune(value)
+                    if value:
+                        kept[key] = value
+                elif isinstance(value, pd.DataFrame):
+                    columns = [column for column in value.columns 
+                               if column in names]
+                    if columns:
+                        kept[key] = value[columns]
+            return kept
+
+        for category_name in self.__get_category_list():
+            if category_name in names:
+                continue
+            category = _prune(getattr(self, category_name))
+            if category:
+                setattr(self, category_name, category)
+            else:
+                delattr(self, category_name)
+        self.dev_out = {}
+
+    def __warn_unknown_names(self, names: set) -> None:
+        """
+        Warn about names that are not a category, key or DataFrame column.
+
+        Args:
+            names (set): Names to look for.
+        """
+        unknown = set(names)
+
+        def _discard_found(group: dict) -> None:
+            unknown.difference_update(group)
+            for value in group.values():
+                if not unknown:
+                    return
+                if isinstance(value, dict):
+                    _discard_found(value)
+                elif isinstance(value, pd.DataFrame):
+                    unknown.difference_update(value.columns)
+
+        for category_name in self.__get_category_list():
+            unknown.discard(category_name)
+            _discard_found(getattr(self, category_name))
+        if unknown:
+            warnings.warn(
+                f"Names to retain not found in the model output: "
+                f"{', '.join(sorted(map(str, unknown)))}"
+                )
+
     def __get_category_list(self) -> List[str]:
         """
         Returns a list of category names.
@@ -230,6 +384,164 @@ class ModelOutput:
             and isinstance(getattr(self, attr_name, None), dict)
         ]
 
+    ### Pickling ###
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pack the output for pickling.
+
+        The layout lists the keys of every dict in the output, e.g. 
+        ("milk", "Mlk_Prod") for the "milk" group of "Production", the kind 
+        of each value and the index labels and name of each Series. It is 
+        pickled and compressed once per layout. Floats and np.float64 values 
+        are stored in one array each, Series as their values and all other 
+        values as they are.
+
+        Returns:
+            Dict[str, Any]: The packed state.
+        """
+        groups = []
+        series_axes = []
+        floats = []
+        float64s = []
+        others = []
+
+        def _pack(group: dict) -> None:
+            kinds = []
+            groups.append((tuple(group), kinds))
+            for value in group.values():
+                value_type = type(value)
+                if value_type is float:
+                    kinds.append(_FLOAT)
+                    floats.append(value)
+                elif value_type is np.float64:
+                    kinds.append(_FLOAT64)
+                    float64s.append(value)
+                elif value_type is dict:
+                    kinds.append(_GROUP)
+                    _pack(value)
+                elif (value_type is pd.Series 
+                      and type(value.index) is pd.Index
+                      and value.index.dtype == object
+                      and value.index.name is None
+                      and isinstance(value.dtype, np.dtype)):
+                    kinds.append(_SERIES)
+                    series_axes.append((tuple(value.index), value.name))
+                    others.append(value.to_numpy())
+                else:
+                    kinds.append(_OTHER)
+                    others.append(value)
+
+        for category_name in self.categories:
+            _pack(getattr(self, category_name))
+
+        layout = (tuple(self.categories), 
+                  tuple((keys, tuple(kinds)) for keys, kinds in groups),
+                  tuple(series_axes))
+        encoded_layout = _ENCODED_LAYOUTS.get(layout)
+        if encoded_layout is None:
+            if len(_ENCODED_LAYOUTS) >= _LAYOUT_CACHE_SIZE:
+                _ENCODED_LAYOUTS.clear()
+            encoded_layout = zlib.compress(
+                pickle.dumps(layout, protocol=pickle.HIGHEST_PROTOCOL), 9
+                )
+            _ENCODED_LAYOUTS[layout] = encoded_layout
+
+        excluded = set(self.categories) | {
+            "categories_structure", "report_structure", "locals_input", 
+            "dev_out", "skip_attrs", "categories", "_search_index"
+        }
+        return {
+            "format": _PICKLE_FORMAT,
+            "layout": encoded_layout,
+            "floats": np.array(floats, dtype=np.float64),
+            "float64s": np.array(float64s, dtype=np.float64),
+            "others": others,
+            "dev_out": {
+                key: value for key, value in self.dev_out.items()
+                if key not in _UNPICKLED_DEV_OUT
+            },
+            "attributes": {
+                key: value for key, value in self.__dict__.items()
+                if key not in excluded
+            }
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Rebuild the output from the state created by __getstate__().
+
+        Args:
+            state (Dict[str, Any]): The packed state, or the attributes of an 
+                output pickled before packing was added.
+
+        Raises:
+            pickle.UnpicklingError: If the state was packed in a format that 
+                is no longer supported.
+        """
+        if "layout" not in state:
+            self.__dict__.update(state)
+            self.__dict__.setdefault(
+                "_config_paths", 
+                ("./model_output_structure.json", "./report_structure.json")
+                )
+            return
+        if state.get("format") != _PICKLE_FORMAT:
+            raise pickle.UnpicklingError(
+                f"Unsupported ModelOutput pickle format: {state.get('format')}"
+                )
+
+        self.__dict__.update(state["attributes"])
+        self.skip_attrs = ["categories_structure", "report_structure", 
+                           "locals_input", "dev_out"]
+        self.locals_input = {}
+        self.dev_out = state["dev_out"]
+        config_path, report_config_path = self._config_paths
+        self.categories_structure = self.__load_structure(config_path)
+        self.report_structure = self.__load_structure(report_config_path)
+
+        layout = _DECODED_LAYOUTS.get(state["layout"])
+        if layout is None:
+            if len(_DECODED_LAYOUTS) >= _LAYOUT_CACHE_SIZE:
+                _DECODED_LAYOUTS.clear()
+            category_names, groups, series_axes = pickle.loads(
+                zlib.decompress(state["layout"])
+                )
+            # Restored Series share their index
+            series_axes = tuple(
+                (pd.Index(labels, dtype=object), name) 
+                for labels, name in series_axes
+                )
+            layout = (category_names, groups, series_axes)
+            _DECODED_LAYOUTS[state["layout"]] = layout
+        category_names, groups, series_axes = layout
+
+        groups = iter(groups)
+        series_axes = iter(series_axes)
+        next_float = iter(state["floats"].tolist()).__next__
+        # Iterating the array yields np.float64 values
+        next_float64 = iter(state["float64s"]).__next__
+        next_other = iter(state["others"]).__next__
+
+        def _next_series() -> pd.Series:
+            index, name = next(series_axes)
+            return pd.Series(next_other(), index=index, name=name, copy=False)
+
+        def _unpack() -> dict:
+            keys, kinds = next(groups)
+            return dict(zip(keys, [readers[kind]() for kind in kinds]))
+
+        readers = {
+            _FLOAT: next_float,
+            _FLOAT64: next_float64,
+            _GROUP: _unpack,
+            _SERIES: _next_series,
+            _OTHER: next_other
+        }
+
+        for category_name in category_names:
+            setattr(self, category_name, _unpack())
+        self.categories = list(category_names)
+
     ### Display Methods ###
     def _repr_html_(self) -> str:
         """
@@ -407,27 +719,61 @@ class ModelOutput:
                 return result
         return None                   
 
+    def get_values(self, names: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve several values by name.
+
+        All names are found in a single pass over the output. Use an 
+        OutputExtractor to read the same names from many outputs.
+
+        Parameters
+        ----------
+        names : List[str]
+            The exact names of the variables, dictionaries or dataframes.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The value of each name, as returned by get_value(). None for
+            names that are not found.
+        """
+        return OutputExtractor(names).extract(self)
+
     def search(
         self, 
-        search_string: str, 
+        search_string: Union[str, re.Pattern], 
         dictionaries_to_search: Union[None, List[str]] = None,
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        match: str = "regex"
     ) -> pd.DataFrame:
         """
         Search for variables containing a specific string pattern.
 
         Performs a pattern search across all or specified categories and returns
         matching results in a structured DataFrame with location information.
+        Searches use an index of the variable names that is built once and 
+        shared by all outputs with the same variables, so repeated searches 
+        (e.g. while a name is typed) only match against the index.
 
         Parameters
         ----------
-        search_string : str
-            The string pattern to search for in variable names.
+        search_string : Union[str, re.Pattern]
+            The string pattern to search for in variable names. A compiled
+            pattern is used with its own flags.
         dictionaries_to_search : Union[None, List[str]], optional
             List of category names to search within. If None, searches all
             categories, by default None
         case_sensitive : bool, optional
             Whether the search should be case-sensitive, by default False
+        match : str, optional
+            How search_string is matched, by default "regex":
+            - 'regex': regular expression searched for in the full path of 
+              each variable (e.g. "Production.milk.Mlk_Prod"), so everything
+              in a matching dictionary is found, and in DataFrame column 
+              names
+            - 'substring': like 'regex', with search_string taken literally
+            - 'prefix': variable and column names that start with 
+              search_string
 
         Returns
         -------
@@ -437,128 +783,105 @@ class ModelOutput:
             - 'Value': Variable value or type description
             - 'Category': Top-level category name
             - 'Level 1', 'Level 2', etc.: Nested location information
-        """
-        def _recursive_search_search(
-            dict_to_search: Dict[str, Any], 
-            path: str = ""
-        ) -> None:
-            """
-            Recursively search for a string in a nested dictionary.
-
-            Args:
-                dict_to_search (Dict[str, Any]): The dictionary to search within.
-                path (str): The current search path.
-            """
-            for key, value in dict_to_search.items():
-                full_key = path + key
-                if ((re.search(search_string, str(full_key), 
-                               flags=user_flags)) and 
-                    full_key not in visited_keys
-                    ):
-                    result[full_key] = value
-                    visited_keys.add(full_key)
-                if isinstance(value, dict):
-                    _recursive_search_search(value, full_key + ".")
-                elif isinstance(value, pd.DataFrame):
-                    matching_columns = [
-                        col for col in value.columns
-                        if re.search(search_string, col, flags=user_flags)
-                    ]
-                    if matching_columns:
-                        columns_key = full_key + "_columns"
-                        if columns_key not in visited_keys:
-                            result[columns_key] = matching_columns
-                            visited_keys.add(columns_key)
-
-
-        def _extract_dataframe_and_column(
-            key: str, 
-            value: Any
-        ) -> Dict[str, Union[str, List[str]]]:
-            """
-            Extract information from a DataFrame column.
-
-            Args:
-                key (str): The key of the DataFrame.
-                value (Any): The value associated with the key.
-
-            Returns:
-                Dict[str, Union[str, List[str]]]: A dictionary containing
-                information about the DataFrame column.
-            """
-            df_name = key.split(".")[-1].rsplit("_", 1)[0]
-            return {'Name': value, 
-                    "Value": "pd.Series",
-                    'Category': key.split(".")[0],
-                    "Level 1": df_name,
-                    "Level 2": value
-                    }
-    
-
-        def _create_output_dataframe(result: dict) -> pd.DataFrame:
-            """
-            Create a DataFrame from the search result.
-
-            Args:
-                result (dict): The dictionary containing search results.
-
-            Returns:
-                pd.DataFrame: A DataFrame containing the search results.
-            """
-            table_rows = []
-            for key, value in result.items():
-                variable_name = key.split('.')[-1]
-                parts = key.split('.')
-                
-                category = parts.pop(0)
-                
-                if isinstance(value, dict):
-                    value_display = 'Dictionary'
-                elif isinstance(value, pd.DataFrame):
-                    value_display = 'DataFrame'
-                elif isinstance(value, list) and key.endswith('_columns'):
-                    table_rows.extend(
-                        [_extract_dataframe_and_column(key, col) for col in value])
-                elif isinstance(value, list):
-                    value_display = 'List'
-                else:
-                    value_display = value
-                # Add the current row to the list
-                if not (isinstance(value, list) and key.endswith('_columns')):
-                    row = {
-                        'Name': variable_name,
-                        'Value': value_display,
-                        'Category': category
-                    }
-                    for index, part in enumerate(parts):
-                        row[f"Level {index + 1}"] = part
-                    table_rows.append(row)
-            output_table = pd.DataFrame(table_rows)
-            output_table = (output_table
-                            .fillna('')
-                            .sort_values(by="Name")
-                            .reset_index(drop=True))
-            return output_table
-
 
+        Raises
+        ------
+        ValueError
+            If match is not one of the modes above, or search_string is a 
+            compiled pattern and match is not 'regex'.
+        """
+        if match not in _SEARCH_MODES:
+            raise ValueError(
+                f"match must be one of {', '.join(_SEARCH_MODES)}, "
+                f"got '{match}'"
+                )
+        if isinstance(search_string, re.Pattern) and match != "regex":
+            raise ValueError("A compiled pattern can only be used with "
+                             "match='regex'")
         if dictionaries_to_search is None:
             dictionaries_to_search = self.categories
-            
-        result = {}
-        visited_keys = set()
-        user_flags = 0 if case_sensitive else re.IGNORECASE
 
-        for dictionary_name in dictionaries_to_search:
+        groups = []
+        for dictionary_name in dict.fromkeys(dictionaries_to_search):
             dictionary = getattr(self, dictionary_name, None)
             if dictionary is not None and isinstance(dictionary, dict):
-                _recursive_search_search(dictionary, dictionary_name + '.')
+                groups.append((dictionary_name, dictionary))
+        # The index of this output is kept while the searched dictionaries 
+        # are the same objects with the same number of keys
+        signature = tuple(
+            (name, id(group), len(group)) for name, group in groups
+            )
+        cached = getattr(self, "_search_index", None)
+        if cached is not None and cached[0] == signature:
+            index = cached[1]
+        else:
+            index = _search_index(groups)
+            self._search_index = (signature, index)
+        positions = index.find(search_string, match, case_sensitive)
 
-        if not result:
-            print(f"No matches found for '{search_string}'")
+        if not positions:
+            pattern = getattr(search_string, "pattern", search_string)
+            print(f"No matches found for '{pattern}'")
             return pd.DataFrame(
                 columns=['Name', 'Value', 'Category', 'Level 1', 'Level 2']
                 )
-        return _create_output_dataframe(result)
+        return self.__search_table(index, positions)
+
+    def __search_table(
+        self, 
+        index: "_SearchIndex", 
+        positions: List[int]
+    ) -> pd.DataFrame:
+        """
+        Create the table of search results.
+
+        Args:
+            index (_SearchIndex): The index that was searched.
+            positions (List[int]): Positions of the matching entries.
+
+        Returns:
+            pd.DataFrame: One row per match, sorted by name.
+        """
+        names = []
+        values = []
+        categories = []
+        levels = []
+        for position in positions:
+            path = index.paths[position]
+            if path is None:
+                # A DataFrame column, found under the name of the DataFrame
+                column = index.names[position]
+                names.append(column)
+                values.append("pd.Series")
+                categories.append(index.keys[position].split(".")[0])
+                levels.append((index.keys[position].split(".")[-1], column))
+                continue
+
+            value = getattr(self, path[0])
+            for key in path[1:]:
+                value = value[key]
+            if isinstance(value, dict):
+                value = 'Dictionary'
+            elif isinstance(value, pd.DataFrame):
+                value = 'DataFrame'
+            elif isinstance(value, list):
+                value = 'List'
+            parts = index.keys[position].split(".")
+            names.append(parts[-1])
+            values.append(value)
+            categories.append(parts[0])
+            levels.append(parts[1:])
+
+        table = {"Name": names, "Value": values, "Category": categories}
+        for level in range(max(len(parts) for parts in levels)):
+            table[f"Level {level + 1}"] = [
+                parts[level] if level < len(parts) else np.nan 
+                for parts in levels
+            ]
+        return (pd.DataFrame(table)
+                .fillna('')
+                .sort_values(by="Name")
+                .reset_index(drop=True))
 
     def export_to_dict(self) -> Dict[str, Any]:
         """
@@ -680,13 +1003,51 @@ class ModelOutput:
         Notes
         -----
         This method uses the RESPONSE_VARIABLE_NAMES configuration to determine
-        which variables to include in the output.
+        which variables to include in the output. Values are read with an
+        OutputExtractor that is shared by all outputs.
+        """
+        return _RESPONSE_VARIABLE_EXTRACTOR.extract(self)
+
+    def memory_usage(self) -> pd.Series:
         """
-        data_dict = self.export_to_dict()
-        response_variables = {}
-        for name in RESPONSE_VARIABLE_NAMES:
-            response_variables[name] = (data_dict.get(name))
-        return response_variables
+        Approximate memory used by each category in bytes.
+
+        Sizes include the nested dictionaries, arrays and DataFrames of each
+        category. Objects referenced more than once, e.g. a value stored 
+        under two names, are counted once under the first category they are
+        found in. The output and report structures are shared by all 
+        ModelOutput objects and are not included.
+
+        Returns
+        -------
+        pd.Series
+            Bytes by category name, including dev_out.
+        """
+        seen = set()
+
+        def _size(value: Any) -> int:
+            if id(value) in seen:
+                return 0
+            seen.add(id(value))
+            if isinstance(value, pd.DataFrame):
+                return int(value.memory_usage(deep=True).sum())
+            if isinstance(value, pd.Series):
+                return int(value.memory_usage(deep=True))
+            size = sys.getsizeof(value)
+            if isinstance(value, np.ndarray) and value.base is not None:
+                size += _size(value.base)  # Views do not own their data
+            elif isinstance(value, dict):
+                size += sum(_size(item) for item in value.values())
+            elif isinstance(value, (list, tuple, set)):
+                size += sum(_size(item) for item in value)
+            return size
+
+        sizes = {
+            category_name: _size(getattr(self, category_name))
+            for category_name in self.categories
+        }
+        sizes["dev_out"] = _size(self.dev_out)
+        return pd.Series(sizes, name="Bytes")
 
     ### Report Creation ###
     def get_report(self, report_name: str) -> pd.DataFrame:
@@ -713,60 +1074,161 @@ class ModelOutput:
         ValueError
             If the report name is not found in the report structure configuration.
         """
-        if report_name not in self.report_structure:
-            raise ValueError(
-                f"Report {report_name} not found in the report structure."
-                )
+        templates = _report_templates(self.report_structure)
+        return templates.get(report_name).render(
+            templates.extractor((report_name,)).extract(self)
+            )
 
-        report_config = self.report_structure[report_name]
-        columns = list(report_config.keys())
+    def get_reports(
+        self, 
+        report_names: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Generate several reports.
 
-        description_columns = ["Description", "Target Performance"]
-        special_keys = ["Total", "Footnote"]
+        The values of all reports are read in a single pass over the output,
+        which is faster than calling get_report() for each report.
 
-        data = {col_name: [] for col_name in columns 
-                if col_name not in special_keys}
+        Parameters
+        ----------
+        report_names : List[str], optional
+            The names of the reports to generate, by default all reports in
+            the report structure.
 
-        for col_name, variables in report_config.items():
-            if col_name in special_keys:
-                continue
-            if col_name in description_columns:
-                data[col_name].extend(variables)
-                continue
-            for variable_name in variables:
-                if isinstance(variable_name, (int, float)):
-                    data[col_name].append(variable_name)
-                    continue
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Each report by name, as created by get_report().
 
-                value = self.get_value(variable_name)
-                if isinstance(value, (pd.Series, np.ndarray)):
-                    data[col_name].extend(value.tolist())
-                elif value is not None:
-                    data[col_name].append(value)
-                else:
-                    data[col_name].append("")
+        Raises
+        ------
+        ValueError
+            If a report name is not found in the report structure.
+        """
+        if report_names is None:
+            report_names = list(self.report_structure)
+        report_names = tuple(report_names)
+        templates = _report_templates(self.report_structure)
+        values = templates.extractor(report_names).extract(self)
+        return {
+            report_name: templates.get(report_name).render(values)
+            for report_name in report_names
+        }
 
-        report_df = pd.DataFrame(data)     
 
-        if "Total" in report_config:
-            total_row = ["Total"] + [self.get_value(value) 
-                                     for value in report_config["Total"] 
-                                     if value != "Total"] 
-            report_df.loc[len(report_df)] = total_row
-            
-        # NOTE This works to include footnotes in the table but it's very ugly.
-        # Dataframes aren't really meant to display long strings like this so
-        # they end up getting cut off. I can't find anything about including footnotes
-        # with a Dataframe. I think it's important to include this info but there 
-        # may be a better way to format it. Maybe we edit the footnotes to be shorter?
-        # - Braeden
-        if "Footnote" in report_config:
-            footnotes = report_config["Footnote"]
-            for key, footnote in footnotes.items():
-                # Adjust length of footnote row based on size of Dataframe
-                footnote_row = [key, footnote] + [""]*(len(report_df.columns)-2)
-                report_df.loc[len(report_df)] = footnote_row
-        return report_df
+class OutputExtractor:
+    """
+    Reads a fixed list of outputs from many ModelOutput objects.
+
+    Names are found where ModelOutput.get_value() would find them. The path 
+    of each name (e.g. Production -> milk -> Mlk_Prod) is found on the first 
+    output that has it and then read directly from every later output, so 
+    extracting a few names does not search or flatten the whole output. If 
+    a path is not in an output, the name is searched for again. All searches
+    of one output are done in a single pass.
+
+    Parameters
+    ----------
+    names : List[str]
+        The names of the outputs to read.
+
+    Examples
+    --------
+    >>> extractor = OutputExtractor(["Mlk_Prod", "An_MPBal_g_Trg"])
+    >>> rows = [extractor.extract(output) for output in outputs]
+    """
+    def __init__(self, names: List[str]):
+        self.names = list(names)
+        # Path of each name, None until it is found
+        self._paths: Dict[str, Optional[tuple]] = dict.fromkeys(self.names)
+
+    def extract(self, output: ModelOutput) -> Dict[str, Any]:
+        """
+        Read the outputs from a ModelOutput.
+
+        Parameters
+        ----------
+        output : ModelOutput
+            The output to read.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The value of each name, in the order of `names`. None for names
+            that are not found.
+        """
+        values = {}
+        missing = []
+        for name, path in self._paths.items():
+            value = None if path is None else self._follow(output, path)
+            if value is None:
+                missing.append(name)
+            values[name] = value
+        if missing:
+            paths = self._find_paths(output, missing)
+            for name, path in paths.items():
+                self._paths[name] = path
+                values[name] = self._follow(output, path)
+        return values
+
+    @staticmethod
+    def _follow(output: ModelOutput, path: tuple) -> Any:
+        """Return the value at path, or None if it is not in output."""
+        value = getattr(output, path[0], None)
+        for key in path[1:]:
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif isinstance(value, pd.DataFrame) and key in value.columns:
+                value = value[key]
+            else:
+                return None
+        return value
+
+    @staticmethod
+    def _find_paths(output: ModelOutput, names: List[str]) -> Dict[str, tuple]:
+        """
+        Find the paths of names in a single pass over the output.
+
+        Args:
+            output (ModelOutput): The output to search.
+            names (List[str]): The names to find.
+
+        Returns:
+            Dict[str, tuple]: The path of each name that was found.
+        """
+        paths = {}
+
+        def _search(group: dict, path: tuple, wanted: set) -> None:
+            # Keys of a dictionary take precedence over anything nested in it,
+            # a key with the value None stops the search in this dictionary
+            direct = wanted.intersection(group)
+            for name in direct:
+                if group[name] is not None:
+                    paths[name] = path + (name,)
+            wanted = wanted - direct
+            for key, value in group.items():
+                wanted = wanted - paths.keys()
+                if not wanted:
+                    return
+                if isinstance(value, dict):
+                    _search(value, path + (key,), wanted)
+                elif isinstance(value, pd.DataFrame):
+                    for name in wanted.intersection(value.columns):
+                        paths[name] = path + (key, name)
+
+        wanted = set(names)
+        for category_name in output.categories:
+            if category_name in wanted:
+                paths[category_name] = (category_name,)
+                wanted.discard(category_name)
+            _search(getattr(output, category_name), (category_name,), wanted)
+            wanted = wanted - paths.keys()
+            if not wanted:
+                break
+        return paths
+
+
+_RESPONSE_VARIABLE_EXTRACTOR = OutputExtractor(RESPONSE_VARIABLE_NAMES)
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -804,4 +1266,537 @@ class CustomJSONEncoder(json.JSONEncoder):
         else:
             logging.warning(f"Encountered non-serializable object of type {type(obj)}: {repr(obj)}")
             return str(obj)
-        
\ No newline at end of file
+        
+
+
+def _load_structure(config_path: str) -> dict:
+    """
+    Load a structure from a JSON file, relative to this module.
+
+    Args:
+        config_path (str): Path to the JSON file containing the structure.
+
+    Returns:
+        dict: The structure loaded from the JSON file.
+
+    Raises:
+        FileNotFoundError: If the JSON file does not exist.
+        ValueError: If there is an error decoding the JSON file.
+    """
+    base_path = os.path.dirname(__file__)
+    full_path = os.path.join(base_path, config_path)
+    # Each file is parsed once per process and shared read-only
+    if full_path in _STRUCTURE_CACHE:
+        return _STRUCTURE_CACHE[full_path]
+
+    if not os.path.exists(full_path):
+        raise FileNotFoundError(
+            f"The configuration file {full_path} does not exist."
+            )
+    
+    with open(full_path, 'r') as file:
+        try:
+            structure = json.load(file)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Error decoding JSON file {full_path}: {e}")
+    structure = _read_only(structure)
+    _STRUCTURE_CACHE[full_path] = structure
+    return structure
+
+
+class _ReportTemplate:
+    """
+    A report from the report structure, compiled for rendering.
+
+    Literal cells are kept as they are and the variables of all other cells 
+    are collected in `names`, so a report is rendered from the values of 
+    those names with a single DataFrame constructor.
+
+    Parameters
+    ----------
+    report_config : dict
+        The entry of the report in the report structure.
+    """
+    description_columns = ("Description", "Target Performance")
+    special_keys = ("Total", "Footnote")
+
+    def __init__(self, report_config: dict):
+        self.columns = [column for column in report_config 
+                        if column not in self.special_keys]
+        # (column, cells) where cells are (is_variable, value)
+        self.cells: List[tuple] = []
+        names = []
+        for column in self.columns:
+            cells = []
+            for item in report_config[column]:
+                is_variable = (
+                    column not in self.description_columns
+                    and not isinstance(item, (int, float)) and item != ""
+                    )
+                cells.append((is_variable, item))
+                if is_variable:
+                    names.append(item)
+            self.cells.append((column, cells))
+        self.total = None
+        if "Total" in report_config:
+            self.total = [name for name in report_config["Total"] 
+                          if name != "Total"]
+            names.extend(self.total)
+        self.footnotes = list(report_config.get("Footnote", {}).items())
+        self.names = list(dict.fromkeys(names))
+
+    def render(self, values: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Render the report.
+
+        Args:
+            values (Dict[str, Any]): The value of each name in `names`, None 
+                for variables that are not found.
+
+        Returns:
+            pd.DataFrame: The report.
+        """
+        return pd.DataFrame(dict(zip(self.columns, self._column_values(values))))
+
+    def _column_values(self, values: Dict[str, Any]) -> List[list]:
+        """The values of each column of the report, including extra rows."""
+        data = []
+        for column, cells in self.cells:
+            column_values = []
+            for is_variable, item in cells:
+                if not is_variable:
+                    column_values.append(item)
+                    continue
+                value = values[item]
+                if isinstance(value, (pd.Series, np.ndarray)):
+                    column_values.extend(value.tolist())
+                elif value is not None:
+                    column_values.append(value)
+                else:
+                    column_values.append("")
+            data.append(column_values)
+
+        if len({len(column_values) for column_values in data}) > 1:
+            raise ValueError("Columns of the report have different lengths")
+
+        # Total and footnote rows are added to the columns, so the report is 
+        # created with one constructor
+        extra_rows = []
+        if self.total is not None:
+            extra_rows.append(["Total"] + [values[name] for name in self.total])
+        # NOTE This works to include footnotes in the table but it's very ugly.
+        # Dataframes aren't really meant to display long strings like this so
+        # they end up getting cut off. I can't find anything about including footnotes
+        # with a Dataframe. I think it's important to include this info but there 
+        # may be a better way to format it. Maybe we edit the footnotes to be shorter?
+        # - Braeden
+        for key, footnote in self.footnotes:
+            extra_rows.append([key, footnote] + [""] * (len(data) - 2))
+        for row in extra_rows:
+            if len(row) != len(data):
+                raise ValueError(
+                    "Total and footnote rows must have one value per column"
+                    )
+            for column_values, value in zip(data, row):
+                column_values.append(value)
+        return data
+
+    def render_stacked(
+        self, 
+        run_ids: List[Any], 
+        vectors: Dict[str, Union[np.ndarray, List[Any]]]
+    ) -> pd.DataFrame:
+        """
+        Render the report for many runs into one table.
+
+        Each variable slot is filled for all runs at once from the vector of
+        its values. If a Series or array variable has a different length in
+        some runs, the runs are rendered one after another instead.
+
+        Args:
+            run_ids (List[Any]): The id of each run.
+            vectors (Dict[str, Union[np.ndarray, List[Any]]]): The values of 
+                each name in `names`, one per run, None where a variable is 
+                not found. Float arrays are used as they are.
+
+        Returns:
+            pd.DataFrame: A "Run" column, followed by the columns of the 
+                report. The rows of each run are in the order of the report.
+        """
+        n_runs = len(run_ids)
+        blocks = []
+        for column, cells in self.cells:
+            column_blocks = []
+            for is_variable, item in cells:
+                if not is_variable:
+                    column_blocks.append(_literal_block(item, n_runs))
+                    continue
+                block = _slot_block(vectors[item], n_runs)
+                if block is None:
+                    return self._render_each(run_ids, vectors)
+                column_blocks.append(block)
+            blocks.append(column_blocks)
+
+        widths = {sum(block.shape[1] for block in column_blocks) 
+                  for column_blocks in blocks}
+        if len(widths) > 1:
+            raise ValueError("Columns of the report have different lengths")
+
+        extra_rows = []
+        if self.total is not None:
+            extra_rows.append(
+                [_literal_block("Total", n_runs)] 
+                + [_value_block(vectors[name], n_runs) for name in self.total]
+                )
+        for key, footnote in self.footnotes:
+            extra_rows.append([
+                _literal_block(item, n_runs)
+                for item in [key, footnote] + [""] * (len(blocks) - 2)
+            ])
+        for row in extra_rows:
+            if len(row) != len(blocks):
+                raise ValueError(
+                    "Total and footnote rows must have one value per column"
+                    )
+            for column_blocks, block in zip(blocks, row):
+                column_blocks.append(block)
+
+        rows_per_run = sum(block.shape[1] for block in blocks[0]) if blocks else 0
+        data = {"Run": np.repeat(np.array(run_ids, dtype=object), rows_per_run)}
+        for column, column_blocks in zip(self.columns, blocks):
+            data[column] = np.hstack(column_blocks).ravel().tolist()
+        return pd.DataFrame(data)
+
+    def _render_each(
+        self, 
+        run_ids: List[Any], 
+        vectors: Dict[str, Union[np.ndarray, List[Any]]]
+    ) -> pd.DataFrame:
+        """Render the runs one after another into one table."""
+        run_column = []
+        data = [[] for _ in self.columns]
+        for position, run_id in enumerate(run_ids):
+            run_data = self._column_values({
+                name: _item(vector[position]) 
+                for name, vector in vectors.items()
+            })
+            run_column.extend([run_id] * len(run_data[0]))
+            for column_values, run_values in zip(data, run_data):
+                column_values.extend(run_values)
+        return pd.DataFrame(
+            {"Run": run_column, **dict(zip(self.columns, data))}
+            )
+
+
+def _item(value: Any) -> Any:
+    """Python float for the values of float vectors, like single reports."""
+    return value.item() if type(value) is np.float64 else value
+
+
+def _literal_block(item: Any, n_runs: int) -> np.ndarray:
+    block = np.empty((n_runs, 1), dtype=object)
+    block.fill(item)
+    return block
+
+
+def _value_block(
+    vector: Union[np.ndarray, List[Any]], 
+    n_runs: int
+) -> np.ndarray:
+    """One row per run with the values of vector as they are."""
+    if isinstance(vector, np.ndarray) and vector.dtype.kind == "f":
+        return vector.astype(object).reshape(n_runs, 1)
+    block = np.empty((n_runs, 1), dtype=object)
+    for position, value in enumerate(vector):
+        block[position, 0] = value
+    return block
+
+
+def _slot_block(
+    vector: Union[np.ndarray, List[Any]], 
+    n_runs: int
+) -> Optional[np.ndarray]:
+    """
+    The rows of a variable slot for every run.
+
+    Args:
+        vector (Union[np.ndarray, List[Any]]): The value of the variable in 
+            each run.
+        n_runs (int): The number of runs.
+
+    Returns:
+        Optional[np.ndarray]: An object array with one row per run. Series and
+            arrays fill one column per value, missing values are "". None if
+            the number of values differs between runs.
+    """
+    if isinstance(vector, np.ndarray) and vector.dtype.kind == "f":
+        return vector.astype(object).reshape(n_runs, 1)
+    width = None
+    rows = []
+    for value in vector:
+        if isinstance(value, (pd.Series, np.ndarray)):
+            value = value.tolist()
+        else:
+            value = ["" if value is None else value]
+        if width is None:
+            width = len(value)
+        elif len(value) != width:
+            return None
+        rows.append(value)
+    block = np.empty((n_runs, width or 0), dtype=object)
+    if width == 1:
+        # Assigned one by one, so values that are lists stay in one cell
+        for position, value in enumerate(rows):
+            block[position, 0] = value[0]
+    else:
+        for position, value in enumerate(rows):
+            block[position, :] = value
+    return block
+
+
+class _ReportTemplates:
+    """
+    Compiled reports of a report structure.
+
+    Reports are compiled when they are first used. Each report has an
+    OutputExtractor for its variables, and every set of reports rendered 
+    together with get_reports() has one for the variables of all of them.
+    """
+    def __init__(self, report_structure: dict):
+        self.report_structure = report_structure
+        self.templates: Dict[str, _ReportTemplate] = {}
+        self.extractors: Dict[tuple, OutputExtractor] = {}
+
+    def get(self, report_name: str) -> _ReportTemplate:
+        template = self.templates.get(report_name)
+        if template is None:
+            if report_name not in self.report_structure:
+                raise ValueError(
+                    f"Report {report_name} not found in the report structure."
+                    )
+            template = _ReportTemplate(self.report_structure[report_name])
+            self.templates[report_name] = template
+        return template
+
+    def extractor(self, report_names: tuple) -> OutputExtractor:
+        extractor = self.extractors.get(report_names)
+        if extractor is None:
+            names = []
+            for report_name in report_names:
+                names.extend(self.get(report_name).names)
+            extractor = OutputExtractor(list(dict.fromkeys(names)))
+            self.extractors[report_names] = extractor
+        return extractor
+
+
+# Compiled reports by id of the report structure. The structure is kept with
+# its templates, so its id is not reused while it is in the cache.
+_REPORT_TEMPLATES: Dict[int, Tuple[dict, _ReportTemplates]] = {}
+
+
+def _report_templates(report_structure: dict) -> _ReportTemplates:
+    """
+    Return the compiled reports of a report structure.
+
+    Args:
+        report_structure (dict): Structure loaded from the report 
+            configuration file.
+
+    Returns:
+        _ReportTemplates: The compiled reports, shared by every ModelOutput 
+            with the same report structure.
+    """
+    entry = _REPORT_TEMPLATES.get(id(report_structure))
+    if entry is None:
+        entry = (report_structure, _ReportTemplates(report_structure))
+        _REPORT_TEMPLATES[id(report_structure)] = entry
+    return entry[1]
+
+
+# Search indexes by layout of the searched dictionaries, see _search_layout()
+_SEARCH_INDEXES: Dict[tuple, "_SearchIndex"] = {}
+_SEARCH_INDEX_CACHE_SIZE = 64
+_SEARCH_MODES = ("regex", "substring", "prefix")
+
+
+class _SearchIndex:
+    """
+    Names and paths of everything ModelOutput.search() can match.
+
+    Entries are in the order the searched dictionaries are walked. An entry
+    is either a key, matched on its full path (e.g. 
+    "Production.milk.Mlk_Prod"), or a DataFrame column, matched on the 
+    column name. Names are sorted once per case for prefix queries.
+
+    Parameters
+    ----------
+    groups : List[Tuple[str, dict]]
+        Name and dictionary of each searched category.
+    """
+    def __init__(self, groups: List[Tuple[str, dict]]):
+        # Full path of each key, or of the DataFrame of each column
+        self.keys: List[str] = []
+        # Key or column name of each entry
+        self.names: List[Any] = []
+        # Path of the value of each key, None for columns
+        self.paths: List[Optional[tuple]] = []
+        # Text matched by regex and substring queries
+        self.texts: List[str] = []
+        # Entries of each group, as (start, stop)
+        self.ranges: Dict[str, Tuple[int, int]] = {}
+        for group_name, group in groups:
+            start = len(self.keys)
+            self._add(group, (group_name,), group_name + ".")
+            self.ranges[group_name] = (start, len(self.keys))
+        self._lower_texts: Optional[List[str]] = None
+        self._sorted_names: Dict[bool, Tuple[List[str], List[int]]] = {}
+
+    def _add(self, group: dict, path: tuple, prefix: str) -> None:
+        """Add the keys of group and everything nested in it."""
+        for key, value in group.items():
+            full_key = prefix + key
+            self.keys.append(full_key)
+            self.names.append(key)
+            self.paths.append(path + (key,))
+            self.texts.append(full_key)
+            if isinstance(value, dict):
+                self._add(value, path + (key,), full_key + ".")
+            elif isinstance(value, pd.DataFrame):
+                for column in value.columns:
+                    self.keys.append(full_key)
+                    self.names.append(column)
+                    self.paths.append(None)
+                    self.texts.append(str(column))
+
+    def find(
+        self, 
+        search_string: Union[str, re.Pattern], 
+        match: str, 
+        case_sensitive: bool
+    ) -> List[int]:
+        """
+        Find the entries that match a query.
+
+        Args:
+            search_string (Union[str, re.Pattern]): The query.
+            match (str): 'regex', 'substring' or 'prefix'.
+            case_sensitive (bool): Whether string queries are case-sensitive.
+
+        Returns:
+            List[int]: Positions of the matching entries, in index order.
+        """
+        if match == "prefix":
+            return self._find_prefix(search_string, case_sensitive)
+
+        if match == "substring":
+            if case_sensitive:
+                return [
+                    position for position, text in enumerate(self.texts)
+                    if search_string in text
+                ]
+            search_string = search_string.lower()
+            return [
+                position for position, text in enumerate(self._lower())
+                if search_string in text
+            ]
+
+        if isinstance(search_string, re.Pattern):
+            pattern = search_string
+        elif re.escape(search_string) == search_string:
+            # Without special characters a regex is a substring
+            return self.find(search_string, "substring", case_sensitive)
+        else:
+            pattern = re.compile(
+                search_string, flags=0 if case_sensitive else re.IGNORECASE
+                )
+        search = pattern.search
+        return [
+            position for position, text in enumerate(self.texts)
+            if search(text)
+        ]
+
+    def _find_prefix(self, prefix: str, case_sensitive: bool) -> List[int]:
+        """Find the entries with names that start with prefix."""
+        if case_sensitive not in self._sorted_names:
+            names = [str(name) for name in self.names]
+            if not case_sensitive:
+                names = [name.lower() for name in names]
+            order = sorted(range(len(names)), key=names.__getitem__)
+            self._sorted_names[case_sensitive] = (
+                [names[position] for position in order], order
+                )
+        sorted_names, order = self._sorted_names[case_sensitive]
+        if not case_sensitive:
+            prefix = prefix.lower()
+
+        positions = []
+        start = bisect.bisect_left(sorted_names, prefix)
+        for name, position in zip(
+            sorted_names[start:], order[start:]
+        ):
+            if not name.startswith(prefix):
+                break
+            positions.append(position)
+        return sorted(positions)
+
+    def _lower(self) -> List[str]:
+        """Return texts in lower case."""
+        if self._lower_texts is None:
+            self._lower_texts = [text.lower() for text in self.texts]
+        return self._lower_texts
+
+
+def _search_layout(groups: List[Tuple[str, dict]]) -> tuple:
+    """
+    Describe the keys of groups and everything nested in them.
+
+    Args:
+        groups (List[Tuple[str, dict]]): Name and dictionary of each group.
+
+    Returns:
+        tuple: The group names, then for each dictionary walked its keys and
+            the kind of each value (1 for dictionaries, 2 for DataFrames), 
+            and the columns of each DataFrame. Groups with the same layout 
+            have the same search index.
+    """
+    layout = [tuple(group_name for group_name, _ in groups)]
+
+    def _walk(group: dict) -> None:
+        kinds = tuple(
+            1 if isinstance(value, dict) 
+            else 2 if isinstance(value, pd.DataFrame) 
+            else 0
+            for value in group.values()
+        )
+        layout.append((tuple(group), kinds))
+        for value, kind in zip(group.values(), kinds):
+            if kind == 1:
+                _walk(value)
+            elif kind == 2:
+                layout.append(tuple(value.columns))
+
+    for _, group in groups:
+        _walk(group)
+    return tuple(layout)
+
+
+def _search_index(groups: List[Tuple[str, dict]]) -> _SearchIndex:
+    """
+    Return the search index of groups.
+
+    Args:
+        groups (List[Tuple[str, dict]]): Name and dictionary of each 
+            searched category.
+
+    Returns:
+        _SearchIndex: The index, shared by every ModelOutput with the same 
+            layout.
+    """
+    layout = _search_layout(groups)
+    index = _SEARCH_INDEXES.get(layout)
+    if index is None:
+        if len(_SEARCH_INDEXES) >= _SEARCH_INDEX_CACHE_SIZE:
+            _SEARCH_INDEXES.clear()
+        index = _SearchIndex(groups)
+        _SEARCH_INDEXES[layout] = index
+    return index
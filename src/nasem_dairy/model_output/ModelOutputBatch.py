@@ -0,0 +1,798 @@
+"""Columnar storage for the outputs of many model runs.
+
+This module defines the `ModelOutputBatch` class, which holds the results of
+many runs without keeping a ModelOutput object per run. Scalar outputs of all
+runs are stored in one (runs × variables) float matrix with a name index, so
+a variable is read for every run with a single column lookup. Arrays, Series
+and DataFrames are stored column-wise: the values of all runs are
+concatenated into one array per variable (or DataFrame column) with offsets
+for each run.
+
+Class:
+    ModelOutputBatch: Holds the outputs of many model runs.
+
+Functions:
+    stack_reports: Generates a report for many outputs as one table.
+
+Example:
+    batch = ModelOutputBatch.from_outputs(outputs)
+    batch.get_value("Mlk_Prod")
+    high_yield = batch.filter(batch.get_value("Mlk_Prod") > 35)
+    high_yield.to_dataframe(["Mlk_Prod", "An_MPBal_g_Trg"])
+    batch.get_report("table1_1", run=0)
+    stack_reports(batch, "table4_1")
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from nasem_dairy.model_output.ModelOutput import (
+    ModelOutput, _load_structure, _report_templates
+)
+
+# Kinds of non-scalar values
+_ARRAY, _SERIES, _FRAME, _OBJECT = "array", "series", "frame", "object"
+
+
+def _flatten(
+    output: Union[ModelOutput, Mapping[str, Any]]
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Collect the values of an output by name.
+
+    Names are resolved like ModelOutput.get_value(): a key found earlier in
+    the search takes precedence over later keys with the same name. Nested
+    dictionaries are stored as their values.
+
+    Args:
+        output (Union[ModelOutput, Mapping[str, Any]]): A ModelOutput, or a
+            mapping of names to values, e.g. the outputs of a ModelServer
+            response.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, str]]: Values by name, and the name of
+            the DataFrame that contains each DataFrame column.
+    """
+    values = {}
+    columns = {}
+
+    def _add(group: Mapping[str, Any]) -> None:
+        for key, value in group.items():
+            if value is not None and not isinstance(value, dict):
+                values.setdefault(key, value)
+        for key, value in group.items():
+            if isinstance(value, dict):
+                _add(value)
+            elif isinstance(value, pd.DataFrame):
+                for column in value.columns:
+                    columns.setdefault(column, key)
+
+    if isinstance(output, ModelOutput):
+        for category_name in output.categories:
+            _add(getattr(output, category_name))
+    else:
+        _add(output)
+    return values, columns
+
+
+def _is_scalar(value: Any) -> bool:
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return True
+    return isinstance(value, (np.floating, np.integer))
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, pd.DataFrame):
+        if value.columns.is_unique:
+            return _FRAME
+    elif isinstance(value, pd.Series):
+        if value.dtype.kind in "fiu":
+            return _SERIES
+    elif isinstance(value, np.ndarray):
+        if value.ndim == 1 and value.dtype.kind in "fiu":
+            return _ARRAY
+    return _OBJECT
+
+
+def _frame_columns(frame: pd.DataFrame) -> List[np.ndarray]:
+    """Arrays of the columns of a DataFrame, taken from one array per dtype."""
+    dtypes = frame.dtypes.to_numpy()
+    columns = [None] * len(dtypes)
+    for dtype in dict.fromkeys(dtypes):
+        positions = np.flatnonzero(dtypes == dtype)
+        block = frame.iloc[:, positions].to_numpy()
+        for column, position in enumerate(positions.tolist()):
+            columns[position] = block[:, column]
+    return columns
+
+
+class _RaggedColumn:
+    """
+    Non-scalar values of one variable for the runs that have it.
+
+    Arrays and Series are concatenated into one array, DataFrames into one
+    array per column. Values are kept per run until they are read, then
+    concatenated once and replaced by views of the concatenated arrays.
+    """
+    def __init__(self, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.runs: List[int] = []
+        # Run position -> entry
+        self.entries: Dict[int, int] = {}
+        # 1D arrays, lists of column arrays (frames) or objects
+        self.values: List[Any] = []
+        # Index of each Series or DataFrame
+        self.indexes: List[Optional[pd.Index]] = []
+        self.columns: Optional[pd.Index] = None
+        self.series_name = None
+        self._concatenated = None
+
+    def fits(self, value: Any) -> bool:
+        kind = _kind(value)
+        if kind != self.kind:
+            return False
+        return (kind != _FRAME or self.columns is None 
+                or value.columns.equals(self.columns))
+
+    def append(self, run: int, value: Any) -> None:
+        if self.kind != _OBJECT and not self.fits(value):
+            self.to_objects()
+        self.entries[run] = len(self.runs)
+        self.runs.append(run)
+        self._concatenated = None
+        if self.kind == _OBJECT:
+            self.values.append(value)
+            return
+        if self.kind == _ARRAY:
+            self.values.append(value)
+            self.indexes.append(None)
+            return
+        if self.kind == _FRAME:
+            if self.columns is None:
+                self.columns = value.columns
+            self.values.append(_frame_columns(value))
+        else:
+            if not self.values:
+                self.series_name = value.name
+            self.values.append(value.to_numpy())
+        # Runs usually share the same index, keep one copy of it
+        index = value.index
+        if self.indexes and index.equals(self.indexes[-1]):
+            index = self.indexes[-1]
+        self.indexes.append(index)
+
+    def to_objects(self) -> None:
+        """Store values as objects, used when runs have different layouts."""
+        self.values = [self.get(run) for run in self.runs]
+        self.indexes = []
+        self.columns = None
+        self.kind = _OBJECT
+        self._concatenated = None
+
+    def concatenated(self) -> Tuple[List[np.ndarray], np.ndarray]:
+        """
+        Concatenate the values of all runs.
+
+        Returns:
+            Tuple[List[np.ndarray], np.ndarray]: One array per DataFrame
+                column (one array for arrays and Series), and the offset of
+                each run in them.
+        """
+        if self._concatenated is None:
+            lengths = [
+                len(value[0]) if self.kind == _FRAME else len(value)
+                for value in self.values
+            ]
+            offsets = np.zeros(len(lengths) + 1, dtype=np.intp)
+            np.cumsum(lengths, out=offsets[1:])
+            if self.kind == _FRAME:
+                arrays = [
+                    np.concatenate([value[position] for value in self.values])
+                    for position in range(len(self.columns))
+                ]
+                self.values = [
+                    [array[start:end] for array in arrays]
+                    for start, end in zip(offsets[:-1], offsets[1:])
+                ]
+            else:
+                arrays = [np.concatenate(self.values)]
+                self.values = [
+                    arrays[0][start:end]
+                    for start, end in zip(offsets[:-1], offsets[1:])
+                ]
+            self._concatenated = (arrays, offsets)
+        return self._concatenated
+
+    def get(self, run: int) -> Any:
+        entry = self.entries.get(run)
+        if entry is None:
+            return None
+        value = self.values[entry]
+        if self.kind == _SERIES:
+            return pd.Series(
+                value, index=self.indexes[entry], name=self.series_name
+                )
+        if self.kind == _FRAME:
+            return pd.DataFrame(
+                dict(zip(self.columns, value)), index=self.indexes[entry]
+                )
+        return value
+
+    def get_column(self, run: int, column: str) -> Optional[pd.Series]:
+        entry = self.entries.get(run)
+        if entry is None:
+            return None
+        if self.kind == _FRAME:
+            position = self.columns.get_loc(column)
+            return pd.Series(
+                self.values[entry][position], index=self.indexes[entry],
+                name=column
+                )
+        value = self.values[entry]
+        if isinstance(value, pd.DataFrame) and column in value.columns:
+            return value[column]
+        return None
+
+    def take(self, runs: np.ndarray) -> "_RaggedColumn":
+        """Copy of the values of runs, renumbered in the order of runs."""
+        column = _RaggedColumn(self.name, self.kind)
+        column.columns = self.columns
+        column.series_name = self.series_name
+        for new_run, run in enumerate(runs.tolist()):
+            entry = self.entries.get(run)
+            if entry is None:
+                continue
+            column.entries[new_run] = len(column.runs)
+            column.runs.append(new_run)
+            column.values.append(self.values[entry])
+            if self.indexes:
+                column.indexes.append(self.indexes[entry])
+        return column
+
+
+class ModelOutputBatch:
+    """
+    Outputs of many model runs in columnar storage.
+
+    Scalar outputs (ints and floats) of every run are stored as floats in a
+    (runs × variables) matrix. Outputs that are missing in a run are NaN.
+    Arrays, Series and DataFrames are stored column-wise, other values
+    (strings, booleans, lists) as they are.
+
+    Batches are filled with append(), from_outputs(), or by passing the batch
+    as the writer of `nasem_dairy.cli.run_scenarios()`. Values are looked up
+    by name, like ModelOutput.get_value(), with nested dictionaries stored as
+    their values.
+
+    Parameters
+    ----------
+    report_config_path : str, optional
+        Path to the report configuration file used by get_report(), by
+        default "./report_structure.json".
+
+    Attributes
+    ----------
+    run_ids : List[Any]
+        Identifier of each run, in the order the runs were added.
+    errors : Dict[Any, str]
+        Error message by run id, for runs added from failed responses.
+    report_structure : dict
+        Structure loaded from the report configuration file.
+
+    Examples
+    --------
+    >>> batch = ModelOutputBatch.from_outputs(outputs)
+    >>> batch.get_value("Mlk_Prod")
+    >>> batch.filter(batch.get_value("Mlk_Prod") > 35).to_dataframe()
+    >>> batch.get_report("table1_1", run=0)
+
+    Collect the results of a batch of scenarios:
+
+    >>> batch = ModelOutputBatch()
+    >>> run_scenarios(scenarios, batch, outputs=["Mlk_Prod", "An_MPBal_g_Trg"])
+    """
+    def __init__(self, report_config_path: str = "./report_structure.json"):
+        self.run_ids: List[Any] = []
+        self.errors: Dict[Any, str] = {}
+        self._report_config_path = report_config_path
+        self.report_structure = _load_structure(report_config_path)
+        # Scalar variable name -> column of the value matrix
+        self._names: Dict[str, int] = {}
+        self._values = np.full((0, 0), np.nan)
+        self._present = np.zeros((0, 0), dtype=bool)
+        self._ragged: Dict[str, _RaggedColumn] = {}
+        # DataFrame column name -> name of the DataFrame
+        self._column_sources: Dict[str, str] = {}
+        # Scalar names of the last run and their columns, reused while runs
+        # have the same outputs
+        self._last_names: Tuple[str, ...] = ()
+        self._last_columns = np.zeros(0, dtype=np.intp)
+
+    @classmethod
+    def from_outputs(
+        cls,
+        outputs: Iterable[Union[ModelOutput, Mapping[str, Any]]],
+        run_ids: Optional[Iterable[Any]] = None,
+        report_config_path: str = "./report_structure.json"
+    ) -> "ModelOutputBatch":
+        """
+        Create a batch from ModelOutput objects or mappings of output values.
+
+        Parameters
+        ----------
+        outputs : Iterable[Union[ModelOutput, Mapping[str, Any]]]
+            Outputs of each run.
+        run_ids : Iterable[Any], optional
+            Identifier of each run, by default the position of the run.
+        report_config_path : str, optional
+            Path to the report configuration file.
+
+        Returns
+        -------
+        ModelOutputBatch
+            Batch with one run per output.
+        """
+        batch = cls(report_config_path)
+        if run_ids is None:
+            for output in outputs:
+                batch.append(output)
+        else:
+            for output, run_id in zip(outputs, run_ids):
+                batch.append(output, run_id)
+        return batch
+
+    ### Adding Runs ###
+    def append(
+        self,
+        output: Union[ModelOutput, Mapping[str, Any]],
+        run_id: Any = None
+    ) -> None:
+        """
+        Add the outputs of one run.
+
+        Parameters
+        ----------
+        output : Union[ModelOutput, Mapping[str, Any]]
+            A ModelOutput, or a mapping of names to values.
+        run_id : Any, optional
+            Identifier of the run, by default its position in the batch.
+        """
+        run = len(self.run_ids)
+        self.run_ids.append(run if run_id is None else run_id)
+        values, columns = _flatten(output)
+        scalar_names = []
+        scalar_values = []
+        for name, value in values.items():
+            if _is_scalar(value):
+                scalar_names.append(name)
+                scalar_values.append(value)
+                continue
+            column = self._ragged.get(name)
+            if column is None:
+                column = self._ragged[name] = _RaggedColumn(name, _kind(value))
+            column.append(run, value)
+        for column_name, frame_name in columns.items():
+            self._column_sources.setdefault(column_name, frame_name)
+
+        scalar_names = tuple(scalar_names)
+        if scalar_names != self._last_names:
+            self._last_names = scalar_names
+            self._last_columns = np.array(
+                [self._add_variable(name) for name in scalar_names],
+                dtype=np.intp
+                )
+        self._reserve(run + 1, len(self._names))
+        self._values[run, self._last_columns] = scalar_values
+        self._present[run, self._last_columns] = True
+
+    def write(self, response: Dict[str, Any]) -> None:
+        """
+        Add a response from ModelServer.handle() or run_scenarios().
+
+        The "outputs" of the response are added as a run with the response
+        "id" as run id. A failed response is added as a run without values
+        and its error is recorded in `errors`.
+
+        Parameters
+        ----------
+        response : Dict[str, Any]
+            The response of one scenario.
+        """
+        if "error" in response:
+            self.errors[response["id"]] = response["error"]
+        self.append(response.get("outputs", {}), response["id"])
+
+    def close(self) -> None:
+        """Does nothing, batches are complete after each write()."""
+
+    def _add_variable(self, name: str) -> int:
+        column = self._names.get(name)
+        if column is None:
+            column = self._names[name] = len(self._names)
+        return column
+
+    def _reserve(self, runs: int, variables: int) -> None:
+        """Grow the value matrix to hold at least runs × variables."""
+        capacity_runs, capacity_variables = self._values.shape
+        if runs <= capacity_runs and variables <= capacity_variables:
+            return
+        if runs > capacity_runs:
+            capacity_runs = max(runs, 2 * capacity_runs)
+        if variables > capacity_variables:
+            capacity_variables = max(variables, 2 * capacity_variables)
+        values = np.full((capacity_runs, capacity_variables), np.nan)
+        present = np.zeros((capacity_runs, capacity_variables), dtype=bool)
+        rows, columns = self._values.shape
+        values[:rows, :columns] = self._values
+        present[:rows, :columns] = self._present
+        self._values = values
+        self._present = present
+
+    ### Data Access ###
+    def __len__(self) -> int:
+        return len(self.run_ids)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the scalar variables, in the order of the value matrix."""
+        return list(self._names)
+
+    @property
+    def values(self) -> np.ndarray:
+        """The (runs × variables) matrix of scalar values."""
+        return self._values[:len(self.run_ids), :len(self._names)]
+
+    def get_value(self, name: str) -> Union[np.ndarray, List[Any], None]:
+        """
+        Retrieve the values of a variable for every run.
+
+        Parameters
+        ----------
+        name : str
+            The exact name of the variable or DataFrame column.
+
+        Returns
+        -------
+        Union[np.ndarray, List[Any], None]
+            A float array with one value per run (NaN where the variable is
+            missing) for scalar variables. A list with one value per run
+            (None where it is missing) for other variables. None if no run
+            has the variable.
+        """
+        column = self._names.get(name)
+        if column is not None:
+            return self.values[:, column].copy()
+        if name in self._ragged:
+            ragged = self._ragged[name]
+            if ragged.kind != _OBJECT:
+                ragged.concatenated()
+            return [ragged.get(run) for run in range(len(self))]
+        if name in self._column_sources:
+            ragged = self._ragged[self._column_sources[name]]
+            return [ragged.get_column(run, name) for run in range(len(self))]
+        return None
+
+    def get_table(self, name: str) -> Optional[pd.DataFrame]:
+        """
+        Stack an array, Series or DataFrame variable of every run.
+
+        Parameters
+        ----------
+        name : str
+            The name of the variable.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            A "Run" column with the run id of each row, followed by the
+            DataFrame columns (or a column with the values of an array or
+            Series). The index is the index of the original values. None if
+            the variable is not an array, Series or DataFrame in every run.
+        """
+        ragged = self._ragged.get(name)
+        if ragged is None or ragged.kind == _OBJECT:
+            return None
+        arrays, offsets = ragged.concatenated()
+        run_ids = np.asarray(self.run_ids, dtype=object)[ragged.runs]
+        data = {"Run": np.repeat(run_ids, np.diff(offsets))}
+        if ragged.kind == _FRAME:
+            data.update(zip(ragged.columns, arrays))
+        else:
+            data[name] = arrays[0]
+        if ragged.kind == _ARRAY:
+            index = np.concatenate(
+                [np.arange(length) for length in np.diff(offsets)]
+                )
+        else:
+            index = ragged.indexes[0].append(ragged.indexes[1:])
+        return pd.DataFrame(data, index=index)
+
+    def get_run_value(self, name: str, run: Any) -> Any:
+        """
+        Retrieve a value of one run.
+
+        Parameters
+        ----------
+        name : str
+            The exact name of the variable or DataFrame column.
+        run : Any
+            The run id.
+
+        Returns
+        -------
+        Any
+            The value, or None if the run does not have the variable.
+        """
+        return self._run_value(self._position(run), name)
+
+    def _run_value(self, position: int, name: str) -> Any:
+        column = self._names.get(name)
+        if column is not None and self._present[position, column]:
+            return float(self._values[position, column])
+        if name in self._ragged:
+            return self._ragged[name].get(position)
+        if name in self._column_sources:
+            return self._ragged[self._column_sources[name]].get_column(
+                position, name
+                )
+        return None
+
+    def _position(self, run: Any) -> int:
+        try:
+            return self.run_ids.index(run)
+        except ValueError:
+            raise KeyError(f"Run {run} is not in the batch") from None
+
+    def to_dataframe(self, names: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Scalar variables as a DataFrame with one row per run.
+
+        Parameters
+        ----------
+        names : List[str], optional
+            Variables to include, by default all scalar variables. Names that
+            are not scalar variables are NaN.
+
+        Returns
+        -------
+        pd.DataFrame
+            One column per variable, indexed by run id.
+        """
+        index = pd.Index(self.run_ids, name="Run")
+        if names is None:
+            return pd.DataFrame(self.values, index=index, columns=self.names)
+        columns = np.array(
+            [self._names.get(name, -1) for name in names], dtype=np.intp
+            )
+        found = columns >= 0
+        values = np.full((len(self), len(names)), np.nan)
+        values[:, found] = self.values[:, columns[found]]
+        return pd.DataFrame(values, index=index, columns=names)
+
+    ### Filtering ###
+    def filter(self, mask: Union[np.ndarray, pd.Series, List[bool]]) -> "ModelOutputBatch":
+        """
+        Select the runs where mask is True.
+
+        Parameters
+        ----------
+        mask : array-like of bool
+            One value per run, e.g. `batch.get_value("Mlk_Prod") > 35`.
+
+        Returns
+        -------
+        ModelOutputBatch
+            A new batch with the selected runs.
+
+        Raises
+        ------
+        ValueError
+            If mask does not have one value per run.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError(
+                f"mask must have one value per run ({len(self)}), "
+                f"not shape {mask.shape}"
+                )
+        return self._take(np.flatnonzero(mask))
+
+    def select(self, run_ids: Iterable[Any]) -> "ModelOutputBatch":
+        """
+        Select runs by run id, in the given order.
+
+        Parameters
+        ----------
+        run_ids : Iterable[Any]
+            The ids of the runs to select.
+
+        Returns
+        -------
+        ModelOutputBatch
+            A new batch with the selected runs.
+
+        Raises
+        ------
+        KeyError
+            If a run id is not in the batch.
+        """
+        positions = {run_id: position
+                     for position, run_id in enumerate(self.run_ids)}
+        try:
+            runs = [positions[run_id] for run_id in run_ids]
+        except KeyError as error:
+            raise KeyError(f"Run {error.args[0]} is not in the batch") from None
+        return self._take(np.array(runs, dtype=np.intp))
+
+    def _take(self, runs: np.ndarray) -> "ModelOutputBatch":
+        batch = ModelOutputBatch(self._report_config_path)
+        batch.run_ids = [self.run_ids[run] for run in runs.tolist()]
+        batch.errors = {
+            run_id: self.errors[run_id]
+            for run_id in batch.run_ids if run_id in self.errors
+        }
+        batch._names = dict(self._names)
+        batch._values = self.values[runs]
+        batch._present = self._present[runs, :len(self._names)]
+        batch._ragged = {
+            name: column.take(runs) for name, column in self._ragged.items()
+        }
+        batch._column_sources = dict(self._column_sources)
+        return batch
+
+    ### Report Creation ###
+    def get_report(self, report_name: str, run: Any) -> pd.DataFrame:
+        """
+        Generate a report for one run.
+
+        Parameters
+        ----------
+        report_name : str
+            The name of the report, see ModelOutput.get_report().
+        run : Any
+            The run id.
+
+        Returns
+        -------
+        pd.DataFrame
+            The report, as ModelOutput.get_report() creates it for the run.
+
+        Raises
+        ------
+        KeyError
+            If the run is not in the batch.
+        ValueError
+            If the report name is not found in the report structure.
+        """
+        position = self._position(run)
+        template = _report_templates(self.report_structure).get(report_name)
+        return template.render({
+            name: self._run_value(position, name) for name in template.names
+        })
+
+    def stack_report(self, report_name: str) -> pd.DataFrame:
+        """
+        Generate a report for every run as one table.
+
+        Parameters
+        ----------
+        report_name : str
+            The name of the report, see ModelOutput.get_report().
+
+        Returns
+        -------
+        pd.DataFrame
+            A "Run" column with the run id, followed by the columns of the 
+            report. Each run has the rows of its report, in run order.
+
+        Raises
+        ------
+        ValueError
+            If the report name is not found in the report structure.
+        """
+        template = _report_templates(self.report_structure).get(report_name)
+        return template.render_stacked(
+            self.run_ids, {name: self._vector(name) for name in template.names}
+            )
+
+    def _vector(self, name: str) -> Union[np.ndarray, List[Any]]:
+        """
+        The value of a variable in every run, None where it is missing.
+
+        Scalar variables that every run has are returned as a float array.
+        """
+        n_runs = len(self)
+        column = self._names.get(name)
+        ragged = self._ragged.get(name)
+        if column is not None:
+            values = self._values[:n_runs, column]
+            present = self._present[:n_runs, column]
+            if present.all():
+                return values.copy()
+            vector = values.astype(object)
+            vector[~present] = None
+            if ragged is not None:
+                for run in ragged.runs:
+                    if not present[run]:
+                        vector[run] = ragged.get(run)
+            return vector
+        if ragged is not None:
+            return [ragged.get(run) for run in range(n_runs)]
+        if name in self._column_sources:
+            ragged = self._ragged[self._column_sources[name]]
+            return [ragged.get_column(run, name) for run in range(n_runs)]
+        return [None] * n_runs
+
+    def __repr__(self) -> str:
+        return (
+            f"ModelOutputBatch({len(self)} runs, {len(self._names)} scalar "
+            f"variables, {len(self._ragged)} other variables)"
+            )
+
+
+def stack_reports(
+    outputs: Union[ModelOutputBatch, Iterable[ModelOutput]],
+    report_name: str,
+    run_ids: Optional[Iterable[Any]] = None
+) -> pd.DataFrame:
+    """
+    Generate a report for many outputs as one table.
+
+    Instead of one get_report() call and one DataFrame per output, the values
+    of every output are read with the same OutputExtractor and the table is 
+    filled slot by slot for all outputs at once.
+
+    Parameters
+    ----------
+    outputs : Union[ModelOutputBatch, Iterable[ModelOutput]]
+        The outputs to report, or a batch.
+    report_name : str
+        The name of the report, see ModelOutput.get_report().
+    run_ids : Iterable[Any], optional
+        Identifier of each output, by default its position. For a batch, the
+        ids of the runs to report, by default all runs.
+
+    Returns
+    -------
+    pd.DataFrame
+        A "Run" column with the run id, followed by the columns of the 
+        report. Each output has the rows of its report, in order.
+
+    Raises
+    ------
+    ValueError
+        If the report name is not found in the report structure, or run_ids
+        does not have one id per output.
+
+    Examples
+    --------
+    >>> table = stack_reports(outputs, "table4_1", run_ids=cow_ids)
+    >>> table[table["Description"] == "ME"]
+    """
+    if isinstance(outputs, ModelOutputBatch):
+        if run_ids is not None:
+            outputs = outputs.select(run_ids)
+        return outputs.stack_report(report_name)
+
+    outputs = list(outputs)
+    run_ids = list(range(len(outputs)) if run_ids is None else run_ids)
+    if len(run_ids) != len(outputs):
+        raise ValueError(
+            f"run_ids must have one id per output ({len(outputs)}), "
+            f"not {len(run_ids)}"
+            )
+    report_structure = (
+        outputs[0].report_structure if outputs 
+        else _load_structure("./report_structure.json")
+        )
+    templates = _report_templates(report_structure)
+    template = templates.get(report_name)
+    extractor = templates.extractor((report_name,))
+    values = [extractor.extract(output) for output in outputs]
+    return template.render_stacked(run_ids, {
+        name: [output_values[name] for output_values in values]
+        for name in template.names
+    })
@@ -1,13 +1,42 @@
 """Functions to calculate various amino acid-related parameters.
 
 These calculations include amino acid absorption, utilization, and metabolism.
+
+Per amino acid values are NumPy arrays with the amino acids in AA_LIST order
+on the last axis, so the same functions work for one animal (10,) or a herd
+(animals x 10). Series indexed by amino acid name are also accepted.
 """
 
-import math
+from typing import Union
 
 import numpy as np
 import pandas as pd
 
+AA_LIST = ["Arg", "His", "Ile", "Leu", "Lys", "Met", "Phe", "Thr", "Trp", "Val"]
+AA_POSITION = {aa: position for position, aa in enumerate(AA_LIST)}
+
+
+def select_aa(
+    values: Union[pd.Series, np.ndarray], 
+    aa: str
+) -> Union[float, np.ndarray]:
+    """
+    Value of one amino acid, by label for a Series or by AA_LIST position on 
+    the last axis of an array
+    """
+    if isinstance(values, pd.Series):
+        return values[aa]
+    return values[..., AA_POSITION[aa]]
+
+
+def sum_aa(values: Union[pd.Series, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Sum over amino acids, skipping NaN like pd.Series.sum()
+    """
+    if isinstance(values, pd.Series):
+        return values.sum()
+    return np.nansum(values, axis=-1)
+
 
 def calculate_MiTPAAProf(aa_list: list, coeff_dict: dict) -> np.ndarray:
     """
@@ -64,14 +93,12 @@ def calculate_mPrt_k_AA_array(mPrt_coeff: dict, aa_list: list) -> np.ndarray:
 
 
 def calculate_An_IdAAIn_array(an_data: dict, aa_list: list) -> np.ndarray:
-    An_IdAAIn = pd.Series([an_data[f"An_Id{aa}In"] for aa in aa_list],
-                          index=aa_list)
+    An_IdAAIn = np.array([an_data[f"An_Id{aa}In"] for aa in aa_list])
     return An_IdAAIn
 
 
 def calculate_Inf_AA_g(infusion_data: dict, aa_list: list) -> np.ndarray:
-    Inf_AA_g = pd.Series([infusion_data[f"Inf_{aa}_g"] for aa in aa_list],
-                         index=aa_list)
+    Inf_AA_g = np.array([infusion_data[f"Inf_{aa}_g"] for aa in aa_list])
     return Inf_AA_g
 
 
@@ -122,25 +149,25 @@ def calculate_mPrt_AA_01(
 
 
 def calculate_mPrt_k_AA(
-    mPrtmx_AA2: pd.Series, 
-    mPrt_AA_01: pd.Series, 
-    AA_mPrtmx: pd.Series
-) -> pd.Series:
-    mPrt_k_AA = np.zeros_like(mPrtmx_AA2)
-    for i in range(len(mPrtmx_AA2)):
-        inner_value = (
-            mPrtmx_AA2.iloc[i]**2 - mPrt_AA_01.iloc[i] * mPrtmx_AA2.iloc[i]
+    mPrtmx_AA2: np.ndarray, 
+    mPrt_AA_01: np.ndarray, 
+    AA_mPrtmx: np.ndarray
+) -> np.ndarray:
+    mPrtmx_AA2 = np.asarray(mPrtmx_AA2, dtype=float)
+    mPrt_AA_01 = np.asarray(mPrt_AA_01, dtype=float)
+    AA_mPrtmx = np.asarray(AA_mPrtmx, dtype=float)
+    inner_value = mPrtmx_AA2**2 - mPrt_AA_01 * mPrtmx_AA2
+    no_response = (inner_value <= 0) | (AA_mPrtmx == 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mPrt_k_AA = np.where(
+            no_response, 0.0,
+            -(2 * np.sqrt(inner_value) - 2 * mPrtmx_AA2) / (AA_mPrtmx * 0.1)
             )
-        if inner_value <= 0 or AA_mPrtmx.iloc[i] == 0:
-            mPrt_k_AA[i] = 0
-        else:
-            mPrt_k_AA[i] = (-(2 * np.sqrt(inner_value) - 2 * mPrtmx_AA2.iloc[i]) 
-                            / (AA_mPrtmx.iloc[i] * 0.1))
     return mPrt_k_AA
 
 
 def calculate_Abs_EAA_g(Abs_AA_g: pd.Series) -> float:
-    Abs_EAA_g = Abs_AA_g.sum()  # Line 1769
+    Abs_EAA_g = sum_aa(Abs_AA_g)  # Line 1769
     return Abs_EAA_g
 
 
@@ -151,8 +178,9 @@ def calculate_Abs_neAA_g(An_MPIn_g: float, Abs_EAA_g: float) -> float:
 
 
 def calculate_Abs_OthAA_g(Abs_neAA_g: float, Abs_AA_g: pd.Series) -> float:
-    Abs_OthAA_g = (Abs_neAA_g + Abs_AA_g['Arg'] + Abs_AA_g['Phe'] + 
-                   Abs_AA_g['Thr'] + Abs_AA_g['Trp'] + Abs_AA_g['Val'])  
+    Abs_OthAA_g = (Abs_neAA_g + select_aa(Abs_AA_g, "Arg") + 
+                   select_aa(Abs_AA_g, "Phe") + select_aa(Abs_AA_g, "Thr") + 
+                   select_aa(Abs_AA_g, "Trp") + select_aa(Abs_AA_g, "Val"))  
     # Line 2110, NRC eqn only, Equation 20-186a, p. 436
     return Abs_OthAA_g
 
@@ -161,33 +189,43 @@ def calculate_Abs_EAA2_g(Abs_AA_g: pd.Series) -> float:
     """
     Abs_EAA2_g: Sum of all squared EAA
     """
-    Abs_EAA2_g = (Abs_AA_g['Arg']**2 + Abs_AA_g['His']**2 + Abs_AA_g['Ile']**2 +
-                  Abs_AA_g['Leu']**2 + Abs_AA_g['Lys']**2 + Abs_AA_g['Met']**2 +
-                  Abs_AA_g['Phe']**2 + Abs_AA_g['Thr']**2 + Abs_AA_g['Trp']**2 + 
-                  Abs_AA_g['Val']**2) # Line 1775-1776
+    Abs_EAA2_g = (select_aa(Abs_AA_g, "Arg")**2 + select_aa(Abs_AA_g, "His")**2 + 
+                  select_aa(Abs_AA_g, "Ile")**2 + select_aa(Abs_AA_g, "Leu")**2 + 
+                  select_aa(Abs_AA_g, "Lys")**2 + select_aa(Abs_AA_g, "Met")**2 +
+                  select_aa(Abs_AA_g, "Phe")**2 + select_aa(Abs_AA_g, "Thr")**2 + 
+                  select_aa(Abs_AA_g, "Trp")**2 + 
+                  select_aa(Abs_AA_g, "Val")**2) # Line 1775-1776
     return Abs_EAA2_g
 
 
 def calculate_Abs_EAA2_HILKM_g(Abs_AA_g: pd.Series) -> float:
-    Abs_EAA2_HILKM_g = (Abs_AA_g['His']**2 + Abs_AA_g['Ile']**2 + 
-                        Abs_AA_g['Leu']**2 + Abs_AA_g['Lys']**2 + 
-                        Abs_AA_g['Met']**2)  
+    Abs_EAA2_HILKM_g = (select_aa(Abs_AA_g, "His")**2 + 
+                        select_aa(Abs_AA_g, "Ile")**2 + 
+                        select_aa(Abs_AA_g, "Leu")**2 + 
+                        select_aa(Abs_AA_g, "Lys")**2 + 
+                        select_aa(Abs_AA_g, "Met")**2)  
     # Line 1778, NRC 2020 (no Arg, Phe, Thr, Trp, or Val)
     return Abs_EAA2_HILKM_g
 
 
 def calculate_Abs_EAA2_RHILKM_g(Abs_AA_g: pd.Series) -> float:
-    Abs_EAA2_RHILKM_g = (Abs_AA_g['Arg']**2 + Abs_AA_g['His']**2 + 
-                         Abs_AA_g['Ile']**2 + Abs_AA_g['Leu']**2 + 
-                         Abs_AA_g['Lys']**2 + Abs_AA_g['Met']**2)  
+    Abs_EAA2_RHILKM_g = (select_aa(Abs_AA_g, "Arg")**2 + 
+                         select_aa(Abs_AA_g, "His")**2 + 
+                         select_aa(Abs_AA_g, "Ile")**2 + 
+                         select_aa(Abs_AA_g, "Leu")**2 + 
+                         select_aa(Abs_AA_g, "Lys")**2 + 
+                         select_aa(Abs_AA_g, "Met")**2)  
     # Line 1780, Virginia Tech 1 (no Phe, Thr, Trp, or Val)
     return Abs_EAA2_RHILKM_g
 
 
 def calculate_Abs_EAA2_HILKMT_g(Abs_AA_g: pd.Series) -> float:
-    Abs_EAA2_HILKMT_g = (Abs_AA_g['His']**2 + Abs_AA_g['Ile']**2 + 
-                         Abs_AA_g['Leu']**2 + Abs_AA_g['Lys']**2 + 
-                         Abs_AA_g['Met']**2 + Abs_AA_g['Thr']**2)
+    Abs_EAA2_HILKMT_g = (select_aa(Abs_AA_g, "His")**2 + 
+                         select_aa(Abs_AA_g, "Ile")**2 + 
+                         select_aa(Abs_AA_g, "Leu")**2 + 
+                         select_aa(Abs_AA_g, "Lys")**2 + 
+                         select_aa(Abs_AA_g, "Met")**2 + 
+                         select_aa(Abs_AA_g, "Thr")**2)
     return Abs_EAA2_HILKMT_g
 
 
@@ -209,9 +247,17 @@ def calculate_mPrt_k_EAA2(
     # Scale the quadratic; can be calculated from any of the aa included in the 
     # squared term. All give the same answer. Line 2184
     # Methionine used to be consistent with R code
-    mPrt_k_EAA2 = (2 * math.sqrt(mPrtmx_AA2["Met"]**2 - mPrt_AA_01["Met"] * 
-                                 mPrtmx_AA2["Met"]) - 2 * mPrtmx_AA2["Met"] + 
-                                 mPrt_AA_01["Met"]) / (AA_mPrtmx["Met"] * 0.1)**2
+    mPrtmx_Met2 = select_aa(mPrtmx_AA2, "Met")
+    mPrt_Met_01 = select_aa(mPrt_AA_01, "Met")
+    Met_mPrtmx = select_aa(AA_mPrtmx, "Met")
+    inner_value = mPrtmx_Met2**2 - mPrt_Met_01 * mPrtmx_Met2
+    if np.any(inner_value < 0):
+        raise ValueError(
+            "mPrtmx_Met2**2 - mPrt_Met_01 * mPrtmx_Met2 is negative, "
+            "so mPrt_k_EAA2 cannot be calculated."
+            )
+    mPrt_k_EAA2 = (2 * np.sqrt(inner_value) - 
+                   2 * mPrtmx_Met2 + mPrt_Met_01) / (Met_mPrtmx * 0.1)**2
     return mPrt_k_EAA2
 
 
@@ -379,7 +425,7 @@ def calculate_Body_EAAGain_g(Body_AAGain_g: pd.Series) -> float:
     """
     Body_EAAGain_g: Body EAA gain (g/d)
     """
-    Body_EAAGain_g = Body_AAGain_g.sum()  # Line 2507-2508
+    Body_EAAGain_g = sum_aa(Body_AAGain_g)  # Line 2507-2508
     return Body_EAAGain_g
 
 
@@ -415,7 +461,7 @@ def calculate_An_EAAUse_g(An_AAUse_g: pd.Series) -> float:
     """
     An_EAAUse_g: Total net EAA use (g/d)
     """
-    An_EAAUse_g = An_AAUse_g.sum()  # Line 2554-2555
+    An_EAAUse_g = sum_aa(An_AAUse_g)  # Line 2554-2555
     return An_EAAUse_g
 
 
@@ -465,7 +511,7 @@ def calculate_Trg_AbsEAA_NPxprtEAA(Trg_AbsAA_NPxprtAA: np.array) -> np.array:
                           obsreved efficiencies from Martineau and LaPiere as 
                           listed in NRC, Ch. 6.
     """
-    Trg_AbsEAA_NPxprtEAA = Trg_AbsAA_NPxprtAA.sum() / 9  
+    Trg_AbsEAA_NPxprtEAA = sum_aa(Trg_AbsAA_NPxprtAA) / 9  
     # Should be weighted or derived directly from total EAA, Line 2593-2594
     return Trg_AbsEAA_NPxprtEAA
 
@@ -531,7 +577,7 @@ def calculate_Imb_EAA(Imb_AA: pd.Series) -> float:
     Imb_EAA: Sum the penalty to get a relative imbalance value for the optimizer 
     """
     # Sum the penalty to get a relative imbalance value for the optimizer
-    Imb_EAA = Imb_AA.sum()
+    Imb_EAA = sum_aa(Imb_AA)
     return Imb_EAA
 
 
@@ -539,7 +585,7 @@ def calculate_An_IdEAAIn(An_IdAAIn: pd.Series) -> float:
     """
     An_IdEAAIn: Intestinally digested EAA intake
     """
-    An_IdEAAIn = An_IdAAIn.sum()  # Line 3126-3127
+    An_IdEAAIn = sum_aa(An_IdAAIn)  # Line 3126-3127
     return An_IdEAAIn
 
 
@@ -547,7 +593,7 @@ def calculate_Du_IdEAAMic(Du_IdAAMic: pd.Series) -> float:
     """
     Du_IdEAAMic: Intestinally digested microbial EAA
     """
-    Du_IdEAAMic = Du_IdAAMic.sum()  # LIne 3128-3129
+    Du_IdEAAMic = sum_aa(Du_IdAAMic)  # LIne 3128-3129
     return Du_IdEAAMic
 
 
@@ -555,7 +601,7 @@ def calculate_Dt_IdEAARUPIn(Dt_IdAARUPIn: pd.Series) -> float:
     """
     Dt_IdEAARUPIn: Intestinally digested EAA RUP intake
     """
-    Dt_IdEAARUPIn = Dt_IdAARUPIn.sum()  # Line 3130
+    Dt_IdEAARUPIn = sum_aa(Dt_IdAARUPIn)  # Line 3130
     return Dt_IdEAARUPIn
 
 
@@ -575,7 +621,7 @@ def calculate_Trg_Mlk_EAA_g(Trg_Mlk_AA_g: pd.Series) -> float:
     """
     Trg_Mlk_EAA_g: Target milk EAA output (g/d)
     """
-    Trg_Mlk_EAA_g = Trg_Mlk_AA_g.sum()
+    Trg_Mlk_EAA_g = sum_aa(Trg_Mlk_AA_g)
     return Trg_Mlk_EAA_g
 
 
@@ -600,7 +646,7 @@ def calculate_Trg_EAAUse_g(Trg_AAUse_g: pd.Series) -> float:
     """
     Trg_EAAUse_g: Net EAA use at user entered production (g/d)
     """
-    Trg_EAAUse_g = Trg_AAUse_g.sum()
+    Trg_EAAUse_g = sum_aa(Trg_AAUse_g)
     return Trg_EAAUse_g
 
 
@@ -636,8 +682,13 @@ def calculate_Trg_AbsAA_g(
                    Trg_AbsAA_NPxprtAA + Ur_AAEnd_g + Gest_AA_g / 
                    coeff_dict['Ky_MP_NP_Trg'] + Body_AAGain_g / Kg_MP_NP_Trg)  
     # Line 3165-3173
-    if 'Arg' in Trg_AbsAA_g.index:  # Arg not included in this calculation
-        Trg_AbsAA_g['Arg'] = np.nan
+    # Arg not included in this calculation
+    if isinstance(Trg_AbsAA_g, pd.Series):
+        if 'Arg' in Trg_AbsAA_g.index:
+            Trg_AbsAA_g['Arg'] = np.nan
+    else:
+        Trg_AbsAA_g = np.array(Trg_AbsAA_g, dtype=float)
+        Trg_AbsAA_g[..., AA_POSITION["Arg"]] = np.nan
     return Trg_AbsAA_g
 
 
@@ -645,8 +696,8 @@ def calculate_Trg_AbsEAA_g(Trg_AbsAA_g: pd.Series) -> float:
     """
     Trg_AbsEAA_g: Absorbed EAA at user entered production (g/d)
     """
-    Trg_AbsEAA_g = Trg_AbsAA_g.sum(
-    )  # Arg not considered as partially synthesized, Line 3174-3175
+    # Arg not considered as partially synthesized, Line 3174-3175
+    Trg_AbsEAA_g = sum_aa(Trg_AbsAA_g)
     return Trg_AbsEAA_g
 
 
@@ -658,7 +709,9 @@ def calculate_Trg_MlkEAA_AbsEAA(
     """
     Trg_MlkEAA_AbsEAA: Milk EAA as a fraction of absorbed EAA at user entered production
     """
-    Trg_MlkEAA_AbsEAA = (Mlk_EAA_g - Mlk_AA_g["Arg"]) / Trg_AbsEAA_g  # Line 3176
+    Trg_MlkEAA_AbsEAA = (
+        (Mlk_EAA_g - select_aa(Mlk_AA_g, "Arg")) / Trg_AbsEAA_g
+        )  # Line 3176
     return Trg_MlkEAA_AbsEAA
 
 
@@ -785,5 +838,5 @@ def calculate_Trg_AbsAA_NPxprtAA_array(
     return Trg_AbsAA_NPxprtAA
 
 def calculate_Du_EAA_g(Du_AA: pd.Series) -> float:
-    Du_EAA_g = Du_AA.sum()
+    Du_EAA_g = sum_aa(Du_AA)
     return Du_EAA_g
@@ -9,6 +9,8 @@ import math
 import numpy as np
 import pandas as pd
 
+from nasem_dairy.nasem_equations.amino_acid import sum_aa
+
 
 def calculate_Uter_Wtpart(Fet_BWbrth: float, coeff_dict: dict) -> float:
     """
@@ -342,7 +344,7 @@ def calculate_Gest_EAA_g(Gest_AA_g: pd.Series) -> float:
     """
     Gest_EAA_g: EAA deposited in gravid uterus (g/d)
     """
-    Gest_EAA_g = Gest_AA_g.sum()  # Line 2377-2378
+    Gest_EAA_g = sum_aa(Gest_AA_g)  # Line 2377-2378
     return Gest_EAA_g
 
 
@@ -5,6 +5,7 @@ animals, including minerals and vitamins, based on physiological state and diet.
 """
 
 import math
+from typing import Any, Dict, Union
 
 import numpy as np
 
@@ -1572,3 +1573,327 @@ def calculate_Dt_VitEReq_DMI(An_VitE_req: float, An_DMIn: float) -> float:
     """
     Dt_VitEReq_DMI = An_VitE_req / An_DMIn  # Line 3329
     return Dt_VitEReq_DMI
+
+
+### TABLE-DRIVEN MINERAL CALCULATIONS ###
+# The functions above are the reference equations, one mineral at a time. 
+# calculate_mineral_requirements() evaluates the same equations for every 
+# mineral at once, with per-mineral coefficients in MINERAL_COEFFICIENTS. 
+# Values have the minerals in MINERAL_LIST order on the last axis, so inputs 
+# can be scalars for one animal or arrays for a herd (animals x 14).
+MINERAL_LIST = [
+    "Ca", "P", "Mg", "Na", "Cl", "K", "S", "Co", "Cu", "I", "Fe", "Mn", "Se", 
+    "Zn"
+    ]
+MINERAL_POSITION = {
+    mineral: position for position, mineral in enumerate(MINERAL_LIST)
+    }
+
+
+def _mineral_coefficients(
+    values: Dict[str, float], 
+    default: float = 0.0
+) -> np.ndarray:
+    coefficients = np.array(
+        [values.get(mineral, default) for mineral in MINERAL_LIST], dtype=float
+        )
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+MINERAL_COEFFICIENTS = {
+    # Maintenance, per kg BW (urinary) and per kg DMI (fecal)
+    "Ur_m_BW": _mineral_coefficients(
+        {"P": 0.0006, "Mg": 0.0007, "K": 0.2, "Cu": 0.0145, "Mn": 0.0026}
+        ),
+    # Used instead of Ur_m_BW when Trg_MilkProd is not > 0
+    "Ur_m_BW_dry": _mineral_coefficients(
+        {"P": 0.0006, "Mg": 0.0007, "K": 0.07, "Cu": 0.0145, "Mn": 0.0026}
+        ),
+    "Fe_m_DMIn": _mineral_coefficients(
+        {"Ca": 0.9, "P": 1.0, "Mg": 0.3, "Na": 1.45, "Cl": 1.11, "K": 2.5,
+         "S": 2.0, "Co": 0.2, "Se": 0.3, "Zn": 5.0}
+        ),
+    # Used instead of Fe_m_DMIn when An_Parity_rl is 0
+    "Fe_m_DMIn_heifer": _mineral_coefficients(
+        {"Ca": 0.9, "P": 0.8, "Mg": 0.3, "Na": 1.45, "Cl": 1.11, "K": 2.5,
+         "S": 2.0, "Co": 0.2, "Se": 0.3, "Zn": 5.0}
+        ),
+    # Growth, per kg Body_Gain
+    "g_Gain": _mineral_coefficients(
+        {"Mg": 0.45, "Na": 1.4, "Cl": 1.0, "K": 2.5, "Cu": 2.0, "Fe": 34,
+         "Mn": 0.7, "Zn": 24}
+        ),
+    # Gestation, per kg BW after day 190 and from day 90 to 190
+    "y_BW": _mineral_coefficients(
+        {"Mg": 0.3 / 715, "Na": 1.4 / 715, "Cl": 1.0 / 715, "K": 1.03 / 715,
+         "Cu": 0.0023, "Fe": 0.025, "Mn": 0.00042, "Zn": 0.017}
+        ),
+    "y_BW_mid": _mineral_coefficients({"Cu": 0.0003}),
+    # Lactation, per kg Trg_MilkProd
+    "l_Milk": _mineral_coefficients(
+        {"Mg": 0.11, "Na": 0.4, "Cl": 1.0, "K": 1.5, "Cu": 0.04, "Fe": 1.0,
+         "Mn": 0.03, "Zn": 4.0}
+        ),
+    # Calf requirement, 
+    # scale * (BW_empty + BW + DMIn + BW_empty^exponent * Gain_empty + Gain 
+    # terms) / efficiency, NaN efficiency where there is no calf equation
+    "Clf_BW_empty": _mineral_coefficients(
+        {"Ca": 0.0127, "P": 0.0118, "Mg": 0.0035, "Na": 0.00637, 
+         "Cl": 0.00637, "K": 0.0203}
+        ),
+    "Clf_BW": _mineral_coefficients({"Cu": 0.0145, "Mn": 0.0026}),
+    "Clf_DMIn": _mineral_coefficients({"Zn": 2.0}),
+    "Clf_Gain_empty": _mineral_coefficients(
+        {"Ca": 14.4, "P": 5.85, "Mg": 0.60, "Na": 1.508, "Cl": 1.508, 
+         "K": 1.14, "Cu": 2.5}
+        ),
+    "Clf_exponent": _mineral_coefficients(
+        {"Ca": -0.139, "P": -0.027, "Mg": -0.036, "Na": -0.045, "Cl": -0.045,
+         "K": -0.048}
+        ),
+    "Clf_Gain": _mineral_coefficients({"Fe": 34, "Mn": 0.7, "Zn": 24}),
+    "Clf_scale": _mineral_coefficients({"Cl": 0.8}, default=1.0),
+    "Clf_efficiency": _mineral_coefficients(
+        {"Ca": 0.73, "P": 0.65, "Mg": 0.30, "Na": 0.24, "Cl": 0.24, "K": 0.13,
+         "Cu": 0.5, "Fe": 0.25, "Mn": 0.01, "Zn": 0.25}, default=np.nan
+        ),
+    # 0 where the balance is calculated from diet rather than absorbed intake
+    "absorbed": _mineral_coefficients(
+        {"S": 0.0, "I": 0.0, "Se": 0.0}, default=1.0
+        ),
+    # Required density: 1 where requirements are divided by Dt_ac, and the 
+    # divisor for g/kg to % DM
+    "density_ac": _mineral_coefficients(
+        {"S": 0.0, "Co": 0.0, "I": 0.0, "Se": 0.0}, default=1.0
+        ),
+    "density_scale": _mineral_coefficients(
+        {"Ca": 10, "P": 10, "Mg": 10, "Na": 10, "Cl": 10, "K": 10, "S": 10}, 
+        default=1.0
+        ),
+}
+
+# Named model outputs for each row of calculate_mineral_requirements()
+_PRODUCTION_MINERALS = ["Ca", "P", "Mg", "Na", "Cl", "K", "Cu", "Fe", "Mn", "Zn"]
+MINERAL_OUTPUTS = {
+    "Ur_m": {
+        "P": "Ur_P_m", "Mg": "Ur_Mg_m", "K": "Ur_K_m", "Cu": "An_Cu_m", 
+        "Mn": "An_Mn_m"
+        },
+    "Fe_m": {
+        "Ca": "Fe_Ca_m", "P": "Fe_P_m", "Mg": "Fe_Mg_m", "Na": "Fe_Na_m", 
+        "Cl": "Fe_Cl_m", "K": "Fe_K_m", "Zn": "An_Zn_m"
+        },
+    "m": {"P": "An_P_m", "Mg": "An_Mg_m", "K": "An_K_m"},
+    "g": {mineral: f"An_{mineral}_g" for mineral in _PRODUCTION_MINERALS},
+    "y": {mineral: f"An_{mineral}_y" for mineral in _PRODUCTION_MINERALS},
+    "l": {mineral: f"An_{mineral}_l" for mineral in _PRODUCTION_MINERALS},
+    "Clf": {mineral: f"An_{mineral}_Clf" for mineral in _PRODUCTION_MINERALS},
+    "req": {mineral: f"An_{mineral}_req" for mineral in MINERAL_LIST},
+    "bal": {mineral: f"An_{mineral}_bal" for mineral in MINERAL_LIST},
+    "prod": {mineral: f"An_{mineral}_prod" for mineral in _PRODUCTION_MINERALS},
+    "Dt_ac": {
+        mineral: f"Dt_ac{mineral}" for mineral in _PRODUCTION_MINERALS + ["Co"]
+        },
+    "Prod_In": {
+        mineral: f"{mineral}Prod_{mineral}In" 
+        for mineral in _PRODUCTION_MINERALS
+        },
+    "Prod_Abs": {
+        mineral: f"{mineral}Prod_{mineral}Abs" 
+        for mineral in _PRODUCTION_MINERALS
+        },
+    "Req_DMI": {mineral: f"Dt_{mineral}Req_DMI" for mineral in MINERAL_LIST},
+    "Man_out": {
+        mineral: f"Man_{mineral}_out" for mineral in _PRODUCTION_MINERALS
+        },
+}
+
+
+def get_mineral_intakes(
+    diet_data: Dict[str, Any]
+) -> Dict[str, np.ndarray]:
+    """
+    Dt_MinIn and Abs_MinIn: Diet and absorbed mineral intakes in MINERAL_LIST
+    order, NaN for absorbed S, I and Se which are not calculated
+    """
+    return {
+        "Dt_MinIn": np.array(
+            [diet_data[f"Dt_{mineral}In"] for mineral in MINERAL_LIST], 
+            dtype=float
+            ),
+        "Abs_MinIn": np.array(
+            [diet_data.get(f"Abs_{mineral}In", np.nan) 
+             for mineral in MINERAL_LIST], dtype=float
+            )
+    }
+
+
+def calculate_mineral_requirements(
+    An_StatePhys: Union[str, np.ndarray],
+    An_BW: Union[float, np.ndarray],
+    An_BW_mature: Union[float, np.ndarray],
+    An_BW_empty: Union[float, np.ndarray],
+    An_Parity_rl: Union[int, np.ndarray],
+    An_GestDay: Union[int, np.ndarray],
+    An_DMIn: Union[float, np.ndarray],
+    Trg_MilkProd: Union[float, np.ndarray],
+    Trg_MilkTPp: Union[float, np.ndarray],
+    Ca_Mlk: Union[float, np.ndarray],
+    Mlk_NP_g: Union[float, np.ndarray],
+    MlkNP_Milk: Union[float, np.ndarray],
+    Body_Gain: Union[float, np.ndarray],
+    Body_Gain_empty: Union[float, np.ndarray],
+    Dt_DMIn_ClfLiq: Union[float, np.ndarray],
+    Dt_MinIn: np.ndarray,
+    Abs_MinIn: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Requirements, balances, use efficiencies and manure output of every 
+    mineral, same equations as the named functions above (Line 2963-3095,
+    3223-3234, 3282-3310, 3313-3326)
+
+    Animal inputs are scalars, or arrays with one value per animal. Dt_MinIn
+    and Abs_MinIn have the minerals on the last axis, see 
+    get_mineral_intakes(). Returns arrays by component (Ur_m, Fe_m, m, g, y, 
+    l, Clf, req, bal, prod, Dt_ac, Prod_In, Prod_Abs, Req_DMI, Man_out) with 
+    the minerals on the last axis, NaN where a mineral has no such value. 
+    MINERAL_OUTPUTS maps them to the model output names.
+    """
+    Dt_MinIn = np.asarray(Dt_MinIn, dtype=float)
+    Abs_MinIn = np.asarray(Abs_MinIn, dtype=float)
+    animal_inputs = (
+        An_StatePhys, An_BW, An_BW_mature, An_BW_empty, An_Parity_rl, 
+        An_GestDay, An_DMIn, Trg_MilkProd, Trg_MilkTPp, Ca_Mlk, Mlk_NP_g, 
+        MlkNP_Milk, Body_Gain, Body_Gain_empty, Dt_DMIn_ClfLiq
+        )
+    animals = np.broadcast_shapes(
+        Dt_MinIn.shape[:-1], Abs_MinIn.shape[:-1], 
+        *(np.shape(value) for value in animal_inputs)
+        )
+    if animals:
+        Dt_MinIn = np.broadcast_to(Dt_MinIn, animals + (len(MINERAL_LIST),))
+        Abs_MinIn = np.broadcast_to(Abs_MinIn, animals + (len(MINERAL_LIST),))
+
+    def per_animal(value: Any, dtype: type = float) -> np.ndarray:
+        # One value per animal, with a trailing axis for the minerals
+        value = np.asarray(value, dtype=dtype)
+        if value.shape != animals:
+            value = np.broadcast_to(value, animals)
+        return value[..., np.newaxis]
+
+    coeff = MINERAL_COEFFICIENTS
+    BW = per_animal(An_BW)
+    BW_empty = per_animal(An_BW_empty)
+    GestDay = per_animal(An_GestDay)
+    DMIn = per_animal(An_DMIn)
+    Milk = per_animal(Trg_MilkProd)
+    Gain = per_animal(Body_Gain)
+    Gain_empty = per_animal(Body_Gain_empty)
+    calf = per_animal(An_StatePhys, dtype=object) == "Calf"
+    # Per animal values for the Ca, P and I equations
+    BW_1 = BW[..., 0]
+    BW_ratio = per_animal(An_BW_mature)[..., 0]**0.22 * BW_1**-0.22
+    Day = GestDay[..., 0]
+    Milk_1 = Milk[..., 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Ur_m = np.where(Milk > 0, coeff["Ur_m_BW"], coeff["Ur_m_BW_dry"]) * BW
+        Fe_m = np.where(
+            per_animal(An_Parity_rl) == 0, 
+            coeff["Fe_m_DMIn_heifer"], coeff["Fe_m_DMIn"]
+            ) * DMIn
+        m = Ur_m + Fe_m
+
+        g = coeff["g_Gain"] * Gain
+        g[..., MINERAL_POSITION["Ca"]] = 9.83 * BW_ratio * Gain[..., 0]
+        g[..., MINERAL_POSITION["P"]] = (1.2 + 4.635 * BW_ratio) * Gain[..., 0]
+
+        y = np.where(
+            GestDay > 190, coeff["y_BW"], 
+            np.where(GestDay >= 90, coeff["y_BW_mid"], 0.0)
+            ) * BW
+        y[..., MINERAL_POSITION["Ca"]] = (
+            0.0245 * np.exp((0.05581 - 0.00007 * Day) * Day)
+            - 0.0245 * np.exp((0.05581 - 0.00007 * (Day - 1)) * (Day - 1))
+            ) * BW_1 / 715
+        y[..., MINERAL_POSITION["P"]] = (
+            0.02743 * np.exp((0.05527 - 0.000075 * Day) * Day)
+            - 0.02743 * np.exp((0.05527 - 0.000075 * (Day - 1)) * (Day - 1))
+            ) * BW_1 / 715
+
+        l = np.where(np.isnan(Milk), 0.0, coeff["l_Milk"] * Milk)
+        l[..., MINERAL_POSITION["Ca"]] = np.where(
+            np.isnan(per_animal(Mlk_NP_g)[..., 0]), 
+            per_animal(Ca_Mlk)[..., 0] * Milk_1,
+            (0.295 + 0.239 * per_animal(Trg_MilkTPp)[..., 0]) * Milk_1
+            )
+        l[..., MINERAL_POSITION["P"]] = np.where(
+            np.isnan(Milk_1), 0.0, 
+            (0.48 + 0.13 * per_animal(MlkNP_Milk)[..., 0] * 100) * Milk_1
+            )
+
+        Clf = coeff["Clf_scale"] * (
+            coeff["Clf_BW_empty"] * BW_empty 
+            + coeff["Clf_BW"] * BW 
+            + coeff["Clf_DMIn"] * DMIn
+            + coeff["Clf_Gain_empty"] * BW_empty**coeff["Clf_exponent"] 
+            * Gain_empty
+            + coeff["Clf_Gain"] * Gain
+            ) / coeff["Clf_efficiency"]
+        use_Clf = (
+            calf & (per_animal(Dt_DMIn_ClfLiq) > 0) 
+            & ~np.isnan(coeff["Clf_efficiency"])
+            )
+        req = np.where(use_Clf, Clf, m + g + y + l)
+        req[..., MINERAL_POSITION["I"]] = np.where(
+            calf[..., 0], 0.8 * DMIn[..., 0], 
+            0.216 * BW_1**0.528 + 0.1 * Milk_1
+            )
+
+        bal = np.where(coeff["absorbed"] == 1, Abs_MinIn, Dt_MinIn) - req
+        prod = y + l + g
+        Dt_ac = Abs_MinIn / Dt_MinIn
+        Co = MINERAL_POSITION["Co"]
+        Dt_ac[..., Co] = np.where(
+            Dt_MinIn[..., Co] != 0, Dt_ac[..., Co], np.nan
+            )
+        Prod_In = prod / Dt_MinIn
+        Prod_Abs = prod / Abs_MinIn
+        Req_DMI = (
+            req / np.where(coeff["density_ac"] == 1, Dt_ac, 1.0) / DMIn 
+            / coeff["density_scale"]
+            )
+        Man_out = Dt_MinIn - prod
+
+    return {
+        "Ur_m": Ur_m, "Fe_m": Fe_m, "m": m, "g": g, "y": y, "l": l, 
+        "Clf": Clf, "req": req, "bal": bal, "prod": prod, "Dt_ac": Dt_ac, 
+        "Prod_In": Prod_In, "Prod_Abs": Prod_Abs, "Req_DMI": Req_DMI, 
+        "Man_out": Man_out
+    }
+
+
+def get_mineral_outputs(
+    mineral_requirements: Dict[str, np.ndarray]
+) -> Dict[str, Any]:
+    """
+    Values from calculate_mineral_requirements() by model output name, e.g.
+    An_Ca_req, Dt_acZn, Man_P_out
+
+    For a single animal these are scalars and Dt_acCo is None when it is not
+    defined, as in calculate_Dt_acCo().
+    """
+    outputs = {}
+    for component, names in MINERAL_OUTPUTS.items():
+        values = mineral_requirements[component]
+        if values.ndim == 1:
+            values = values.tolist()  # Python floats for one animal
+            for mineral, name in names.items():
+                outputs[name] = values[MINERAL_POSITION[mineral]]
+        else:
+            for mineral, name in names.items():
+                outputs[name] = values[..., MINERAL_POSITION[mineral]]
+    if np.ndim(outputs["Dt_acCo"]) == 0 and math.isnan(outputs["Dt_acCo"]):
+        outputs["Dt_acCo"] = None
+    return outputs
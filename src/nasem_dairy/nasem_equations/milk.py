@@ -6,6 +6,8 @@ estimation of milk energy content, protein, fat, and lactose yields.
 import numpy as np
 import pandas as pd
 
+from nasem_dairy.nasem_equations.amino_acid import select_aa, sum_aa
+
 
 def calculate_Trg_NEmilk_Milk(
     Trg_MilkFatp: float, 
@@ -116,16 +118,16 @@ def calculate_Mlk_NP_g(
         Mlk_NP_g = Trg_Mlk_NP_g
     else:
         Mlk_NP_g = (mPrt_coeff['mPrt_Int'] + 
-                    Abs_AA_g['Arg'] * mPrt_k_AA['Arg'] + 
-                    Abs_AA_g['His'] * mPrt_k_AA['His'] + 
-                    Abs_AA_g['Ile'] * mPrt_k_AA['Ile'] + 
-                    Abs_AA_g['Leu'] * mPrt_k_AA['Leu'] + 
-                    Abs_AA_g['Lys'] * mPrt_k_AA['Lys'] + 
-                    Abs_AA_g['Met'] * mPrt_k_AA['Met'] + 
-                    Abs_AA_g['Phe'] * mPrt_k_AA['Phe'] + 
-                    Abs_AA_g['Thr'] * mPrt_k_AA['Thr'] + 
-                    Abs_AA_g['Trp'] * mPrt_k_AA['Trp'] + 
-                    Abs_AA_g['Val'] * mPrt_k_AA['Val'] + 
+                    select_aa(Abs_AA_g, "Arg") * select_aa(mPrt_k_AA, "Arg") + 
+                    select_aa(Abs_AA_g, "His") * select_aa(mPrt_k_AA, "His") + 
+                    select_aa(Abs_AA_g, "Ile") * select_aa(mPrt_k_AA, "Ile") + 
+                    select_aa(Abs_AA_g, "Leu") * select_aa(mPrt_k_AA, "Leu") + 
+                    select_aa(Abs_AA_g, "Lys") * select_aa(mPrt_k_AA, "Lys") + 
+                    select_aa(Abs_AA_g, "Met") * select_aa(mPrt_k_AA, "Met") + 
+                    select_aa(Abs_AA_g, "Phe") * select_aa(mPrt_k_AA, "Phe") + 
+                    select_aa(Abs_AA_g, "Thr") * select_aa(mPrt_k_AA, "Thr") + 
+                    select_aa(Abs_AA_g, "Trp") * select_aa(mPrt_k_AA, "Trp") + 
+                    select_aa(Abs_AA_g, "Val") * select_aa(mPrt_k_AA, "Val") + 
                     Abs_neAA_g * mPrt_coeff['mPrt_k_NEAA'] + 
                     Abs_OthAA_g * mPrt_coeff['mPrt_k_OthAA'] + 
                     Abs_EAA2b_g * mPrt_k_EAA2 + 
@@ -201,8 +203,8 @@ def calculate_Mlk_Fatemp_g(
                         24.52 * (Dt_DMIn - Dt_FAIn) + 
                         0.41 * Dt_DigC160In * 1000 + 
                         1.80 * Dt_DigC183In * 1000 + 
-                        1.45 * Abs_AA_g["Ile"] + 
-                        1.34 * Abs_AA_g["Met"])
+                        1.45 * select_aa(Abs_AA_g, "Ile") + 
+                        1.34 * select_aa(Abs_AA_g, "Met"))
     else:
         Mlk_Fatemp_g = 0  # Line 2261
     return Mlk_Fatemp_g
@@ -478,11 +480,11 @@ def calculate_Mlk_NPmx(
     Mlk_NPmx: Maximal milk protein output at the entered DE, DigNDF, and BW
     """
     # Calculate the maximal milk protein output at the entered DE, DigNDF, and BW
-    Mlk_NPmx = (mPrt_coeff['mPrt_Int'] + mPrtmx_AA2['Arg'] + 
-                mPrtmx_AA2['His'] + mPrtmx_AA2['Ile'] + 
-                mPrtmx_AA2['Leu'] + mPrtmx_AA2['Lys'] + 
-                mPrtmx_AA2['Met'] + mPrtmx_AA2['Thr'] + 
-                mPrtmx_AA2['Val'] + 
+    Mlk_NPmx = (mPrt_coeff['mPrt_Int'] + select_aa(mPrtmx_AA2, "Arg") + 
+                select_aa(mPrtmx_AA2, "His") + select_aa(mPrtmx_AA2, "Ile") + 
+                select_aa(mPrtmx_AA2, "Leu") + select_aa(mPrtmx_AA2, "Lys") + 
+                select_aa(mPrtmx_AA2, "Met") + select_aa(mPrtmx_AA2, "Thr") + 
+                select_aa(mPrtmx_AA2, "Val") + 
                 An_DEInp * mPrt_coeff['mPrt_k_DEInp'] + 
                 (An_DigNDF - 17.06) * mPrt_coeff['mPrt_k_DigNDF'] + 
                 (An_BW - 612) * mPrt_coeff['mPrt_k_BW'] + 
@@ -531,7 +533,7 @@ def calculate_Mlk_EAA_g(Mlk_AA_g: pd.Series) -> float:
     """
     Mlk_EAA_g: Total EAA in milk protein 
     """
-    Mlk_EAA_g = Mlk_AA_g.sum()  # Line 2226
+    Mlk_EAA_g = sum_aa(Mlk_AA_g)  # Line 2226
     return Mlk_EAA_g
 
 
@@ -5,10 +5,13 @@ by animals, including energy, protein, and minerals, based on dietary compositio
 and dry matter intake.
 """
 import math
+from typing import Union
 
 import numpy as np
 import pandas as pd
 
+from nasem_dairy.nasem_equations.amino_acid import select_aa
+
 
 ####################
 # Functions for Feed Intakes
@@ -26,13 +29,15 @@ def calculate_Fd_DNDF48(Fd_Conc: pd.Series, Fd_DNDF48_input: pd.Series) -> pd.Se
     # including the feed library in the NASEM software,
     # For now all the Fd_DNDF48 values are being calculated
     # I've added a column of 0s as the Fd_DNDF48 column
-    condition = (Fd_Conc < 100) & (Fd_DNDF48_input.isin([0, np.nan]))
-    condition_conc = (Fd_Conc == 100) & (Fd_DNDF48_input.isin([0, np.nan]))
+    missing = pd.isna(Fd_DNDF48_input) | (Fd_DNDF48_input == 0)
+    condition = (Fd_Conc < 100) & missing
+    condition_conc = (Fd_Conc == 100) & missing
     # Line 241, mean of Mike Allen database used for DMI equation
     Fd_DNDF48 = np.where(condition, 48.3, Fd_DNDF48_input)
     # Line 242, mean of concentrates in the feed library
     Fd_DNDF48 = np.where(condition_conc, 65, Fd_DNDF48)
-    Fd_DNDF48 = pd.Series(Fd_DNDF48, index=Fd_Conc.index)
+    if isinstance(Fd_Conc, pd.Series):
+        Fd_DNDF48 = pd.Series(Fd_DNDF48, index=Fd_Conc.index)
     return Fd_DNDF48
 
 
@@ -47,9 +52,9 @@ def calculate_TT_dcFdNDF_Base(
     TT_dcFdNDF_Lg: pd.Series,
     TT_dcFdNDF_48h: pd.Series
 ) -> pd.Series:
-    condition1 = (Use_DNDF_IV == 1) & (Fd_Conc < 100) & ~TT_dcFdNDF_48h.isna()  
+    condition1 = (Use_DNDF_IV == 1) & (Fd_Conc < 100) & ~pd.isna(TT_dcFdNDF_48h)
     # Line 249, Forages only
-    condition2 = (Use_DNDF_IV == 2) & ~TT_dcFdNDF_48h.isna()  
+    condition2 = (Use_DNDF_IV == 2) & ~pd.isna(TT_dcFdNDF_48h)
     # Line 251, All Ingredients
     TT_dcFdNDF_Base = TT_dcFdNDF_Lg
     TT_dcFdNDF_Base = np.where(condition1, TT_dcFdNDF_48h, TT_dcFdNDF_Base)
@@ -196,8 +201,7 @@ def calculate_Fd_NFC(
     Fd_NPNDM: pd.Series
 ) -> pd.Series:
     Fd_NFC = 100 - Fd_Ash - Fd_NDF - Fd_TP - Fd_NPNDM - Fd_FAhydr  # Line 465
-    # Forces any values below 0 to =0           # Line 466
-    Fd_NFC.clip(lower=0)
+    # NOTE Negative values are kept (not clipped) to match validated outputs
     return Fd_NFC
 
 
@@ -850,21 +854,27 @@ def calculate_TT_dcFdFA(
     )
     ```
     """
-    TT_dcFdFA = Fd_dcFA.copy()  # Line 1251
+    TT_dcFdFA = Fd_dcFA  # Line 1251
 
     condition_1 = (
-        (TT_dcFdFA.isna()) & 
+        (pd.isna(TT_dcFdFA)) & 
         (Fd_Category == "Fatty Acid Supplement")
         )
-    TT_dcFdFA[condition_1] = coeff_dict['TT_dcFA_Base'] # Line 1252
+    TT_dcFdFA = np.where(
+        condition_1, coeff_dict['TT_dcFA_Base'], TT_dcFdFA
+        ) # Line 1252
 
     condition_2 =(
-        (TT_dcFdFA.isna()) & 
+        (pd.isna(TT_dcFdFA)) & 
         (Fd_Category == "Fat Supplement")
         )
-    TT_dcFdFA[condition_2] = coeff_dict['TT_dcFat_Base'] # Line 1253
+    TT_dcFdFA = np.where(
+        condition_2, coeff_dict['TT_dcFat_Base'], TT_dcFdFA
+        ) # Line 1253
     # Line 1254, Fill in any remaining missing values with fat dc
-    TT_dcFdFA = TT_dcFdFA.fillna(coeff_dict['TT_dcFat_Base'])
+    TT_dcFdFA = np.where(
+        pd.isna(TT_dcFdFA), coeff_dict['TT_dcFat_Base'], TT_dcFdFA
+        )
 
     condition_3 = (
         (An_StatePhys == "Calf") & 
@@ -872,16 +882,21 @@ def calculate_TT_dcFdFA(
         (Fd_Type == "Concentrate")
         )
     # Line 1255, likely an over estimate for forage
-    TT_dcFdFA[condition_3] = coeff_dict['TT_dcFA_ClfDryFd']
+    TT_dcFdFA = np.where(
+        condition_3, coeff_dict['TT_dcFA_ClfDryFd'], TT_dcFdFA
+        )
 
     condition_4 = (
-        (TT_dcFdFA.isna()) & 
+        (pd.isna(TT_dcFdFA)) & 
         (An_StatePhys == "Calf") & 
         (Fd_Category == "Calf Liquid Feed")
         )
     # Line 1256, Default if dc is not entered.
-    TT_dcFdFA[condition_4] = coeff_dict['TT_dcFA_ClfLiqFd']
-    TT_dcFdFA = pd.to_numeric(TT_dcFdFA, errors='coerce').fillna(0).astype(float)
+    TT_dcFdFA = np.where(
+        condition_4, coeff_dict['TT_dcFA_ClfLiqFd'], TT_dcFdFA
+        )
+    TT_dcFdFA = pd.to_numeric(TT_dcFdFA, errors='coerce')
+    TT_dcFdFA = np.where(pd.isna(TT_dcFdFA), 0, TT_dcFdFA).astype(float)
     return TT_dcFdFA
 
 
@@ -1788,8 +1803,8 @@ def calculate_Dt_ForDNDF48(
     Fd_NDF: pd.Series, 
     Fd_DNDF48: pd.Series
 ) -> float:
-    Dt_ForDNDF48 = ((1 - Fd_Conc / 100) * Fd_NDF * Fd_DNDF48 / 100 *
-                    Fd_DMInp).sum()  # Line 259
+    Dt_ForDNDF48 = np.nansum((1 - Fd_Conc / 100) * Fd_NDF * Fd_DNDF48 / 100 *
+                             Fd_DMInp)  # Line 259
     return Dt_ForDNDF48
 
 
@@ -1857,7 +1872,7 @@ def calculate_Dt_NIn(Dt_CPIn: float) -> float:
 
 def calculate_Dt_RUPIn(Fd_RUPIn: pd.Series) -> float:
     # The feed summation is not as accurate as the equation below
-    Dt_RUPIn = Fd_RUPIn.sum()  # Line 616
+    Dt_RUPIn = np.nansum(Fd_RUPIn)  # Line 616
     Dt_RUPIn = 0 if Dt_RUPIn < 0 else Dt_RUPIn # Line 617
 
     # The following diet level RUPIn is slightly more accurate than the feed 
@@ -3990,9 +4005,8 @@ def calculate_TT_dcDtFA(Dt_DigFAIn: float, Dt_FAIn: float) -> float:
     return TT_dcDtFA
 
 
-def calculate_Dt_IdAARUPIn_array(diet_data: dict, aa_list: list) -> pd.Series:
-    Dt_IdAARUPIn = pd.Series([diet_data[f"Dt_Id{aa}RUPIn"] for aa in aa_list],
-                             index=aa_list)
+def calculate_Dt_IdAARUPIn_array(diet_data: dict, aa_list: list) -> np.ndarray:
+    Dt_IdAARUPIn = np.array([diet_data[f"Dt_Id{aa}RUPIn"] for aa in aa_list])
     return Dt_IdAARUPIn
 
 
@@ -4006,9 +4020,334 @@ def calculate_Trg_Fd_DMIn(Fd_DMInp: pd.Series, Trg_Dt_DMIn: float) -> pd.Series:
     return Trg_Fd_DMIn
 
 
+####################
+# Matrix form of diet intakes
+####################
+# Diet intakes that are a linear aggregation of a feed column. Each entry is
+# Dt name: (Fd column, Fd weight column or None for a plain sum, scale)
+DIET_AGGREGATES = {
+    "Dt_ADF": ("Fd_ADF", "Fd_DMInp", 1.0),
+    "Dt_NDF": ("Fd_NDF", "Fd_DMInp", 1.0),
+    "Dt_For": ("Fd_For", "Fd_DMInp", 1.0),
+    "Dt_ForNDF": ("Fd_ForNDF", "Fd_DMInp", 1.0),
+    "Dt_DMIn_ClfLiq": ("Fd_DMIn_ClfLiq", None, 1.0),
+    "Dt_DMIn_ClfFor": ("Fd_DMIn_ClfFor", None, 1.0),
+    "Dt_AFIn": ("Fd_AFIn", None, 1.0),
+    "Dt_NDFIn": ("Fd_NDFIn", None, 1.0),
+    "Dt_ADFIn": ("Fd_ADFIn", None, 1.0),
+    "Dt_LgIn": ("Fd_LgIn", None, 1.0),
+    "Dt_DigNDFIn_Base": ("Fd_DigNDFIn_Base", None, 1.0),
+    "Dt_ForWetIn": ("Fd_ForWetIn", None, 1.0),
+    "Dt_ForDryIn": ("Fd_ForDryIn", None, 1.0),
+    "Dt_PastIn": ("Fd_PastIn", None, 1.0),
+    "Dt_ForIn": ("Fd_ForIn", None, 1.0),
+    "Dt_ConcIn": ("Fd_ConcIn", None, 1.0),
+    "Dt_NFCIn": ("Fd_NFCIn", None, 1.0),
+    "Dt_StIn": ("Fd_StIn", None, 1.0),
+    "Dt_WSCIn": ("Fd_WSCIn", None, 1.0),
+    "Dt_CPIn": ("Fd_CPIn", None, 1.0),
+    "Dt_CPIn_ClfLiq": ("Fd_CPIn_ClfLiq", None, 1.0),
+    "Dt_TPIn": ("Fd_TPIn", None, 1.0),
+    "Dt_NPNCPIn": ("Fd_NPNCPIn", None, 1.0),
+    "Dt_NPNIn": ("Fd_NPNIn", None, 1.0),
+    "Dt_NPNDMIn": ("Fd_NPNDMIn", None, 1.0),
+    "Dt_CPAIn": ("Fd_CPAIn", None, 1.0),
+    "Dt_CPBIn": ("Fd_CPBIn", None, 1.0),
+    "Dt_CPCIn": ("Fd_CPCIn", None, 1.0),
+    "Dt_RUPBIn": ("Fd_RUPBIn", None, 1.0),
+    "Dt_CFatIn": ("Fd_CFatIn", None, 1.0),
+    "Dt_FAIn": ("Fd_FAIn", None, 1.0),
+    "Dt_FAhydrIn": ("Fd_FAhydrIn", None, 1.0),
+    "Dt_C120In": ("Fd_C120In", None, 1.0),
+    "Dt_C140In": ("Fd_C140In", None, 1.0),
+    "Dt_C160In": ("Fd_C160In", None, 1.0),
+    "Dt_C161In": ("Fd_C161In", None, 1.0),
+    "Dt_C180In": ("Fd_C180In", None, 1.0),
+    "Dt_C181tIn": ("Fd_C181tIn", None, 1.0),
+    "Dt_C181cIn": ("Fd_C181cIn", None, 1.0),
+    "Dt_C182In": ("Fd_C182In", None, 1.0),
+    "Dt_C183In": ("Fd_C183In", None, 1.0),
+    "Dt_OtherFAIn": ("Fd_OtherFAIn", None, 1.0),
+    "Dt_AshIn": ("Fd_AshIn", None, 1.0),
+    "Dt_GEIn": ("Fd_GEIn", None, 1.0),
+    "Dt_DEIn_base": ("Fd_DEIn_base", None, 1.0),
+    "Dt_DEIn_base_ClfLiq": ("Fd_DEIn_base_ClfLiq", None, 1.0),
+    "Dt_DEIn_base_ClfDry": ("Fd_DEIn_base_ClfDry", None, 1.0),
+    "Dt_DigStIn_Base": ("Fd_DigStIn_Base", None, 1.0),
+    "Dt_DigrOMtIn": ("Fd_DigrOMtIn", None, 1.0),
+    "Dt_idRUPIn": ("Fd_idRUPIn", None, 1.0),
+    "Dt_DigFAIn": ("Fd_DigFAIn", None, 1.0),
+    "Dt_ArgIn": ("Fd_ArgIn", None, 1.0),
+    "Dt_HisIn": ("Fd_HisIn", None, 1.0),
+    "Dt_IleIn": ("Fd_IleIn", None, 1.0),
+    "Dt_LeuIn": ("Fd_LeuIn", None, 1.0),
+    "Dt_LysIn": ("Fd_LysIn", None, 1.0),
+    "Dt_MetIn": ("Fd_MetIn", None, 1.0),
+    "Dt_PheIn": ("Fd_PheIn", None, 1.0),
+    "Dt_ThrIn": ("Fd_ThrIn", None, 1.0),
+    "Dt_TrpIn": ("Fd_TrpIn", None, 1.0),
+    "Dt_ValIn": ("Fd_ValIn", None, 1.0),
+    "Dt_ArgRUPIn": ("Fd_ArgRUPIn", None, 1.0),
+    "Dt_HisRUPIn": ("Fd_HisRUPIn", None, 1.0),
+    "Dt_IleRUPIn": ("Fd_IleRUPIn", None, 1.0),
+    "Dt_LeuRUPIn": ("Fd_LeuRUPIn", None, 1.0),
+    "Dt_LysRUPIn": ("Fd_LysRUPIn", None, 1.0),
+    "Dt_MetRUPIn": ("Fd_MetRUPIn", None, 1.0),
+    "Dt_PheRUPIn": ("Fd_PheRUPIn", None, 1.0),
+    "Dt_ThrRUPIn": ("Fd_ThrRUPIn", None, 1.0),
+    "Dt_TrpRUPIn": ("Fd_TrpRUPIn", None, 1.0),
+    "Dt_ValRUPIn": ("Fd_ValRUPIn", None, 1.0),
+    "Dt_DMInSum": ("Fd_DMIn", None, 1.0),
+    "Dt_DEIn_ClfLiq": ("Fd_DE_ClfLiq", "Fd_DMIn_ClfLiq", 1.0),
+    "Dt_MEIn_ClfLiq": ("Fd_ME_ClfLiq", "Fd_DMIn_ClfLiq", 1.0),
+    "Dt_NDFnfIn": ("Fd_NDFnf", "Fd_DMIn", 0.01),
+    "Dt_ForNDFIn": ("Fd_ForNDF", "Fd_DMIn", 0.01),
+    "Dt_CaIn": ("Fd_CaIn", None, 1.0),
+    "Dt_PIn": ("Fd_PIn", None, 1.0),
+    "Dt_PinorgIn": ("Fd_PinorgIn", None, 1.0),
+    "Dt_PorgIn": ("Fd_PorgIn", None, 1.0),
+    "Dt_NaIn": ("Fd_NaIn", None, 1.0),
+    "Dt_MgIn": ("Fd_MgIn", None, 1.0),
+    "Dt_MgIn_min": ("Fd_MgIn_min", None, 1.0),
+    "Dt_KIn": ("Fd_KIn", None, 1.0),
+    "Dt_ClIn": ("Fd_ClIn", None, 1.0),
+    "Dt_SIn": ("Fd_SIn", None, 1.0),
+    "Dt_CoIn": ("Fd_CoIn", None, 1.0),
+    "Dt_CrIn": ("Fd_CrIn", None, 1.0),
+    "Dt_CuIn": ("Fd_CuIn", None, 1.0),
+    "Dt_FeIn": ("Fd_FeIn", None, 1.0),
+    "Dt_IIn": ("Fd_IIn", None, 1.0),
+    "Dt_MnIn": ("Fd_MnIn", None, 1.0),
+    "Dt_MoIn": ("Fd_MoIn", None, 1.0),
+    "Dt_SeIn": ("Fd_SeIn", None, 1.0),
+    "Dt_ZnIn": ("Fd_ZnIn", None, 1.0),
+    "Dt_VitAIn": ("Fd_VitAIn", None, 1.0),
+    "Dt_VitDIn": ("Fd_VitDIn", None, 1.0),
+    "Dt_VitEIn": ("Fd_VitEIn", None, 1.0),
+    "Dt_CholineIn": ("Fd_CholineIn", None, 1.0),
+    "Dt_BiotinIn": ("Fd_BiotinIn", None, 1.0),
+    "Dt_NiacinIn": ("Fd_NiacinIn", None, 1.0),
+    "Dt_B_CaroteneIn": ("Fd_B_CaroteneIn", None, 1.0),
+    "Dt_IdArgRUPIn": ("Fd_IdArgRUPIn", None, 1.0),
+    "Dt_IdHisRUPIn": ("Fd_IdHisRUPIn", None, 1.0),
+    "Dt_IdIleRUPIn": ("Fd_IdIleRUPIn", None, 1.0),
+    "Dt_IdLeuRUPIn": ("Fd_IdLeuRUPIn", None, 1.0),
+    "Dt_IdLysRUPIn": ("Fd_IdLysRUPIn", None, 1.0),
+    "Dt_IdMetRUPIn": ("Fd_IdMetRUPIn", None, 1.0),
+    "Dt_IdPheRUPIn": ("Fd_IdPheRUPIn", None, 1.0),
+    "Dt_IdThrRUPIn": ("Fd_IdThrRUPIn", None, 1.0),
+    "Dt_IdTrpRUPIn": ("Fd_IdTrpRUPIn", None, 1.0),
+    "Dt_IdValRUPIn": ("Fd_IdValRUPIn", None, 1.0),
+    "Dt_DigC120In": ("Fd_DigC120In", None, 1.0),
+    "Dt_DigC140In": ("Fd_DigC140In", None, 1.0),
+    "Dt_DigC160In": ("Fd_DigC160In", None, 1.0),
+    "Dt_DigC161In": ("Fd_DigC161In", None, 1.0),
+    "Dt_DigC180In": ("Fd_DigC180In", None, 1.0),
+    "Dt_DigC181tIn": ("Fd_DigC181tIn", None, 1.0),
+    "Dt_DigC181cIn": ("Fd_DigC181cIn", None, 1.0),
+    "Dt_DigC182In": ("Fd_DigC182In", None, 1.0),
+    "Dt_DigC183In": ("Fd_DigC183In", None, 1.0),
+    "Dt_DigOtherFAIn": ("Fd_DigOtherFAIn", None, 1.0),
+    "Abs_CaIn": ("Fd_absCaIn", None, 1.0),
+    "Abs_PIn": ("Fd_absPIn", None, 1.0),
+    "Abs_NaIn": ("Fd_absNaIn", None, 1.0),
+    "Abs_KIn": ("Fd_absKIn", None, 1.0),
+    "Abs_ClIn": ("Fd_absClIn", None, 1.0),
+    "Abs_CoIn": ("Fd_absCoIn", None, 1.0),
+    "Abs_CuIn": ("Fd_absCuIn", None, 1.0),
+    "Abs_FeIn": ("Fd_absFeIn", None, 1.0),
+    "Abs_MnIn": ("Fd_absMnIn", None, 1.0),
+    "Abs_ZnIn": ("Fd_absZnIn", None, 1.0),
+    "Dt_DigWSCIn": ("Fd_DigWSCIn", None, 1.0),
+    "Dt_Fe_RUPout": ("Fd_Fe_RUPout", None, 1.0),
+}
+
+
+def calculate_nutrient_matrix(
+    complete_feed_data: Union[pd.DataFrame, dict], 
+    columns: list
+) -> np.ndarray:
+    """
+    nutrient_matrix: Contiguous (feeds x columns) float array of feed values 
+
+    Missing values are set to 0 so the matrix product matches the NaN 
+    skipping behaviour of pd.Series.sum().
+    """
+    nutrient_matrix = np.column_stack(
+        [np.asarray(complete_feed_data[column], dtype=float) 
+         for column in columns]
+        )
+    nutrient_matrix[np.isnan(nutrient_matrix)] = 0.0
+    return nutrient_matrix
+
+
+def calculate_Dt_aggregates(
+    weights: np.ndarray, 
+    nutrient_matrix: np.ndarray, 
+    scale: np.ndarray = None
+) -> np.ndarray:
+    """
+    Dt_aggregates: Weighted sums of feed values over the feed axis
+
+    weights is either a (feeds,) vector, giving a (nutrients,) result, or a 
+    (diets x feeds) matrix, giving a (diets x nutrients) result.
+    """
+    Dt_aggregates = weights @ nutrient_matrix
+    if scale is not None:
+        Dt_aggregates = Dt_aggregates * scale
+    return Dt_aggregates
+
+
+def _group_diet_aggregates(aggregates: dict) -> dict:
+    groups = {}
+    for name, (column, weight, scale) in aggregates.items():
+        names, columns, scales = groups.setdefault(weight, ([], [], []))
+        names.append(name)
+        columns.append(column)
+        scales.append(scale)
+    return {
+        weight: (names, columns, np.array(scales, dtype=float))
+        for weight, (names, columns, scales) in groups.items()
+    }
+
+
+_DIET_AGGREGATE_GROUPS = _group_diet_aggregates(DIET_AGGREGATES)
+
+
+def calculate_diet_aggregates(
+    complete_feed_data: Union[pd.DataFrame, dict]
+) -> dict:
+    """
+    Calculate every entry of DIET_AGGREGATES with one matrix product per 
+    weight column. The calculate_Dt_* functions remain the reference 
+    definitions of these values.
+    """
+    diet_aggregates = {}
+    for weight, (names, columns, scales) in _DIET_AGGREGATE_GROUPS.items():
+        nutrient_matrix = calculate_nutrient_matrix(complete_feed_data, columns)
+        if weight is None:
+            weights = np.ones(nutrient_matrix.shape[0])
+        else:
+            weights = np.asarray(complete_feed_data[weight], dtype=float)
+            weights = np.where(np.isnan(weights), 0.0, weights)
+        values = calculate_Dt_aggregates(weights, nutrient_matrix, scales)
+        diet_aggregates.update(zip(names, values))
+    return diet_aggregates
+
+
+# Columns of the matrix returned by calculate_diet_matrix, in group order
+DIET_MATRIX_COLUMNS = [
+    name for names, _, _ in _DIET_AGGREGATE_GROUPS.values() for name in names
+    ] + ["Dt_ForDNDF48", "Dt_RUPIn"]
+
+
+def _calculate_unit_feed_arrays(
+    An_StatePhys: str, 
+    Use_DNDF_IV: int, 
+    feed_arrays: dict, 
+    coeff_dict: dict
+) -> dict:
+    # Feed level columns for 1 kg DM of each feed
+    feed_count = len(feed_arrays["Fd_Conc"])
+    unit_feed_arrays = dict(feed_arrays, Fd_DMInp=np.ones(feed_count))
+    return calculate_feed_arrays(
+        1.0, An_StatePhys, Use_DNDF_IV, unit_feed_arrays, coeff_dict
+        )
+
+
+def _aggregate_unit_feed_arrays(
+    unit_feed_arrays: dict, 
+    Fd_DMInp: np.ndarray, 
+    Fd_DMIn: np.ndarray
+) -> np.ndarray:
+    diet_columns = []
+    for weight, (names, columns, scales) in _DIET_AGGREGATE_GROUPS.items():
+        if weight is None:
+            weights = Fd_DMIn
+        elif weight == "Fd_DMInp":
+            weights = Fd_DMInp
+        else:
+            unit_weight = np.asarray(unit_feed_arrays[weight], dtype=float)
+            weights = Fd_DMIn * np.where(np.isnan(unit_weight), 0.0, unit_weight)
+        diet_columns.append(calculate_Dt_aggregates(
+            weights, calculate_nutrient_matrix(unit_feed_arrays, columns), 
+            scales
+            ))
+    Fd_ForDNDF48 = ((1 - unit_feed_arrays["Fd_Conc"] / 100) * 
+                    unit_feed_arrays["Fd_NDF"] * 
+                    unit_feed_arrays["Fd_DNDF48"] / 100)
+    nutrient_matrix = calculate_nutrient_matrix(
+        {"Fd_ForDNDF48": Fd_ForDNDF48, "Fd_RUPIn": unit_feed_arrays["Fd_RUPIn"]},
+        ["Fd_ForDNDF48", "Fd_RUPIn"]
+        )
+    Dt_ForDNDF48 = calculate_Dt_aggregates(Fd_DMInp, nutrient_matrix[:, :1])
+    # Line 617, negative RUP intakes are set to 0
+    Dt_RUPIn = np.maximum(
+        calculate_Dt_aggregates(Fd_DMIn, nutrient_matrix[:, 1:]), 0
+        )
+    return np.hstack(diet_columns + [Dt_ForDNDF48, Dt_RUPIn])
+
+
+def calculate_diet_matrix(
+    Dt_DMIn: Union[float, np.ndarray],
+    An_StatePhys: str,
+    Use_DNDF_IV: int,
+    kg_user: np.ndarray,
+    feed_arrays: dict,
+    coeff_dict: dict
+) -> np.ndarray:
+    """
+    diet_matrix: (diets x DIET_MATRIX_COLUMNS) diet intakes for many rations 
+
+    kg_user is a (diets x feeds) array of feed amounts with columns in the 
+    same order as the feeds in feed_arrays. Dt_DMIn is either one intake for 
+    every diet or one per diet. Feed level columns are calculated once for 
+    1 kg DM of each feed and scaled by each diet's Fd_DMIn, which gives the 
+    same values as calculate_feed_data and calculate_diet_data per diet.
+    """
+    kg_user = np.atleast_2d(np.asarray(kg_user, dtype=float))
+    Fd_DMInp = kg_user / kg_user.sum(axis=1, keepdims=True)
+    Fd_DMIn = Fd_DMInp * np.reshape(np.asarray(Dt_DMIn, dtype=float), (-1, 1))
+
+    unit_feed_arrays = _calculate_unit_feed_arrays(
+        An_StatePhys, Use_DNDF_IV, feed_arrays, coeff_dict
+        )
+    diet_matrix = _aggregate_unit_feed_arrays(
+        unit_feed_arrays, Fd_DMInp, Fd_DMIn
+        )
+
+    # Calf mineral absorption depends on Dt_DMIn_ClfLiq > 0, so diets without 
+    # any liquid feed are recalculated from the dry feeds only
+    liquid_feed = np.nan_to_num(unit_feed_arrays["Fd_DMIn_ClfLiq"]) > 0
+    no_liquid = (Fd_DMIn[:, liquid_feed] == 0).all(axis=1)
+    if liquid_feed.any() and not liquid_feed.all() and no_liquid.any():
+        dry_feed_arrays = _calculate_unit_feed_arrays(
+            An_StatePhys, Use_DNDF_IV, 
+            {column: np.asarray(values)[~liquid_feed] 
+             for column, values in feed_arrays.items()}, 
+            coeff_dict
+            )
+        diet_matrix[no_liquid] = _aggregate_unit_feed_arrays(
+            dry_feed_arrays, 
+            Fd_DMInp[no_liquid][:, ~liquid_feed], 
+            Fd_DMIn[no_liquid][:, ~liquid_feed]
+            )
+    return diet_matrix
+
+
 ####################
 # Wrapper functions for feed and diet intakes
 ####################
+def get_feed_arrays(feed_data: pd.DataFrame) -> dict:
+    """
+    feed_arrays: Feed level data as a dict of column name to np.ndarray
+    """
+    feed_arrays = {
+        column: feed_data[column].to_numpy() for column in feed_data.columns
+    }
+    return feed_arrays
+
+
 def calculate_feed_data(
     Dt_DMIn: float, 
     An_StatePhys: str, 
@@ -4016,8 +4355,29 @@ def calculate_feed_data(
     feed_data: pd.DataFrame, 
     coeff_dict: dict
 ) -> pd.DataFrame:
-    # Start with copy of feed_data
-    complete_feed_data = feed_data.copy()
+    complete_feed_data = calculate_feed_arrays(
+        Dt_DMIn, An_StatePhys, Use_DNDF_IV, get_feed_arrays(feed_data), 
+        coeff_dict
+        )
+    return pd.DataFrame(complete_feed_data, index=feed_data.index)
+
+
+# pandas silences division warnings on Series, match that for plain arrays
+@np.errstate(divide="ignore", invalid="ignore")
+def calculate_feed_arrays(
+    Dt_DMIn: float, 
+    An_StatePhys: str, 
+    Use_DNDF_IV: int, 
+    feed_arrays: dict, 
+    coeff_dict: dict
+) -> dict:
+    """
+    Same calculations as calculate_feed_data, run on a dict of np.ndarray 
+    (see get_feed_arrays) to avoid the overhead of pandas operations on 
+    small diets. Returns a new dict with the derived Fd_ columns added.
+    """
+    # Start with copy of feed_arrays
+    complete_feed_data = dict(feed_arrays)
     new_columns = {}
 
     # Calculate all aditional feed data columns
@@ -4386,7 +4746,7 @@ def calculate_feed_data(
         complete_feed_data['Fd_DMIn'], complete_feed_data["Fd_B_Carotene"]
         )
     # Dt_DMIn_ClfLiq is needed for the calf mineral absorption calculations
-    Dt_DMIn_ClfLiq = new_columns['Fd_DMIn_ClfLiq'].sum()
+    Dt_DMIn_ClfLiq = np.nansum(new_columns['Fd_DMIn_ClfLiq'])
 
     new_columns['Fd_acCa'] = calculate_Fd_acCa(
         An_StatePhys, complete_feed_data['Fd_acCa_input'], Dt_DMIn_ClfLiq
@@ -4711,9 +5071,7 @@ def calculate_feed_data(
     new_columns["Fd_RDPIn"] = calculate_Fd_RDPIn(
         new_columns["Fd_RDP"], complete_feed_data['Fd_DMIn']
     )
-    complete_feed_data = pd.concat(
-        [complete_feed_data, pd.DataFrame(new_columns)], axis=1
-        )
+    complete_feed_data.update(new_columns)
     return complete_feed_data
 
 
@@ -4734,232 +5092,11 @@ def calculate_diet_data(
     Fe_MiTP: float,
     Fe_NPend: float,
     Du_idMiTP: float,
-    Du_IdAAMic: pd.Series,
+    Du_IdAAMic: Union[pd.Series, np.ndarray],
     coeff_dict: dict
 ) -> dict:
     # Diet Intakes
-    diet_data["Dt_ADF"] = calculate_Dt_ADF(
-        complete_feed_data["Fd_DMInp"], complete_feed_data["Fd_ADF"]
-        )
-    diet_data["Dt_NDF"] = calculate_Dt_NDF(
-        complete_feed_data["Fd_DMInp"], complete_feed_data["Fd_NDF"]
-        )
-    diet_data["Dt_For"] = calculate_Dt_For(
-        complete_feed_data["Fd_DMInp"], complete_feed_data["Fd_For"]
-        )
-    diet_data["Dt_ForNDF"] = calculate_Dt_ForNDF(
-        complete_feed_data["Fd_DMInp"], complete_feed_data["Fd_ForNDF"]
-        )
-    diet_data["Dt_DMIn_ClfLiq"] = calculate_Dt_DMIn_ClfLiq(
-        complete_feed_data["Fd_DMIn_ClfLiq"]
-        )
-    diet_data["Dt_DMIn_ClfFor"] = calculate_Dt_DMIn_ClfFor(
-        complete_feed_data["Fd_DMIn_ClfFor"]
-        )
-    diet_data["Dt_AFIn"] = calculate_Dt_AFIn(
-        complete_feed_data["Fd_AFIn"]
-        )
-    diet_data["Dt_NDFIn"] = calculate_Dt_NDFIn(
-        complete_feed_data["Fd_NDFIn"]
-        )
-    diet_data["Dt_ADFIn"] = calculate_Dt_ADFIn(
-        complete_feed_data["Fd_ADFIn"]
-        )
-    diet_data["Dt_LgIn"] = calculate_Dt_LgIn(
-        complete_feed_data["Fd_LgIn"]
-        )
-    diet_data["Dt_DigNDFIn_Base"] = calculate_Dt_DigNDFIn_Base(
-        complete_feed_data["Fd_DigNDFIn_Base"]
-        )
-    diet_data["Dt_ForWetIn"] = calculate_Dt_ForWetIn(
-        complete_feed_data["Fd_ForWetIn"]
-        )
-    diet_data["Dt_ForDryIn"] = calculate_Dt_ForDryIn(
-        complete_feed_data["Fd_ForDryIn"]
-        )
-    diet_data["Dt_PastIn"] = calculate_Dt_PastIn(
-        complete_feed_data["Fd_PastIn"]
-        )
-    diet_data["Dt_ForIn"] = calculate_Dt_ForIn(
-        complete_feed_data["Fd_ForIn"]
-        )
-    diet_data["Dt_ConcIn"] = calculate_Dt_ConcIn(
-        complete_feed_data["Fd_ConcIn"]
-        )
-    diet_data["Dt_NFCIn"] = calculate_Dt_NFCIn(
-        complete_feed_data["Fd_NFCIn"]
-        )
-    diet_data["Dt_StIn"] = calculate_Dt_StIn(
-        complete_feed_data["Fd_StIn"]
-        )
-    diet_data["Dt_WSCIn"] = calculate_Dt_WSCIn(
-        complete_feed_data["Fd_WSCIn"]
-        )
-    diet_data["Dt_CPIn"] = calculate_Dt_CPIn(
-        complete_feed_data["Fd_CPIn"]
-        )
-    diet_data["Dt_CPIn_ClfLiq"] = calculate_Dt_CPIn_ClfLiq(
-        complete_feed_data["Fd_CPIn_ClfLiq"]
-        )
-    diet_data["Dt_TPIn"] = calculate_Dt_TPIn(
-        complete_feed_data["Fd_TPIn"]
-        )
-    diet_data["Dt_NPNCPIn"] = calculate_Dt_NPNCPIn(
-        complete_feed_data["Fd_NPNCPIn"]
-        )
-    diet_data["Dt_NPNIn"] = calculate_Dt_NPNIn(
-        complete_feed_data["Fd_NPNIn"]
-        )
-    diet_data["Dt_NPNDMIn"] = calculate_Dt_NPNDMIn(
-        complete_feed_data["Fd_NPNDMIn"]
-        )
-    diet_data["Dt_CPAIn"] = calculate_Dt_CPAIn(
-        complete_feed_data["Fd_CPAIn"]
-        )
-    diet_data["Dt_CPBIn"] = calculate_Dt_CPBIn(
-        complete_feed_data["Fd_CPBIn"]
-        )
-    diet_data["Dt_CPCIn"] = calculate_Dt_CPCIn(
-        complete_feed_data["Fd_CPCIn"]
-        )
-    diet_data["Dt_RUPBIn"] = calculate_Dt_RUPBIn(
-        complete_feed_data["Fd_RUPBIn"]
-        )
-    diet_data["Dt_CFatIn"] = calculate_Dt_CFatIn(
-        complete_feed_data["Fd_CFatIn"]
-        )
-    diet_data["Dt_FAIn"] = calculate_Dt_FAIn(
-        complete_feed_data["Fd_FAIn"]
-        )
-    diet_data["Dt_FAhydrIn"] = calculate_Dt_FAhydrIn(
-        complete_feed_data["Fd_FAhydrIn"]
-        )
-    diet_data["Dt_C120In"] = calculate_Dt_C120In(
-        complete_feed_data["Fd_C120In"]
-        )
-    diet_data["Dt_C140In"] = calculate_Dt_C140In(
-        complete_feed_data["Fd_C140In"]
-        )
-    diet_data["Dt_C160In"] = calculate_Dt_C160In(
-        complete_feed_data["Fd_C160In"]
-        )
-    diet_data["Dt_C161In"] = calculate_Dt_C161In(
-        complete_feed_data["Fd_C161In"]
-        )
-    diet_data["Dt_C180In"] = calculate_Dt_C180In(
-        complete_feed_data["Fd_C180In"]
-        )
-    diet_data["Dt_C181tIn"] = calculate_Dt_C181tIn(
-        complete_feed_data["Fd_C181tIn"]
-        )
-    diet_data["Dt_C181cIn"] = calculate_Dt_C181cIn(
-        complete_feed_data["Fd_C181cIn"]
-        )
-    diet_data["Dt_C182In"] = calculate_Dt_C182In(
-        complete_feed_data["Fd_C182In"]
-        )
-    diet_data["Dt_C183In"] = calculate_Dt_C183In(
-        complete_feed_data["Fd_C183In"]
-        )
-    diet_data["Dt_OtherFAIn"] = calculate_Dt_OtherFAIn(
-        complete_feed_data["Fd_OtherFAIn"]
-        )
-    diet_data["Dt_AshIn"] = calculate_Dt_AshIn(
-        complete_feed_data["Fd_AshIn"]
-        )
-    diet_data["Dt_GEIn"] = calculate_Dt_GEIn(
-        complete_feed_data["Fd_GEIn"]
-        )
-    diet_data["Dt_DEIn_base"] = calculate_Dt_DEIn_base(
-        complete_feed_data["Fd_DEIn_base"]
-        )
-    diet_data["Dt_DEIn_base_ClfLiq"] = calculate_Dt_DEIn_base_ClfLiq(
-        complete_feed_data["Fd_DEIn_base_ClfLiq"]
-        )
-    diet_data["Dt_DEIn_base_ClfDry"] = calculate_Dt_DEIn_base_ClfDry(
-        complete_feed_data["Fd_DEIn_base_ClfDry"]
-        )
-    diet_data["Dt_DigStIn_Base"] = calculate_Dt_DigStIn_Base(
-        complete_feed_data["Fd_DigStIn_Base"]
-        )
-    diet_data["Dt_DigrOMtIn"] = calculate_Dt_DigrOMtIn(
-        complete_feed_data["Fd_DigrOMtIn"]
-        )
-    diet_data["Dt_idRUPIn"] = calculate_Dt_idRUPIn(
-        complete_feed_data["Fd_idRUPIn"]
-        )
-    diet_data["Dt_DigFAIn"] = calculate_Dt_DigFAIn(
-        complete_feed_data["Fd_DigFAIn"]
-        )
-    diet_data["Dt_ArgIn"] = calculate_Dt_ArgIn(
-        complete_feed_data["Fd_ArgIn"]
-        )
-    diet_data["Dt_HisIn"] = calculate_Dt_HisIn(
-        complete_feed_data["Fd_HisIn"]
-        )
-    diet_data["Dt_IleIn"] = calculate_Dt_IleIn(
-        complete_feed_data["Fd_IleIn"]
-        )
-    diet_data["Dt_LeuIn"] = calculate_Dt_LeuIn(
-        complete_feed_data["Fd_LeuIn"]
-        )
-    diet_data["Dt_LysIn"] = calculate_Dt_LysIn(
-        complete_feed_data["Fd_LysIn"]
-        )
-    diet_data["Dt_MetIn"] = calculate_Dt_MetIn(
-        complete_feed_data["Fd_MetIn"]
-        )
-    diet_data["Dt_PheIn"] = calculate_Dt_PheIn(
-        complete_feed_data["Fd_PheIn"]
-        )
-    diet_data["Dt_ThrIn"] = calculate_Dt_ThrIn(
-        complete_feed_data["Fd_ThrIn"]
-        )
-    diet_data["Dt_TrpIn"] = calculate_Dt_TrpIn(
-        complete_feed_data["Fd_TrpIn"]
-        )
-    diet_data["Dt_ValIn"] = calculate_Dt_ValIn(
-        complete_feed_data["Fd_ValIn"]
-        )
-    diet_data["Dt_ArgRUPIn"] = calculate_Dt_ArgRUPIn(
-        complete_feed_data["Fd_ArgRUPIn"]
-        )
-    diet_data["Dt_HisRUPIn"] = calculate_Dt_HisRUPIn(
-        complete_feed_data["Fd_HisRUPIn"]
-        )
-    diet_data["Dt_IleRUPIn"] = calculate_Dt_IleRUPIn(
-        complete_feed_data["Fd_IleRUPIn"]
-        )
-    diet_data["Dt_LeuRUPIn"] = calculate_Dt_LeuRUPIn(
-        complete_feed_data["Fd_LeuRUPIn"]
-        )
-    diet_data["Dt_LysRUPIn"] = calculate_Dt_LysRUPIn(
-        complete_feed_data["Fd_LysRUPIn"]
-        )
-    diet_data["Dt_MetRUPIn"] = calculate_Dt_MetRUPIn(
-        complete_feed_data["Fd_MetRUPIn"]
-        )
-    diet_data["Dt_PheRUPIn"] = calculate_Dt_PheRUPIn(
-        complete_feed_data["Fd_PheRUPIn"]
-        )
-    diet_data["Dt_ThrRUPIn"] = calculate_Dt_ThrRUPIn(
-        complete_feed_data["Fd_ThrRUPIn"]
-        )
-    diet_data["Dt_TrpRUPIn"] = calculate_Dt_TrpRUPIn(
-        complete_feed_data["Fd_TrpRUPIn"]
-        )
-    diet_data["Dt_ValRUPIn"] = calculate_Dt_ValRUPIn(
-        complete_feed_data["Fd_ValRUPIn"]
-        )
-    diet_data['Dt_DMInSum'] = calculate_Dt_DMInSum(
-        complete_feed_data['Fd_DMIn']
-        )
-    diet_data['Dt_DEIn_ClfLiq'] = calculate_Dt_DEIn_ClfLiq(
-        complete_feed_data['Fd_DE_ClfLiq'], complete_feed_data['Fd_DMIn_ClfLiq']
-        )
-    diet_data['Dt_MEIn_ClfLiq'] = calculate_Dt_MEIn_ClfLiq(
-        complete_feed_data['Fd_ME_ClfLiq'], complete_feed_data['Fd_DMIn_ClfLiq']
-        )
+    diet_data.update(calculate_diet_aggregates(complete_feed_data))
     diet_data['Dt_ForDNDF48'] = calculate_Dt_ForDNDF48(
         complete_feed_data['Fd_DMInp'], complete_feed_data['Fd_Conc'], 
         complete_feed_data['Fd_NDF'], complete_feed_data['Fd_DNDF48']
@@ -4970,15 +5107,9 @@ def calculate_diet_data(
     diet_data['Dt_ADF_NDF'] = calculate_Dt_ADF_NDF(
         diet_data['Dt_ADF'], diet_data['Dt_NDF']
         )
-    diet_data['Dt_NDFnfIn'] = calculate_Dt_NDFnfIn(
-        complete_feed_data['Fd_DMIn'], complete_feed_data['Fd_NDFnf']
-        )
     diet_data['Dt_Lg_NDF'] = calculate_Dt_Lg_NDF(
         diet_data['Dt_LgIn'], diet_data['Dt_NDFIn']
         )
-    diet_data['Dt_ForNDFIn'] = calculate_Dt_ForNDFIn(
-        complete_feed_data['Fd_DMIn'], complete_feed_data['Fd_ForNDF']
-        )
     diet_data['Dt_PastSupplIn'] = calculate_Dt_PastSupplIn(
         diet_data['Dt_DMInSum'], diet_data['Dt_PastIn']
         )
@@ -5117,52 +5248,6 @@ def calculate_diet_data(
     diet_data['Dt_CPC_CP'] = calculate_Dt_CPC_CP(
         diet_data['Dt_CPCIn'], diet_data['Dt_CPIn']
         )
-    diet_data["Dt_CaIn"] = calculate_Dt_CaIn(complete_feed_data["Fd_CaIn"])
-    diet_data["Dt_PIn"] = calculate_Dt_PIn(complete_feed_data["Fd_PIn"])
-    diet_data["Dt_PinorgIn"] = calculate_Dt_PinorgIn(
-        complete_feed_data["Fd_PinorgIn"]
-        )
-    diet_data["Dt_PorgIn"] = calculate_Dt_PorgIn(
-        complete_feed_data["Fd_PorgIn"]
-        )
-    diet_data["Dt_NaIn"] = calculate_Dt_NaIn(complete_feed_data["Fd_NaIn"])
-    diet_data["Dt_MgIn"] = calculate_Dt_MgIn(complete_feed_data["Fd_MgIn"])
-    diet_data["Dt_MgIn_min"] = calculate_Dt_MgIn_min(
-        complete_feed_data["Fd_MgIn_min"]
-        )
-    diet_data["Dt_KIn"] = calculate_Dt_KIn(complete_feed_data["Fd_KIn"])
-    diet_data["Dt_ClIn"] = calculate_Dt_ClIn(complete_feed_data["Fd_ClIn"])
-    diet_data["Dt_SIn"] = calculate_Dt_SIn(complete_feed_data["Fd_SIn"])
-    diet_data["Dt_CoIn"] = calculate_Dt_CoIn(complete_feed_data["Fd_CoIn"])
-    diet_data["Dt_CrIn"] = calculate_Dt_CrIn(complete_feed_data["Fd_CrIn"])
-    diet_data["Dt_CuIn"] = calculate_Dt_CuIn(complete_feed_data["Fd_CuIn"])
-    diet_data["Dt_FeIn"] = calculate_Dt_FeIn(complete_feed_data["Fd_FeIn"])
-    diet_data["Dt_IIn"] = calculate_Dt_IIn(complete_feed_data["Fd_IIn"])
-    diet_data["Dt_MnIn"] = calculate_Dt_MnIn(complete_feed_data["Fd_MnIn"])
-    diet_data["Dt_MoIn"] = calculate_Dt_MoIn(complete_feed_data["Fd_MoIn"])
-    diet_data["Dt_SeIn"] = calculate_Dt_SeIn(complete_feed_data["Fd_SeIn"])
-    diet_data["Dt_ZnIn"] = calculate_Dt_ZnIn(complete_feed_data["Fd_ZnIn"])
-    diet_data["Dt_VitAIn"] = calculate_Dt_VitAIn(
-        complete_feed_data["Fd_VitAIn"]
-        )
-    diet_data["Dt_VitDIn"] = calculate_Dt_VitDIn(
-        complete_feed_data["Fd_VitDIn"]
-        )
-    diet_data["Dt_VitEIn"] = calculate_Dt_VitEIn(
-        complete_feed_data["Fd_VitEIn"]
-        )
-    diet_data["Dt_CholineIn"] = calculate_Dt_CholineIn(
-        complete_feed_data["Fd_CholineIn"]
-        )
-    diet_data["Dt_BiotinIn"] = calculate_Dt_BiotinIn(
-        complete_feed_data["Fd_BiotinIn"]
-        )
-    diet_data["Dt_NiacinIn"] = calculate_Dt_NiacinIn(
-        complete_feed_data["Fd_NiacinIn"]
-        )
-    diet_data["Dt_B_CaroteneIn"] = calculate_Dt_B_CaroteneIn(
-        complete_feed_data["Fd_B_CaroteneIn"]
-        )
     diet_data["Dt_Ca"] = calculate_Dt_Ca(diet_data["Dt_CaIn"], Dt_DMIn)
     diet_data["Dt_P"] = calculate_Dt_P(diet_data["Dt_PIn"], Dt_DMIn)
     diet_data["Dt_Pinorg"] = calculate_Dt_Pinorg(
@@ -5198,36 +5283,6 @@ def calculate_diet_data(
     diet_data["Dt_B_Carotene"] = calculate_Dt_B_Carotene(
         diet_data["Dt_B_CaroteneIn"], Dt_DMIn
         )
-    diet_data["Dt_IdArgRUPIn"] = calculate_Dt_IdArgRUPIn(
-        complete_feed_data["Fd_IdArgRUPIn"]
-        )
-    diet_data["Dt_IdHisRUPIn"] = calculate_Dt_IdHisRUPIn(
-        complete_feed_data["Fd_IdHisRUPIn"]
-        )
-    diet_data["Dt_IdIleRUPIn"] = calculate_Dt_IdIleRUPIn(
-        complete_feed_data["Fd_IdIleRUPIn"]
-        )
-    diet_data["Dt_IdLeuRUPIn"] = calculate_Dt_IdLeuRUPIn(
-        complete_feed_data["Fd_IdLeuRUPIn"]
-        )
-    diet_data["Dt_IdLysRUPIn"] = calculate_Dt_IdLysRUPIn(
-        complete_feed_data["Fd_IdLysRUPIn"]
-        )
-    diet_data["Dt_IdMetRUPIn"] = calculate_Dt_IdMetRUPIn(
-        complete_feed_data["Fd_IdMetRUPIn"]
-        )
-    diet_data["Dt_IdPheRUPIn"] = calculate_Dt_IdPheRUPIn(
-        complete_feed_data["Fd_IdPheRUPIn"]
-        )
-    diet_data["Dt_IdThrRUPIn"] = calculate_Dt_IdThrRUPIn(
-        complete_feed_data["Fd_IdThrRUPIn"]
-        )
-    diet_data["Dt_IdTrpRUPIn"] = calculate_Dt_IdTrpRUPIn(
-        complete_feed_data["Fd_IdTrpRUPIn"]
-        )
-    diet_data["Dt_IdValRUPIn"] = calculate_Dt_IdValRUPIn(
-        complete_feed_data["Fd_IdValRUPIn"]
-        )
     diet_data['Dt_RDPIn'] = calculate_Dt_RDPIn(
         diet_data['Dt_CPIn'], diet_data['Dt_RUPIn']
         )
@@ -5279,46 +5334,6 @@ def calculate_diet_data(
         diet_data['Dt_DMIn_ClfFor'], An_AgeDryFdStart, Env_TempCurr, DMIn_eqn,
         Dt_DMIn, coeff_dict
         )
-    diet_data["Dt_DigC120In"] = calculate_Dt_DigC120In(
-        complete_feed_data["Fd_DigC120In"]
-        )
-    diet_data["Dt_DigC140In"] = calculate_Dt_DigC140In(
-        complete_feed_data["Fd_DigC140In"]
-        )
-    diet_data["Dt_DigC160In"] = calculate_Dt_DigC160In(
-        complete_feed_data["Fd_DigC160In"]
-        )
-    diet_data["Dt_DigC161In"] = calculate_Dt_DigC161In(
-        complete_feed_data["Fd_DigC161In"]
-        )
-    diet_data["Dt_DigC180In"] = calculate_Dt_DigC180In(
-        complete_feed_data["Fd_DigC180In"]
-        )
-    diet_data["Dt_DigC181tIn"] = calculate_Dt_DigC181tIn(
-        complete_feed_data["Fd_DigC181tIn"]
-        )
-    diet_data["Dt_DigC181cIn"] = calculate_Dt_DigC181cIn(
-        complete_feed_data["Fd_DigC181cIn"]
-        )
-    diet_data["Dt_DigC182In"] = calculate_Dt_DigC182In(
-        complete_feed_data["Fd_DigC182In"]
-        )
-    diet_data["Dt_DigC183In"] = calculate_Dt_DigC183In(
-        complete_feed_data["Fd_DigC183In"]
-        )
-    diet_data["Dt_DigOtherFAIn"] = calculate_Dt_DigOtherFAIn(
-        complete_feed_data["Fd_DigOtherFAIn"]
-        )
-    diet_data["Abs_CaIn"] = calculate_Abs_CaIn(complete_feed_data["Fd_absCaIn"])
-    diet_data["Abs_PIn"] = calculate_Abs_PIn(complete_feed_data["Fd_absPIn"])
-    diet_data["Abs_NaIn"] = calculate_Abs_NaIn(complete_feed_data["Fd_absNaIn"])
-    diet_data["Abs_KIn"] = calculate_Abs_KIn(complete_feed_data["Fd_absKIn"])
-    diet_data["Abs_ClIn"] = calculate_Abs_ClIn(complete_feed_data["Fd_absClIn"])
-    diet_data["Abs_CoIn"] = calculate_Abs_CoIn(complete_feed_data["Fd_absCoIn"])
-    diet_data["Abs_CuIn"] = calculate_Abs_CuIn(complete_feed_data["Fd_absCuIn"])
-    diet_data["Abs_FeIn"] = calculate_Abs_FeIn(complete_feed_data["Fd_absFeIn"])
-    diet_data["Abs_MnIn"] = calculate_Abs_MnIn(complete_feed_data["Fd_absMnIn"])
-    diet_data["Abs_ZnIn"] = calculate_Abs_ZnIn(complete_feed_data["Fd_absZnIn"])
     diet_data['Dt_acMg'] = calculate_Dt_acMg(
         An_StatePhys, diet_data['Dt_K'], diet_data['Dt_MgIn_min'], 
         diet_data['Dt_MgIn']
@@ -5326,9 +5341,6 @@ def calculate_diet_data(
     diet_data['Abs_MgIn'] = calculate_Abs_MgIn(
         diet_data['Dt_acMg'], diet_data['Dt_MgIn']
         )
-    diet_data['Dt_DigWSCIn'] = calculate_Dt_DigWSCIn(
-        complete_feed_data['Fd_DigWSCIn']
-        )
     diet_data['Dt_DigSt'] = calculate_Dt_DigSt(diet_data['Dt_DigStIn'], Dt_DMIn)
     diet_data['Dt_DigWSC'] = calculate_Dt_DigWSC(
         diet_data['Dt_DigWSCIn'], Dt_DMIn
@@ -5354,9 +5366,6 @@ def calculate_diet_data(
     diet_data['Dt_idcRUP'] = calculate_Dt_idcRUP(
         diet_data['Dt_idRUPIn'], diet_data['Dt_RUPIn']
         )
-    diet_data['Dt_Fe_RUPout'] = calculate_Dt_Fe_RUPout(
-        complete_feed_data['Fd_Fe_RUPout']
-        )
     diet_data['Dt_RDTPIn'] = calculate_Dt_RDTPIn(
         diet_data['Dt_RDPIn'], diet_data['Dt_NPNCPIn'], coeff_dict
         )
@@ -5519,34 +5528,34 @@ def calculate_diet_data(
         diet_data['Dt_DEIn_base_ClfDry'], Monensin_eqn
         )
     diet_data["Dt_IdArgIn"] = calculate_Dt_IdArgIn(
-        Du_IdAAMic["Arg"], diet_data["Dt_IdArgRUPIn"]
+        select_aa(Du_IdAAMic, "Arg"), diet_data["Dt_IdArgRUPIn"]
         )
     diet_data["Dt_IdHisIn"] = calculate_Dt_IdHisIn(
-        Du_IdAAMic["His"], diet_data["Dt_IdHisRUPIn"]
+        select_aa(Du_IdAAMic, "His"), diet_data["Dt_IdHisRUPIn"]
         )
     diet_data["Dt_IdIleIn"] = calculate_Dt_IdIleIn(
-        Du_IdAAMic["Ile"], diet_data["Dt_IdIleRUPIn"]
+        select_aa(Du_IdAAMic, "Ile"), diet_data["Dt_IdIleRUPIn"]
         )
     diet_data["Dt_IdLeuIn"] = calculate_Dt_IdLeuIn(
-        Du_IdAAMic["Leu"], diet_data["Dt_IdLeuRUPIn"]
+        select_aa(Du_IdAAMic, "Leu"), diet_data["Dt_IdLeuRUPIn"]
         )
     diet_data["Dt_IdLysIn"] = calculate_Dt_IdLysIn(
-        Du_IdAAMic["Lys"], diet_data["Dt_IdLysRUPIn"]
+        select_aa(Du_IdAAMic, "Lys"), diet_data["Dt_IdLysRUPIn"]
         )
     diet_data["Dt_IdMetIn"] = calculate_Dt_IdMetIn(
-        Du_IdAAMic["Met"], diet_data["Dt_IdMetRUPIn"]
+        select_aa(Du_IdAAMic, "Met"), diet_data["Dt_IdMetRUPIn"]
         )
     diet_data["Dt_IdPheIn"] = calculate_Dt_IdPheIn(
-        Du_IdAAMic["Phe"], diet_data["Dt_IdPheRUPIn"]
+        select_aa(Du_IdAAMic, "Phe"), diet_data["Dt_IdPheRUPIn"]
         )
     diet_data["Dt_IdThrIn"] = calculate_Dt_IdThrIn(
-        Du_IdAAMic["Thr"], diet_data["Dt_IdThrRUPIn"]
+        select_aa(Du_IdAAMic, "Thr"), diet_data["Dt_IdThrRUPIn"]
         )
     diet_data["Dt_IdTrpIn"] = calculate_Dt_IdTrpIn(
-        Du_IdAAMic["Trp"], diet_data["Dt_IdTrpRUPIn"]
+        select_aa(Du_IdAAMic, "Trp"), diet_data["Dt_IdTrpRUPIn"]
         )
     diet_data["Dt_IdValIn"] = calculate_Dt_IdValIn(
-        Du_IdAAMic["Val"], diet_data["Dt_IdValRUPIn"]
+        select_aa(Du_IdAAMic, "Val"), diet_data["Dt_IdValRUPIn"]
         )
     diet_data['Dt_DigOMaIn'] = calculate_Dt_DigOMaIn(
         diet_data['Dt_DigNDFIn'], diet_data['Dt_DigStIn'],
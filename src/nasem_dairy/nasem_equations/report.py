@@ -5,6 +5,7 @@ and other derived metrics that are part of the NASEM model but are not
 used directly in the core calculations.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -58,12 +59,12 @@ def calculate_digestable_rup(An_idRUP: float) -> float:
 
 
 def calculate_Fd_AFIn_sum(Fd_AFInp: pd.Series) -> float:
-    Fd_AFIn_sum = Fd_AFInp.sum()
+    Fd_AFIn_sum = np.nansum(Fd_AFInp)
     return Fd_AFIn_sum
 
 
 def calculate_Fd_DMIn_sum(Fd_DMInp: pd.Series) -> float:
-    Fd_DMIn_sum = Fd_DMInp.sum()
+    Fd_DMIn_sum = np.nansum(Fd_DMInp)
     return Fd_DMIn_sum
 
 
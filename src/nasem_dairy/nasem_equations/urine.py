@@ -7,6 +7,8 @@ components in urine.
 import numpy as np
 import pandas as pd
 
+from nasem_dairy.nasem_equations.amino_acid import sum_aa
+
 
 def calculate_Ur_Nout_g(
     Dt_CPIn: float, 
@@ -201,7 +203,7 @@ def calculate_Ur_EAAEnd_g(Ur_AAEnd_g: np.array) -> float:
     """
     Ur_EAAEnd_g: Total EAA in urine (g/d) 
     """
-    Ur_EAAEnd_g = Ur_AAEnd_g.sum()  # Line 2059-2061
+    Ur_EAAEnd_g = sum_aa(Ur_AAEnd_g)  # Line 2059-2061
     return Ur_EAAEnd_g
 
 
@@ -223,15 +223,22 @@ class SensitivityAnalyzer:
             coefficient_names=coeff_names
         )
 
+        # Validate once, only the coefficients change between samples
+        inputs = input_validation.prepare(
+            user_diet, animal_input, equation_selection, 
+            feed_library=feed_library, coeff_dict=coeff_dict,
+            infusion_input=infusion_input, verbose=False
+        )
+
         for index, param_array in enumerate(param_values):
             modified_coeff_dict = self._update_coeff_dict(
                 param_array, coeff_dict, coeff_names
             )
 
             model_output = nasem(
-                user_diet, animal_input, equation_selection, 
-                feed_library=feed_library, infusion_input=infusion_input, 
-                coeff_dict=modified_coeff_dict
+                inputs.with_changes(
+                    coeff_dict=modified_coeff_dict, verbose=False
+                    )
             )
 
             if save_full_output:
@@ -0,0 +1,4 @@
+from nasem_dairy.service.server import main
+
+if __name__ == "__main__":
+    main()
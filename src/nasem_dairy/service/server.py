@@ -0,0 +1,397 @@
+"""Long-running model server.
+
+This module keeps the NASEM model warm in a single process so that repeated
+requests do not pay for importing the package, reading the feed library or
+parsing the output structure files. Requests use the same JSON format as
+`utility.read_json_input`, with optional "id" and "outputs" keys, and are
+answered with the selected outputs.
+
+Requests can be read as JSON lines from stdin (one request per line, one
+response per line on stdout) or posted to a local HTTP endpoint. With more
+than one worker, requests are evaluated in a pool of warm worker processes.
+
+Classes:
+    ModelServer: Evaluates requests against a warm feed library.
+
+Functions:
+    serve_jsonl: Answers JSON-lines requests from a stream.
+    serve_http: Answers requests posted to a local HTTP endpoint.
+    main: Command line entry point, `python -m nasem_dairy.service`.
+"""
+import argparse
+import concurrent.futures
+import http.server
+import importlib.resources
+import json
+import sys
+import threading
+from typing import Any, Dict, IO, Iterable, List, Optional
+
+import pandas as pd
+
+import nasem_dairy.data.constants as constants
+import nasem_dairy.model.input_validation as validate
+from nasem_dairy.model.nasem import nasem
+from nasem_dairy.model.utility import parse_json_input
+from nasem_dairy.model_output.ModelOutput import CustomJSONEncoder, OutputExtractor
+from nasem_dairy.sensitivity.response_variables_config import RESPONSE_VARIABLE_NAMES
+
+
+class ModelServer:
+    """
+    Evaluates model requests against a feed library loaded once.
+
+    Parameters
+    ----------
+    feed_library : pd.DataFrame, optional
+        Feed library to use for every request. Defaults to the NASEM feed
+        library.
+    outputs : List[str], optional
+        Outputs returned when a request does not list its own. Defaults to
+        the response variables used by the sensitivity analysis.
+
+    Examples
+    --------
+    >>> server = ModelServer()
+    >>> server.handle({"id": 1, "outputs": ["Mlk_Prod"], **request_json})
+    {'id': 1, 'outputs': {'Mlk_Prod': 25.062}}
+    """
+    def __init__(
+        self,
+        feed_library: Optional[pd.DataFrame] = None,
+        outputs: Optional[List[str]] = None
+    ):
+        if feed_library is None:
+            path_to_package_data = importlib.resources.files(
+                "nasem_dairy.data.feed_library"
+                )
+            feed_library = pd.read_csv(
+                path_to_package_data.joinpath("NASEM_feed_library.csv")
+            )
+        self.feed_library = feed_library
+        self.outputs = list(outputs or RESPONSE_VARIABLE_NAMES)
+        self._extractor = OutputExtractor(self.outputs)
+        # Row of each feed by stripped name, to pass only the diet's feeds
+        self._feed_rows = pd.Series(
+            range(len(feed_library)), index=feed_library["Fd_Name"].str.strip()
+            )
+        self._feed_rows = self._feed_rows[
+            ~self._feed_rows.index.duplicated(keep="first")
+            ]
+
+    def evaluate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Runs the model for one request and returns the selected outputs.
+
+        Parameters
+        ----------
+        request : dict
+            Model inputs in the read_json_input format. infusion_input is
+            optional. "outputs" can list the output names to return.
+
+        Returns
+        -------
+        dict
+            Output values by name. Names that are not model outputs are None.
+
+        Raises
+        ------
+        KeyError, TypeError, ValueError
+            If the inputs are missing or invalid.
+        """
+        if "infusion_input" not in request:
+            request = {**request, "infusion_input": constants.infusion_dict}
+        user_diet, animal_input, equation_selection, infusion_input = (
+            parse_json_input(request)
+            )
+        feeds = user_diet["Feedstuff"].str.strip()
+        rows = self._feed_rows.reindex(feeds.unique()).dropna()
+        feed_library = self.feed_library.iloc[rows.astype(int)]
+        inputs = validate.prepare(
+            user_diet, animal_input, equation_selection, feed_library,
+            infusion_input=infusion_input, verbose=False
+            )
+        model_output = nasem(inputs)
+        outputs = request.get("outputs", self.outputs)
+        if outputs == self.outputs:
+            return self._extractor.extract(model_output)
+        return model_output.get_values(outputs)
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answers a request, returning any error instead of raising it.
+
+        Parameters
+        ----------
+        request : dict
+            A request for evaluate().
+
+        Returns
+        -------
+        dict
+            {"id": ..., "outputs": {...}} or {"id": ..., "error": "..."}.
+        """
+        if not isinstance(request, dict):
+            return {
+                "id": None, 
+                "error": "TypeError: Request must be a JSON object, not "
+                         f"{type(request).__name__}"
+            }
+        response = {"id": request.get("id")}
+        try:
+            response["outputs"] = self.evaluate(request)
+        except Exception as error:
+            response["error"] = f"{type(error).__name__}: {error}"
+        return response
+
+
+def encode_response(response: Dict[str, Any]) -> str:
+    """Serializes a response as a single line of JSON."""
+    return json.dumps(response, cls=CustomJSONEncoder)
+
+
+# Each worker process holds its own warm server
+_worker_server: Optional[ModelServer] = None
+
+
+def _initialize_worker(
+    feed_library: Optional[pd.DataFrame],
+    outputs: Optional[List[str]]
+) -> None:
+    global _worker_server
+    _worker_server = ModelServer(feed_library, outputs)
+
+
+def _handle_in_worker(request: Dict[str, Any]) -> str:
+    return encode_response(_worker_server.handle(request))
+
+
+class _Dispatcher:
+    """Answers requests in this process or in a pool of warm workers."""
+    def __init__(self, server: ModelServer, workers: int):
+        self.server = server
+        self.pool = None
+        if workers > 1:
+            self.pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_initialize_worker,
+                initargs=(server.feed_library, server.outputs)
+                )
+
+    def submit(self, request: Dict[str, Any]) -> concurrent.futures.Future:
+        if self.pool is not None:
+            return self.pool.submit(_handle_in_worker, request)
+        future = concurrent.futures.Future()
+        future.set_result(encode_response(self.server.handle(request)))
+        return future
+
+    def shutdown(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown()
+
+
+def _parse_request_line(line: str, line_number: int) -> Dict[str, Any]:
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as error:
+        return {"id": line_number, "error": f"JSONDecodeError: {error}"}
+    if not isinstance(request, dict):
+        return {"id": line_number, "error": "Request must be a JSON object"}
+    request.setdefault("id", line_number)
+    return request
+
+
+def serve_jsonl(
+    server: ModelServer,
+    input_stream: Iterable[str] = sys.stdin,
+    output_stream: IO[str] = sys.stdout,
+    workers: int = 1
+) -> None:
+    """
+    Answers one JSON request per line until the input ends.
+
+    Each response is written as one line and flushed as soon as it is
+    ready. With more than one worker, responses are written in the order
+    they complete, so each response carries the request "id" (the line
+    number when the request has none).
+
+    Args:
+        server: The server used to evaluate requests.
+        input_stream: Lines of JSON requests. Defaults to stdin.
+        output_stream: Stream for JSON responses. Defaults to stdout.
+        workers: Number of worker processes. Defaults to 1, which evaluates
+            requests in this process.
+    """
+    dispatcher = _Dispatcher(server, workers)
+    # Responses are written by the thread that completes them, so writes 
+    # and the count of unanswered requests share a lock
+    condition = threading.Condition()
+    unanswered = 0
+
+    def write(line: str) -> None:
+        with condition:
+            output_stream.write(line + "\n")
+            output_stream.flush()
+
+    def answer(future: concurrent.futures.Future, request_id: Any) -> None:
+        nonlocal unanswered
+        try:
+            line = future.result()
+        except Exception as error:
+            line = encode_response(
+                {"id": request_id, "error": f"{type(error).__name__}: {error}"}
+                )
+        with condition:
+            write(line)
+            unanswered -= 1
+            condition.notify_all()
+
+    try:
+        for line_number, line in enumerate(input_stream, start=1):
+            if not line.strip():
+                continue
+            request = _parse_request_line(line, line_number)
+            if "error" in request:
+                write(encode_response(request))
+                continue
+            with condition:
+                unanswered += 1
+            try:
+                future = dispatcher.submit(request)
+            except Exception:
+                with condition:
+                    unanswered -= 1
+                raise
+            future.add_done_callback(
+                lambda future, request_id=request["id"]: 
+                    answer(future, request_id)
+                )
+        with condition:
+            condition.wait_for(lambda: unanswered == 0)
+    finally:
+        dispatcher.shutdown()
+
+
+def make_http_server(
+    server: ModelServer,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1
+) -> http.server.ThreadingHTTPServer:
+    """
+    Creates an HTTP server that answers model requests.
+
+    POST a request (or a list of requests) as JSON to any path to receive the
+    response (or list of responses). GET /health returns {"status": "ok"}.
+    Call serve_forever() on the returned server to start it.
+
+    Args:
+        server: The server used to evaluate requests.
+        host: Address to listen on. Defaults to localhost only.
+        port: Port to listen on, 0 picks a free port.
+        workers: Number of worker processes.
+
+    Returns:
+        The HTTP server. server_close() also stops the worker processes.
+    """
+    dispatcher = _Dispatcher(server, workers)
+
+    class RequestHandler(http.server.BaseHTTPRequestHandler):
+        def _send(self, status: int, body: str) -> None:
+            encoded = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._send(200, json.dumps({"status": "ok"}))
+            else:
+                self._send(404, json.dumps({"error": "Not found"}))
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                body = json.loads(self.rfile.read(length))
+            except json.JSONDecodeError as error:
+                self._send(400, json.dumps({"error": f"JSONDecodeError: {error}"}))
+                return
+            requests = body if isinstance(body, list) else [body]
+            futures = [dispatcher.submit(request) for request in requests]
+            responses = [future.result() for future in futures]
+            if isinstance(body, list):
+                self._send(200, "[" + ",".join(responses) + "]")
+            else:
+                self._send(200, responses[0])
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    class ModelHTTPServer(http.server.ThreadingHTTPServer):
+        daemon_threads = True
+
+        def server_close(self) -> None:
+            super().server_close()
+            dispatcher.shutdown()
+
+    return ModelHTTPServer((host, port), RequestHandler)
+
+
+def serve_http(
+    server: ModelServer,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1
+) -> None:
+    """Answers HTTP requests until interrupted, see make_http_server()."""
+    http_server = make_http_server(server, host, port, workers)
+    try:
+        http_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        http_server.server_close()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the server options to a command line parser."""
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Number of worker processes (default 1)"
+        )
+    parser.add_argument(
+        "--feed-library", help="Path to a feed library CSV file"
+        )
+    parser.add_argument(
+        "--outputs", nargs="+",
+        help="Outputs to return when a request does not list its own"
+        )
+    parser.add_argument(
+        "--http", type=int, metavar="PORT",
+        help="Listen for HTTP requests on PORT instead of reading stdin"
+        )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address for --http"
+        )
+
+
+def run_server(args: argparse.Namespace) -> None:
+    """Starts the server described by parsed add_server_arguments options."""
+    feed_library = None
+    if args.feed_library:
+        feed_library = pd.read_csv(args.feed_library)
+    server = ModelServer(feed_library, args.outputs)
+    if args.http is not None:
+        serve_http(server, args.host, args.http, args.workers)
+    else:
+        serve_jsonl(server, workers=args.workers)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m nasem_dairy.service",
+        description="Serve NASEM model requests from a warm process."
+        )
+    add_server_arguments(parser)
+    run_server(parser.parse_args(argv))
@@ -0,0 +1,143 @@
+import os
+
+import pytest
+
+import nasem_dairy as nd
+from nasem_dairy.model.cache import ResultCache
+
+
+@pytest.fixture
+def demo_inputs():
+    return nd.demo("lactating_cow_test")
+
+
+def test_cache_hit(tmp_path, demo_inputs, monkeypatch):
+    user_diet, animal_input, equation_selection, infusion_input = demo_inputs
+    cache = ResultCache(tmp_path)
+    first = cache.run(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input
+        )
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("nasem() should not run on a cache hit")
+
+    monkeypatch.setattr("nasem_dairy.model.cache.nasem", fail)
+    second = cache.run(
+        user_diet.copy(), dict(animal_input), equation_selection,
+        infusion_input=infusion_input
+        )
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert isinstance(second, nd.ModelOutput)
+    for name in ["Mlk_Prod", "An_MPBal_g_Trg", "Dt_CP"]:
+        assert second.get_value(name) == first.get_value(name)
+
+
+def test_key_changes_with_inputs(demo_inputs):
+    user_diet, animal_input, equation_selection, infusion_input = demo_inputs
+    inputs = nd.prepare(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input
+        )
+    key = ResultCache.key(inputs)
+    assert key == ResultCache.key(nd.prepare(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input
+        ))
+    changed_coeffs = {**inputs.coeff_dict, "VmMiNInt": 101.0}
+    changed_library = inputs.feed_library.copy()
+    used_row = changed_library["Fd_Name"] == user_diet["Feedstuff"][0]
+    changed_library.loc[used_row, "Fd_CP"] += 1
+    unused_row = ~changed_library["Fd_Name"].isin(user_diet["Feedstuff"])
+    unused_library = inputs.feed_library.copy()
+    unused_library.loc[unused_row.idxmax(), "Fd_CP"] += 1
+
+    assert key != ResultCache.key(inputs.with_changes(
+        coeff_dict=changed_coeffs, verbose=False
+        ))
+    assert key != ResultCache.key(inputs.with_changes(
+        animal_input={**animal_input, "An_BW": 600.0}
+        ))
+    assert key != ResultCache.key(inputs.with_changes(
+        feed_library=changed_library
+        ))
+    assert key == ResultCache.key(inputs.with_changes(
+        feed_library=unused_library
+        ))
+    assert key != ResultCache.key(inputs, outputs=["Mlk_Prod"])
+
+
+def test_selected_outputs(tmp_path, demo_inputs):
+    user_diet, animal_input, equation_selection, _ = demo_inputs
+    inputs = nd.prepare(user_diet, animal_input, equation_selection)
+    cache = ResultCache(tmp_path)
+    values = cache.run(inputs, outputs=["Mlk_Prod", "Dt_CP"])
+    assert values == cache.run(inputs, outputs=["Mlk_Prod", "Dt_CP"])
+    assert values["Mlk_Prod"] == nd.nasem(inputs).get_value("Mlk_Prod")
+    assert cache.hits == 1
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_size=13_000)
+    payload = b"x" * 4000
+    for key in ["aa01", "bb02", "cc03"]:
+        cache.put(key, payload)
+        os.utime(cache._path(key), (0, {"aa01": 1, "bb02": 2, "cc03": 3}[key]))
+    # Reading an entry marks it as recently used
+    assert cache.get("aa01") == payload
+    cache.put("dd04", payload)
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") == payload
+    assert cache.get("cc03") == payload
+    assert cache.get("dd04") == payload
+    assert cache.size() <= 13_000
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_running_size(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path, max_size=13_000)
+    payload = b"x" * 4000
+    cache.put("aa01", payload)
+    scans = []
+    entries = cache._entries
+
+    def counted_entries():
+        scans.append(1)
+        return entries()
+
+    monkeypatch.setattr(cache, "_entries", counted_entries)
+    cache.put("bb02", payload)
+    cache.put("aa01", payload)
+    cache.put("cc03", payload)
+    # The directory is only scanned once the cache is full
+    assert scans == []
+    cache.put("dd04", payload)
+    assert scans == [1]
+    assert cache._size == cache.size() <= 13_000
+
+
+@pytest.mark.parametrize("contents", [
+    b"",
+    b"not a pickle",
+    b"cnasem_dairy.model.cache\nNoSuchClass\n.",
+    b"cno_such_module\nNoSuchClass\n.",
+])
+def test_unreadable_entry_is_a_miss(tmp_path, contents):
+    cache = ResultCache(tmp_path)
+    cache.put("aa01", "value")
+    with open(cache._path("aa01"), "wb") as file:
+        file.write(contents)
+    assert cache.get("aa01") is None
+
+
+def test_get_entry_evicted_while_loading(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+    cache.put("aa01", "value")
+
+    def evicted(path):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr("nasem_dairy.model.cache.os.utime", evicted)
+    assert cache.get("aa01") == "value"
@@ -0,0 +1,108 @@
+import json
+import shutil
+
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+from nasem_dairy import cli
+
+DEMO_DIR = "src/nasem_dairy/data/demo"
+OUTPUTS = ["Mlk_Prod", "An_MPBal_g_Trg", "Dt_CP"]
+
+
+@pytest.fixture
+def scenario_dir(tmp_path):
+    for name in ["lactating_cow_test", "dry_cow", "jersey_heifer"]:
+        shutil.copy(f"{DEMO_DIR}/{name}.json", tmp_path / f"{name}.json")
+    return tmp_path
+
+
+def expected_outputs(name):
+    user_diet, animal_input, equation_selection, infusion_input = nd.demo(name)
+    output = nd.nasem(
+        user_diet, animal_input, equation_selection, 
+        infusion_input=infusion_input
+    )
+    return [output.get_value(output_name) for output_name in OUTPUTS]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_run_directory_to_csv(scenario_dir, tmp_path, workers):
+    output_path = tmp_path / "results.csv"
+    exit_code = cli.main([
+        "run", str(scenario_dir), "-w", workers, "-q", 
+        "-o", str(output_path), "--outputs", *OUTPUTS
+    ])
+    assert exit_code == 0
+    results = pd.read_csv(output_path).set_index("id").sort_index()
+    assert list(results.index) == ["dry_cow", "jersey_heifer", "lactating_cow_test"]
+    assert results["error"].isna().all()
+    for name in results.index:
+        assert results.loc[name, OUTPUTS].tolist() == pytest.approx(
+            expected_outputs(name)
+        )
+
+
+def test_run_jsonl_with_errors(tmp_path, capsys):
+    with open(f"{DEMO_DIR}/lactating_cow_test.json") as file:
+        scenario = json.load(file)
+    bad_scenario = {**scenario, "animal_input": {
+        **scenario["animal_input"], "An_StatePhys": "Bull"
+    }}
+    scenario_path = tmp_path / "herd.jsonl"
+    scenario_path.write_text("\n".join([
+        json.dumps({**scenario, "id": "cow_1"}),
+        json.dumps(bad_scenario),
+        "{not json"
+    ]))
+    exit_code = cli.main([
+        "run", str(scenario_path), "-w", "1", "--format", "jsonl",
+        "--outputs", *OUTPUTS
+    ])
+    captured = capsys.readouterr()
+    assert exit_code == 1
+    assert "Evaluated 3/3 scenarios (2 failed)" in captured.err
+    rows = {row["id"]: row for row in map(json.loads, captured.out.splitlines())}
+    assert rows["cow_1"]["error"] is None
+    assert [rows["cow_1"][name] for name in OUTPUTS] == pytest.approx(
+        expected_outputs("lactating_cow_test")
+    )
+    assert rows[2]["error"].startswith("ValueError: An_StatePhys must be one of")
+    assert rows[3]["error"].startswith("JSONDecodeError")
+
+
+def test_parquet_output(scenario_dir, tmp_path):
+    output_path = tmp_path / "results.parquet"
+    args = [
+        "run", str(scenario_dir), "-w", "1", "-q", "-o", str(output_path), 
+        "--outputs", *OUTPUTS
+    ]
+    if cli.pyarrow is None:
+        with pytest.raises(ImportError, match="pyarrow"):
+            cli.main(args)
+    else:
+        assert cli.main(args) == 0
+        results = pd.read_parquet(output_path)
+        assert len(results) == 3
+
+
+def test_parquet_schema(tmp_path):
+    pytest.importorskip("pyarrow")
+    output_path = tmp_path / "results.parquet"
+    with open(output_path, "wb") as stream:
+        writer = cli.ResultWriter(stream, "parquet", OUTPUTS, batch_size=1)
+        # The first batch is an error row, the second has no errors
+        writer.write({"id": 1, "error": "ValueError: bad input"})
+        writer.write({"id": 2, "outputs": dict(zip(OUTPUTS, [25.0, 1, None]))})
+        writer.write({"id": "cow", "error": "KeyError: 'user_diet'"})
+        writer.close()
+    results = pd.read_parquet(output_path)
+    assert list(results.columns) == ["id", "error"] + OUTPUTS
+    assert results["id"].tolist() == ["1", "2", "cow"]
+    assert results["error"].tolist() == [
+        "ValueError: bad input", None, "KeyError: 'user_diet'"
+    ]
+    assert (results[OUTPUTS].dtypes == "float64").all()
+    assert results.loc[1, OUTPUTS[:2]].tolist() == [25.0, 1.0]
+    assert results[OUTPUTS[2]].isna().all()
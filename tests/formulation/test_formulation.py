@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+import nasem_dairy as nd
+
+
+@pytest.fixture
+def demo_inputs():
+    user_diet, animal_input, equation_selection, infusion_input = nd.demo(
+        "lactating_cow_test"
+        )
+    prices = dict(zip(user_diet["Feedstuff"], [0.2, 0.35, 0.45, 0.6]))
+    return prices, animal_input, equation_selection, infusion_input
+
+
+def test_formulate_diet_meets_constraints(demo_inputs):
+    prices, animal_input, equation_selection, infusion_input = demo_inputs
+    constraints = {
+        "An_MPBal_g_Trg": (0, 200), "An_NEbal": (0, None), 
+        "Dt_NDF": (28, 36), "Dt_St": (None, 25)
+        }
+    user_diet, output = nd.formulate_diet(
+        prices, constraints, animal_input, equation_selection, 
+        infusion_input=infusion_input
+        )
+    assert user_diet["kg_user"].sum() == pytest.approx(
+        animal_input["Trg_Dt_DMIn"]
+        )
+    assert (user_diet["kg_user"] >= -1e-9).all()
+    for name, (lower, upper) in constraints.items():
+        value = output.get_value(name)
+        if lower is not None:
+            assert value >= lower - 1e-3
+        if upper is not None:
+            assert value <= upper + 1e-3
+
+
+def test_formulate_diet_linear_constraints_only(demo_inputs):
+    prices, animal_input, equation_selection, infusion_input = demo_inputs
+    user_diet, output = nd.formulate_diet(
+        prices, {"Dt_NDF": (None, 40)}, animal_input, equation_selection, 
+        inclusion_limits={"Canola meal": (2, 6)}, infusion_input=infusion_input
+        )
+    kg_user = dict(zip(user_diet["Feedstuff"], user_diet["kg_user"]))
+    assert 2 - 1e-9 <= kg_user["Canola meal"] <= 6 + 1e-9
+    assert output.get_value("Dt_NDF") == pytest.approx(40)
+
+
+def test_formulate_diet_infeasible_limits(demo_inputs):
+    prices, animal_input, equation_selection, infusion_input = demo_inputs
+    limits = {feed: (0, 1) for feed in prices}
+    with pytest.raises(ValueError, match="Inclusion limits"):
+        nd.formulate_diet(
+            prices, {}, animal_input, equation_selection, 
+            inclusion_limits=limits
+            )
+
+
+def test_formulate_diet_unknown_output(demo_inputs):
+    prices, animal_input, equation_selection, infusion_input = demo_inputs
+    with pytest.raises(KeyError, match="Not_An_Output"):
+        nd.formulate_diet(
+            prices, {"Not_An_Output": (0, None)}, animal_input, 
+            equation_selection
+            )
@@ -0,0 +1,99 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+import nasem_dairy.model.input_definitions as expected
+from nasem_dairy.model.input_validation import (
+    check_and_convert_type, compile_schema, validate_table
+)
+
+
+def test_compiled_matches_check_and_convert_type():
+    _, animal_input, equation_selection, _ = nd.demo("lactating_cow_test")
+    for schema, input_dict in [
+        (expected.AnimalInput, animal_input),
+        (expected.EquationSelection, equation_selection),
+        (expected.CoeffDict, nd.coeff_dict)
+    ]:
+        compiled = compile_schema(schema)
+        assert compiled.convert(input_dict) == check_and_convert_type(
+            input_dict, schema.__annotations__
+            )
+
+
+def test_compiled_converters():
+    compiled = compile_schema(expected.EquationSelection)
+    assert compiled.converters["DMIn_eqn"]("8") == 8
+    assert compiled.required == frozenset(expected.EquationSelection.__annotations__)
+    with pytest.raises(ValueError, match="Use_DNDF_IV must be one of"):
+        compiled.converters["Use_DNDF_IV"](5)
+    with pytest.raises(
+        TypeError, match="Value for MiN_eqn must be of type int. Got str"
+        ):
+        compiled.converters["MiN_eqn"]("two")
+    with pytest.raises(KeyError, match="The following keys are missing"):
+        compiled.check_keys(["DMIn_eqn"])
+
+
+def test_validate_table():
+    _, _, equation_selection, _ = nd.demo("lactating_cow_test")
+    compiled = compile_schema(expected.EquationSelection)
+    table = pd.DataFrame([equation_selection] * 4, index=[10, 11, 12, 13])
+    table["DMIn_eqn"] = ["8", 0, 8.0, 1]
+    table["extra_column"] = 1
+    validated = validate_table(table, compiled)
+    assert list(validated.columns) == list(compiled.converters)
+    assert validated["DMIn_eqn"].tolist() == [8, 0, 8, 1]
+    assert validated.loc[12].to_dict() == compiled.convert(
+        table.loc[12].to_dict()
+        )
+
+    table.loc[[11, 13], "mProd_eqn"] = 9
+    with pytest.raises(ValueError, match=r"mProd_eqn in rows \[11, 13\]"):
+        validate_table(table, compiled)
+    with pytest.raises(KeyError, match="The following keys are missing"):
+        validate_table(table.drop(columns="MiN_eqn"), compiled)
+
+
+@pytest.mark.parametrize("expected_type, value", [
+    (int, "8"), (int, "8.0"), (int, 8.7), (int, np.nan), (int, np.inf), 
+    (int, None), (int, True), (float, "1.5"), (float, "nan"), (float, None), 
+    (float, pd.NA), (float, np.nan), (str, "Rumen"), (str, np.nan), 
+    (str, None), (str, 1.5), (Literal[0, 1, 2], "1"), (Literal[0, 1, 2], 5), 
+    (Literal["Holstein", "Jersey"], np.nan)
+])
+def test_column_and_single_value_rules_match(expected_type, value):
+    compiled = compile_schema({"key": expected_type})
+    converted, invalid = compiled.column_converters["key"](
+        pd.Series([value], dtype=object)
+        )
+    try:
+        expected_value = compiled.converters["key"](value)
+    except (TypeError, ValueError):
+        assert invalid.tolist() == [True]
+    else:
+        assert invalid.tolist() == [False]
+        assert converted.tolist() == pytest.approx([expected_value], nan_ok=True)
+        assert type(converted.tolist()[0]) is type(expected_value)
+
+
+def test_missing_values_are_not_strings():
+    compiled = compile_schema({"key": str})
+    with pytest.raises(TypeError, match="must be of type str"):
+        compiled.converters["key"](np.nan)
+    _, invalid = compiled.column_converters["key"](pd.Series([np.nan, "a"]))
+    assert invalid.tolist() == [True, False]
+
+
+def test_numeric_columns_match_single_values():
+    compiled = compile_schema({"key": int})
+    column = pd.Series([1.0, 2.9, np.nan, np.inf])
+    converted, invalid = compiled.column_converters["key"](column)
+    assert invalid.tolist() == [False, False, True, True]
+    converted, invalid = compiled.column_converters["key"](column[:2])
+    assert converted.tolist() == [compiled.converters["key"](value) 
+                                  for value in column[:2]]
+    assert not invalid.any()
@@ -0,0 +1,76 @@
+import copy
+
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+
+
+@pytest.fixture
+def demo_inputs():
+    return nd.demo("lactating_cow_test")
+
+
+def test_prepare_matches_nasem(demo_inputs):
+    user_diet, animal_input, equation_selection, infusion_input = demo_inputs
+    inputs = nd.prepare(
+        user_diet, animal_input, equation_selection, 
+        infusion_input=infusion_input
+        )
+    assert isinstance(inputs, nd.ValidatedInputs)
+    expected = nd.nasem(
+        user_diet, animal_input, equation_selection, 
+        infusion_input=infusion_input
+        )
+    prepared_copy = copy.deepcopy(inputs)
+    for _ in range(2):
+        output = nd.nasem(inputs)
+        for name in ["Mlk_Prod", "An_MPBal_g_Trg", "An_NEbal", "Dt_CP"]:
+            assert output.get_value(name) == expected.get_value(name)
+    # nasem() must not modify the prepared inputs it trusts
+    assert inputs.animal_input == prepared_copy.animal_input
+    assert inputs.coeff_dict == prepared_copy.coeff_dict
+    pd.testing.assert_frame_equal(inputs.user_diet, prepared_copy.user_diet)
+
+
+def test_with_changes_validates_field(demo_inputs, capfd):
+    user_diet, animal_input, equation_selection, _ = demo_inputs
+    inputs = nd.prepare(user_diet, animal_input, equation_selection)
+    coeff_dict = {**inputs.coeff_dict, "VmMiNInt": "101.0"}
+    changed = inputs.with_changes(coeff_dict=coeff_dict, verbose=False)
+    assert changed.coeff_dict["VmMiNInt"] == 101.0
+    assert changed.animal_input is inputs.animal_input
+    out, _ = capfd.readouterr()
+    assert out == ""
+
+    with pytest.raises(ValueError, match="An_StatePhys must be one of"):
+        inputs.with_changes(
+            animal_input={**animal_input, "An_StatePhys": "Bull"}
+            )
+    with pytest.raises(ValueError, match="missing in the feed library"):
+        inputs.with_changes(user_diet=pd.DataFrame({
+            "Feedstuff": ["Not a feed"], "kg_user": [1.0]
+            }))
+    with pytest.raises(KeyError, match="Not fields of ValidatedInputs"):
+        inputs.with_changes(diet=user_diet)
+
+
+def test_prepared_inputs_not_captured(demo_inputs):
+    user_diet, animal_input, equation_selection, _ = demo_inputs
+    inputs = nd.prepare(user_diet, animal_input, equation_selection)
+    output = nd.nasem(inputs)
+    # The inputs, with the full feed library, are kept out of the categories
+    assert output.dev_out["inputs"] is inputs
+    assert "inputs" not in output.Uncategorized
+
+    def captured(group):
+        for value in group.values():
+            if isinstance(value, dict):
+                yield from captured(value)
+            else:
+                yield value
+
+    for category in output.categories:
+        for value in captured(getattr(output, category)):
+            assert value is not inputs
+            assert value is not inputs.feed_library
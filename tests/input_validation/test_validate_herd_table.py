@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+from nasem_dairy.model.input_validation import (
+    InputTableError, validate_animal_input, validate_herd_table
+)
+
+
+@pytest.fixture
+def herd():
+    _, animal_input, equation_selection, _ = nd.demo("lactating_cow_test")
+    herd = pd.DataFrame([{**animal_input, **equation_selection}] * 6)
+    herd.index = [f"cow_{i}" for i in range(6)]
+    return herd
+
+
+def test_valid_herd(herd):
+    herd.loc["cow_1", "An_StatePhys"] = "Heifer"
+    herd["An_AgeConcept1st"] = [np.nan, "400", np.nan, np.nan, np.nan, np.nan]
+    herd["An_LactDay"] = herd["An_LactDay"].astype(str)
+    validated = validate_herd_table(herd)
+    assert validated["An_LactDay"].dtype == int
+    assert validated.loc["cow_1", "An_AgeConcept1st"] == 400
+    assert validated["An_AgeConcept1st"].isna().sum() == 5
+    row = herd.loc["cow_0"].drop("An_AgeConcept1st").to_dict()
+    expected_animal = validate_animal_input(row)
+    for key, value in expected_animal.items():
+        assert validated.loc["cow_0", key] == value
+
+
+def test_all_errors_reported(herd):
+    herd.loc[["cow_1", "cow_4"], "An_StatePhys"] = "Bull"
+    herd.loc["cow_2", "An_Breed"] = "Angus"
+    herd["An_BW"] = herd["An_BW"].astype(object)
+    herd.loc["cow_3", "An_BW"] = "heavy"
+    herd.loc[["cow_0", "cow_5"], "DMIn_eqn"] = 42
+    herd.loc["cow_5", "An_StatePhys"] = "Heifer"
+    with pytest.raises(InputTableError) as error:
+        validate_herd_table(herd)
+    rows = {item["column"]: item["rows"] for item in error.value.errors}
+    assert rows == {
+        "An_StatePhys": ["cow_1", "cow_4"],
+        "An_Breed": ["cow_2"],
+        "An_BW": ["cow_3"],
+        "DMIn_eqn": ["cow_0", "cow_5"],
+        "An_AgeConcept1st": ["cow_5"]
+    }
+    assert "An_BW in rows [cow_3]: must be of type float" in str(error.value)
+    assert isinstance(error.value, ValueError)
+
+
+def test_missing_columns(herd):
+    with pytest.raises(KeyError, match="The following keys are missing"):
+        validate_herd_table(herd.drop(columns=["An_BW"]))
@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import nasem_dairy as nd
+import nasem_dairy.data.constants as constants
+import nasem_dairy.model.nasem as nasem_module
+
+
+@pytest.fixture
+def demo_inputs():
+    user_diet, animal_input, equation_selection, _ = nd.demo(
+        "lactating_cow_test"
+        )
+    return nd.prepare(user_diet, animal_input, equation_selection)
+
+
+def test_unchanged_coefficients_reuse_values(demo_inputs):
+    first = nd.nasem(demo_inputs)
+    second = nd.nasem(demo_inputs)
+    assert first.get_value("MWAA") is second.get_value("MWAA")
+    assert not first.get_value("MWAA").flags.writeable
+    assert first.get_value("Mlk_Prod") == second.get_value("Mlk_Prod")
+
+
+def test_changed_coefficients_are_recalculated(demo_inputs):
+    coeff_dict = {**demo_inputs.coeff_dict, "MWLys": 150.0}
+    output = nd.nasem(demo_inputs.with_changes(
+        coeff_dict=coeff_dict, verbose=False
+        ))
+    MWAA = output.get_value("MWAA")
+    assert MWAA[4] == 150.0
+    assert MWAA[0] == constants.coeff_dict["MWArg"]
+
+
+def test_cache_size_is_bounded(demo_inputs, monkeypatch):
+    monkeypatch.setattr(nasem_module, "_INPUT_VALUES_CACHE_SIZE", 2)
+    nasem_module._INPUT_VALUES_CACHE.clear()
+    aa_list = ["Arg", "His", "Ile", "Leu", "Lys", "Met", "Phe", "Thr", "Trp", "Val"]
+    for MWLys in (140.0, 145.0, 150.0):
+        nasem_module._calculate_input_values(
+            aa_list, {**demo_inputs.coeff_dict, "MWLys": MWLys},
+            demo_inputs.MP_NP_efficiency, demo_inputs.mPrt_coeff_list[0]
+            )
+    assert len(nasem_module._INPUT_VALUES_CACHE) == 2
+    cached_MWLys = [key[1] for key in nasem_module._INPUT_VALUES_CACHE]
+    assert [dict(items)["MWLys"] for items in cached_MWLys] == [145.0, 150.0]
+    np.testing.assert_array_equal(
+        list(nasem_module._INPUT_VALUES_CACHE.values())[-1][2][4], 150.0
+        )
+
+
+def test_concurrent_calls(demo_inputs, monkeypatch):
+    monkeypatch.setattr(nasem_module, "_INPUT_VALUES_CACHE_SIZE", 2)
+    nasem_module._INPUT_VALUES_CACHE.clear()
+    aa_list = ["Arg", "His", "Ile", "Leu", "Lys", "Met", "Phe", "Thr", "Trp", "Val"]
+
+    def calculate(call):
+        MWLys = 140.0 + call % 5
+        values = nasem_module._calculate_input_values(
+            aa_list, {**demo_inputs.coeff_dict, "MWLys": MWLys},
+            demo_inputs.MP_NP_efficiency, demo_inputs.mPrt_coeff_list[0]
+            )
+        return values[2][4] == MWLys
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(calculate, range(400)))
+    assert len(nasem_module._INPUT_VALUES_CACHE) == 2
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+import nasem_dairy as nd
+import nasem_dairy.model.nasem as nasem_module
+import nasem_dairy.nasem_equations.micronutrient_requirement as micro_req
+import nasem_dairy.nasem_equations.nutrient_intakes as diet
+from nasem_dairy.dag.tracing import DependencyTrace, trace_dependencies
+
+
+def run_demo(scenario):
+    user_diet, animal_input, equation_selection, infusion_input = nd.demo(
+        scenario
+        )
+    return nd.nasem(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input
+        )
+
+
+@pytest.fixture(scope="module")
+def traced():
+    with trace_dependencies() as trace:
+        output = run_demo("lactating_cow_test")
+    return trace, output
+
+
+def test_outputs_unchanged(traced):
+    _, output = traced
+    expected = run_demo("lactating_cow_test")
+    for name in ["Mlk_Prod", "An_MPBal_g_Trg", "Dt_CP", "An_CPIn", 
+                 "An_Ca_req", "Man_Ca_out"]:
+        np.testing.assert_equal(output.get_value(name), expected.get_value(name))
+
+
+def test_dictionary_flows(traced):
+    trace, _ = traced
+    # Values read from diet_data and infusion_data
+    assert trace.variables["An_CPIn"] == {
+        "Module": "animal",
+        "Function": "calculate_An_CPIn",
+        "Arguments": ["Dt_CPIn", "Inf_CPIn"],
+        "Constants": [],
+        "Inputs": []
+    }
+    # Calculated inside calculate_diet_data
+    assert trace.variables["Dt_ForDNDF48"]["Function"] == (
+        "calculate_Dt_ForDNDF48"
+        )
+    # Previously added to the AST parsed DAG by hand
+    assert "An_GasEOut_Dry" in trace
+    assert "An_GasEOut_Dry" in trace.dependencies("An_GasEOut")
+
+
+def test_constants_and_inputs(traced):
+    trace, _ = traced
+    entry = trace.variables["GrUter_Wt"]
+    assert sorted(entry["Constants"]) == ["GrUter_Ksyn", "GrUter_KsynDecay"]
+    assert sorted(entry["Inputs"]) == ["An_GestDay", "An_GestLength"]
+    assert "Uter_Wt" in entry["Arguments"]
+    for entry in trace.variables.values():
+        assert not set(entry["Arguments"]) & set(entry["Inputs"])
+
+
+def test_mineral_requirements(traced):
+    trace, _ = traced
+    # Calculated for all minerals at once, traced per mineral
+    assert trace.variables["An_Ca_req"] == {
+        "Module": "micronutrient_requirement",
+        "Function": "calculate_An_Ca_req",
+        "Arguments": [
+            "Dt_DMIn_ClfLiq", "An_Ca_Clf", "Fe_Ca_m", "An_Ca_g", "An_Ca_y", 
+            "An_Ca_l"
+        ],
+        "Constants": [],
+        "Inputs": ["An_StatePhys"]
+    }
+    assert trace.variables["Man_Ca_out"]["Arguments"] == [
+        "Dt_CaIn", "An_Ca_prod"
+    ]
+    for name in ["Ur_m", "Fe_m", "m", "g", "y", "l", "req", "Dt_MinIn"]:
+        assert name not in trace
+    for entry in trace.variables.values():
+        assert entry["Function"] not in (
+            "get_mineral_outputs", "calculate_mineral_requirements"
+        )
+
+
+def test_dag_data_and_save(traced, tmp_path):
+    trace, _ = traced
+    dag_data = trace.to_dag_data()
+    assert list(dag_data.columns) == [
+        "Name", "Module", "Function", "Arguments", "Constants", "Inputs"
+    ]
+    assert len(dag_data) == len(trace)
+    assert not dag_data.isna().any().any()
+
+    path = tmp_path / "dependencies.json"
+    trace.save(path)
+    loaded = DependencyTrace.load(path)
+    assert loaded.variables == trace.variables
+
+
+def test_merge_runs():
+    with trace_dependencies() as trace:
+        run_demo("lactating_cow_test")
+        lactating = set(trace.variables)
+        run_demo("calf_starter_feed")
+    assert lactating < set(trace.variables)
+
+
+def test_functions_restored():
+    original_function = diet.calculate_diet_data
+    original_output = nasem_module.ModelOutput
+    original_cache = nasem_module._INPUT_VALUES_CACHE
+    original_mineral_outputs = micro_req.get_mineral_outputs
+    with pytest.raises(ValueError):
+        with trace_dependencies():
+            assert diet.calculate_diet_data is not original_function
+            raise ValueError
+    assert diet.calculate_diet_data is original_function
+    assert nasem_module.ModelOutput is original_output
+    assert nasem_module._INPUT_VALUES_CACHE is original_cache
+    assert micro_req.get_mineral_outputs is original_mineral_outputs
+
+    with trace_dependencies():
+        with pytest.raises(RuntimeError, match="already active"):
+            with trace_dependencies():
+                pass
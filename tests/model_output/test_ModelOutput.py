@@ -1,10 +1,16 @@
 import json
 import os
+import pickle
+import re
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from nasem_dairy.model_output.ModelOutput import ModelOutput
+import nasem_dairy as nd
+from nasem_dairy.model_output.ModelOutput import (
+    ModelOutput, OutputExtractor, _ReportTemplate
+)
 
 class TestModelOutput:
     @pytest.fixture
@@ -93,6 +99,29 @@ class TestModelOutput:
             f.write("Invalid JSON Content")
         with pytest.raises(ValueError):
             ModelOutput(locals_input={}, config_path=str(invalid_json_path))
+
+    def test_structures_are_read_only(
+        self, mock_structure, mock_report_structure
+    ):
+        outputs = [
+            ModelOutput(
+                locals_input={"user_diet": "value1"},
+                config_path=str(mock_structure),
+                report_config_path=str(mock_report_structure)
+            )
+            for _ in range(2)
+        ]
+        report_structure = outputs[0].report_structure
+        # Structures are parsed once and shared, so they cannot be changed
+        assert outputs[1].report_structure is report_structure
+        with pytest.raises(TypeError, match="cannot be changed"):
+            report_structure["report2"] = {}
+        with pytest.raises(TypeError, match="cannot be changed"):
+            report_structure["report1"]["col1"].append("var4")
+        with pytest.raises(TypeError, match="cannot be changed"):
+            outputs[0].categories_structure["Inputs"].pop("user_diet")
+        assert json.loads(json.dumps(report_structure)) == report_structure
+        assert pickle.loads(pickle.dumps(report_structure)) == report_structure
     
     def test_filter_locals_input(self, mock_structure, mock_report_structure):
         locals_input = {
@@ -625,6 +654,52 @@ class TestModelOutput:
 
         pd.testing.assert_frame_equal(search_df, expected_df)
 
+    def test_search_modes(
+        self, 
+        mock_structure_search, 
+        mock_report_structure, 
+        mock_locals_input_search
+    ):
+        outputs = [
+            ModelOutput(
+                locals_input=dict(mock_locals_input_search),
+                config_path=str(mock_structure_search),
+                report_config_path=str(mock_report_structure)
+            )
+            for _ in range(2)
+        ]
+        model_output = outputs[0]
+        assert model_output.search("COL", match="prefix")["Name"].tolist() == [
+            "column1", "column2"
+            ]
+        # Prefixes match names, not the dictionaries they are in
+        assert model_output.search("nested", match="prefix")["Name"].tolist(
+            ) == ["nested_key"]
+        assert model_output.search("dict", match="prefix")["Name"].tolist(
+            ) == ["dict_value"]
+        assert model_output.search(
+            "Col", case_sensitive=True, match="prefix"
+            ).empty
+        assert model_output.search("_value.nes", match="substring")[
+            "Name"].tolist() == ["nested_key"]
+        assert model_output.search("_value.nes", match="substring").equals(
+            model_output.search(r"_value\.nes")
+            )
+        assert model_output.search("(value", match="substring").empty
+        pd.testing.assert_frame_equal(
+            model_output.search(re.compile(r"^inputs\.\w+_value$", re.I)),
+            model_output.search(r"^Inputs\.\w+_value$")
+            )
+        assert len(model_output.search(r"^Inputs\.\w+_value$")) == 6
+        # Outputs with the same variables share an index
+        model_output.search("int_value")
+        outputs[1].search("int_value")
+        assert model_output._search_index[1] is outputs[1]._search_index[1]
+        with pytest.raises(ValueError, match="match must be one of"):
+            model_output.search("int_value", match="glob")
+        with pytest.raises(ValueError, match="compiled pattern"):
+            model_output.search(re.compile("int"), match="prefix")
+
     def test_export_to_dict(
         self, 
         mock_structure_search, 
@@ -724,6 +799,49 @@ class TestModelOutput:
         expected_df = pd.DataFrame(expected_data)
         pd.testing.assert_frame_equal(report_df, expected_df)
 
+    def test_get_reports(
+        self, 
+        tmp_path,
+        mock_structure_search, 
+        mock_locals_input_report
+    ):
+        report_structure = {
+            "SampleReport": {
+                "Description": ["Description 1", "Description 2"],
+                "Values": ["int_value", "float_value"],
+                "Total": ["float_value"]
+            },
+            "ColumnReport": {
+                "Description": ["Row 1", "Row 2", "Row 3", "Row 4"],
+                "Values": ["column1", "missing_value"],
+                "Other": [100, "", "float_value", "string_value"]
+            }
+        }
+        report_path = tmp_path / "report_structure.json"
+        with open(report_path, "w") as f:
+            json.dump(report_structure, f)
+        model_output = ModelOutput(
+            locals_input=mock_locals_input_report,
+            config_path=str(mock_structure_search),
+            report_config_path=str(report_path)
+        )
+        reports = model_output.get_reports()
+        assert list(reports) == ["SampleReport", "ColumnReport"]
+        pd.testing.assert_frame_equal(
+            reports["ColumnReport"],
+            pd.DataFrame({
+                "Description": ["Row 1", "Row 2", "Row 3", "Row 4"],
+                "Values": [1, 2, 3, ""],
+                "Other": [100, "", 45.67, "example string"]
+            })
+            )
+        for report_name, report in reports.items():
+            pd.testing.assert_frame_equal(
+                report, model_output.get_report(report_name)
+                )
+        with pytest.raises(ValueError, match="Report missing not found"):
+            model_output.get_reports(["SampleReport", "missing"])
+
     def test_get_category_list(
         self, 
         mock_structure, 
@@ -777,3 +895,257 @@ class TestModelOutput:
             match="Report non_existent_report not found in the report structure."
             ):
             model_output.get_report("non_existent_report")
+
+    def test_retain(self, mock_structure_nested, mock_report_structure):
+        locals_input = {
+            "user_diet": "diet_value",
+            "animal_input": "animal_value",
+            "deep_value1": 1.0,
+            "deep_value2": 2.0,
+            "value4": 4.0,
+            "extra": pd.DataFrame({"column1": [1, 2], "column2": [3, 4]}),
+            "key": "dev_value"
+        }
+        model_output = ModelOutput(
+            locals_input=dict(locals_input),
+            config_path=str(mock_structure_nested),
+            report_config_path=str(mock_report_structure),
+            retain=["animal_input", "nested5", "column2"]
+        )
+        assert model_output.categories == ["Inputs", "Uncategorized"]
+        assert model_output.Inputs == {
+            "animal_input": "animal_value",
+            "deep": {"nested1": {"nested2": {"nested3": {"nested4": {
+                "nested5": {"deep_value1": 1.0, "deep_value2": 2.0}
+            }}}}}
+        }
+        pd.testing.assert_frame_equal(
+            model_output.Uncategorized["extra"], 
+            pd.DataFrame({"column2": [3, 4]})
+            )
+        assert model_output.dev_out == {}
+        assert model_output.get_value("value4") is None
+
+        with pytest.warns(UserWarning, match="not found in the model output: "
+                                             "Mlk_Prdo$"):
+            model_output = ModelOutput(
+                locals_input=dict(locals_input),
+                config_path=str(mock_structure_nested),
+                report_config_path=str(mock_report_structure),
+                retain=["Inputs", "deep_value1", "Mlk_Prdo"]
+            )
+        assert model_output.categories == ["Inputs"]
+
+    def test_retain_response_variables(
+        self, 
+        mock_structure, 
+        mock_report_structure
+    ):
+        model_output = ModelOutput(
+            locals_input={"Mlk_Prod": 30.0, "An_BW": 600.0},
+            config_path=str(mock_structure),
+            report_config_path=str(mock_report_structure),
+            retain="response_variables"
+        )
+        assert model_output.categories == ["Uncategorized"]
+        assert model_output.Uncategorized == {"Mlk_Prod": 30.0}
+        with pytest.raises(ValueError, match="retain must be"):
+            ModelOutput(
+                locals_input={},
+                config_path=str(mock_structure),
+                report_config_path=str(mock_report_structure),
+                retain="Mlk_Prod"
+            )
+
+    def test_memory_usage(self, mock_structure, mock_report_structure):
+        shared = np.zeros(1000)
+        model_output = ModelOutput(
+            locals_input={
+                "user_diet": pd.DataFrame({"kg_user": np.zeros(100)}),
+                "feed_data": {"array": shared, "view": shared[:10]},
+                "other": shared,
+                "key": "value"
+            },
+            config_path=str(mock_structure),
+            report_config_path=str(mock_report_structure)
+        )
+        usage = model_output.memory_usage()
+        assert list(usage.index) == [
+            "Inputs", "Intakes", "Uncategorized", "dev_out"
+        ]
+        assert usage["Inputs"] >= 800
+        # The array is counted once, under the first category it is found in
+        assert usage["Intakes"] >= 8000
+        assert usage["Uncategorized"] < 8000
+
+    def test_pickle(self, mock_structure, mock_report_structure):
+        feed_data = pd.DataFrame({
+            "Fd_Name": ["Corn", "Hay"],
+            "Fd_CP": [8.5, 17.0],
+            "Fd_Type": [1, 2],
+            "Fd_DM": [88.0, 90.0]
+        }, index=["a", "b"])
+        model_output = ModelOutput(
+            locals_input={
+                "user_diet": pd.DataFrame({"kg_user": [1.0, 2.0]}),
+                "animal_input": {"An_BW": 600.0, "An_Parity_rl": 2},
+                "feed_data": feed_data,
+                "Mlk_Prod": np.float64(30.0),
+                "An_StatePhys": "Lactating Cow",
+                "Abs_AA_g": pd.Series([1.5, 2.5], index=["Arg", "His"], 
+                                      name="Abs_AA_g"),
+                "feed_library": feed_data
+            },
+            config_path=str(mock_structure),
+            report_config_path=str(mock_report_structure)
+        )
+        restored = pickle.loads(pickle.dumps(model_output))
+        assert restored.categories == model_output.categories
+        assert restored.categories_structure is model_output.categories_structure
+        assert restored.Inputs["animal_input"] == {
+            "An_BW": 600.0, "An_Parity_rl": 2
+        }
+        assert type(restored.Inputs["animal_input"]["An_Parity_rl"]) is int
+        assert type(restored.get_value("Mlk_Prod")) is np.float64
+        assert restored.get_value("An_StatePhys") == "Lactating Cow"
+        pd.testing.assert_frame_equal(
+            restored.get_value("feed_data"), feed_data
+            )
+        pd.testing.assert_frame_equal(
+            restored.get_value("user_diet"), 
+            model_output.get_value("user_diet")
+            )
+        pd.testing.assert_series_equal(
+            restored.get_value("Abs_AA_g"), 
+            model_output.get_value("Abs_AA_g")
+            )
+        # The feed library is not pickled
+        assert "feed_library" not in restored.dev_out
+
+    def test_unpickle_unsupported_format(
+        self, mock_structure, mock_report_structure
+    ):
+        model_output = ModelOutput(
+            locals_input={"user_diet": "value1"},
+            config_path=str(mock_structure),
+            report_config_path=str(mock_report_structure)
+        )
+        state = model_output.__getstate__()
+        del state["format"]
+        restored = ModelOutput.__new__(ModelOutput)
+        with pytest.raises(pickle.UnpicklingError, match="Unsupported"):
+            restored.__setstate__(state)
+
+    def test_unpickle_unpacked_state(self, mock_structure, mock_report_structure):
+        model_output = ModelOutput(
+            locals_input={"user_diet": "value1"},
+            config_path=str(mock_structure),
+            report_config_path=str(mock_report_structure)
+        )
+        restored = ModelOutput.__new__(ModelOutput)
+        state = dict(model_output.__dict__)
+        del state["_config_paths"]
+        restored.__setstate__(state)
+        assert restored.Inputs == {"user_diet": "value1"}
+        assert restored.categories_structure == model_output.categories_structure
+        # Outputs pickled before _config_paths was added can be pickled again
+        repickled = pickle.loads(pickle.dumps(restored))
+        assert repickled.Inputs == {"user_diet": "value1"}
+
+    def test_get_values(
+        self, 
+        mock_structure_nested, 
+        mock_report_structure, 
+        mock_locals_input_nested
+    ):
+        model_output = ModelOutput(
+            locals_input=mock_locals_input_nested,
+            config_path=str(mock_structure_nested),
+            report_config_path=str(mock_report_structure)
+        )
+        names = ["deep_value2", "value0", "column2", "Inputs", "missing"]
+        values = model_output.get_values(names)
+        assert list(values) == names
+        for name in names:
+            value = model_output.get_value(name)
+            if isinstance(value, pd.Series):
+                pd.testing.assert_series_equal(values[name], value)
+            else:
+                assert values[name] is value
+
+    def test_output_extractor(self, mock_structure, mock_report_structure):
+        def make_output(locals_input):
+            return ModelOutput(
+                locals_input=locals_input,
+                config_path=str(mock_structure),
+                report_config_path=str(mock_report_structure)
+            )
+
+        extractor = OutputExtractor(["Mlk_Prod", "kg_user", "missing"])
+        first = make_output({
+            "user_diet": pd.DataFrame({"kg_user": [1.0, 2.0]}),
+            "Mlk_Prod": 30.0
+        })
+        values = extractor.extract(first)
+        assert values["Mlk_Prod"] == 30.0
+        assert values["kg_user"].tolist() == [1.0, 2.0]
+        assert values["missing"] is None
+        # Paths found in the first output are read from later outputs
+        assert extractor.extract(
+            make_output({"user_diet": pd.DataFrame({"kg_user": [3.0]}), 
+                         "Mlk_Prod": 25.0})
+            )["Mlk_Prod"] == 25.0
+        # Names are searched for again when their path is not in an output
+        values = extractor.extract(make_output({
+            "animal_input": {"Mlk_Prod": 20.0, "missing": 1.0}
+        }))
+        assert values == {"Mlk_Prod": 20.0, "kg_user": None, "missing": 1.0}
+
+
+@pytest.fixture(scope="module")
+def demo_outputs():
+    outputs = {}
+    for scenario in ["dry_cow", "lactating_cow_test"]:
+        user_diet, animal_input, equation_selection, infusion_input = nd.demo(
+            scenario
+            )
+        outputs[scenario] = nd.nasem(
+            user_diet, animal_input, equation_selection,
+            infusion_input=infusion_input
+            )
+    return outputs
+
+
+def test_output_extractor_mixed_animals(demo_outputs):
+    names = ["Mlk_Prod_MPalow", "Mlk_Prod", "An_StatePhys"]
+    extractor = OutputExtractor(names)
+    # Names missing from a dry cow are still found in a lactating cow
+    for scenario in ["dry_cow", "lactating_cow_test", "dry_cow"]:
+        output = demo_outputs[scenario]
+        assert extractor.extract(output) == {
+            name: output.get_value(name) for name in names
+            }
+    assert extractor.extract(demo_outputs["dry_cow"])["Mlk_Prod_MPalow"] is None
+    assert extractor.extract(
+        demo_outputs["lactating_cow_test"]
+        )["Mlk_Prod_MPalow"] > 0
+
+
+def test_reports_mixed_animals(demo_outputs):
+    report_names = list(demo_outputs["dry_cow"].report_structure)
+    for scenario in ["dry_cow", "lactating_cow_test", "dry_cow"]:
+        output = demo_outputs[scenario]
+        reports = output.get_reports()
+        for report_name in report_names:
+            template = _ReportTemplate(output.report_structure[report_name])
+            expected = template.render(
+                {name: output.get_value(name) for name in template.names}
+                )
+            pd.testing.assert_frame_equal(reports[report_name], expected)
+            pd.testing.assert_frame_equal(
+                output.get_report(report_name), expected
+                )
+    report = demo_outputs["lactating_cow_test"].get_report("table1_3b")
+    assert report.loc[
+        report["Description"] == "MP Allow Milk, kg/d", "Values"
+        ].item() == demo_outputs["lactating_cow_test"].get_value("Mlk_Prod_MPalow")
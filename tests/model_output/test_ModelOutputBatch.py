@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+from nasem_dairy.model_output.ModelOutputBatch import ModelOutputBatch
+
+
+@pytest.fixture(scope="module")
+def model_output():
+    user_diet, animal_input, equation_selection, infusion_input = nd.demo(
+        "lactating_cow_test"
+        )
+    return nd.nasem(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input
+        )
+
+
+def make_run(milk: float, n_rows: int = 2) -> dict:
+    return {
+        "Mlk_Prod": milk,
+        "An_Parity_rl": 2,
+        "An_StatePhys": "Lactating Cow",
+        "milk": {"Mlk_Fat": milk * 0.04},
+        "Du_AA": pd.Series([1.0, 2.0], index=["Arg", "His"]),
+        "feed_data": pd.DataFrame({
+            "Fd_Name": [f"Feed {i}" for i in range(n_rows)],
+            "Fd_CP": np.arange(n_rows, dtype=float)
+        })
+    }
+
+
+def test_get_value():
+    batch = ModelOutputBatch.from_outputs(
+        [make_run(30.0), {"Mlk_Prod": 20.0}, make_run(40.0, n_rows=3)],
+        run_ids=["a", "b", "c"]
+        )
+    assert len(batch) == 3
+    np.testing.assert_array_equal(
+        batch.get_value("Mlk_Prod"), [30.0, 20.0, 40.0]
+        )
+    np.testing.assert_array_equal(
+        batch.get_value("Mlk_Fat"), [1.2, np.nan, 1.6]
+        )
+    np.testing.assert_array_equal(
+        batch.get_value("An_Parity_rl"), [2.0, np.nan, 2.0]
+        )
+    assert batch.get_value("An_StatePhys") == [
+        "Lactating Cow", None, "Lactating Cow"
+        ]
+    series = batch.get_value("Du_AA")
+    assert series[1] is None
+    pd.testing.assert_series_equal(series[2], make_run(40.0)["Du_AA"])
+    frames = batch.get_value("feed_data")
+    pd.testing.assert_frame_equal(frames[2], make_run(40.0, 3)["feed_data"])
+    assert batch.get_value("Fd_CP")[2].tolist() == [0.0, 1.0, 2.0]
+    assert batch.get_value("missing") is None
+    assert batch.get_run_value("Mlk_Prod", "b") == 20.0
+    assert batch.get_run_value("Mlk_Fat", "b") is None
+
+
+def test_get_table():
+    batch = ModelOutputBatch.from_outputs(
+        [make_run(30.0), make_run(40.0, n_rows=3)], run_ids=["a", "b"]
+        )
+    table = batch.get_table("feed_data")
+    assert list(table.columns) == ["Run", "Fd_Name", "Fd_CP"]
+    assert table["Run"].tolist() == ["a", "a", "b", "b", "b"]
+    assert table["Fd_CP"].tolist() == [0.0, 1.0, 0.0, 1.0, 2.0]
+    amino_acids = batch.get_table("Du_AA")
+    assert amino_acids.index.tolist() == ["Arg", "His", "Arg", "His"]
+    assert batch.get_table("Mlk_Prod") is None
+
+
+def test_filter_and_to_dataframe():
+    batch = ModelOutputBatch.from_outputs(
+        [make_run(30.0), make_run(20.0), make_run(40.0, n_rows=3)],
+        run_ids=["a", "b", "c"]
+        )
+    high_yield = batch.filter(batch.get_value("Mlk_Prod") > 25)
+    assert high_yield.run_ids == ["a", "c"]
+    pd.testing.assert_frame_equal(
+        high_yield.to_dataframe(["Mlk_Prod", "missing"]),
+        pd.DataFrame(
+            {"Mlk_Prod": [30.0, 40.0], "missing": [np.nan, np.nan]},
+            index=pd.Index(["a", "c"], name="Run")
+            )
+        )
+    assert len(high_yield.get_value("feed_data")[1]) == 3
+    selected = batch.select(["c", "a"])
+    np.testing.assert_array_equal(selected.get_value("Mlk_Prod"), [40.0, 30.0])
+    with pytest.raises(ValueError, match="one value per run"):
+        batch.filter([True])
+    with pytest.raises(KeyError, match="not in the batch"):
+        batch.select(["d"])
+
+
+def test_write_responses():
+    batch = ModelOutputBatch()
+    batch.write({"id": 1, "outputs": {"Mlk_Prod": 25.0}})
+    batch.write({"id": 2, "error": "ValueError: bad input"})
+    batch.close()
+    assert batch.run_ids == [1, 2]
+    assert batch.errors == {2: "ValueError: bad input"}
+    np.testing.assert_array_equal(batch.get_value("Mlk_Prod"), [25.0, np.nan])
+
+
+def test_matches_model_output(model_output):
+    batch = ModelOutputBatch.from_outputs([model_output, model_output])
+    assert batch.get_value("Mlk_Prod").tolist() == [
+        model_output.get_value("Mlk_Prod")
+        ] * 2
+    pd.testing.assert_frame_equal(
+        batch.get_run_value("aa_values", 1), model_output.get_value("aa_values")
+        )
+    for report_name in ["table1_1", "table4_1"]:
+        pd.testing.assert_frame_equal(
+            batch.get_report(report_name, run=1),
+            model_output.get_report(report_name),
+            check_dtype=False
+            )
+    with pytest.raises(KeyError):
+        batch.get_report("table1_1", run=5)
+
+
+def test_stack_reports(model_output):
+    outputs = [model_output, model_output]
+    batch = ModelOutputBatch.from_outputs(outputs, run_ids=["a", "b"])
+    for report_name in ["table2_2", "table4_1", "table6_4"]:
+        report = model_output.get_report(report_name)
+        expected = pd.concat(
+            [report.assign(Run=run_id) for run_id in ["a", "b"]], 
+            ignore_index=True
+            )
+        expected = expected[["Run"] + list(report.columns)]
+        pd.testing.assert_frame_equal(
+            nd.stack_reports(outputs, report_name, run_ids=["a", "b"]),
+            expected, check_dtype=False
+            )
+        pd.testing.assert_frame_equal(
+            nd.stack_reports(batch, report_name), expected, check_dtype=False
+            )
+    assert nd.stack_reports(batch, "table4_1", run_ids=["b"])["Run"].unique(
+        ).tolist() == ["b"]
+    with pytest.raises(ValueError, match="one id per output"):
+        nd.stack_reports(outputs, "table4_1", run_ids=["a"])
+
+
+def test_stack_reports_mixed_animals(model_output):
+    user_diet, animal_input, equation_selection, infusion_input = nd.demo(
+        "dry_cow"
+        )
+    dry_cow = nd.nasem(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input
+        )
+    # The dry cow comes first, so names it lacks are looked up again later
+    outputs = [dry_cow, model_output, dry_cow, model_output]
+    run_ids = ["dry_1", "lactating_1", "dry_2", "lactating_2"]
+    batch = ModelOutputBatch.from_outputs(outputs, run_ids=run_ids)
+    for report_name in ["table1_3b", "table4_1"]:
+        expected = pd.concat(
+            [
+                output.get_report(report_name).assign(Run=run_id) 
+                for output, run_id in zip(outputs, run_ids)
+            ],
+            ignore_index=True
+            )
+        expected = expected[["Run"] + list(model_output.get_report(
+            report_name
+            ).columns)]
+        pd.testing.assert_frame_equal(
+            nd.stack_reports(outputs, report_name, run_ids=run_ids),
+            expected, check_dtype=False
+            )
+        pd.testing.assert_frame_equal(
+            batch.stack_report(report_name), expected, check_dtype=False
+            )
+    stacked = nd.stack_reports(outputs, "table1_3b", run_ids=run_ids)
+    mp_allow_milk = stacked.loc[
+        stacked["Description"] == "MP Allow Milk, kg/d", "Values"
+        ].tolist()
+    assert mp_allow_milk[1] == model_output.get_value("Mlk_Prod_MPalow")
+    assert mp_allow_milk[3] == mp_allow_milk[1]
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+import nasem_dairy.nasem_equations.amino_acid as aa
+
+
+@pytest.fixture
+def herd_mPrt_inputs():
+    rng = np.random.default_rng(0)
+    mPrtmx_AA2 = rng.uniform(-1, 4, size=(6, 10))
+    mPrt_AA_01 = rng.uniform(0, 3, size=(6, 10))
+    AA_mPrtmx = rng.uniform(0, 1, size=(6, 10))
+    AA_mPrtmx[0, :3] = 0
+    return mPrtmx_AA2, mPrt_AA_01, AA_mPrtmx
+
+
+def _mPrt_k_AA_loop(mPrtmx_AA2, mPrt_AA_01, AA_mPrtmx):
+    mPrt_k_AA = np.zeros(len(mPrtmx_AA2))
+    for i in range(len(mPrtmx_AA2)):
+        inner_value = mPrtmx_AA2[i]**2 - mPrt_AA_01[i] * mPrtmx_AA2[i]
+        if inner_value > 0 and AA_mPrtmx[i] != 0:
+            mPrt_k_AA[i] = (-(2 * np.sqrt(inner_value) - 2 * mPrtmx_AA2[i]) 
+                            / (AA_mPrtmx[i] * 0.1))
+    return mPrt_k_AA
+
+
+def test_mPrt_k_AA_herd(herd_mPrt_inputs):
+    herd = aa.calculate_mPrt_k_AA(*herd_mPrt_inputs)
+    assert herd.shape == (6, 10)
+    for animal in range(6):
+        expected = _mPrt_k_AA_loop(
+            *(values[animal] for values in herd_mPrt_inputs)
+            )
+        np.testing.assert_allclose(herd[animal], expected)
+
+
+def test_mPrt_k_EAA2_negative_inner_value():
+    mPrt_AA_01 = np.ones(10)
+    AA_mPrtmx = np.ones(10)
+    mPrtmx_AA2 = np.full(10, 2.0)
+    assert aa.calculate_mPrt_k_EAA2(
+        mPrtmx_AA2, mPrt_AA_01, AA_mPrtmx
+        ) == pytest.approx((2 * np.sqrt(2) - 3) / 0.01)
+    herd_mPrtmx_AA2 = np.array([mPrtmx_AA2, np.full(10, 0.5)])
+    with pytest.raises(ValueError, match="mPrt_k_EAA2 cannot be calculated"):
+        aa.calculate_mPrt_k_EAA2(herd_mPrtmx_AA2, mPrt_AA_01, AA_mPrtmx)
+
+
+def test_herd_rows_match_single_animal():
+    Abs_AA_g = np.arange(1, 31, dtype=float).reshape(3, 10)
+    for animal in range(3):
+        series = pd.Series(Abs_AA_g[animal], index=aa.AA_LIST)
+        assert aa.calculate_Abs_EAA_g(Abs_AA_g)[animal] == pytest.approx(
+            aa.calculate_Abs_EAA_g(series)
+            )
+        assert aa.calculate_Abs_OthAA_g(10, Abs_AA_g)[animal] == pytest.approx(
+            aa.calculate_Abs_OthAA_g(10, series)
+            )
+        assert aa.calculate_Abs_EAA2_g(Abs_AA_g)[animal] == pytest.approx(
+            aa.calculate_Abs_EAA2_g(series)
+            )
+
+
+def test_Trg_AbsAA_g_herd_excludes_Arg():
+    ones = np.ones((2, 10))
+    Trg_AbsAA_g = aa.calculate_Trg_AbsAA_g(
+        ones, ones, ones, ones, ones, ones, ones, 0.4, {"Ky_MP_NP_Trg": 0.33}
+        )
+    assert np.isnan(Trg_AbsAA_g[:, 0]).all()
+    np.testing.assert_allclose(
+        aa.calculate_Trg_AbsEAA_g(Trg_AbsAA_g), 
+        np.nansum(Trg_AbsAA_g[0, 1:]) * np.ones(2)
+        )
+
+
+def test_model_aa_values_frame():
+    user_diet, animal_input, equation_selection, _ = nd.demo(
+        "lactating_cow_test"
+        )
+    output = nd.nasem(user_diet, animal_input, equation_selection)
+    aa_values = output.get_value("aa_values")
+    assert isinstance(aa_values, pd.DataFrame)
+    assert list(aa_values.index) == aa.AA_LIST
+    assert aa_values["Abs_AA_g"].sum() == pytest.approx(
+        output.get_value("Abs_EAA_g")
+        )
+    for name in [
+        "An_IdAAIn", "Dt_IdAARUPIn", "Inf_AA_g", "Fe_AAMet_AbsAA", 
+        "Ur_AAEnd_AbsAA", "ScrfAA_AbsAA"
+    ]:
+        values = output.get_value(name)
+        assert isinstance(values, pd.Series), name
+        assert list(values.index) == aa.AA_LIST
+        assert values["Lys"] == values.iloc[aa.AA_POSITION["Lys"]]
@@ -0,0 +1,57 @@
+import inspect
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+import nasem_dairy.nasem_equations.nutrient_intakes as diet
+
+
+@pytest.fixture
+def complete_feed_data() -> pd.DataFrame:
+    with open("tests/wrapper_functions/test_calculate_diet_data.json") as file:
+        data = json.load(file)
+    return pd.DataFrame(data["input"]["complete_feed_data_df"])
+
+
+def test_diet_aggregates_match_reference(complete_feed_data):
+    aggregates = nd.calculate_diet_aggregates(complete_feed_data)
+    assert set(aggregates) == set(diet.DIET_AGGREGATES)
+    for name, value in aggregates.items():
+        func = getattr(diet, f"calculate_{name}")
+        args = {
+            param: complete_feed_data[param] 
+            for param in inspect.signature(func).parameters
+            }
+        np.testing.assert_allclose(value, func(**args), rtol=1e-12, atol=1e-12)
+
+
+def test_diet_aggregates_skip_missing_values(complete_feed_data):
+    complete_feed_data.loc[0, "Fd_CaIn"] = np.nan
+    aggregates = nd.calculate_diet_aggregates(complete_feed_data)
+    assert aggregates["Dt_CaIn"] == pytest.approx(
+        nd.calculate_Dt_CaIn(complete_feed_data["Fd_CaIn"])
+        )
+
+
+def test_Dt_aggregates_batch_weights(complete_feed_data):
+    columns = ["Fd_ADF", "Fd_NDF", "Fd_CPIn"]
+    nutrient_matrix = nd.calculate_nutrient_matrix(complete_feed_data, columns)
+    weights = np.array([[0.2, 0.7, 0.1], [0.5, 0.5, 0.0]])
+    batch = nd.calculate_Dt_aggregates(weights, nutrient_matrix)
+    assert batch.shape == (2, 3)
+    for row, diet_weights in enumerate(weights):
+        np.testing.assert_allclose(
+            batch[row], nd.calculate_Dt_aggregates(diet_weights, nutrient_matrix)
+            )
+
+
+def test_diet_aggregates_from_feed_arrays(complete_feed_data):
+    feed_arrays = nd.get_feed_arrays(complete_feed_data)
+    assert all(isinstance(value, np.ndarray) for value in feed_arrays.values())
+    from_frame = nd.calculate_diet_aggregates(complete_feed_data)
+    from_arrays = nd.calculate_diet_aggregates(feed_arrays)
+    for name, value in from_frame.items():
+        assert from_arrays[name] == pytest.approx(value)
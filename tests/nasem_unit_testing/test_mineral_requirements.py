@@ -0,0 +1,227 @@
+import numpy as np
+import pytest
+
+import nasem_dairy.nasem_equations.micronutrient_requirement as micro_req
+
+ANIMALS = [
+    # Lactating cow
+    {"An_StatePhys": "Lactating Cow", "An_BW": 650.0, "An_BW_mature": 700.0,
+     "An_BW_empty": 590.0, "An_Parity_rl": 2, "An_GestDay": 100,
+     "An_DMIn": 24.0, "Trg_MilkProd": 35.0, "Trg_MilkTPp": 3.2,
+     "Mlk_NP_g": 1050.0, "MlkNP_Milk": 0.03, "Body_Gain": 0.2,
+     "Body_Gain_empty": 0.18, "Dt_DMIn_ClfLiq": 0.0},
+    # Dry cow in late gestation
+    {"An_StatePhys": "Dry Cow", "An_BW": 700.0, "An_BW_mature": 700.0,
+     "An_BW_empty": 620.0, "An_Parity_rl": 1, "An_GestDay": 260,
+     "An_DMIn": 13.0, "Trg_MilkProd": 0.0, "Trg_MilkTPp": 0.0,
+     "Mlk_NP_g": np.nan, "MlkNP_Milk": 0.0, "Body_Gain": 0.6,
+     "Body_Gain_empty": 0.5, "Dt_DMIn_ClfLiq": 0.0},
+    # Heifer, early gestation and unknown milk production
+    {"An_StatePhys": "Heifer", "An_BW": 400.0, "An_BW_mature": 680.0,
+     "An_BW_empty": 350.0, "An_Parity_rl": 0, "An_GestDay": 45,
+     "An_DMIn": 9.0, "Trg_MilkProd": np.nan, "Trg_MilkTPp": 0.0,
+     "Mlk_NP_g": np.nan, "MlkNP_Milk": 0.0, "Body_Gain": 0.8,
+     "Body_Gain_empty": 0.7, "Dt_DMIn_ClfLiq": 0.0},
+    # Calf fed milk replacer
+    {"An_StatePhys": "Calf", "An_BW": 60.0, "An_BW_mature": 680.0,
+     "An_BW_empty": 52.0, "An_Parity_rl": 0, "An_GestDay": 0,
+     "An_DMIn": 1.2, "Trg_MilkProd": 0.0, "Trg_MilkTPp": 0.0,
+     "Mlk_NP_g": np.nan, "MlkNP_Milk": 0.0, "Body_Gain": 0.7,
+     "Body_Gain_empty": 0.6, "Dt_DMIn_ClfLiq": 0.9},
+]
+
+PRODUCTION_MINERALS = ["Ca", "P", "Mg", "Na", "Cl", "K", "Cu", "Fe", "Mn", "Zn"]
+
+
+def _diet_data(seed):
+    rng = np.random.default_rng(seed)
+    diet_data = {
+        f"Dt_{mineral}In": rng.uniform(5, 50)
+        for mineral in micro_req.MINERAL_LIST
+        }
+    diet_data.update({
+        f"Abs_{mineral}In": rng.uniform(1, 5)
+        for mineral in micro_req.MINERAL_LIST if mineral not in ("S", "I", "Se")
+        })
+    return diet_data
+
+
+def _calculations():
+    """Function and argument names of every one-mineral-at-a-time output"""
+    calculations = {
+        "Ca_Mlk": ("calculate_Ca_Mlk", ["An_Breed"]),
+        "Fe_Ca_m": ("calculate_Fe_Ca_m", ["An_DMIn"]),
+        "An_Ca_g": ("calculate_An_Ca_g", ["An_BW_mature", "An_BW", "Body_Gain"]),
+        "An_Ca_y": ("calculate_An_Ca_y", ["An_GestDay", "An_BW"]),
+        "An_Ca_l": ("calculate_An_Ca_l",
+                    ["Mlk_NP_g", "Ca_Mlk", "Trg_MilkProd", "Trg_MilkTPp"]),
+        "An_Ca_Clf": ("calculate_An_Ca_Clf", ["An_BW_empty", "Body_Gain_empty"]),
+        "An_Ca_req": ("calculate_An_Ca_req",
+                      ["An_StatePhys", "Dt_DMIn_ClfLiq", "An_Ca_Clf", "Fe_Ca_m",
+                       "An_Ca_g", "An_Ca_y", "An_Ca_l"]),
+        "Ur_P_m": ("calculate_Ur_P_m", ["An_BW"]),
+        "Fe_P_m": ("calculate_Fe_P_m", ["An_Parity_rl", "An_DMIn"]),
+        "An_P_m": ("calculate_An_P_m", ["Ur_P_m", "Fe_P_m"]),
+        "An_P_g": ("calculate_An_P_g", ["An_BW_mature", "An_BW", "Body_Gain"]),
+        "An_P_y": ("calculate_An_P_y", ["An_GestDay", "An_BW"]),
+        "An_P_l": ("calculate_An_P_l", ["Trg_MilkProd", "MlkNP_Milk"]),
+        "An_P_Clf": ("calculate_An_P_Clf", ["An_BW_empty", "Body_Gain_empty"]),
+        "An_P_req": ("calculate_An_P_req",
+                     ["An_StatePhys", "Dt_DMIn_ClfLiq", "An_P_Clf", "An_P_m",
+                      "An_P_g", "An_P_y", "An_P_l"]),
+        "Ur_Mg_m": ("calculate_Ur_Mg_m", ["An_BW"]),
+        "Fe_Mg_m": ("calculate_Fe_Mg_m", ["An_DMIn"]),
+        "An_Mg_m": ("calculate_An_Mg_m", ["Ur_Mg_m", "Fe_Mg_m"]),
+        "Fe_Na_m": ("calculate_Fe_Na_m", ["An_DMIn"]),
+        "Fe_Cl_m": ("calculate_Fe_Cl_m", ["An_DMIn"]),
+        "Ur_K_m": ("calculate_Ur_K_m", ["Trg_MilkProd", "An_BW"]),
+        "Fe_K_m": ("calculate_Fe_K_m", ["An_DMIn"]),
+        "An_K_m": ("calculate_An_K_m", ["Ur_K_m", "Fe_K_m"]),
+        "An_S_req": ("calculate_An_S_req", ["An_DMIn"]),
+        "An_Co_req": ("calculate_An_Co_req", ["An_DMIn"]),
+        "An_Cu_Clf": ("calculate_An_Cu_Clf", ["An_BW", "Body_Gain_empty"]),
+        "An_Cu_m": ("calculate_An_Cu_m", ["An_BW"]),
+        "An_I_req": ("calculate_An_I_req",
+                     ["An_StatePhys", "An_DMIn", "An_BW", "Trg_MilkProd"]),
+        "An_Fe_Clf": ("calculate_An_Fe_Clf", ["Body_Gain"]),
+        "An_Mn_Clf": ("calculate_An_Mn_Clf", ["An_BW", "Body_Gain"]),
+        "An_Mn_m": ("calculate_An_Mn_m", ["An_BW"]),
+        "An_Se_req": ("calculate_An_Se_req", ["An_DMIn"]),
+        "An_Zn_Clf": ("calculate_An_Zn_Clf", ["An_DMIn", "Body_Gain"]),
+        "An_Zn_m": ("calculate_An_Zn_m", ["An_DMIn"]),
+    }
+    for mineral in ["Mg", "Na", "Cl", "K"]:
+        calculations[f"An_{mineral}_Clf"] = (
+            f"calculate_An_{mineral}_Clf", ["An_BW_empty", "Body_Gain_empty"]
+            )
+    for mineral in ["Mg", "Na", "Cl", "K", "Cu", "Fe", "Mn", "Zn"]:
+        calculations[f"An_{mineral}_g"] = (
+            f"calculate_An_{mineral}_g", ["Body_Gain"]
+            )
+        calculations[f"An_{mineral}_y"] = (
+            f"calculate_An_{mineral}_y", ["An_GestDay", "An_BW"]
+            )
+        calculations[f"An_{mineral}_l"] = (
+            f"calculate_An_{mineral}_l", ["Trg_MilkProd"]
+            )
+    maintenance = {
+        "Mg": "An_Mg_m", "Na": "Fe_Na_m", "Cl": "Fe_Cl_m", "K": "An_K_m",
+        "Cu": "An_Cu_m", "Mn": "An_Mn_m", "Zn": "An_Zn_m"
+        }
+    for mineral, maintenance_name in maintenance.items():
+        calculations[f"An_{mineral}_req"] = (
+            f"calculate_An_{mineral}_req",
+            ["An_StatePhys", "Dt_DMIn_ClfLiq", f"An_{mineral}_Clf",
+             maintenance_name, f"An_{mineral}_g", f"An_{mineral}_y",
+             f"An_{mineral}_l"]
+            )
+    calculations["An_Fe_req"] = (
+        "calculate_An_Fe_req",
+        ["An_StatePhys", "Dt_DMIn_ClfLiq", "An_Fe_Clf", "An_Fe_g", "An_Fe_y",
+         "An_Fe_l"]
+        )
+    for mineral in PRODUCTION_MINERALS:
+        calculations[f"An_{mineral}_prod"] = (
+            f"calculate_An_{mineral}_prod",
+            [f"An_{mineral}_y", f"An_{mineral}_l", f"An_{mineral}_g"]
+            )
+        calculations[f"Dt_ac{mineral}"] = (
+            "calculate_Dt_acMg_final" if mineral == "Mg"
+            else f"calculate_Dt_ac{mineral}",
+            [f"Abs_{mineral}In", f"Dt_{mineral}In"]
+            )
+        calculations[f"{mineral}Prod_{mineral}In"] = (
+            f"calculate_{mineral}Prod_{mineral}In",
+            [f"An_{mineral}_prod", f"Dt_{mineral}In"]
+            )
+        calculations[f"{mineral}Prod_{mineral}Abs"] = (
+            f"calculate_{mineral}Prod_{mineral}Abs",
+            [f"An_{mineral}_prod", f"Abs_{mineral}In"]
+            )
+        calculations[f"Dt_{mineral}Req_DMI"] = (
+            f"calculate_Dt_{mineral}Req_DMI",
+            [f"An_{mineral}_req", f"Dt_ac{mineral}", "An_DMIn"]
+            )
+    calculations["Dt_acCo"] = ("calculate_Dt_acCo", ["Abs_CoIn", "Dt_CoIn"])
+    for mineral in micro_req.MINERAL_LIST:
+        intake = "Dt" if mineral in ("S", "I", "Se") else "Abs"
+        calculations[f"An_{mineral}_bal"] = (
+            f"calculate_An_{mineral}_bal",
+            [f"{intake}_{mineral}In", f"An_{mineral}_req"]
+            )
+        if mineral not in PRODUCTION_MINERALS:
+            calculations[f"Dt_{mineral}Req_DMI"] = (
+                f"calculate_Dt_{mineral}Req_DMI",
+                [f"An_{mineral}_req", "An_DMIn"]
+                )
+    return calculations
+
+
+# Functions are looked up at collection, so a misspelled name fails there
+CALCULATIONS = {
+    name: (getattr(micro_req, function), arguments)
+    for name, (function, arguments) in _calculations().items()
+    }
+
+
+def _named_function_outputs(animal, diet_data):
+    """Every mineral output from the one-mineral-at-a-time functions"""
+    values = {**animal, **diet_data, "An_Breed": "Holstein"}
+    outputs = {}
+    for name, (function, arguments) in CALCULATIONS.items():
+        outputs[name] = function(
+            **{argument: values[argument] for argument in arguments}
+            )
+        values[name] = outputs[name]
+    for mineral in PRODUCTION_MINERALS:
+        outputs[f"Man_{mineral}_out"] = (
+            diet_data[f"Dt_{mineral}In"] - outputs[f"An_{mineral}_prod"]
+            )
+    return outputs
+
+
+def _engine_outputs(animals, diet_data):
+    intakes = micro_req.get_mineral_intakes(diet_data)
+    return micro_req.get_mineral_outputs(
+        micro_req.calculate_mineral_requirements(
+            animals["An_StatePhys"], animals["An_BW"],
+            animals["An_BW_mature"], animals["An_BW_empty"],
+            animals["An_Parity_rl"], animals["An_GestDay"], animals["An_DMIn"],
+            animals["Trg_MilkProd"], animals["Trg_MilkTPp"], 1.17,
+            animals["Mlk_NP_g"], animals["MlkNP_Milk"], animals["Body_Gain"],
+            animals["Body_Gain_empty"], animals["Dt_DMIn_ClfLiq"], **intakes
+            )
+        )
+
+
+@pytest.mark.parametrize("animal_index", range(len(ANIMALS)))
+def test_matches_named_functions(animal_index):
+    diet_data = _diet_data(animal_index)
+    expected = _named_function_outputs(ANIMALS[animal_index], diet_data)
+    outputs = _engine_outputs(ANIMALS[animal_index], diet_data)
+    assert set(outputs) == set(expected) - {"Ca_Mlk"}
+    for name, value in outputs.items():
+        assert value == pytest.approx(expected[name], rel=1e-12, nan_ok=True), name
+
+
+def test_herd_rows_match_single_animal():
+    herd = {
+        key: np.array([animal[key] for animal in ANIMALS])
+        for key in ANIMALS[0]
+        }
+    diet_data = _diet_data(0)
+    herd_outputs = _engine_outputs(herd, diet_data)
+    assert herd_outputs["An_Ca_req"].shape == (len(ANIMALS),)
+    for animal_index, animal in enumerate(ANIMALS):
+        outputs = _engine_outputs(animal, diet_data)
+        for name, value in outputs.items():
+            assert herd_outputs[name][animal_index] == pytest.approx(
+                value, rel=1e-12, nan_ok=True
+                ), name
+
+
+def test_Dt_acCo_undefined_without_cobalt_intake():
+    diet_data = {**_diet_data(0), "Dt_CoIn": 0.0}
+    outputs = _engine_outputs(ANIMALS[0], diet_data)
+    assert outputs["Dt_acCo"] is None
+    assert micro_req.calculate_Dt_acCo(diet_data["Abs_CoIn"], 0.0) is None
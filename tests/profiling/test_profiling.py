@@ -0,0 +1,76 @@
+import pytest
+
+import nasem_dairy as nd
+import nasem_dairy.nasem_equations.nutrient_intakes as diet
+from nasem_dairy.model import nasem as nasem_module
+from nasem_dairy.model.profiling import EquationTimings, profile_equations
+
+
+@pytest.fixture
+def demo_inputs():
+    return nd.demo("lactating_cow_test")
+
+
+def run_demo(demo_inputs):
+    user_diet, animal_input, equation_selection, infusion_input = demo_inputs
+    return nd.nasem(
+        user_diet, animal_input, equation_selection,
+        infusion_input=infusion_input
+        )
+
+
+def test_profile_run(demo_inputs):
+    with profile_equations() as timings:
+        output = run_demo(demo_inputs)
+
+    assert isinstance(output.timings, EquationTimings)
+    assert output.timings.records == timings.records
+    calls, total_time, self_time = timings.records[
+        ("nutrient_intakes", "calculate_diet_data")
+        ]
+    assert calls == 1
+    # Equations called inside calculate_diet_data are recorded separately
+    assert 0 < self_time < total_time
+    assert ("model_output", "ModelOutput") in timings.records
+
+    by_module = timings.by_module()
+    assert {"nutrient_intakes", "micronutrient_requirement",
+            "amino_acid", "model_output"} <= set(by_module["Module"])
+    assert by_module["Time (s)"].sum() == pytest.approx(timings.total_time)
+    assert by_module["Share (%)"].sum() == pytest.approx(100)
+    by_function = timings.by_function()
+    assert by_function["Calls"].sum() == by_module["Calls"].sum()
+    assert by_function["Self Time (s)"].is_monotonic_decreasing
+
+
+def test_timings_per_run(demo_inputs):
+    with profile_equations() as timings:
+        first = run_demo(demo_inputs)
+        second = run_demo(demo_inputs)
+
+    assert first.timings is not second.timings
+    for key, (calls, _, _) in timings.records.items():
+        assert calls == (first.timings.records[key][0]
+                         + second.timings.records[key][0])
+
+
+def test_functions_restored(demo_inputs):
+    original_function = diet.calculate_diet_data
+    original_output = nasem_module.ModelOutput
+    with pytest.raises(ValueError):
+        with profile_equations():
+            assert diet.calculate_diet_data is not original_function
+            assert diet.calculate_diet_data.__wrapped__ is original_function
+            raise ValueError
+    assert diet.calculate_diet_data is original_function
+    assert nasem_module.ModelOutput is original_output
+    assert run_demo(demo_inputs).timings is None
+
+
+def test_nested_profiling():
+    with profile_equations():
+        with pytest.raises(RuntimeError, match="already active"):
+            with profile_equations():
+                pass
+    with profile_equations():
+        pass
@@ -0,0 +1,124 @@
+import io
+import json
+import threading
+import urllib.request
+
+import pytest
+
+import nasem_dairy as nd
+from nasem_dairy.service.server import (
+    ModelServer, make_http_server, serve_jsonl
+)
+
+OUTPUTS = ["Mlk_Prod", "An_MPBal_g_Trg", "Dt_CP"]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return ModelServer(outputs=OUTPUTS)
+
+
+@pytest.fixture(scope="module")
+def request_json():
+    with open("src/nasem_dairy/data/demo/lactating_cow_test.json") as file:
+        return json.load(file)
+
+
+@pytest.fixture(scope="module")
+def expected(request_json):
+    user_diet, animal_input, equation_selection, infusion_input = (
+        nd.parse_json_input(request_json)
+    )
+    output = nd.nasem(
+        user_diet, animal_input, equation_selection, 
+        infusion_input=infusion_input
+    )
+    return {name: output.get_value(name) for name in OUTPUTS}
+
+
+def test_handle(server, request_json, expected):
+    response = server.handle({**request_json, "id": "cow"})
+    assert response == {"id": "cow", "outputs": expected}
+    response = server.handle({**request_json, "outputs": ["Mlk_Prod", "nope"]})
+    assert response["outputs"] == {
+        "Mlk_Prod": expected["Mlk_Prod"], "nope": None
+    }
+
+
+def test_handle_error(server, request_json):
+    response = server.handle({**request_json, "user_diet": {
+        "Feedstuff": ["Not a feed"], "kg_user": [1.0]
+    }})
+    assert response["id"] is None
+    assert response["error"].startswith("ValueError")
+
+
+@pytest.mark.parametrize("request_value", ["x", 1, None, [1]])
+def test_handle_not_an_object(server, request_value):
+    response = server.handle(request_value)
+    assert response["id"] is None
+    assert response["error"].startswith(
+        "TypeError: Request must be a JSON object"
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_serve_jsonl(server, request_json, expected, workers):
+    lines = [json.dumps({**request_json, "id": index}) for index in range(3)]
+    lines += ["", "{not json", json.dumps({"id": "empty"})]
+    output = io.StringIO()
+    serve_jsonl(server, lines, output, workers=workers)
+    responses = {
+        response["id"]: response 
+        for response in map(json.loads, output.getvalue().splitlines())
+    }
+    assert set(responses) == {0, 1, 2, 5, "empty"}
+    for index in range(3):
+        assert responses[index]["outputs"] == pytest.approx(expected)
+    assert responses[5]["error"].startswith("JSONDecodeError")
+    assert responses["empty"]["error"] == "KeyError: 'user_diet'"
+
+
+def test_serve_jsonl_answers_before_input_ends(server, request_json, expected):
+    answered = threading.Event()
+
+    class Output(io.StringIO):
+        def flush(self):
+            super().flush()
+            answered.set()
+
+    def open_input():
+        yield json.dumps({**request_json, "id": "first"})
+        # The client waits for its answer before sending anything else
+        assert answered.wait(timeout=60)
+
+    output = Output()
+    serve_jsonl(server, open_input(), output, workers=2)
+    response = json.loads(output.getvalue())
+    assert response["outputs"] == pytest.approx(expected)
+
+
+def test_http(server, request_json, expected):
+    http_server = make_http_server(server, port=0)
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{url}/health") as response:
+            assert json.load(response) == {"status": "ok"}
+        body = json.dumps([request_json, {"id": 2}]).encode()
+        with urllib.request.urlopen(urllib.request.Request(url, body)) as response:
+            responses = json.load(response)
+        assert responses[0]["outputs"] == pytest.approx(expected)
+        assert "error" in responses[1]
+        error = "TypeError: Request must be a JSON object, not "
+        for body, expected_body in [
+            ("x", {"id": None, "error": error + "str"}),
+            ([[1]], [{"id": None, "error": error + "list"}]),
+        ]:
+            request = urllib.request.Request(url, json.dumps(body).encode())
+            with urllib.request.urlopen(request) as response:
+                assert json.load(response) == expected_body
+    finally:
+        http_server.shutdown()
+        http_server.server_close()
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+import nasem_dairy as nd
+
+HEAVY_MODULES = [
+    "pandas", "numpy", "scipy", "SALib", "graph_tool", "importlib.metadata",
+    "nasem_dairy.model.nasem", "nasem_dairy.sensitivity.SensitivityAnalyzer"
+]
+
+
+def test_import_does_not_load_heavy_modules():
+    code = (
+        "import sys, nasem_dairy\n"
+        f"print([name for name in {HEAVY_MODULES!r} if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attributes():
+    from nasem_dairy.model.nasem import nasem
+    from nasem_dairy.nasem_equations.body_composition import calculate_Frm_Gain
+
+    assert nd.nasem is nasem
+    assert nd.calculate_Frm_Gain is calculate_Frm_Gain
+    assert "calculate_Dt_DMIn" in dir(nd)
+    assert nd.__version__
+    for name in nd._ATTRIBUTE_MODULES:
+        assert callable(getattr(nd, name)) or name in {
+            "coeff_dict", "infusion_dict", "MP_NP_efficiency_dict", 
+            "mPrt_coeff_list", "f_Imb"
+        }
+
+
+def test_unknown_attribute():
+    with pytest.raises(
+        AttributeError, 
+        match="module 'nasem_dairy' has no attribute 'not_a_function'"
+        ):
+        nd.not_a_function
+
+
+def test_star_import():
+    namespace = {}
+    exec("from nasem_dairy import *", namespace)
+
+    assert namespace["nasem"] is nd.nasem
+    assert namespace["ModelOutput"] is nd.ModelOutput
+    assert namespace["calculate_Dt_DMIn"] is nd.calculate_Dt_DMIn
+    assert namespace["__version__"] == nd.__version__
+    assert set(nd._ATTRIBUTE_MODULES) <= set(namespace)
+    assert "importlib" not in namespace
+    assert "_importlib" not in namespace
+
+
+@pytest.mark.parametrize(
+    "name", 
+    ["model", "dag", "data", "nasem_equations", "sensitivity", "model_output"]
+    )
+def test_subpackage_attributes(name):
+    import importlib
+
+    assert getattr(nd, name) is importlib.import_module(f"nasem_dairy.{name}")
+
+
+def test_version_function():
+    from importlib.metadata import version
+
+    assert nd.version is version
+    assert nd.version("nasem_dairy") == nd.__version__
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasem_dairy as nd
+from nasem_dairy.nasem_equations.nutrient_intakes import DIET_MATRIX_COLUMNS
+
+
+def per_diet_intakes(
+    kg_user: pd.Series, 
+    An_StatePhys: str, 
+    feed_library: pd.DataFrame
+) -> pd.Series:
+    user_diet = pd.DataFrame({
+        "Feedstuff": kg_user.index, "kg_user": kg_user.to_numpy()
+        })
+    feed_data = nd.get_feed_data(kg_user.sum(), user_diet, feed_library)
+    feed_data["Fd_ForNDF"] = nd.calculate_Fd_ForNDF(
+        feed_data["Fd_NDF"], feed_data["Fd_Conc"]
+        )
+    complete_feed_data = nd.calculate_feed_data(
+        kg_user.sum(), An_StatePhys, 0, feed_data, nd.coeff_dict
+        )
+    intakes = nd.calculate_diet_aggregates(complete_feed_data)
+    intakes["Dt_ForDNDF48"] = nd.calculate_Dt_ForDNDF48(
+        complete_feed_data["Fd_DMInp"], complete_feed_data["Fd_Conc"], 
+        complete_feed_data["Fd_NDF"], complete_feed_data["Fd_DNDF48"]
+        )
+    intakes["Dt_RUPIn"] = nd.calculate_Dt_RUPIn(complete_feed_data["Fd_RUPIn"])
+    return pd.Series(intakes)
+
+
+@pytest.mark.parametrize("An_StatePhys, kg_user", [
+    ("Lactating Cow", pd.DataFrame(
+        [[10.0, 5.0, 4.0, 0.2], [8.0, 7.0, 2.0, 0.0], [12.0, 2.0, 6.0, 0.1]], 
+        columns=[
+            "Corn silage, typical", "Canola meal", "Alfalfa meal", 
+            "Urea"
+            ]
+        )),
+    ("Calf", pd.DataFrame(
+        [[0.6, 0.3], [0.0, 0.9], [0.8, 0.0]], 
+        columns=[
+            "Milk replacer 20 CP 20 fat", 
+            "Calf starter 18CP high starch (Fed to calves only)"
+            ]
+        )),
+])
+def test_evaluate_diets_matches_single_diet(An_StatePhys, kg_user):
+    feed_library = pd.read_csv(
+        "src/nasem_dairy/data/feed_library/NASEM_feed_library.csv"
+        )
+    diets = nd.evaluate_diets(kg_user, An_StatePhys, feed_library)
+    assert diets.shape == (len(kg_user), len(DIET_MATRIX_COLUMNS))
+    for index, row in kg_user.iterrows():
+        expected = per_diet_intakes(row[row > 0], An_StatePhys, feed_library)
+        np.testing.assert_allclose(
+            diets.loc[index, expected.index].to_numpy(dtype=float), 
+            expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-12
+            )
+
+
+def test_evaluate_diets_unknown_feed():
+    kg_user = pd.DataFrame([[1.0]], columns=["Not a feed"])
+    with pytest.raises(ValueError, match="Not a feed"):
+        nd.evaluate_diets(kg_user, "Lactating Cow", 
+                          feed_library=nd.select_feeds(["Canola meal"]))
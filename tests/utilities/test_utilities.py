@@ -105,3 +105,60 @@ def test_adjust_diet():
             assert adjusted_output.get_value(nutrient) == pytest.approx(
                 expected_value, rel=1e-2
             )
+
+
+def test_adjust_diet_simultaneous():
+    diet = pd.DataFrame({
+        "Feedstuff": [
+            "Alfalfa meal", "Blood meal, low dRUP", "Corn and cob meal, dry", 
+            "Wheat bran"
+        ],
+        "kg_user": [6.5, 3.0, 4.7, 5.1]
+    })
+    nutrients_to_adjust = [
+        ("Fd_CP", "Dt_CP"), 
+        ("Fd_NDF", "Dt_NDF"),
+        ("Fd_St", "Dt_St"),
+        ("Fd_FA", "Dt_FA")
+    ]
+    expected_values = {
+        "Dt_CP": 19.57,
+        "Dt_NDF": 29.0,
+        "Dt_St": 20.0,
+        "Dt_FA": 3.5
+    }
+    _, animal, equation, _ = nd.demo("lactating_cow_test")
+    sequential_library, sequential_factors = nd.adjust_diet(
+        animal, equation, diet, expected_values, nutrients_to_adjust
+    )
+    adjusted_feed_library, factors = nd.adjust_diet(
+        animal, equation, diet, expected_values, nutrients_to_adjust,
+        method="simultaneous", tolerance=1e-8
+    )
+    adjusted_output = nd.nasem(
+        diet, animal, equation, feed_library=adjusted_feed_library
+    )
+    for nutrient, expected_value in expected_values.items():
+        assert adjusted_output.get_value(nutrient) == pytest.approx(
+            expected_value, rel=1e-6
+        )
+    for feed_column, adjustment in sequential_factors.items():
+        assert factors[feed_column] == pytest.approx(adjustment, rel=1e-4)
+
+
+def test_adjust_diet_simultaneous_invalid():
+    diet = pd.DataFrame({
+        "Feedstuff": ["Alfalfa meal", "Wheat bran"],
+        "kg_user": [6.5, 5.1]
+    })
+    _, animal, equation, _ = nd.demo("lactating_cow_test")
+    with pytest.raises(ValueError, match="method='sequential'"):
+        nd.adjust_diet(
+            animal, equation, diet, {"An_MPBal_g": 0}, 
+            [("Fd_CP", "An_MPBal_g")], method="simultaneous"
+        )
+    with pytest.raises(ValueError, match="method must be"):
+        nd.adjust_diet(
+            animal, equation, diet, {"Dt_CP": 18}, [("Fd_CP", "Dt_CP")], 
+            method="joint"
+        )